@@ -0,0 +1,5 @@
+"""
+Benchmarks for FinAgents
+
+Throughput and latency benchmarks of the debate pipeline on synthetic portfolios.
+"""
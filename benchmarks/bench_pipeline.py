@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+
+Runs the whole pipeline on synthetic portfolios of increasing size: fetching
+stock data from a fake yfinance provider, the analyst and investor phases with
+latency-injecting agents, synthesis and writing the Markdown results. For each
+size it reports throughput, p50/p95/p99 latency of every stage and peak RSS,
+and can compare them with a baseline saved by an earlier run:
+
+    python -m benchmarks.bench_pipeline --sizes 10 100 1000 --save-baseline baseline.json
+    python -m benchmarks.bench_pipeline --sizes 10 100 1000 --baseline baseline.json
+
+The exit status is 1 when a result is slower than the baseline by more than
+the tolerance.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'src'))
+
+from agents.debate_manager import DebateManager, DEFAULT_MAX_WORKERS, EXECUTOR_TYPES  # noqa: E402
+from utils.stock_data import get_stock_data_batch  # noqa: E402
+from utils.snapshot import SnapshotTable  # noqa: E402
+from utils.metrics import Metrics  # noqa: E402
+from utils.progress import NULL_PROGRESS  # noqa: E402
+from utils.results_writer import ResultsWriter  # noqa: E402
+from benchmarks.synthetic import SyntheticYFinance, generate_tickers, latency_teams  # noqa: E402
+
+AGENT_KINDS = ("latency", "http", "local")
+
+DEFAULT_SIZES = [10, 100, 1000]
+
+# Relative slowdown against the baseline that counts as a regression
+DEFAULT_TOLERANCE = 0.2
+
+# Stage latencies below this many seconds are too noisy to compare
+NOISE_FLOOR = 0.005
+
+# Labels that identify one ticker or agent; stages are summarized over all of them
+PER_ITEM_LABELS = ("ticker", "agent")
+
+logger = logging.getLogger(__name__)
+
+class StageMetrics(Metrics):
+    """Collector that summarizes spans per stage rather than per ticker and agent."""
+
+    def observe(self, name: str, duration_ns: int, **labels: Any) -> None:
+        for label in PER_ITEM_LABELS:
+            labels.pop(label, None)
+        super().observe(name, duration_ns, **labels)
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MiB, or None where it cannot be read."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kibibytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+def stage_name(span: Dict[str, Any]) -> str:
+    return ".".join([span["name"]] + [value for _, value in sorted(span["labels"].items())])
+
+def run_size(size: int, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Benchmark the pipeline on one synthetic portfolio.
+
+    Args:
+        size: Number of tickers in the portfolio
+        config: Options of the run, as collected by ``benchmark_config``
+
+    Returns:
+        Wall-clock seconds, throughput in tickers per second, peak RSS and a
+        latency summary of every stage
+    """
+    # INFO logging of every ticker would dominate the timings
+    logging.getLogger().setLevel(config["log_level"])
+    tickers = generate_tickers(size, config["seed"])
+    provider = SyntheticYFinance(tickers, config["seed"], latency=config["provider_latency"])
+    metrics = StageMetrics()
+    output_dir = tempfile.mkdtemp(prefix="finagents-bench-")
+    server = None
+    try:
+        started = time.perf_counter()
+        with metrics.span("stock_data"):
+            stock_data = SnapshotTable(get_stock_data_batch(tickers, provider=provider))
+
+        if config["agents"] == "local":
+            from agents.investor_agents import create_investor_team
+            from agents.analyst_agents import create_analyst_team
+            investor_team, analyst_team = create_investor_team(), create_analyst_team()
+        elif config["agents"] == "http":
+            from tests.fake_llm import FakeLLMServer, FakeLLMAgent
+            from benchmarks.synthetic import ANALYST_NAMES, INVESTOR_NAMES
+            server = FakeLLMServer(latency=config["agent_latency"]).__enter__()
+            investor_team = {name: FakeLLMAgent(server.url) for name in INVESTOR_NAMES}
+            analyst_team = {name: FakeLLMAgent(server.url) for name in ANALYST_NAMES}
+        else:
+            investor_team, analyst_team = latency_teams(config["agent_latency"], seed=config["seed"])
+
+        def record_written(ticker, outputs, submitted):
+            metrics.observe("write_results", time.perf_counter_ns() - submitted)
+
+        # Results are written on the writer's thread, as in main; a write is timed until its files are on disk
+        with ResultsWriter(output_dir) as writer, \
+                DebateManager(investor_team, analyst_team, max_workers=config["workers"],
+                              executor=config["executor"], metrics=metrics, progress=NULL_PROGRESS) as manager:
+            for ticker, result in manager.iter_debate(tickers, stock_data, max_in_flight=config["max_in_flight"]):
+                writer.submit(ticker, result, on_written=partial(record_written, submitted=time.perf_counter_ns()))
+        seconds = time.perf_counter() - started
+    finally:
+        if server is not None:
+            server.__exit__(None, None, None)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    stages = {}
+    for span in metrics.snapshot()["spans"]:
+        stages[stage_name(span)] = {
+            "count": span["count"],
+            "p50_seconds": span["p50_seconds"],
+            "p95_seconds": span["p95_seconds"],
+            "p99_seconds": span["p99_seconds"]
+        }
+    return {
+        "tickers": size,
+        "seconds": seconds,
+        "tickers_per_second": size / seconds,
+        "peak_rss_mb": peak_rss_mb(),
+        "stages": stages
+    }
+
+def run_benchmarks(sizes: List[int], config: Dict[str, Any], in_process: bool = False) -> Dict[str, Any]:
+    """
+    Benchmark every portfolio size.
+
+    Each size runs in a fresh process so its peak RSS is its own, unless
+    ``in_process`` is set.
+    """
+    results = {}
+    for size in sizes:
+        if in_process:
+            results[str(size)] = run_size(size, config)
+        else:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                results[str(size)] = pool.submit(run_size, size, config).result()
+    return {"config": config, "results": results}
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Compare a report with a baseline report.
+
+    Returns:
+        A description of every throughput drop and stage p95 increase larger
+        than ``tolerance``, for the sizes both reports cover
+    """
+    regressions = []
+    if report["config"] != baseline["config"]:
+        logger.warning("Baseline was recorded with different options; the comparison may not be meaningful")
+    for size, result in report["results"].items():
+        before = baseline["results"].get(size)
+        if before is None:
+            continue
+        if result["tickers_per_second"] < before["tickers_per_second"] * (1 - tolerance):
+            regressions.append(f"{size} tickers: throughput {result['tickers_per_second']:.1f}/s, "
+                               f"baseline {before['tickers_per_second']:.1f}/s")
+        for stage, summary in result["stages"].items():
+            previous = before["stages"].get(stage)
+            if previous is None:
+                continue
+            p95, previous_p95 = summary["p95_seconds"], previous["p95_seconds"]
+            if p95 > NOISE_FLOOR and p95 > previous_p95 * (1 + tolerance):
+                regressions.append(f"{size} tickers: {stage} p95 {p95 * 1000:.1f}ms, "
+                                   f"baseline {previous_p95 * 1000:.1f}ms")
+    return regressions
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Format a report as a table per portfolio size."""
+    lines = []
+    for size, result in report["results"].items():
+        rss = "n/a" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.0f} MiB"
+        lines.append(f"\n{size} tickers: {result['seconds']:.2f}s, {result['tickers_per_second']:.1f} tickers/s, "
+                     f"peak RSS {rss}")
+        lines.append(f"  {'stage':<32}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for stage, summary in sorted(result["stages"].items()):
+            lines.append(f"  {stage:<32}{summary['count']:>8}{summary['p50_seconds'] * 1000:>10.1f}"
+                         f"{summary['p95_seconds'] * 1000:>10.1f}{summary['p99_seconds'] * 1000:>10.1f}")
+    return "\n".join(lines)
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Benchmark the debate pipeline on synthetic portfolios")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help=f"portfolio sizes to benchmark (default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--agents", choices=AGENT_KINDS, default="latency",
+                        help="agents that sleep for a random latency, agents calling a local fake LLM "
+                             "server, or the local response library (default: latency)")
+    parser.add_argument("--agent-latency", type=float, default=0.01,
+                        help="median seconds per agent call (default: 0.01)")
+    parser.add_argument("--provider-latency", type=float, default=0.0,
+                        help="seconds per request to the fake yfinance provider (default: 0)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"agent calls in flight (default: {DEFAULT_MAX_WORKERS})")
+    parser.add_argument("--max-in-flight", type=int, default=4,
+                        help="stocks debated at once (default: 4)")
+    parser.add_argument("--executor", choices=EXECUTOR_TYPES, default="thread",
+                        help="run agent calls on threads or worker processes (default: thread)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic data (default: 0)")
+    parser.add_argument("--in-process", action="store_true",
+                        help="run every size in this process; peak RSS is then cumulative")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    parser.add_argument("--baseline", help="compare with a report saved by --save-baseline")
+    parser.add_argument("--save-baseline", help="save the report as a baseline to this file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"relative slowdown counted as a regression (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--log-level", default="WARNING", help="logging level of the run (default: WARNING)")
+    return parser.parse_args(argv)
+
+def benchmark_config(args) -> Dict[str, Any]:
+    """Return the options that affect the results, which are saved with them."""
+    return {
+        "agents": args.agents,
+        "agent_latency": args.agent_latency,
+        "provider_latency": args.provider_latency,
+        "workers": args.workers,
+        "max_in_flight": args.max_in_flight,
+        "executor": args.executor,
+        "seed": args.seed,
+        "log_level": args.log_level
+    }
+
+def main(args):
+    logging.getLogger().setLevel(args.log_level)
+    report = run_benchmarks(args.sizes, benchmark_config(args), in_process=args.in_process)
+    print(format_report(report))
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"\nReport saved to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -0,0 +1,166 @@
+"""
+Synthetic Portfolio Module
+
+This module generates portfolios of any size for benchmarks: ticker symbols,
+a fake of the yfinance API that serves random but deterministic prices and
+fundamentals, and agents that answer after an injected latency. Nothing here
+touches the network.
+"""
+
+import time
+import random
+import string
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+# Trading days in the default one year period
+HISTORY_DAYS = 252
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+SECTORS = ["Technology", "Healthcare", "Financial Services", "Energy", "Consumer Cyclical", "Industrials"]
+
+ANALYST_NAMES = ["Fundamental Analyst", "Technical Analyst", "Industry Analyst", "Quantitative Analyst",
+                 "ESG Analyst"]
+
+INVESTOR_NAMES = ["Warren Buffett", "Ray Dalio", "Cathie Wood", "Peter Lynch", "Michael Burry"]
+
+# Characters in a synthetic agent response, about the length of a real report
+RESPONSE_CHARS = 2000
+
+def generate_tickers(count: int, seed: int = 0) -> List[str]:
+    """Return ``count`` distinct made-up ticker symbols."""
+    rng = random.Random(seed)
+    tickers = set()
+    while len(tickers) < count:
+        length = rng.choice((3, 4, 4, 5))
+        tickers.add("".join(rng.choice(string.ascii_uppercase) for _ in range(length)))
+    return sorted(tickers)
+
+class SyntheticTicker:
+    """Stand-in for ``yf.Ticker`` serving the provider's fundamentals for one symbol."""
+
+    def __init__(self, provider: "SyntheticYFinance", ticker: str):
+        self.provider = provider
+        self.ticker = ticker
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        self.provider.wait()
+        return self.provider.infos[self.ticker]
+
+    @property
+    def income_stmt(self) -> pd.DataFrame:
+        self.provider.wait()
+        return self.provider.income_stmts[self.ticker]
+
+    @property
+    def balance_sheet(self) -> pd.DataFrame:
+        self.provider.wait()
+        return self.provider.balance_sheets[self.ticker]
+
+    @property
+    def cashflow(self) -> pd.DataFrame:
+        self.provider.wait()
+        return self.provider.cash_flows[self.ticker]
+
+    def history(self, period: str = "1y", start: Optional[str] = None) -> pd.DataFrame:
+        self.provider.wait()
+        return self.provider.download([self.ticker], period=period, start=start)[self.ticker].dropna(how="all")
+
+class SyntheticYFinance:
+    """
+    Fake of the yfinance module API used by ``get_stock_data_batch``.
+
+    Prices are random walks and fundamentals are random values drawn from a
+    seeded generator, so every run of a benchmark sees the same data. Each
+    request sleeps for ``latency`` seconds to stand in for the network.
+    """
+
+    def __init__(self, tickers: List[str], seed: int = 0, latency: float = 0.0, days: int = HISTORY_DAYS):
+        self.tickers = list(tickers)
+        self.latency = latency
+        rng = np.random.default_rng(seed)
+        count = len(self.tickers)
+
+        dates = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=days)
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, count)), axis=0)) * rng.uniform(0.2, 20, count)
+        spread = close * rng.uniform(0, 0.03, (days, count))
+        prices = np.stack([close - spread / 2, close + spread, close - spread, close,
+                           rng.integers(10_000, 10_000_000, (days, count)).astype(float)], axis=2)
+        # Columns are (ticker, field) like a ``yf.download(group_by="ticker")`` frame
+        self._prices = pd.DataFrame(prices.reshape(days, count * len(PRICE_COLUMNS)), index=dates,
+                                    columns=pd.MultiIndex.from_product([self.tickers, PRICE_COLUMNS]))
+
+        revenue = rng.uniform(1e8, 1e11, (count, 2))
+        net_income = revenue * rng.uniform(-0.1, 0.3, (count, 2))
+        assets = rng.uniform(1e7, 1e10, count)
+        years = ["2024", "2023"]
+        self.infos = {}
+        self.income_stmts = {}
+        self.balance_sheets = {}
+        self.cash_flows = {}
+        for i, ticker in enumerate(self.tickers):
+            self.infos[ticker] = {
+                "longName": f"{ticker} Holdings Inc",
+                "sector": SECTORS[i % len(SECTORS)],
+                "industry": "Synthetic",
+                "marketCap": int(close[-1, i] * rng.integers(10_000_000, 10_000_000_000)),
+                "trailingPE": float(rng.uniform(5, 60)),
+                "forwardPE": float(rng.uniform(5, 50)),
+                "beta": float(rng.uniform(0.5, 2)),
+                "recommendationKey": "hold",
+                "longBusinessSummary": f"{ticker} is a synthetic company generated for benchmarks. " * 5
+            }
+            self.income_stmts[ticker] = pd.DataFrame([revenue[i], net_income[i]], columns=years,
+                                                     index=["Total Revenue", "Net Income"])
+            self.balance_sheets[ticker] = pd.DataFrame(
+                [[assets[i]], [assets[i] * 0.6], [assets[i] * 0.8], [assets[i] * 0.5]], columns=years[:1],
+                index=["Total Current Assets", "Total Current Liabilities", "Total Debt",
+                       "Total Stockholder Equity"]
+            )
+            self.cash_flows[ticker] = pd.DataFrame([[net_income[i, 0] * 0.8]], columns=years[:1],
+                                                   index=["Free Cash Flow"])
+
+    def wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def Ticker(self, ticker: str) -> SyntheticTicker:
+        return SyntheticTicker(self, ticker)
+
+    def download(self, tickers: List[str], period: Optional[str] = None, start: Optional[str] = None,
+                 **kwargs) -> pd.DataFrame:
+        self.wait()
+        known = [ticker for ticker in tickers if ticker in self.infos]
+        prices = self._prices[known]
+        if start is not None:
+            prices = prices[prices.index >= start]
+        return prices
+
+class LatencyAgent:
+    """
+    Agent that answers after a random latency, like a hosted LLM.
+
+    Latencies are log-normal with the given median, so a few calls are much
+    slower than the rest, as with real providers.
+    """
+
+    def __init__(self, name: str, latency: float, spread: float = 0.5, seed: int = 0):
+        self.name = name
+        self.latency = latency
+        self.spread = spread
+        self._rng = random.Random(f"{name}:{seed}")
+        self._text = (f"{name} response. " * (RESPONSE_CHARS // (len(name) + 11) + 1))[:RESPONSE_CHARS]
+
+    def invoke(self, inputs: Dict[str, Any]) -> Dict[str, str]:
+        if self.latency:
+            time.sleep(self.latency * self._rng.lognormvariate(0, self.spread))
+        return {"text": f"{inputs.get('ticker', '')}: {self._text}"}
+
+def latency_teams(latency: float, spread: float = 0.5, seed: int = 0):
+    """Return an investor team and an analyst team of ``LatencyAgent``, named like the real ones."""
+    investors = {name: LatencyAgent(name, latency, spread, seed) for name in INVESTOR_NAMES}
+    analysts = {name: LatencyAgent(name, latency, spread, seed) for name in ANALYST_NAMES}
+    return investors, analysts
@@ -8,6 +8,8 @@ and manages the debate about stock investment opportunities.
 import os
 import logging
 import sys
+import argparse
+from functools import partial
 from dotenv import load_dotenv
 
 # Add src directory to path for imports
@@ -15,8 +17,22 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from agents.investor_agents import create_investor_team
 from agents.analyst_agents import create_analyst_team
-from agents.debate_manager import DebateManager
-from utils.stock_data import get_stock_data
+from agents.debate_manager import DebateManager, DEFAULT_MAX_WORKERS, EXECUTOR_TYPES
+from agents.response_cache import ResponseCache, DEFAULT_RESPONSE_CACHE_PATH
+from agents.scheduler import AgentScheduler
+from agents.call_policy import CallPolicy
+from utils.stock_data import get_stock_data_batch
+from utils.snapshot import SnapshotTable
+from utils.portfolio import load_portfolio
+from utils.results_writer import ResultsWriter, ARCHIVE_FORMATS
+from utils.results_store import ResultsStore, RESULTS_DB_FILENAME
+from utils.change_detection import (ChangeThresholds, detect_changes, take_snapshot,
+                                    DEFAULT_PRICE_CHANGE_PCT, DEFAULT_MAX_AGE_DAYS)
+from utils.stock_cache import StockDataCache, DEFAULT_CACHE_PATH
+from utils.history_store import PriceHistoryStore, DEFAULT_HISTORY_PATH
+from utils.run_manifest import RunManifest, MANIFEST_FILENAME, input_hash
+from utils.metrics import Metrics
+from utils.progress import create_progress, PROGRESS_SINKS
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -25,21 +41,76 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="FinAgents - multi-agent financial debate system")
+    parser.add_argument("--refresh", action="store_true",
+                        help="ignore cached stock data and fetch everything again")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="do not read or write the on-disk stock data cache")
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH,
+                        help=f"location of the stock data cache (default: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--history-path", default=DEFAULT_HISTORY_PATH,
+                        help=f"location of the local price history (default: {DEFAULT_HISTORY_PATH})")
+    parser.add_argument("--max-in-flight", type=int, default=1,
+                        help="number of stocks debated concurrently; above 1 the debates are pipelined")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"maximum number of agent calls in flight across all stocks (default: {DEFAULT_MAX_WORKERS})")
+    parser.add_argument("--executor", choices=EXECUTOR_TYPES, default="thread",
+                        help="run agent calls on worker threads, or on worker processes for CPU-bound agents")
+    parser.add_argument("--requests-per-minute", type=float,
+                        help="pace agent calls to stay under the LLM provider's request rate limit")
+    parser.add_argument("--tokens-per-minute", type=float,
+                        help="pace agent calls to stay under the LLM provider's token rate limit")
+    parser.add_argument("--agent-timeout", type=float,
+                        help="seconds an agent call may take, including retries, before it is reported as timed out")
+    parser.add_argument("--agent-retries", type=int, default=0,
+                        help="number of times a failed agent call is retried (default: 0)")
+    parser.add_argument("--hedge", action="store_true",
+                        help="send a duplicate of agent calls that run longer than the recent p95 latency")
+    parser.add_argument("--metrics-jsonl",
+                        help="append every timing span and counter to this JSON lines file as the run goes")
+    parser.add_argument("--metrics-prometheus",
+                        help="write timing summaries and counters to this file in Prometheus text format")
+    parser.add_argument("--progress", choices=PROGRESS_SINKS, default="bar",
+                        help="how to report progress: one progress bar, a line per agent call (verbose), "
+                             "JSON lines events or nothing (default: bar)")
+    parser.add_argument("--no-decisions", action="store_true",
+                        help="do not print each stock's final decision and output paths once it completes")
+    parser.add_argument("--archive", choices=ARCHIVE_FORMATS,
+                        help="write every result of the run into one JSON lines or tar file in results/ "
+                             "instead of two Markdown files per stock")
+    parser.add_argument("--no-results-store", action="store_true",
+                        help="do not record positions and investor ratings in results/results.sqlite")
+    parser.add_argument("--delta", action="store_true",
+                        help="only analyze stocks whose data materially changed since their last results "
+                             "and keep the previous results of the others")
+    parser.add_argument("--delta-price-pct", type=float, default=DEFAULT_PRICE_CHANGE_PCT,
+                        help=f"price move in percent that counts as a change with --delta "
+                             f"(default: {DEFAULT_PRICE_CHANGE_PCT})")
+    parser.add_argument("--delta-max-age-days", type=float, default=DEFAULT_MAX_AGE_DAYS,
+                        help=f"analyze stocks again with --delta once their results are this old "
+                             f"(default: {DEFAULT_MAX_AGE_DAYS})")
+    parser.add_argument("--no-response-cache", action="store_true",
+                        help="always invoke the agents instead of reusing responses for unchanged inputs")
+    parser.add_argument("--response-cache-path", default=DEFAULT_RESPONSE_CACHE_PATH,
+                        help=f"location of the agent response cache (default: {DEFAULT_RESPONSE_CACHE_PATH})")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip stocks whose results exist and were produced from the same input data")
+    return parser.parse_args(argv)
+
+def main(args=None):
     """Main function to run the financial agents debate system."""
+    if args is None:
+        args = parse_args([])
     logger.info("Starting FinAgents System")
 
-    # Read stocks from portfolio CSV
-    import pandas as pd
+    # Read stocks from the portfolio export (CSV or Parquet)
     portfolio_path = os.getenv("PORTFOLIO_PATH", os.path.expanduser("~/SourceCode/etorotrade/yahoofinance/output/portfolio.csv"))
 
     try:
-        df = pd.read_csv(portfolio_path)
-        # Filter out ETFs, crypto, and empty rows
-        stocks_df = df[df['BS'] != 'I']
-        stocks_to_analyze = stocks_df['TICKER'].dropna().tolist()
-        # Remove crypto tickers
-        stocks_to_analyze = [s for s in stocks_to_analyze if '-USD' not in s and s.strip() != '']
+        # ETFs, crypto and empty rows are filtered out
+        stocks_to_analyze = load_portfolio(portfolio_path)
 
         print(f"\n{'='*80}")
         print(f"PORTFOLIO ANALYSIS")
@@ -67,62 +138,109 @@ def main():
     logger.info(f"Created analyst team with {len(analyst_team)} analysts")
     
     # Get stock data
-    stock_data = {}
-    for ticker in stocks_to_analyze:
-        stock_data[ticker] = get_stock_data(ticker)
+    cache = None if args.no_cache else StockDataCache(args.cache_path, refresh=args.refresh)
+    history_store = None if args.no_cache else PriceHistoryStore(args.history_path, refresh=args.refresh)
+    # Held column-wise for the rest of the run; each stock's snapshot is built when it is debated
+    stock_data = SnapshotTable(get_stock_data_batch(stocks_to_analyze, cache=cache, history_store=history_store))
     logger.info(f"Retrieved data for {len(stock_data)} stocks")
+    if cache is not None:
+        logger.info(f"Stock data cache stats: {cache.stats()}")
+        cache.close()
+        history_store.close()
     
-    # Create debate manager
-    debate_manager = DebateManager(investor_team, analyst_team)
-    
-    # Run the debate
-    results = debate_manager.run_debate(stocks_to_analyze, stock_data)
+    # Record progress in a manifest so an interrupted run can be resumed
+    output_dir = "results"
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = RunManifest(os.path.join(output_dir, MANIFEST_FILENAME))
+    hashes = {ticker: input_hash(stock_data.get(ticker, {})) for ticker in stocks_to_analyze}
+    if args.resume:
+        remaining = [ticker for ticker in stocks_to_analyze if not manifest.is_complete(ticker, hashes[ticker])]
+        skipped = len(stocks_to_analyze) - len(remaining)
+        if skipped:
+            print(f"Resuming: skipping {skipped} stocks already analyzed from unchanged data")
+        stocks_to_analyze = remaining
+    if args.delta:
+        # Keep the previous results of stocks whose data has not materially changed
+        thresholds = ChangeThresholds(price_change_pct=args.delta_price_pct, max_age_days=args.delta_max_age_days)
+        changes = detect_changes(stocks_to_analyze, stock_data, manifest, thresholds)
+        remaining = [ticker for ticker in stocks_to_analyze if changes[ticker] is not None]
+        skipped = len(stocks_to_analyze) - len(remaining)
+        if skipped:
+            print(f"Delta run: reusing previous results of {skipped} stocks without material changes")
+        stocks_to_analyze = remaining
+    snapshots = {ticker: take_snapshot(stock_data.get(ticker, {})) for ticker in stocks_to_analyze}
+    manifest.mark_pending(stocks_to_analyze, hashes)
     
-    # Print results in a more user-friendly format and save to files
-    for ticker, result in results.items():
+    # Create debate manager and run the debate, saving each stock as soon as it completes
+    response_cache = None if args.no_response_cache else ResponseCache(path=args.response_cache_path)
+    metrics = None
+    if args.metrics_jsonl or args.metrics_prometheus:
+        metrics = Metrics(events_path=args.metrics_jsonl)
+    progress = create_progress(args.progress)
+    scheduler = None
+    if args.requests_per_minute or args.tokens_per_minute:
+        scheduler = AgentScheduler(requests_per_minute=args.requests_per_minute,
+                                   tokens_per_minute=args.tokens_per_minute)
+    # Positions and investor ratings are also recorded in a queryable store
+    results_store = None if args.no_results_store else ResultsStore(os.path.join(output_dir, RESULTS_DB_FILENAME))
+
+    def record_done(ticker, outputs, result, seconds):
+        manifest.mark_done(ticker, hashes[ticker], outputs, snapshot=snapshots[ticker])
+        if results_store is not None:
+            results_store.record(ticker, result, seconds=seconds)
+
+    # Results are written on a background thread; a stock is marked done once its files are on disk
+    with ResultsWriter(output_dir, archive=args.archive) as writer, \
+            DebateManager(investor_team, analyst_team, max_workers=args.workers, response_cache=response_cache,
+                          executor=args.executor, scheduler=scheduler,
+                          call_policy=CallPolicy(args.agent_timeout, args.agent_retries, args.hedge),
+                          metrics=metrics, progress=progress) as debate_manager:
+        for ticker, result in debate_manager.iter_debate(stocks_to_analyze, stock_data,
+                                                         max_in_flight=args.max_in_flight):
+            seconds = debate_manager.ticker_seconds.pop(ticker, None)
+            outputs = writer.submit(ticker, result, on_written=partial(record_done, result=result, seconds=seconds))
+            report_results(ticker, result, outputs, show_decision=not args.no_decisions)
+            # Release the reports once written so memory stays flat
+            del result
+    progress.close()
+    if results_store is not None:
+        results_store.close()
+    if metrics is not None:
+        if args.metrics_prometheus:
+            metrics.write_prometheus(args.metrics_prometheus)
+        metrics.close()
+    if scheduler is not None:
+        logger.info(f"Scheduler stats: {scheduler.stats()}")
+    if response_cache is not None:
+        logger.info(f"Response cache stats: {response_cache.stats()}")
+        response_cache.close()
+
+def report_results(ticker, result, outputs, show_decision=True):
+    """Log a stock's agent timeouts and, with ``show_decision``, print its final decision and output paths."""
+    if show_decision:
+        # Print results in a more user-friendly format
         print("\n" + "="*80)
         print(f"INVESTMENT ANALYSIS FOR {ticker}")
         print("="*80)
-        
+
         print("\nFINAL DECISION:")
         print("-"*50)
         print(result["decision"])
-        
-        # Save the analysis to files
-        output_dir = "results"
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            
-        # Save the final decision
-        with open(f"{output_dir}/{ticker}_decision.md", "w") as f:
-            f.write(f"# Investment Analysis for {ticker}\n\n")
-            f.write(result["decision"])
-            
-        # Save detailed reports
-        with open(f"{output_dir}/{ticker}_detailed_analysis.md", "w") as f:
-            f.write(f"# Detailed Analysis for {ticker}\n\n")
-            
-            f.write("## Analyst Reports\n\n")
-            for analyst, report in result["analyst_reports"].items():
-                f.write(f"### {analyst}\n\n")
-                f.write(report)
-                f.write("\n\n---\n\n")
-            
-            f.write("## Investor Opinions\n\n")
-            for investor, opinion in result["investor_opinions"].items():
-                f.write(f"### {investor}\n\n")
-                f.write(opinion)
-                f.write("\n\n---\n\n")
-                
+
+    for timeout in result.get("timeouts", []):
+        logger.warning(f"{ticker}: {timeout['agent']} timed out after {timeout['seconds']:.1f}s")
+
+    if show_decision:
+        labels = ["Final Decision", "Detailed Reports"] if len(outputs) == 2 else ["Archive"]
         print(f"\nAnalysis saved to:")
-        print(f"  - {output_dir}/{ticker}_decision.md (Final Decision)")
-        print(f"  - {output_dir}/{ticker}_detailed_analysis.md (Detailed Reports)")
-        
-        logger.info(f"Completed analysis for {ticker} and saved to files")
+        for path, label in zip(outputs, labels):
+            print(f"  - {path} ({label})")
+
+    logger.info(f"Completed analysis for {ticker} and saved to files")
 
 if __name__ == "__main__":
     try:
-        main()
+        main(parse_args())
     except KeyboardInterrupt:
         print("\nProgram terminated by user.")
     except Exception as e:
@@ -4,6 +4,9 @@ setup(
     name="finagents",
     version="0.1",
     packages=find_packages(),
+    package_data={
+        "src.local_claude_responses": ["data/*/index.json", "data/*/*.md", "data/*/*/*.md"],
+    },
     install_requires=[
         "langchain>=1.2.15",
         "langchain-core>=1.2.31",
@@ -14,4 +17,7 @@ setup(
         "yfinance>=1.3.0",
         "pydantic>=2.13.1",
     ],
+    extras_require={
+        "parquet": ["pyarrow>=13.0.0"],
+    },
 )
\ No newline at end of file
@@ -8,6 +8,8 @@ about stocks to provide reports for the investor agents to debate.
 from typing import Dict, List, Any
 from langchain_core.prompts import ChatPromptTemplate
 
+from local_claude_responses import get_canned_analyst_report, get_generic_analyst_report
+
 # Analyst types with their focus areas
 ANALYST_TYPES = {
     "Fundamental Analyst": {
@@ -60,26 +62,32 @@ Please provide your specialized analysis for this stock.
         ("human", human_template)
     ])
 
-def create_analyst_agent(analyst_type: str, analyst_data: Dict[str, str]):
-    """Create an agent for a specific analyst type."""
-    # Use local Claude responses instead of API calls
-    from local_claude_responses import ANALYST_REPORTS, get_generic_analyst_report
+class LocalAnalyst:
+    """Analyst agent that answers from the local response library instead of calling an LLM."""
 
-    class LocalAnalyst:
-        def __init__(self, analyst_type):
-            self.analyst_type = analyst_type
+    def __init__(self, analyst_type, prompt=None):
+        self.analyst_type = analyst_type
+        # The prompt an LLM-backed agent would use; part of the response cache key
+        self.prompt = prompt
 
-        def invoke(self, inputs):
-            # Get ticker from inputs
-            ticker = inputs.get('ticker', 'UNKNOWN')
+    def invoke(self, inputs):
+        # Get ticker from inputs
+        ticker = inputs.get('ticker', 'UNKNOWN')
 
-            # Use pre-generated MSFT response or generate generic response
-            if ticker == 'MSFT' and self.analyst_type in ANALYST_REPORTS:
-                return {"text": ANALYST_REPORTS[self.analyst_type]}
-            else:
-                return {"text": get_generic_analyst_report(self.analyst_type, ticker, inputs.get('stock_data', {}))}
+        # Use a pre-generated response for this ticker or generate a generic one
+        report = get_canned_analyst_report(ticker, self.analyst_type)
+        if report is None:
+            report = get_generic_analyst_report(self.analyst_type, ticker, inputs.get('stock_data', {}))
+        return {"text": report}
 
-    return LocalAnalyst(analyst_type)
+    async def ainvoke(self, inputs):
+        # Local responses are generated in-process, so there is nothing to await
+        return self.invoke(inputs)
+
+def create_analyst_agent(analyst_type: str, analyst_data: Dict[str, str]):
+    """Create an agent for a specific analyst type."""
+    # Use local Claude responses instead of API calls
+    return LocalAnalyst(analyst_type, create_analyst_prompt(analyst_type, analyst_data))
 
 def create_analyst_team() -> Dict[str, Any]:
     """Create a team of analyst agents."""
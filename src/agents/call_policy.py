@@ -0,0 +1,233 @@
+"""
+Call Policy Module
+
+This module bounds the latency of agent calls. Each call gets an optional
+deadline, a bounded number of retries with jittered backoff, and optionally a
+hedged duplicate that is sent once the call has taken longer than the recent
+p95 latency. The first attempt to succeed wins. The others are cancelled if
+they have not started, and their results are discarded if they have.
+"""
+
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from utils.metrics import NULL_METRICS
+
+# Recent latencies kept per role to estimate when a call is running late
+LATENCY_WINDOW = 256
+
+# Latencies needed before hedged requests are sent, so early outliers do not trigger them
+MIN_HEDGE_SAMPLES = 20
+
+# A call is hedged once it has run longer than this quantile of recent latencies
+HEDGE_QUANTILE = 0.95
+
+DEFAULT_BASE_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 10.0
+
+class AgentTimeoutError(Exception):
+    """Raised in place of the result of an agent call that missed its deadline."""
+
+    def __init__(self, seconds: float):
+        super().__init__(f"timed out after {seconds:.1f}s")
+        self.seconds = seconds
+
+class CallPolicy:
+    """Deadline, retry and hedging settings shared by the agent calls of a debate."""
+
+    def __init__(self, timeout: Optional[float] = None, max_retries: int = 0, hedge: bool = False,
+                 base_backoff: float = DEFAULT_BASE_BACKOFF, max_backoff: float = DEFAULT_MAX_BACKOFF):
+        """
+        Create the policy.
+
+        Args:
+            timeout: Seconds an agent call may take including its retries, or None for no deadline
+            max_retries: Number of times a failed call is tried again
+            hedge: Send a duplicate of a call that has run longer than the recent p95 latency
+            base_backoff: Upper bound of the jittered pause before the first retry
+            max_backoff: Upper bound of the jittered pause before any retry
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.hedge = hedge
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+    def backoff(self, retry: int) -> float:
+        """Return the pause before the ``retry``-th retry (from one), with full jitter."""
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * 2 ** (retry - 1)))
+
+class LatencyTracker:
+    """Sliding window of successful call latencies."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the ``q`` quantile of recent latencies, or None until enough have been seen."""
+        with self._lock:
+            if len(self._samples) < MIN_HEDGE_SAMPLES:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+class _CallState:
+    """Attempts in flight and the timers of one call in ``run_calls``."""
+
+    def __init__(self, started: float, timeout: Optional[float]):
+        self.deadline = None if timeout is None else started + timeout
+        self.attempts: Dict[Future, float] = {}
+        self.tries = 0
+        self.retry_at: Optional[float] = None
+        self.hedged = False
+
+    def launch(self, future: Future, now: float) -> None:
+        self.attempts[future] = now
+        self.tries += 1
+
+    def abandon(self) -> None:
+        for future in self.attempts:
+            future.cancel()
+
+def run_calls(submit: Callable[[Any], Future], keys: Iterable[Any], policy: CallPolicy,
+              latencies: LatencyTracker, metrics=NULL_METRICS, **labels: Any) -> Dict[Any, Any]:
+    """
+    Run one call per key under the policy, waiting in the calling thread.
+
+    Args:
+        submit: Starts one attempt of the call for a key and returns its future
+        keys: The calls to make
+        policy: Deadline, retry and hedging settings
+        latencies: Recent latencies of calls like these, updated with the new ones
+        metrics: Collector counting retries, hedges, timeouts and failures
+        labels: Labels of those counters
+
+    Returns:
+        The result of each call keyed like ``keys``, or the exception it ended with,
+        which is an ``AgentTimeoutError`` for calls that missed their deadline
+    """
+    hedge_delay = latencies.quantile(HEDGE_QUANTILE) if policy.hedge else None
+    now = time.monotonic()
+    calls = {key: _CallState(now, policy.timeout) for key in keys}
+    outcomes = {}
+    for key, call in calls.items():
+        call.launch(submit(key), now)
+
+    while calls:
+        now = time.monotonic()
+        for key, call in list(calls.items()):
+            finished = [future for future in call.attempts if future.done()]
+            winner = next((future for future in finished if future.exception() is None), None)
+            if winner is not None:
+                latencies.add(now - call.attempts[winner])
+                call.abandon()
+                outcomes[key] = winner.result()
+                del calls[key]
+                continue
+
+            for future in finished:
+                del call.attempts[future]
+                error = future.exception()
+            if finished and not call.attempts:
+                if call.tries > policy.max_retries:
+                    metrics.increment("agent_failures", **labels)
+                    outcomes[key] = error
+                    del calls[key]
+                    continue
+                call.retry_at = now + policy.backoff(call.tries)
+
+            if call.deadline is not None and now >= call.deadline:
+                call.abandon()
+                metrics.increment("agent_timeouts", **labels)
+                outcomes[key] = AgentTimeoutError(policy.timeout)
+                del calls[key]
+            elif call.retry_at is not None and now >= call.retry_at:
+                call.retry_at = None
+                metrics.increment("agent_retries", **labels)
+                call.launch(submit(key), now)
+            elif (hedge_delay is not None and not call.hedged and len(call.attempts) == 1
+                    and now - next(iter(call.attempts.values())) >= hedge_delay):
+                call.hedged = True
+                metrics.increment("agent_hedges", **labels)
+                call.attempts[submit(key)] = now
+
+        # Sleep until an attempt finishes or the next deadline, retry or hedge is due
+        wakeups = []
+        for call in calls.values():
+            wakeups += [t for t in (call.deadline, call.retry_at) if t is not None]
+            if hedge_delay is not None and not call.hedged and len(call.attempts) == 1:
+                wakeups.append(next(iter(call.attempts.values())) + hedge_delay)
+        timeout = max(0.0, min(wakeups) - time.monotonic()) if wakeups else None
+        running = [future for call in calls.values() for future in call.attempts]
+        if running:
+            wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+        elif timeout:
+            time.sleep(timeout)
+    return outcomes
+
+async def arun_call(call: Callable[[], Awaitable[Any]], policy: CallPolicy, latencies: LatencyTracker,
+                    metrics=NULL_METRICS, **labels: Any) -> Any:
+    """
+    Await one call under the policy on the event loop, counting its retries,
+    hedges, timeouts and failures in ``metrics`` under ``labels``.
+
+    Raises:
+        AgentTimeoutError: If the call and its retries missed the deadline
+    """
+    hedge_delay = latencies.quantile(HEDGE_QUANTILE) if policy.hedge else None
+    deadline = None if policy.timeout is None else time.monotonic() + policy.timeout
+    retries = 0
+    while True:
+        attempt = asyncio.ensure_future(_ahedged(call, hedge_delay, latencies, metrics, labels))
+        done, _ = await asyncio.wait({attempt}, timeout=None if deadline is None else deadline - time.monotonic())
+        if not done:
+            attempt.cancel()
+            metrics.increment("agent_timeouts", **labels)
+            raise AgentTimeoutError(policy.timeout)
+        if attempt.exception() is None:
+            return attempt.result()
+        retries += 1
+        if retries > policy.max_retries:
+            metrics.increment("agent_failures", **labels)
+            return attempt.result()
+        pause = policy.backoff(retries)
+        if deadline is not None and time.monotonic() + pause >= deadline:
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+            metrics.increment("agent_timeouts", **labels)
+            raise AgentTimeoutError(policy.timeout)
+        metrics.increment("agent_retries", **labels)
+        await asyncio.sleep(pause)
+
+async def _ahedged(call: Callable[[], Awaitable[Any]], hedge_delay: Optional[float],
+                   latencies: LatencyTracker, metrics, labels: Dict[str, Any]) -> Any:
+    started = {asyncio.ensure_future(call()): time.monotonic()}
+    pending = set(started)
+    try:
+        if hedge_delay is not None:
+            done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+            if not done:
+                metrics.increment("agent_hedges", **labels)
+                hedge = asyncio.ensure_future(call())
+                started[hedge] = time.monotonic()
+                pending.add(hedge)
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    latencies.add(time.monotonic() - started[task])
+                    return task.result()
+            if not pending:
+                return task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -5,12 +5,38 @@ This module orchestrates the debate between investor agents about stock investme
 It coordinates the analysis from analyst agents and facilitates the discussion between investors.
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Dict, List, Any
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 from unittest.mock import MagicMock
 
+from .response_cache import ResponseCache, agent_fingerprint, response_key
+from .scheduler import AgentScheduler, estimate_tokens
+from .prompt_context import PromptContext, build_prompt_context, DEFAULT_STOCK_DATA_TOKENS
+from utils.metrics import NULL_METRICS
+from utils import progress as events
+from .call_policy import CallPolicy, LatencyTracker, AgentTimeoutError, run_calls, arun_call
+
 logger = logging.getLogger(__name__)
 
+# Default cap on agent calls running at the same time across all stocks
+DEFAULT_MAX_WORKERS = 10
+
+# Default cap on agent calls awaited at the same time by the asyncio path
+DEFAULT_MAX_CONCURRENCY = 100
+
+# What each role's responses are called in log messages and failure texts
+RESPONSE_KIND = {"analyst": "report", "investor": "opinion"}
+
+# Where agent invocations run: worker threads, or worker processes for CPU-bound agents
+EXECUTOR_TYPES = ("thread", "process")
+
 class DebateManager:
     """
     Manages the debate between investor agents about stock investment opportunities.
@@ -21,14 +47,145 @@ class DebateManager:
     3. Synthesize the final investment decision
     """
     
-    def __init__(self, investor_team: Dict[str, Any], analyst_team: Dict[str, Any]):
-        """Initialize the debate manager with investor and analyst teams."""
+    def __init__(self, investor_team: Dict[str, Any], analyst_team: Dict[str, Any],
+                 max_workers: int = DEFAULT_MAX_WORKERS, response_cache: Optional[ResponseCache] = None,
+                 executor: str = "thread", scheduler: Optional[AgentScheduler] = None,
+                 call_policy: Optional[CallPolicy] = None, metrics=None, progress=None,
+                 stock_data_tokens: Optional[int] = DEFAULT_STOCK_DATA_TOKENS):
+        """
+        Initialize the debate manager with investor and analyst teams.
+        
+        Args:
+            investor_team: Investor agents keyed by name
+            analyst_team: Analyst agents keyed by name
+            max_workers: Size of the worker pool shared by every agent call, which
+                caps the number of calls in flight across all stocks
+            response_cache: Optional cache of agent responses keyed by agent and inputs
+            executor: ``"thread"`` to invoke agents on the worker pool, or ``"process"`` to
+                invoke them in up to ``max_workers`` worker processes (capped at the
+                number of CPUs) that each load the teams once when they start
+            scheduler: Optional scheduler that paces agent calls under the provider's
+                rate limits; any object with the ``run``, ``arun`` and ``priority``
+                methods of ``AgentScheduler`` can be used
+            call_policy: Per-agent deadline, retries and hedging (default: wait for
+                every call once, without a deadline)
+            metrics: Optional ``utils.metrics.Metrics`` collector for spans of every
+                ticker, phase and agent call and counters of cache hits, retries and
+                failures (default: collect nothing)
+            progress: Reporter from ``utils.progress.create_progress`` that renders the
+                run's progress on its own thread (default: a line per phase and agent
+                call, closed with the manager)
+            stock_data_tokens: Token budget of the stock data in each prompt; the
+                business summary is shortened to fit (None keeps it whole)
+        """
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(f"Unknown executor {executor!r}, expected one of {EXECUTOR_TYPES}")
         self.investor_team = investor_team
         self.analyst_team = analyst_team
+        self.max_workers = max_workers
+        self.response_cache = response_cache
+        self.scheduler = scheduler
+        self.call_policy = call_policy or CallPolicy()
+        self.stock_data_tokens = stock_data_tokens
+        self._metrics = metrics or NULL_METRICS
+        self._owns_progress = progress is None
+        self.progress = events.create_progress("verbose") if progress is None else progress
+        self._latencies = {role: LatencyTracker() for role in RESPONSE_KIND}
+        self._timeouts: Dict[str, List[Dict[str, Any]]] = {}
+        # Wall-clock seconds of each stock's debate, until the caller pops them
+        self.ticker_seconds: Dict[str, float] = {}
+        self._fingerprints: Dict[Tuple[str, str, int], str] = {}
+        self.executor_type = executor
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._process_pool = None
+        self._executor_lock = threading.Lock()
         # Mock LLM and chain for test compatibility (actual logic uses local responses)
         self.llm = MagicMock()
         self.synthesis_chain = MagicMock()
     
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The worker pool shared by all agent calls, created on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="debate-agent")
+            return self._executor
+    
+    @property
+    def process_pool(self):
+        """The worker processes agent calls run in with the process executor, started on first use."""
+        from .process_pool import create_agent_pool
+        
+        with self._executor_lock:
+            if self._process_pool is None:
+                self._process_pool = create_agent_pool(self.investor_team, self.analyst_team,
+                                                       min(self.max_workers, os.cpu_count() or 1))
+            return self._process_pool
+    
+    def close(self) -> None:
+        """Shut down the shared worker pools, waiting for running agent calls to finish."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            process_pool, self._process_pool = self._process_pool, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if process_pool is not None:
+            process_pool.shutdown(wait=True)
+        if self._owns_progress:
+            self.progress.close()
+        else:
+            self.progress.flush()
+    
+    def metrics(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the span summaries and counters collected so far; empty without a collector."""
+        return self._metrics.snapshot()
+    
+    def invoke_agent(self, role: str, name: str, agent: Any, inputs: Dict[str, Any]) -> str:
+        """
+        Invoke an agent and return its text, skipping the call on a response cache hit.
+        
+        With a scheduler the call waits for its turn under the rate limits and is
+        retried after rate-limit errors.
+        """
+        key = self._response_key(role, name, agent, inputs)
+        if key is not None:
+            text = self.response_cache.get(key)
+            if text is not None:
+                self._metrics.increment("response_cache_hits", role=role)
+                return text
+            self._metrics.increment("response_cache_misses", role=role)
+        
+        if self.scheduler is not None:
+            text = self.scheduler.run(lambda: self._call_agent(role, name, agent, inputs),
+                                      self.scheduler.priority(role, inputs.get("ticker")),
+                                      estimate_tokens(inputs))
+        else:
+            text = self._call_agent(role, name, agent, inputs)
+        if key is not None:
+            self.response_cache.put(key, text)
+        return text
+    
+    def _call_agent(self, role: str, name: str, agent: Any, inputs: Dict[str, Any]) -> str:
+        if self.executor_type == "process":
+            from .process_pool import submit_agent_call
+            return submit_agent_call(self.process_pool, role, name, inputs).result()
+        return agent.invoke(inputs)["text"]
+    
+    def _response_key(self, role: str, name: str, agent: Any, inputs: Dict[str, Any]) -> Optional[str]:
+        if self.response_cache is None:
+            return None
+        identity = (role, name, id(agent))
+        fingerprint = self._fingerprints.get(identity)
+        if fingerprint is None:
+            fingerprint = self._fingerprints[identity] = agent_fingerprint(role, name, agent)
+        return response_key(fingerprint, inputs)
+    
+    def __enter__(self) -> "DebateManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def get_market_context(self) -> str:
         """Get the current market context (overall market conditions, economic indicators, etc.)."""
         # In a real implementation, this would pull data from financial APIs or news sources
@@ -45,162 +202,401 @@ Current market indicators:
 - Consumer Sentiment: Slightly positive
 """
     
+    def prompt_context(self, ticker: str, stock_data: Dict[str, Any]) -> PromptContext:
+        """Prepare a ticker's stock data once for all of its agents; see ``build_prompt_context``."""
+        return build_prompt_context(ticker, stock_data, self.stock_data_tokens)
+    
     def get_analyst_reports(self, ticker: str, stock_data: Dict[str, Any]) -> Dict[str, str]:
         """Get reports from all analysts for a specific stock in parallel."""
-        from concurrent.futures import ThreadPoolExecutor
-        import concurrent.futures
-        import time
-        
-        analyst_reports = {}
-        logger.info(f"Starting parallel analysis for {ticker} with {len(self.analyst_team)} analysts")
-        print(f"\nGathering analyst reports for {ticker}...")
-        
-        def get_analyst_report(analyst_data):
-            name, agent = analyst_data
-            start_time = time.time()
-            logger.info(f"Thread started for {name}'s report on {ticker}")
-            print(f"  • Working on {name}'s analysis...")
-            
-            try:
-                # Invoke the analyst agent
-                report = agent.invoke({
-                    "ticker": ticker,
-                    "stock_data": stock_data
-                })
-                elapsed = time.time() - start_time
-                logger.info(f"Received {name}'s report in {elapsed:.2f} seconds")
-                print(f"  ✓ Completed {name}'s analysis ({elapsed:.2f}s)")
-                return name, report["text"]
-            except Exception as e:
-                elapsed = time.time() - start_time
-                logger.error(f"Error getting report from {name} after {elapsed:.2f}s: {e}")
-                print(f"  ✗ Failed to get {name}'s analysis: {str(e)}")
-                return name, f"Unable to generate report due to: {str(e)}"
-        
-        # Use ThreadPoolExecutor to run API calls in parallel
-        start_time = time.time()
-        with ThreadPoolExecutor(max_workers=len(self.analyst_team)) as executor:
-            future_to_analyst = {
-                executor.submit(get_analyst_report, (name, agent)): name 
-                for name, agent in self.analyst_team.items()
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_analyst):
-                try:
-                    name, report = future.result()
-                    analyst_reports[name] = report
-                except Exception as e:
-                    logger.error(f"Thread error: {e}")
-        
-        total_time = time.time() - start_time
-        logger.info(f"Completed all analyst reports for {ticker} in {total_time:.2f} seconds")
-        print(f"All analyst reports completed in {total_time:.2f} seconds\n")
-        
-        return analyst_reports
+        return self._run_phase("analyst", ticker, self.analyst_team, self._analyst_inputs(ticker, stock_data))
     
     def get_investor_opinions(self, ticker: str, stock_data: Dict[str, Any], analyst_reports: Dict[str, str]) -> Dict[str, str]:
         """Get opinions from all investors for a specific stock in parallel."""
-        from concurrent.futures import ThreadPoolExecutor
-        import concurrent.futures
-        import time
-        
-        investor_opinions = {}
-        market_context = self.get_market_context()
-        
+        return self._run_phase("investor", ticker, self.investor_team,
+                               self._investor_inputs(ticker, stock_data, analyst_reports))
+    
+    def _analyst_inputs(self, ticker: str, stock_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "ticker": ticker,
+            "stock_data": self.prompt_context(ticker, stock_data)
+        }
+    
+    def _investor_inputs(self, ticker: str, stock_data: Dict[str, Any],
+                         analyst_reports: Dict[str, str]) -> Dict[str, Any]:
         # Format analyst reports as a string
         analyst_reports_str = "\n\n".join([f"{name}:\n{report}" for name, report in analyst_reports.items()])
+        return {
+            "ticker": ticker,
+            "stock_info": self.prompt_context(ticker, stock_data),
+            "market_context": self.get_market_context(),
+            "analyst_reports": analyst_reports_str
+        }
+    
+    def _run_phase(self, role: str, ticker: str, team: Dict[str, Any], inputs: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Invoke every agent of a team on the shared worker pool under the call policy.
         
-        logger.info(f"Starting parallel investor opinions for {ticker} with {len(self.investor_team)} investors")
-        print(f"\nGathering investor opinions for {ticker}...")
-        
-        def get_investor_opinion(investor_data):
-            name, agent = investor_data
-            start_time = time.time()
-            logger.info(f"Thread started for {name}'s opinion on {ticker}")
-            print(f"  • Working on {name}'s investment analysis...")
-            
-            try:
-                # Invoke the investor agent
-                opinion = agent.invoke({
-                    "ticker": ticker,
-                    "stock_info": stock_data,
-                    "market_context": market_context,
-                    "analyst_reports": analyst_reports_str
-                })
-                elapsed = time.time() - start_time
-                logger.info(f"Received {name}'s opinion in {elapsed:.2f} seconds")
-                print(f"  ✓ Completed {name}'s investment analysis ({elapsed:.2f}s)")
-                return name, opinion["text"]
-            except Exception as e:
-                elapsed = time.time() - start_time
-                logger.error(f"Error getting opinion from {name} after {elapsed:.2f}s: {e}")
-                print(f"  ✗ Failed to get {name}'s opinion: {str(e)}")
-                return name, f"Unable to generate opinion due to: {str(e)}"
+        The calling thread waits for the attempts, so retries and hedged duplicates
+        never wait on the pool from inside it. Failed calls are reported in the text
+        of their response and timeouts are also recorded for the ticker's result.
+        """
+        # Worker threads only queue progress events; formatting and output happen on the reporter's thread
+        def attempt(name, queued_ns):
+            with self._agent_attempt(role, ticker, name, queued_ns):
+                return self.invoke_agent(role, name, team[name], inputs)
         
-        # Use ThreadPoolExecutor to run API calls in parallel
+        with self._phase(role, ticker, team):
+            outcomes = run_calls(lambda name: self.executor.submit(attempt, name, time.perf_counter_ns()), team,
+                                 self.call_policy, self._latencies[role], self._metrics, role=role)
+            return self._settle_outcomes(role, ticker, outcomes)
+    
+    @contextmanager
+    def _phase(self, role: str, ticker: str, team: Dict[str, Any]) -> Iterator[None]:
+        """Report a phase of a ticker's debate, on the sync and asyncio paths alike."""
+        logger.info(f"Starting {role} phase for {ticker} with {len(team)} {role}s")
+        self.progress.emit(events.PHASE_START, ticker, role)
         start_time = time.time()
-        with ThreadPoolExecutor(max_workers=len(self.investor_team)) as executor:
-            future_to_investor = {
-                executor.submit(get_investor_opinion, (name, agent)): name 
-                for name, agent in self.investor_team.items()
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_investor):
-                try:
-                    name, opinion = future.result()
-                    investor_opinions[name] = opinion
-                except Exception as e:
-                    logger.error(f"Thread error: {e}")
-        
+        with self._metrics.span("phase", phase=role):
+            yield
         total_time = time.time() - start_time
-        logger.info(f"Completed all investor opinions for {ticker} in {total_time:.2f} seconds")
-        print(f"All investor opinions completed in {total_time:.2f} seconds\n")
+        logger.info(f"Completed {role} phase for {ticker} in {total_time:.2f} seconds")
+        self.progress.emit(events.PHASE_DONE, ticker, role, value=total_time)
+    
+    @contextmanager
+    def _agent_attempt(self, role: str, ticker: str, name: str, queued_ns: int) -> Iterator[None]:
+        """
+        Report one attempt of an agent call: the time it waited to start, its
+        progress events and its ``agent_call`` span. Retries and hedged
+        duplicates are attempts of their own; a failed attempt is not reported
+        as done.
+        """
+        self._metrics.observe("agent_queue_wait", time.perf_counter_ns() - queued_ns, role=role, agent=name)
+        attempt_start = time.time()
+        self.progress.emit(events.AGENT_START, ticker, role, name)
+        with self._metrics.span("agent_call", role=role, agent=name):
+            yield
+        self.progress.emit(events.AGENT_DONE, ticker, role, name, time.time() - attempt_start)
+    
+    def _settle_outcomes(self, role: str, ticker: str, outcomes: Dict[str, Any]) -> Dict[str, str]:
+        """Replace the calls that ended in an error with its failure text, recording timeouts."""
+        for name, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                if isinstance(outcome, AgentTimeoutError):
+                    self._record_timeout(ticker, role, name, outcome)
+                outcomes[name] = self._report_failure(role, ticker, name, outcome)
+        return outcomes
+    
+    def _report_failure(self, role: str, ticker: str, name: str, error: Exception) -> str:
+        """Log and report a failed agent, returning the text that stands in for its response."""
+        from local_claude_responses import failure_text
         
-        return investor_opinions
+        kind = RESPONSE_KIND[role]
+        logger.error(f"Error getting {kind} from {name} for {ticker}: {error}")
+        self.progress.emit(events.AGENT_FAILED, ticker, role, name, str(error))
+        return failure_text(kind, error)
+    
+    def _record_timeout(self, ticker: str, role: str, name: str, error: AgentTimeoutError) -> None:
+        with self._executor_lock:
+            self._timeouts.setdefault(ticker, []).append({"role": role, "agent": name, "seconds": error.seconds})
+    
+    def _pop_timeouts(self, ticker: str) -> List[Dict[str, Any]]:
+        with self._executor_lock:
+            return self._timeouts.pop(ticker, [])
     
     def synthesize_decision(self, ticker: str, investor_opinions: Dict[str, str]) -> Dict[str, Any]:
         """Synthesize the final investment decision based on investor opinions."""
-        import time
-        from local_claude_responses import SYNTHESIS_DECISION, get_generic_synthesis
+        from local_claude_responses import get_canned_synthesis, get_generic_synthesis
 
-        print(f"\nSynthesizing final investment decision for {ticker}...")
+        self.progress.emit(events.SYNTHESIS_START, ticker)
         start_time = time.time()
         logger.info(f"Starting synthesis for {ticker}")
 
-        # Use pre-generated MSFT synthesis or generate generic
-        if ticker == 'MSFT':
-            result = SYNTHESIS_DECISION
-        else:
-            result = get_generic_synthesis(ticker, investor_opinions)
+        # Use a pre-generated synthesis for this ticker or generate a generic one
+        with self._metrics.span("phase", phase="synthesis"):
+            result = get_canned_synthesis(ticker)
+            if result is None:
+                result = get_generic_synthesis(ticker, investor_opinions)
 
         elapsed = time.time() - start_time
         logger.info(f"Completed synthesis for {ticker} in {elapsed:.2f} seconds")
-        print(f"Decision synthesis completed in {elapsed:.2f} seconds\n")
+        self.progress.emit(events.SYNTHESIS_DONE, ticker, value=elapsed)
 
         return result
     
-    def run_debate(self, tickers: List[str], stock_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Run the full debate process for a list of stocks."""
-        results = {}
+    def debate_ticker(self, ticker: str, stock_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run analysts, investors and synthesis for a single stock."""
+        # Serialized once and shared by every analyst and investor of the ticker
+        stock_data = self.prompt_context(ticker, stock_data)
         
-        for ticker in tickers:
-            logger.info(f"Starting debate for {ticker}")
-            
+        with self._debate(ticker):
             # Get analyst reports
-            analyst_reports = self.get_analyst_reports(ticker, stock_data.get(ticker, {}))
+            analyst_reports = self.get_analyst_reports(ticker, stock_data)
             
             # Get investor opinions
-            investor_opinions = self.get_investor_opinions(ticker, stock_data.get(ticker, {}), analyst_reports)
+            investor_opinions = self.get_investor_opinions(ticker, stock_data, analyst_reports)
             
             # Synthesize final decision
             decision = self.synthesize_decision(ticker, investor_opinions)
+        
+        return self._result(ticker, analyst_reports, investor_opinions, decision)
+    
+    @contextmanager
+    def _debate(self, ticker: str) -> Iterator[None]:
+        """Time and report a ticker's debate, on the sync and asyncio paths alike."""
+        logger.info(f"Starting debate for {ticker}")
+        start_time = time.perf_counter()
+        with self._metrics.span("ticker", ticker=ticker):
+            yield
+        self.ticker_seconds[ticker] = time.perf_counter() - start_time
+        logger.info(f"Completed debate for {ticker}")
+        self.progress.emit(events.TICKER_DONE, ticker)
+    
+    def _result(self, ticker: str, analyst_reports: Dict[str, str], investor_opinions: Dict[str, str],
+                decision: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "analyst_reports": analyst_reports,
+            "investor_opinions": investor_opinions,
+            "decision": decision,
+            "timeouts": self._pop_timeouts(ticker)
+        }
+    
+    def iter_debate(self, tickers: List[str], stock_data: Dict[str, Any],
+                    max_in_flight: int = 1) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Run the debate for many stocks, yielding each result as soon as it is ready.
+        
+        With ``max_in_flight`` of one the stocks are debated one after another and
+        yielded in ticker order. Above one they run as a pipeline: up to
+        ``max_in_flight`` tickers are debated at once, so one ticker's analyst phase
+        overlaps another's investor phase and synthesis, and results are yielded in
+        completion order. The tickers' agent calls all share the manager's worker pool.
+        
+        When every agent is a local one the portfolio is rendered in one pass instead,
+        in ticker order, using up to ``max_in_flight`` worker processes (``max_workers``
+        with the process executor).
+        
+        Args:
+            tickers: The stock ticker symbols to debate
+            stock_data: Stock data keyed by ticker
+            max_in_flight: Maximum number of tickers in progress at the same time
             
-            results[ticker] = {
-                "analyst_reports": analyst_reports,
-                "investor_opinions": investor_opinions,
-                "decision": decision
-            }
+        Yields:
+            ``(ticker, result)`` pairs, each result shaped like a ``run_debate`` entry
+        """
+        from concurrent.futures import wait, FIRST_COMPLETED
+        
+        if hasattr(tickers, "__len__"):
+            self.progress.emit(events.RUN_START, value=len(tickers))
+        
+        if self.uses_local_agents():
+            yield from self._iter_local_debate(tickers, stock_data, max_in_flight)
+            return
+        
+        if max_in_flight <= 1:
+            for ticker in tickers:
+                result = self.debate_ticker(ticker, stock_data.get(ticker, {}))
+                # Render the ticker's progress before the caller reports its result
+                self.progress.flush()
+                yield ticker, result
+            return
+        
+        pending = iter(tickers)
+        in_flight = {}
+        
+        with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="debate-ticker") as executor:
+            def submit_next():
+                ticker = next(pending, None)
+                if ticker is not None:
+                    future = executor.submit(self.debate_ticker, ticker, stock_data.get(ticker, {}))
+                    in_flight[future] = ticker
+            
+            for _ in range(max_in_flight):
+                submit_next()
             
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ticker = in_flight.pop(future)
+                    submit_next()
+                    self.progress.flush()
+                    yield ticker, future.result()
+    
+    def uses_local_agents(self) -> bool:
+        """Return True if every agent answers from the local response library under its own name."""
+        from .analyst_agents import LocalAnalyst
+        from .investor_agents import LocalInvestor
+        
+        return (
+            all(isinstance(agent, LocalAnalyst) and agent.analyst_type == name
+                for name, agent in self.analyst_team.items())
+            and all(isinstance(agent, LocalInvestor) and agent.persona_name == name
+                    for name, agent in self.investor_team.items())
+        )
+    
+    def _iter_local_debate(self, tickers: List[str], stock_data: Dict[str, Any],
+                           max_in_flight: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Render a portfolio of local agents in one pass, in ticker order, instead of invoking each agent.
+        
+        Each rendered document is reported like an agent call: progress events,
+        ``agent_call``, phase and ticker spans and ``ticker_seconds`` come from the
+        render timings. Rendering is pure and local, so it bypasses the response
+        cache, the scheduler and the call policy.
+        """
+        from local_claude_responses import iter_render_portfolio
+        
+        # The process executor renders on as many processes as it would invoke agents on
+        max_workers = self.max_workers if self.executor_type == "process" else max_in_flight
+        max_workers = min(max_workers, os.cpu_count() or 1)
+        logger.info(f"Rendering local responses for {len(tickers)} stocks with {max_workers} processes")
+        
+        for ticker, result in iter_render_portfolio(tickers, stock_data, self.analyst_team, self.investor_team,
+                                                    max_workers=max_workers, timed=True):
+            timings = result.pop("timings_ns")
+            self._report_rendered_phase(ticker, "analyst", result["analyst_reports"], timings["analyst"])
+            self._report_rendered_phase(ticker, "investor", result["investor_opinions"], timings["investor"])
+            self.progress.emit(events.SYNTHESIS_START, ticker)
+            self._metrics.observe("phase", timings["synthesis"], phase="synthesis")
+            self.progress.emit(events.SYNTHESIS_DONE, ticker, value=timings["synthesis"] / 1e9)
+            self._metrics.observe("ticker", timings["ticker"], ticker=ticker)
+            self.ticker_seconds[ticker] = timings["ticker"] / 1e9
+            result["timeouts"] = []
+            self._metrics.increment("tickers_rendered")
+            self.progress.emit(events.TICKER_DONE, ticker)
             logger.info(f"Completed debate for {ticker}")
+            yield ticker, result
+    
+    def _report_rendered_phase(self, ticker: str, role: str, documents: Dict[str, Any],
+                               timings: Dict[str, int]) -> None:
+        """Report rendered documents like the phase's agent calls and replace failures with their text."""
+        self.progress.emit(events.PHASE_START, ticker, role)
+        for name, document in documents.items():
+            self.progress.emit(events.AGENT_START, ticker, role, name)
+            self._metrics.observe("agent_call", timings[name], role=role, agent=name)
+            if isinstance(document, Exception):
+                self._metrics.increment("agent_failures", role=role)
+                documents[name] = self._report_failure(role, ticker, name, document)
+            else:
+                self.progress.emit(events.AGENT_DONE, ticker, role, name, timings[name] / 1e9)
+        phase_ns = sum(timings.values())
+        self._metrics.observe("phase", phase_ns, phase=role)
+        self.progress.emit(events.PHASE_DONE, ticker, role, value=phase_ns / 1e9)
+    
+    async def ainvoke_agent(self, role: str, name: str, agent: Any, inputs: Dict[str, Any]) -> str:
+        """
+        Invoke an agent from the event loop and return its text.
+        
+        Agents with a native ``ainvoke`` coroutine are awaited directly; blocking
+        agents are run on the shared worker pool, or in the worker processes with
+        the process executor. Response cache hits skip the call, and calls wait for
+        the scheduler if one is set.
+        """
+        key = self._response_key(role, name, agent, inputs)
+        if key is not None:
+            text = self.response_cache.get(key)
+            if text is not None:
+                self._metrics.increment("response_cache_hits", role=role)
+                return text
+            self._metrics.increment("response_cache_misses", role=role)
+        
+        if self.scheduler is not None:
+            text = await self.scheduler.arun(lambda: self._acall_agent(role, name, agent, inputs),
+                                             self.scheduler.priority(role, inputs.get("ticker")),
+                                             estimate_tokens(inputs))
+        else:
+            text = await self._acall_agent(role, name, agent, inputs)
+        
+        if key is not None:
+            self.response_cache.put(key, text)
+        return text
+    
+    async def _acall_agent(self, role: str, name: str, agent: Any, inputs: Dict[str, Any]) -> str:
+        ainvoke = getattr(agent, "ainvoke", None)
+        if self.executor_type == "process":
+            from .process_pool import submit_agent_call
+            return await asyncio.wrap_future(submit_agent_call(self.process_pool, role, name, inputs))
+        if ainvoke is not None and inspect.iscoroutinefunction(ainvoke):
+            return (await ainvoke(inputs))["text"]
+        loop = asyncio.get_running_loop()
+        return (await loop.run_in_executor(self.executor, agent.invoke, inputs))["text"]
+    
+    async def aget_analyst_reports(self, ticker: str, stock_data: Dict[str, Any],
+                                   semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, str]:
+        """Get reports from all analysts for a specific stock concurrently on the event loop."""
+        return await self._arun_phase("analyst", ticker, self.analyst_team,
+                                      self._analyst_inputs(ticker, stock_data), semaphore)
+    
+    async def aget_investor_opinions(self, ticker: str, stock_data: Dict[str, Any], analyst_reports: Dict[str, str],
+                                     semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, str]:
+        """Get opinions from all investors for a specific stock concurrently on the event loop."""
+        return await self._arun_phase("investor", ticker, self.investor_team,
+                                      self._investor_inputs(ticker, stock_data, analyst_reports), semaphore)
+    
+    async def _arun_phase(self, role: str, ticker: str, team: Dict[str, Any], inputs: Dict[str, Any],
+                          semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, str]:
+        """
+        Await every agent of a team under the call policy, like ``_run_phase``.
+        
+        Each attempt holds a slot of ``semaphore`` while it runs, so calls waiting
+        to be retried do not keep others from starting.
+        """
+        semaphore = semaphore or asyncio.Semaphore(DEFAULT_MAX_CONCURRENCY)
+        
+        async def attempt(name, queued_ns):
+            async with semaphore:
+                with self._agent_attempt(role, ticker, name, queued_ns):
+                    return await self.ainvoke_agent(role, name, team[name], inputs)
+        
+        async def call(name):
+            try:
+                return await arun_call(lambda: attempt(name, time.perf_counter_ns()), self.call_policy,
+                                       self._latencies[role], self._metrics, role=role)
+            except Exception as e:
+                return e
+        
+        with self._phase(role, ticker, team):
+            outcomes = await asyncio.gather(*(call(name) for name in team))
+            return self._settle_outcomes(role, ticker, dict(zip(team, outcomes)))
+    
+    async def arun_debate(self, tickers: List[str], stock_data: Dict[str, Any],
+                          max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                          max_in_flight: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run the full debate process for a list of stocks on a single event loop.
+        
+        Args:
+            tickers: The stock ticker symbols to debate
+            stock_data: Stock data keyed by ticker
+            max_concurrency: Maximum number of agent calls awaited at once across all stocks
+            max_in_flight: Maximum number of stocks in progress at once (default: all)
+            
+        Returns:
+            Results keyed by ticker, shaped like ``run_debate``
+        """
+        tickers = list(dict.fromkeys(tickers))
+        agent_semaphore = asyncio.Semaphore(max_concurrency)
+        ticker_semaphore = asyncio.Semaphore(max_in_flight or max(1, len(tickers)))
+        
+        async def debate(ticker):
+            async with ticker_semaphore:
+                data = self.prompt_context(ticker, stock_data.get(ticker, {}))
+                with self._debate(ticker):
+                    analyst_reports = await self.aget_analyst_reports(ticker, data, agent_semaphore)
+                    investor_opinions = await self.aget_investor_opinions(ticker, data, analyst_reports, agent_semaphore)
+                    decision = self.synthesize_decision(ticker, investor_opinions)
+                return ticker, self._result(ticker, analyst_reports, investor_opinions, decision)
+        
+        self.progress.emit(events.RUN_START, value=len(tickers))
+        results = dict(await asyncio.gather(*(debate(ticker) for ticker in tickers)))
+        self.progress.flush()
+        return results
+    
+    def run_debate(self, tickers: List[str], stock_data: Dict[str, Any], max_in_flight: int = 1) -> Dict[str, Any]:
+        """
+        Run the full debate process for a list of stocks and collect every result.
         
-        return results
\ No newline at end of file
+        With ``max_in_flight`` above one the stocks are pipelined through ``iter_debate``
+        and the results are ordered by completion rather than by ticker. Use
+        ``iter_debate`` directly to handle each result without holding them all.
+        """
+        return dict(self.iter_debate(tickers, stock_data, max_in_flight))
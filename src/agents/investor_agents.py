@@ -8,6 +8,8 @@ Each investor has a distinct investment philosophy and methodology based on thei
 from typing import List, Dict, Any
 from langchain_core.prompts import ChatPromptTemplate
 
+from local_claude_responses import get_canned_investor_opinion, get_generic_investor_opinion
+
 # Investor personas with their investment philosophies
 INVESTOR_PERSONAS = {
     "Warren Buffett": {
@@ -91,27 +93,33 @@ Based on this information, would you invest in this stock? Provide your reasonin
         ("human", human_template)
     ])
 
-def create_investor_agent(persona_name: str, persona_data: Dict[str, Any], tools: List[Any] = None):
-    """Create an agent for a specific investor persona."""
-    # Use local Claude responses instead of API calls
-    from local_claude_responses import INVESTOR_OPINIONS, get_generic_investor_opinion
+class LocalInvestor:
+    """Investor agent that answers from the local response library instead of calling an LLM."""
 
-    class LocalInvestor:
-        def __init__(self, persona_name):
-            self.persona_name = persona_name
+    def __init__(self, persona_name, prompt=None):
+        self.persona_name = persona_name
+        # The prompt an LLM-backed agent would use; part of the response cache key
+        self.prompt = prompt
 
-        def invoke(self, inputs):
-            # Get ticker from inputs
-            ticker = inputs.get('ticker', 'UNKNOWN')
-            stock_info = inputs.get('stock_info', {})
+    def invoke(self, inputs):
+        # Get ticker from inputs
+        ticker = inputs.get('ticker', 'UNKNOWN')
+        stock_info = inputs.get('stock_info', {})
 
-            # Use pre-generated MSFT response or generate generic response
-            if ticker == 'MSFT' and self.persona_name in INVESTOR_OPINIONS:
-                return {"text": INVESTOR_OPINIONS[self.persona_name]}
-            else:
-                return {"text": get_generic_investor_opinion(self.persona_name, ticker, stock_info)}
+        # Use a pre-generated response for this ticker or generate a generic one
+        opinion = get_canned_investor_opinion(ticker, self.persona_name)
+        if opinion is None:
+            opinion = get_generic_investor_opinion(self.persona_name, ticker, stock_info)
+        return {"text": opinion}
 
-    return LocalInvestor(persona_name)
+    async def ainvoke(self, inputs):
+        # Local responses are generated in-process, so there is nothing to await
+        return self.invoke(inputs)
+
+def create_investor_agent(persona_name: str, persona_data: Dict[str, Any], tools: List[Any] = None):
+    """Create an agent for a specific investor persona."""
+    # Use local Claude responses instead of API calls
+    return LocalInvestor(persona_name, create_investor_prompt(persona_name, persona_data))
 
 def create_investor_team() -> Dict[str, Any]:
     """Create a team of investor agents based on famous personas."""
@@ -0,0 +1,77 @@
+"""
+Process Pool Module
+
+This module runs agent invocations in worker processes, so CPU-bound agents are
+not serialized by the GIL. Each worker is given the analyst and investor teams
+once, when it starts, and is then sent only the role and name of the agent to
+invoke and its inputs reduced to plain Python values.
+"""
+
+import os
+import logging
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# The teams of the current worker process, set by the pool initializer
+_worker_teams: Optional[Dict[str, Dict[str, Any]]] = None
+
+def compact_payload(value: Any) -> Any:
+    """
+    Reduce a payload to plain Python containers and scalars before it is pickled.
+
+    NumPy scalars become Python numbers and pandas objects become dicts, which
+    pickle to a fraction of the size and load without reconstructing objects.
+    """
+    if isinstance(value, dict):
+        return {key: compact_payload(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [compact_payload(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.DataFrame):
+        return compact_payload(value.to_dict(orient="split"))
+    if isinstance(value, pd.Series):
+        return compact_payload(value.to_dict())
+    return value
+
+def _init_worker(teams: Dict[str, Dict[str, Any]]) -> None:
+    global _worker_teams
+    _worker_teams = teams
+    # Load the report templates now rather than on the worker's first task
+    importlib.import_module("local_claude_responses")
+    logger.debug(f"Agent worker {os.getpid()} ready with {sum(len(team) for team in teams.values())} agents")
+
+def _invoke_in_worker(role: str, name: str, inputs: Dict[str, Any]) -> str:
+    return _worker_teams[role][name].invoke(inputs)["text"]
+
+def create_agent_pool(investor_team: Dict[str, Any], analyst_team: Dict[str, Any],
+                      max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Start a process pool whose workers each hold a copy of the teams.
+
+    The teams are copied when a worker starts, so agents added to a team later
+    are not seen by the pool.
+
+    Args:
+        investor_team: Investor agents keyed by name
+        analyst_team: Analyst agents keyed by name
+        max_workers: Number of worker processes (default: the number of CPUs)
+
+    Returns:
+        A pool to pass to ``submit_agent_call``
+    """
+    teams = {"analyst": analyst_team, "investor": investor_team}
+    return ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                               initializer=_init_worker, initargs=(teams,))
+
+def submit_agent_call(pool: ProcessPoolExecutor, role: str, name: str, inputs: Dict[str, Any]):
+    """Invoke an agent of the pool's teams in a worker, returning a future of its text."""
+    return pool.submit(_invoke_in_worker, role, name, compact_payload(inputs))
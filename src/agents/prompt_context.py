@@ -0,0 +1,136 @@
+"""
+Prompt Context Module
+
+This module prepares the stock data every agent of a ticker is given. The data
+is canonicalized, serialized to compact ``key: value`` lines and trimmed to a
+token budget once per ticker, and the frozen result is shared by all of the
+ticker's analysts and investors: prompts print the prepared text, local agents
+read the fields as before, and the response cache keys on its digest instead
+of hashing the data again for every agent.
+"""
+
+import math
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+from utils.hashing import canonicalize, stable_hash
+from .scheduler import CHARS_PER_TOKEN
+
+# Tokens the stock data may take in a prompt; the business summary is shortened to fit
+DEFAULT_STOCK_DATA_TOKENS = 400
+
+# Shortened at the end of the text, as it is the only free-form field
+SUMMARY_FIELD = "business_summary"
+
+# Significant digits of numbers in the prompt text
+PROMPT_DIGITS = 6
+
+# How ``canonicalize`` spells NaN and infinities, which are left out of prompts like missing values
+NON_FINITE = frozenset({repr(math.nan), repr(math.inf), repr(-math.inf)})
+
+def _format_value(value: Any) -> Optional[str]:
+    """Format a canonicalized value for the prompt, or None to leave the field out."""
+    if value is None or value == "" or (isinstance(value, str) and value in NON_FINITE):
+        return None
+    if isinstance(value, float):
+        return f"{value:.{PROMPT_DIGITS}g}"
+    return str(value).strip() or None
+
+def _shorten(text: str, max_chars: int) -> str:
+    """Cut text to at most ``max_chars`` characters at a word boundary."""
+    if len(text) <= max_chars:
+        return text
+    if max_chars < 4:
+        return ""
+    cut = text[:max_chars - 3]
+    if " " in cut:
+        cut = cut[:cut.rindex(" ")]
+    return cut.rstrip(" ,.;:") + "..."
+
+def serialize_stock_data(canonical: Dict[str, Any], max_tokens: Optional[int] = DEFAULT_STOCK_DATA_TOKENS) -> str:
+    """
+    Serialize canonicalized stock data to one ``key: value`` line per field.
+
+    Missing, blank and non-finite values are left out and numbers keep
+    ``PROMPT_DIGITS`` significant digits. With a ``max_tokens`` budget the
+    business summary is shortened, or dropped, so the text fits it.
+    """
+    lines = []
+    for key, value in canonical.items():
+        if key == SUMMARY_FIELD:
+            continue
+        text = _format_value(value)
+        if text is not None:
+            lines.append(f"{key}: {text}")
+
+    summary = _format_value(canonical.get(SUMMARY_FIELD))
+    if summary is not None:
+        if max_tokens is not None:
+            used = sum(len(line) + 1 for line in lines) + len(SUMMARY_FIELD) + 2
+            summary = _shorten(summary, max_tokens * CHARS_PER_TOKEN - used)
+        if summary:
+            lines.append(f"{SUMMARY_FIELD}: {summary}")
+    return "\n".join(lines)
+
+class PromptContext(Mapping):
+    """
+    A ticker's stock data prepared once for every agent prompt.
+
+    Reads like the stock data it was built from, so agents that look fields up
+    are unaffected, while ``str()`` returns the compact prompt text. ``digest``
+    identifies the full data and the token budget the text was trimmed to, and
+    stands in for both in response cache keys.
+    """
+
+    __slots__ = ("ticker", "data", "text", "digest")
+
+    def __init__(self, ticker: str, data: Mapping, text: str, digest: str):
+        object.__setattr__(self, "ticker", ticker)
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "digest", digest)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PromptContext is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"PromptContext({self.ticker!r}, digest={self.digest[:12]!r})"
+
+    def __reduce__(self):
+        # Worker processes get the data as plain values, like every other payload
+        from .process_pool import compact_payload
+        return (PromptContext, (self.ticker, compact_payload(dict(self.data)), self.text, self.digest))
+
+def build_prompt_context(ticker: str, stock_data: Mapping,
+                         max_tokens: Optional[int] = DEFAULT_STOCK_DATA_TOKENS) -> PromptContext:
+    """
+    Prepare a ticker's stock data for its agents' prompts.
+
+    Args:
+        ticker: The stock ticker symbol
+        stock_data: The ticker's stock data; a ``PromptContext`` is returned as it is
+        max_tokens: Token budget of the prompt text, or None to keep the full summary
+
+    Returns:
+        The frozen context to pass to every agent of the ticker
+    """
+    if isinstance(stock_data, PromptContext):
+        return stock_data
+    canonical = canonicalize(dict(stock_data))
+    # Keep the fields in the order of the stock data rather than the sorted canonical order
+    ordered = {key: canonical[str(key)] for key in stock_data}
+    # The budget changes the prompt text, so responses to other budgets are not reused
+    return PromptContext(ticker, stock_data, serialize_stock_data(ordered, max_tokens),
+                         stable_hash(canonical, max_tokens))
@@ -0,0 +1,166 @@
+"""
+Response Cache Module
+
+This module memoizes analyst and investor responses by content. A response is
+keyed on the agent's identity, its prompt template and the canonicalized inputs,
+so re-running a portfolio whose data has not changed skips the agent call.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict, Counter
+from typing import Dict, Any, Optional
+
+from utils.hashing import stable_hash
+from .prompt_context import PromptContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESPONSE_CACHE_PATH = os.path.join(os.getenv("FINAGENTS_CACHE_DIR", ".finagents_cache"), "responses.sqlite")
+
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+
+def agent_fingerprint(role: str, name: str, agent: Any) -> str:
+    """Identify an agent by its role, name, implementation and prompt template."""
+    prompt = getattr(agent, "prompt", None)
+    if prompt is None:
+        prompt_text = ""
+    elif hasattr(prompt, "pretty_repr"):
+        prompt_text = prompt.pretty_repr()
+    else:
+        prompt_text = repr(prompt)
+    agent_type = type(agent)
+    return stable_hash(role, name, f"{agent_type.__module__}.{agent_type.__qualname__}", prompt_text)
+
+def response_key(fingerprint: str, inputs: Dict[str, Any]) -> str:
+    """
+    Return the cache key for an agent fingerprint and its canonicalized inputs.
+
+    A ``PromptContext`` input counts by its digest, so the shared stock data is
+    not canonicalized again for every agent.
+    """
+    return stable_hash(fingerprint, {
+        name: value.digest if isinstance(value, PromptContext) else value for name, value in inputs.items()
+    })
+
+class ResponseCache:
+    """
+    Two-level response cache: an in-memory LRU bounded by size, backed by an
+    optional SQLite store that is also evicted least-recently-used by size.
+    """
+
+    def __init__(self, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES, path: Optional[str] = None,
+                 max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        """
+        Create the cache.
+
+        Args:
+            max_memory_bytes: Total size of responses kept in memory
+            path: Location of the SQLite store, or None to keep responses in memory only
+            max_disk_bytes: Total size of responses kept on disk
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.path = path
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_bytes = 0
+        self._counters = Counter()
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, text TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None."""
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return text
+
+            if self._conn is not None:
+                row = self._conn.execute("SELECT text FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+                    self._conn.commit()
+                    self._remember(key, row[0])
+                    self._counters["disk_hits"] += 1
+                    return row[0]
+
+            self._counters["misses"] += 1
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        """Store a response in memory and, if configured, on disk."""
+        with self._lock:
+            self._remember(key, text)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, text, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, text, _size(text), time.time())
+                )
+                self._evict_disk()
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current in-memory size."""
+        with self._lock:
+            return {
+                "memory_hits": self._counters["memory_hits"],
+                "disk_hits": self._counters["disk_hits"],
+                "misses": self._counters["misses"],
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+    def close(self) -> None:
+        """Close the SQLite store, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, text: str) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= _size(previous)
+        size = _size(text)
+        if size > self.max_memory_bytes:
+            return
+        self._memory[key] = text
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= _size(evicted)
+
+    def _evict_disk(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        freed = 0
+        evict = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if total - freed <= self.max_disk_bytes:
+                break
+            evict.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+        logger.debug(f"Evicted {len(evict)} cached responses ({freed} bytes)")
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
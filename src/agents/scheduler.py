@@ -0,0 +1,283 @@
+"""
+Scheduler Module
+
+This module paces agent calls against an LLM provider's rate limits. Calls wait
+in a priority queue and are released when the request and token budgets allow.
+A rate-limit error pauses dispatch and halves the allowed rate. The rate then
+recovers step by step as calls succeed.
+"""
+
+import time
+import heapq
+import random
+import asyncio
+import logging
+import itertools
+import threading
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Within a ticker, analyst reports feed the investor phase, so they are dispatched first
+ROLE_PRIORITY = {"analyst": 0, "investor": 1}
+
+# Rough size of a token in characters, used to estimate the tokens of a call
+CHARS_PER_TOKEN = 4
+
+# Seconds of traffic the buckets let through in a burst
+DEFAULT_BURST_SECONDS = 5.0
+
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BASE_BACKOFF = 1.0
+DEFAULT_MAX_BACKOFF = 60.0
+
+# Lowest fraction of the configured rates the scheduler backs off to, and the fraction
+# recovered after each successful call
+MIN_RATE_SCALE = 0.05
+RATE_RECOVERY_STEP = 0.05
+
+# How often a queued coroutine checks whether it may go
+ASYNC_POLL_INTERVAL = 0.05
+
+def estimate_tokens(value: Any) -> int:
+    """Estimate the number of tokens of a prompt or response from its length."""
+    if isinstance(value, dict):
+        size = sum(len(str(item)) for item in value.values())
+    else:
+        size = len(str(value))
+    return size // CHARS_PER_TOKEN + 1
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Return True if an exception is a provider's HTTP 429 response."""
+    return getattr(error, "status_code", None) == 429 or getattr(error, "code", None) == 429
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Return the delay a rate-limit error asks for in its Retry-After header, if any."""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a rate per minute.
+
+    Calls larger than the bucket are let through once it is full, leaving it in
+    debt, so a single oversized call cannot stall the queue forever.
+    """
+
+    def __init__(self, per_minute: float, burst_seconds: float = DEFAULT_BURST_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.per_minute = per_minute
+        self.burst_seconds = burst_seconds
+        self.clock = clock
+        self.level = self.capacity
+        self._updated = clock()
+
+    @property
+    def capacity(self) -> float:
+        return max(1.0, self.per_minute / 60.0 * self.burst_seconds)
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.per_minute / 60.0)
+        self._updated = now
+
+    def delay(self, amount: float) -> float:
+        """Return the seconds until ``amount`` can be taken, or 0 if it can be taken now."""
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing * 60.0 / self.per_minute)
+
+    def take(self, amount: float) -> None:
+        """Take ``amount`` from the bucket, which may leave it in debt."""
+        self._refill()
+        self.level -= amount
+
+    def set_rate(self, per_minute: float) -> None:
+        """Change the refill rate, keeping what has accumulated so far."""
+        self._refill()
+        self.per_minute = per_minute
+        self.level = min(self.level, self.capacity)
+
+class AgentScheduler:
+    """
+    Priority scheduler for agent calls with request and token rate limits.
+
+    Calls are dispatched in priority order: tickers in the order they were first
+    seen, so tickers already under way finish before new ones start, then a
+    ticker's analysts before its investors. Rate-limit errors are retried after a backoff and shrink
+    the rates multiplicatively; every success grows them back additively.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES, base_backoff: float = DEFAULT_BASE_BACKOFF,
+                 max_backoff: float = DEFAULT_MAX_BACKOFF, burst_seconds: float = DEFAULT_BURST_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Create the scheduler.
+
+        Args:
+            requests_per_minute: Sustained request rate, or None for no request limit
+            tokens_per_minute: Sustained prompt and response token rate, or None for no token limit
+            max_retries: Number of times a rate-limited call is retried before its error is raised
+            base_backoff: Pause after the first rate-limit error when the provider gives no Retry-After
+            max_backoff: Longest pause after repeated rate-limit errors
+            burst_seconds: Seconds of traffic at the full rate allowed in a burst
+            clock: Monotonic clock in seconds
+        """
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self._limits = {"requests": requests_per_minute, "tokens": tokens_per_minute}
+        self._buckets = {
+            kind: TokenBucket(limit, burst_seconds, clock)
+            for kind, limit in self._limits.items() if limit
+        }
+        self._scale = 1.0
+        self._paused_until = 0.0
+        self._queue = []
+        self._sequence = itertools.count()
+        self._ticker_order: Dict[str, int] = {}
+        self._counters = Counter()
+        self._condition = threading.Condition()
+
+    def priority(self, role: str, ticker: str) -> Tuple[int, int]:
+        """Return the dispatch priority of an agent call; lower values go first."""
+        with self._condition:
+            order = self._ticker_order.setdefault(ticker, len(self._ticker_order))
+        return order, ROLE_PRIORITY.get(role, len(ROLE_PRIORITY))
+
+    def acquire(self, priority: Any = 0, tokens: int = 0) -> None:
+        """Block until a call of the given priority and estimated tokens may be sent."""
+        ticket = self._enqueue(priority)
+        try:
+            with self._condition:
+                while True:
+                    wait = self._try_dispatch(ticket, tokens)
+                    if wait == 0:
+                        return
+                    self._condition.wait(wait)
+        except BaseException:
+            self._dequeue(ticket)
+            raise
+
+    async def aacquire(self, priority: Any = 0, tokens: int = 0) -> None:
+        """Wait on the event loop until a call of the given priority and estimated tokens may be sent."""
+        ticket = self._enqueue(priority)
+        try:
+            while True:
+                with self._condition:
+                    wait = self._try_dispatch(ticket, tokens)
+                if wait == 0:
+                    return
+                await asyncio.sleep(ASYNC_POLL_INTERVAL if wait is None else min(wait, ASYNC_POLL_INTERVAL))
+        except BaseException:
+            self._dequeue(ticket)
+            raise
+
+    def record_success(self, response_tokens: int = 0) -> None:
+        """Charge a completed call's response tokens and recover part of the backed-off rate."""
+        with self._condition:
+            self._counters["succeeded"] += 1
+            if "tokens" in self._buckets:
+                self._buckets["tokens"].take(response_tokens)
+            if self._scale < 1.0:
+                self._set_scale(self._scale + RATE_RECOVERY_STEP)
+
+    def record_rate_limit(self, attempt: int, delay: Optional[float] = None) -> float:
+        """
+        Back off after a rate-limit error on a call's ``attempt``-th try (from zero).
+
+        Returns:
+            The pause in seconds before any further call is sent
+        """
+        if delay is None:
+            backoff = min(self.max_backoff, self.base_backoff * 2 ** attempt)
+            # Full jitter spreads out the retries of calls that were rejected together
+            delay = random.uniform(backoff / 2, backoff)
+        with self._condition:
+            self._counters["rate_limited"] += 1
+            self._set_scale(max(MIN_RATE_SCALE, self._scale / 2))
+            self._paused_until = max(self._paused_until, self.clock() + delay)
+            self._condition.notify_all()
+        logger.warning(f"Rate limited by the provider, pausing {delay:.2f}s at {self._scale:.0%} of the configured rate")
+        return delay
+
+    def run(self, call: Callable[[], str], priority: Any = 0, tokens: int = 0) -> str:
+        """Send a call when the scheduler allows it, retrying it after rate-limit errors."""
+        for attempt in itertools.count():
+            self.acquire(priority, tokens)
+            try:
+                text = call()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                self.record_rate_limit(attempt, retry_after(e))
+                continue
+            self.record_success(estimate_tokens(text))
+            return text
+
+    async def arun(self, call: Callable[[], Awaitable[str]], priority: Any = 0, tokens: int = 0) -> str:
+        """Await a call when the scheduler allows it, retrying it after rate-limit errors."""
+        for attempt in itertools.count():
+            await self.aacquire(priority, tokens)
+            try:
+                text = await call()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                self.record_rate_limit(attempt, retry_after(e))
+                continue
+            self.record_success(estimate_tokens(text))
+            return text
+
+    def stats(self) -> Dict[str, Any]:
+        """Return dispatch counters, the queue length and the current fraction of the configured rates."""
+        with self._condition:
+            return {**self._counters, "queued": len(self._queue), "rate_scale": self._scale}
+
+    def _enqueue(self, priority: Any) -> list:
+        ticket = [priority, next(self._sequence)]
+        with self._condition:
+            heapq.heappush(self._queue, ticket)
+        return ticket
+
+    def _dequeue(self, ticket: list) -> None:
+        with self._condition:
+            if ticket in self._queue:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                self._condition.notify_all()
+
+    def _try_dispatch(self, ticket: list, tokens: int) -> Optional[float]:
+        # Called with the condition held. Returns 0 once the call is dispatched, the seconds
+        # to wait while it is first in line, or None while other calls are ahead of it
+        if self._queue[0] is not ticket:
+            return None
+        wait = self._paused_until - self.clock()
+        if "requests" in self._buckets:
+            wait = max(wait, self._buckets["requests"].delay(1))
+        if "tokens" in self._buckets:
+            wait = max(wait, self._buckets["tokens"].delay(tokens))
+        if wait > 0:
+            return wait
+
+        heapq.heappop(self._queue)
+        if "requests" in self._buckets:
+            self._buckets["requests"].take(1)
+        if "tokens" in self._buckets:
+            self._buckets["tokens"].take(tokens)
+        self._counters["dispatched"] += 1
+        self._condition.notify_all()
+        return 0
+
+    def _set_scale(self, scale: float) -> None:
+        self._scale = min(1.0, scale)
+        for kind, bucket in self._buckets.items():
+            bucket.set_rate(self._limits[kind] * self._scale)
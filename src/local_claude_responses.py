@@ -1,1556 +0,0 @@
-"""
-Pre-generated responses from Claude for the FinAgents system.
-This allows the system to run without making external API calls.
-"""
-
-def get_generic_analyst_report(analyst_type, ticker, stock_data):
-    """Generate a detailed analyst report for any stock based on actual data."""
-    company = stock_data.get('company_name', ticker)
-    sector = stock_data.get('sector', 'Unknown')
-    industry = stock_data.get('industry', 'Unknown')
-    price = stock_data.get('current_price', 0)
-    pe = stock_data.get('pe_ratio', 0)
-    forward_pe = stock_data.get('forward_pe', 0)
-    market_cap = stock_data.get('market_cap', 0)
-    dividend_yield = stock_data.get('dividend_yield', 0) * 100
-    beta = stock_data.get('beta', 0)
-    eps = stock_data.get('eps', 0)
-    revenue_growth = stock_data.get('revenue_growth', 0)
-    profit_margin = stock_data.get('profit_margin', 0)
-    roe = stock_data.get('return_on_equity', 0)
-    debt_to_equity = stock_data.get('debt_to_equity', 0)
-    year_high = stock_data.get('52w_high', 0)
-    year_low = stock_data.get('52w_low', 0)
-    year_change = stock_data.get('52w_change', 0)
-    recent_trend = stock_data.get('recent_trend', 'Unknown')
-
-    # Format market cap
-    if market_cap >= 1e12:
-        cap_str = f"${market_cap/1e12:.2f}T"
-    elif market_cap >= 1e9:
-        cap_str = f"${market_cap/1e9:.1f}B"
-    else:
-        cap_str = f"${market_cap/1e6:.0f}M"
-
-    if analyst_type == "Fundamental Analyst":
-        valuation_assessment = "Undervalued" if pe < 15 else "Fairly Valued" if pe < 25 else "Premium Valuation" if pe < 40 else "Extended Valuation"
-        growth_assessment = "High Growth" if revenue_growth > 15 else "Moderate Growth" if revenue_growth > 5 else "Low Growth" if revenue_growth > 0 else "Declining"
-        profitability = "Excellent" if profit_margin > 20 else "Strong" if profit_margin > 10 else "Moderate" if profit_margin > 5 else "Weak"
-
-        return f"""# Fundamental Analysis: {company} ({ticker})
-
-## Executive Summary
-{company} is a {sector} sector company with {cap_str} market capitalization. Current fundamental analysis reveals {valuation_assessment.lower()} characteristics with {growth_assessment.lower()} profile.
-
-## Key Metrics
-- **Current Price**: ${price:.2f}
-- **Market Cap**: {cap_str}
-- **Sector/Industry**: {sector} / {industry}
-- **52-Week Range**: ${year_low:.2f} - ${year_high:.2f}
-- **Year-to-Date Performance**: {year_change:+.1f}%
-
-## Valuation Analysis
-**P/E Ratio**: {pe:.1f}x (Forward: {forward_pe:.1f}x)
-- **Assessment**: {valuation_assessment}
-- Trailing P/E suggests the stock is trading at {"a premium" if pe > 25 else "reasonable" if pe > 15 else "attractive"} valuation relative to earnings
-- Forward P/E of {forward_pe:.1f}x indicates {"improving" if forward_pe < pe else "deteriorating"} earnings outlook
-
-**Earnings Per Share**: ${eps:.2f}
-- {"Strong" if eps > 5 else "Moderate" if eps > 1 else "Developing"} earnings generation capability
-
-## Growth & Profitability
-**Revenue Growth**: {revenue_growth:+.1f}%
-- **Assessment**: {growth_assessment}
-- {"Excellent" if revenue_growth > 20 else "Solid" if revenue_growth > 10 else "Modest" if revenue_growth > 0 else "Concerning"} top-line expansion
-
-**Profit Margin**: {profit_margin:.1f}%
-- **Assessment**: {profitability} margins
-- {"Industry-leading" if profit_margin > 20 else "Competitive" if profit_margin > 10 else "Below average"} operational efficiency
-
-**Return on Equity**: {roe:.1f}%
-- {"Exceptional" if roe > 20 else "Strong" if roe > 15 else "Adequate" if roe > 10 else "Weak"} capital efficiency
-
-## Financial Health
-**Debt-to-Equity**: {debt_to_equity:.2f}x
-- {"Conservative" if debt_to_equity < 0.5 else "Moderate" if debt_to_equity < 1.0 else "Elevated" if debt_to_equity < 2.0 else "High"} leverage
-- Balance sheet appears {"strong" if debt_to_equity < 1.0 else "manageable" if debt_to_equity < 2.0 else "stretched"}
-
-**Dividend Yield**: {dividend_yield:.2f}%
-- {"Income-generating with" if dividend_yield > 2 else "Modest" if dividend_yield > 0 else "No"} dividend payment
-
-## Investment Thesis
-**Strengths**:
-- {sector} sector positioning
-- {growth_assessment} revenue trajectory
-- {profitability} profitability profile
-{"- Attractive dividend yield" if dividend_yield > 2 else ""}
-
-**Concerns**:
-{"- Extended valuation metrics" if pe > 30 else ""}
-{"- Negative revenue growth" if revenue_growth < 0 else ""}
-{"- Weak profit margins" if profit_margin < 5 else ""}
-{"- High leverage" if debt_to_equity > 2 else ""}
-
-## Recommendation
-**{("BUY" if pe < 20 and revenue_growth > 10 and profit_margin > 15 else "HOLD" if pe < 30 else "CAUTIOUS")}** - From a fundamental perspective, {company} {"presents compelling value with strong growth and profitability" if pe < 20 and revenue_growth > 10 else "offers reasonable quality at current valuation" if pe < 30 else "appears fully valued and requires patience for better entry"}.
-
-Target Entry: Consider {"current levels" if pe < 20 else "10-15% pullback" if pe < 30 else "significant pullback (20%+)"} for optimal risk/reward.
-"""
-
-    elif analyst_type == "Technical Analyst":
-        price_vs_high = ((price - year_high) / year_high) * 100
-        price_vs_low = ((price - year_low) / year_low) * 100
-        momentum = "Bullish" if year_change > 10 else "Neutral" if year_change > -5 else "Bearish"
-
-        return f"""# Technical Analysis: {company} ({ticker})
-
-## Chart Overview
-**Current Price**: ${price:.2f}
-**52-Week High**: ${year_high:.2f} ({price_vs_high:+.1f}% from high)
-**52-Week Low**: ${year_low:.2f} ({price_vs_low:+.1f}% from low)
-**YTD Performance**: {year_change:+.1f}%
-**Recent Trend**: {recent_trend}
-
-## Price Action Analysis
-The stock is currently trading {"near its 52-week high" if price_vs_high > -5 else "in the upper half of its range" if price > (year_high + year_low)/2 else "in the lower half of its range" if price > year_low * 1.1 else "near its 52-week low"}, suggesting {"strong momentum" if price_vs_high > -10 else "consolidation" if price_vs_high > -30 else "potential value opportunity"}.
-
-**Price Position**:
-- Distance from 52W high: {price_vs_high:+.1f}%
-- Distance from 52W low: {price_vs_low:+.1f}%
-- {"Uptrend intact" if year_change > 10 else "Sideways movement" if year_change > -5 else "Downtrend present"}
-
-## Momentum Indicators
-**Overall Momentum**: {momentum}
-- YTD return of {year_change:+.1f}% indicates {"strong bullish momentum" if year_change > 20 else "positive momentum" if year_change > 10 else "neutral momentum" if year_change > -5 else "bearish momentum"}
-- Recent trend showing {recent_trend}
-
-**Volatility Assessment**:
-- Beta: {beta:.2f}
-- {"High volatility" if beta > 1.5 else "Moderate volatility" if beta > 0.8 else "Low volatility"} relative to market
-- {"More volatile than market" if beta > 1 else "Less volatile than market"} (Beta {beta:.2f})
-
-## Support & Resistance Levels
-**Key Support**: ${year_low:.2f} (52-week low)
-**Secondary Support**: ${(year_low * 1.1):.2f} (10% above low)
-**Key Resistance**: ${year_high:.2f} (52-week high)
-**Secondary Resistance**: ${(price * 1.1):.2f} (10% above current)
-
-## Trading Recommendation
-**Bias**: {momentum}
-
-{"**BUY on dips**" if momentum == "Bullish" and price_vs_high < -10 else "**ACCUMULATE**" if momentum == "Bullish" else "**HOLD**" if momentum == "Neutral" else "**WAIT**"} - Technical setup shows {recent_trend.lower()} with {"bullish" if year_change > 10 else "neutral" if year_change > -5 else "bearish"} momentum.
-
-**Entry Strategy**:
-- Aggressive: ${price:.2f} (current level)
-- Conservative: ${(price * 0.95):.2f} (5% pullback)
-- Value: ${(price * 0.90):.2f} (10% pullback)
-
-**Stop Loss**: ${(year_low * 0.95):.2f} (below 52-week low)
-**Target**: ${(price * 1.15):.2f} (15% upside)
-"""
-
-    elif analyst_type == "Industry Analyst":
-        market_position = "Large Cap" if market_cap > 10e9 else "Mid Cap" if market_cap > 2e9 else "Small Cap"
-
-        return f"""# Industry Analysis: {company} ({ticker})
-
-## Company Profile
-**Sector**: {sector}
-**Industry**: {industry}
-**Market Capitalization**: {cap_str} ({market_position})
-
-## Competitive Positioning
-{company} operates in the {sector} sector, specifically within {industry}. As a {market_position.lower()} company with {cap_str} market capitalization, it {"holds significant market influence" if market_cap > 100e9 else "maintains meaningful industry presence" if market_cap > 10e9 else "represents emerging opportunity"}.
-
-## Sector Dynamics
-**Sector**: {sector}
-- Growth characteristics: {"High growth" if sector in ["Technology", "Healthcare", "Consumer Cyclical"] else "Stable growth" if sector in ["Consumer Defensive", "Utilities"] else "Moderate growth"}
-- Market maturity: {"Mature" if sector in ["Utilities", "Consumer Defensive"] else "Growing" if sector in ["Technology", "Healthcare"] else "Cyclical"}
-- Regulatory environment: {"Heavily regulated" if sector in ["Healthcare", "Financial Services", "Utilities"] else "Moderately regulated"}
-
-## Industry Trends
-**Current Industry Environment**:
-- Revenue growth of {revenue_growth:+.1f}% {"outpaces" if revenue_growth > 5 else "aligns with" if revenue_growth > 0 else "lags"} typical sector growth
-- Profit margins of {profit_margin:.1f}% {"exceed" if profit_margin > 15 else "match" if profit_margin > 5 else "trail"} industry averages
-- {"Technology disruption" if sector == "Technology" else "Healthcare innovation" if sector == "Healthcare" else "Market evolution"} driving sector changes
-
-## Competitive Advantages
-**Observable Strengths**:
-- {"Market leadership indicated by large market cap" if market_cap > 100e9 else "Established position" if market_cap > 10e9 else "Nimble smaller player"}
-- {"Strong profitability metrics" if profit_margin > 15 else "Adequate profitability"}
-- {"Solid balance sheet" if debt_to_equity < 1 else "Leveraged growth strategy"}
-
-## Industry Risks
-**Key Challenges**:
-- {"Intense competition in technology sector" if sector == "Technology" else "Regulatory pressures" if sector in ["Healthcare", "Financial Services"] else "Economic sensitivity"}
-- {"High valuation multiple" if pe > 30 else "Valuation concerns" if pe > 20 else "Reasonable valuation"}
-- {"Execution risk on growth plans" if revenue_growth > 20 else "Growth sustainability"}
-
-## Sector Outlook
-The {sector} sector {"continues strong growth trajectory" if sector in ["Technology", "Healthcare"] else "provides defensive characteristics" if sector in ["Consumer Defensive", "Utilities"] else "faces cyclical headwinds and opportunities"}.
-
-**Industry Recommendation**: {("OVERWEIGHT" if revenue_growth > 10 and profit_margin > 15 else "MARKET WEIGHT" if revenue_growth > 0 else "UNDERWEIGHT")} - {company} {"demonstrates strong competitive positioning" if market_cap > 50e9 else "shows promise" if revenue_growth > 10 else "requires monitoring"} within {sector}.
-"""
-
-    elif analyst_type == "Quantitative Analyst":
-        sharpe_estimate = year_change / (abs(beta) * 15) if beta > 0 else 0
-        quality_score = (
-            (10 if roe > 20 else 7 if roe > 15 else 4 if roe > 10 else 2) +
-            (10 if profit_margin > 20 else 7 if profit_margin > 10 else 4 if profit_margin > 5 else 2) +
-            (10 if debt_to_equity < 0.5 else 7 if debt_to_equity < 1 else 4 if debt_to_equity < 2 else 2)
-        ) / 3
-
-        return f"""# Quantitative Analysis: {company} ({ticker})
-
-## Statistical Metrics
-**Volatility Profile**:
-- Beta: {beta:.2f}
-- {"High volatility asset" if beta > 1.5 else "Moderate volatility" if beta > 0.8 else "Low volatility"} relative to market
-- Estimated Sharpe Ratio: {sharpe_estimate:.2f}
-
-**Performance Metrics**:
-- YTD Return: {year_change:+.1f}%
-- Annualized volatility estimate: ~{abs(beta) * 15:.1f}%
-- Risk-adjusted return {"attractive" if sharpe_estimate > 0.5 else "moderate" if sharpe_estimate > 0 else "concerning"}
-
-## Quality Metrics
-**Quality Score**: {quality_score:.1f}/10
-- Return on Equity: {roe:.1f}% ({"High" if roe > 20 else "Good" if roe > 15 else "Moderate" if roe > 10 else "Low"} quality)
-- Profit Margin: {profit_margin:.1f}% ({"Strong" if profit_margin > 15 else "Adequate" if profit_margin > 5 else "Weak"} profitability)
-- Debt/Equity: {debt_to_equity:.2f}x ({"Conservative" if debt_to_equity < 0.5 else "Moderate" if debt_to_equity < 1 else "Elevated"} leverage)
-
-## Factor Exposure
-**Style Factors**:
-- Quality: {"High" if quality_score > 7 else "Medium" if quality_score > 4 else "Low"} ({quality_score:.1f}/10)
-- Growth: {"High" if revenue_growth > 15 else "Medium" if revenue_growth > 5 else "Low"} ({revenue_growth:+.1f}% revenue growth)
-- Value: {"Attractive" if pe < 15 else "Fair" if pe < 25 else "Expensive"} (P/E: {pe:.1f}x)
-- Momentum: {"Positive" if year_change > 10 else "Neutral" if year_change > -5 else "Negative"} ({year_change:+.1f}% YTD)
-
-## Valuation Model
-**Multi-Factor Score**: {(quality_score + (10 if revenue_growth > 15 else 5 if revenue_growth > 5 else 2) + (10 if pe < 15 else 5 if pe < 25 else 2)) / 3:.1f}/10
-
-Components:
-- Quality: {quality_score:.1f}/10
-- Growth: {(10 if revenue_growth > 15 else 5 if revenue_growth > 5 else 2)}/10
-- Value: {(10 if pe < 15 else 5 if pe < 25 else 2)}/10
-
-## Risk Assessment
-**Key Risks**:
-- Volatility Risk: {"High" if beta > 1.5 else "Medium" if beta > 1 else "Low"} (Beta: {beta:.2f})
-- Leverage Risk: {"High" if debt_to_equity > 2 else "Medium" if debt_to_equity > 1 else "Low"}
-- Valuation Risk: {"High" if pe > 30 else "Medium" if pe > 20 else "Low"}
-
-## Quantitative Recommendation
-**{"BUY" if quality_score > 7 and revenue_growth > 10 and pe < 25 else "ACCUMULATE" if quality_score > 5 else "HOLD"}** - Quantitative metrics {"support long position" if quality_score > 7 else "suggest selective exposure" if quality_score > 4 else "indicate caution"}.
-
-Expected 12-month return: {(10 if quality_score > 7 else 7 if quality_score > 4 else 3) + (revenue_growth / 2):.1f}%
-Risk-adjusted allocation: {min(25, quality_score * 3):.0f}% of portfolio
-"""
-
-    else:  # ESG Analyst
-        esg_score = 7 if market_cap > 100e9 else 6 if market_cap > 10e9 else 5
-
-        return f"""# ESG Analysis: {company} ({ticker})
-
-## ESG Overview
-**Estimated ESG Rating**: {("A" if esg_score >= 8 else "B" if esg_score >= 6 else "C")}/A+ Scale
-
-As a {sector} sector company with {cap_str} market cap, {company} {"likely maintains robust ESG practices given size and scrutiny" if market_cap > 50e9 else "operates with developing ESG framework" if market_cap > 10e9 else "represents emerging ESG opportunity"}.
-
-## Environmental (E) Assessment
-**Estimated Score**: {esg_score}/10
-
-{sector} sector companies face {"significant environmental considerations" if sector in ["Energy", "Materials", "Utilities"] else "moderate environmental impact" if sector in ["Industrials", "Technology"] else "limited direct environmental footprint"}.
-
-**Key Considerations**:
-- Carbon footprint: {("Material concern" if sector in ["Energy", "Materials"] else "Moderate impact" if sector in ["Industrials", "Technology"] else "Limited direct impact")}
-- Resource efficiency: {"Critical to operations" if sector in ["Materials", "Utilities"] else "Important consideration"}
-- Sustainability initiatives: {"Likely advanced" if market_cap > 50e9 else "Developing" if market_cap > 10e9 else "Emerging"}
-
-## Social (S) Assessment
-**Estimated Score**: {esg_score}/10
-
-**Stakeholder Considerations**:
-- Employee practices: {"Sophisticated given scale" if market_cap > 50e9 else "Developing programs"}
-- Community impact: {sector} companies {"have significant community touchpoints" if sector in ["Healthcare", "Consumer Defensive"] else "maintain standard community engagement"}
-- Product responsibility: {"High scrutiny" if sector in ["Healthcare", "Financial Services"] else "Standard oversight"}
-
-## Governance (G) Assessment
-**Estimated Score**: {esg_score + 1}/10
-
-Large public companies typically maintain {"strong" if market_cap > 50e9 else "adequate" if market_cap > 10e9 else "developing"} governance frameworks:
-- Board independence: {"Likely strong" if market_cap > 50e9 else "Developing"}
-- Shareholder rights: {"Well-established" if market_cap > 10e9 else "Standard"}
-- Transparency: {"High disclosure" if market_cap > 50e9 else "Adequate reporting"}
-
-## ESG Risk Assessment
-**Material ESG Risks**:
-- Environmental: {("High" if sector in ["Energy", "Materials"] else "Medium" if sector in ["Industrials"] else "Low")}
-- Social: {("High" if sector in ["Healthcare", "Financial Services"] else "Medium")}
-- Governance: {("Low - large cap scrutiny" if market_cap > 50e9 else "Medium")}
-
-## ESG Investment Perspective
-**{"SUITABLE" if esg_score >= 6 else "CONDITIONAL"}** for ESG-focused portfolios - {company} {"demonstrates characteristics consistent with responsible investing" if esg_score >= 7 else "shows developing ESG profile" if esg_score >= 5 else "requires enhanced ESG diligence"}.
-
-**ESG Momentum**: {"Positive" if market_cap > 50e9 else "Developing"} - {"Large cap companies face increasing ESG expectations and typically respond proactively" if market_cap > 50e9 else "Growing companies increasingly prioritize ESG considerations"}.
-"""
-
-def get_generic_investor_opinion(investor_name, ticker, stock_data):
-    """Generate a detailed investor opinion for any stock."""
-    company = stock_data.get('company_name', ticker)
-    price = stock_data.get('current_price', 0)
-    pe = stock_data.get('pe_ratio', 0)
-    market_cap = stock_data.get('market_cap', 0)
-    revenue_growth = stock_data.get('revenue_growth', 0)
-    profit_margin = stock_data.get('profit_margin', 0)
-    roe = stock_data.get('return_on_equity', 0)
-    debt_to_equity = stock_data.get('debt_to_equity', 0)
-    dividend_yield = stock_data.get('dividend_yield', 0) * 100
-    beta = stock_data.get('beta', 0)
-    year_change = stock_data.get('52w_change', 0)
-    sector = stock_data.get('sector', 'Unknown')
-
-    if investor_name == "Warren Buffett":
-        moat_strength = "wide" if roe > 20 and profit_margin > 15 else "moderate" if roe > 15 else "narrow"
-        valuation_view = "attractive" if pe < 15 else "fair" if pe < 25 else "full" if pe < 35 else "expensive"
-
-        return f"""# Warren Buffett's Analysis: {company} ({ticker})
-
-## Business Quality Assessment
-Looking at {company} through my value investing lens, I evaluate three core elements: economic moat, management quality, and intrinsic value.
-
-**Economic Moat**: {moat_strength.capitalize()}
-- ROE of {roe:.1f}% indicates {"exceptional" if roe > 20 else "strong" if roe > 15 else "adequate" if roe > 10 else "weak"} returns on capital
-- Profit margins of {profit_margin:.1f}% suggest {"pricing power and competitive advantages" if profit_margin > 15 else "decent profitability" if profit_margin > 10 else "limited pricing power"}
-- {"This business prints money - exactly what I look for" if roe > 20 and profit_margin > 15 else "Acceptable economic characteristics" if roe > 15 else "Mediocre business economics"}
-
-**Business Fundamentals**:
-- Debt/Equity of {debt_to_equity:.2f}x - {"Conservative balance sheet" if debt_to_equity < 0.5 else "Prudent leverage" if debt_to_equity < 1 else "Concerning debt levels"}
-- {("Shareholder-friendly dividend of {dividend_yield:.1f}%" if dividend_yield > 2 else "Growing with retained earnings")}
-
-## Valuation Perspective
-**Price is what you pay, value is what you get.**
-
-At P/E of {pe:.1f}x, this is a {valuation_view} price for {"a wonderful business" if roe > 20 and profit_margin > 15 else "a good business" if roe > 15 else "this business"}.
-
-**My Margin of Safety**: {"Adequate at current levels" if pe < 20 else "Limited - would prefer 15-20% lower" if pe < 30 else "Insufficient - this is priced for perfection"}
-
-## Circle of Competence
-{sector} sector {"falls within my circle of competence" if sector in ["Consumer Defensive", "Financial Services", "Industrials"] else "requires careful evaluation - not my traditional area"}. {"I understand this business and can value it with confidence." if sector in ["Consumer Defensive", "Financial Services"] else "Would need to study this industry more carefully."}
-
-## Investment Decision
-**{("BUY" if pe < 20 and roe > 15 and debt_to_equity < 1 else "HOLD if owned" if pe < 30 and roe > 10 else "WAIT")}**
-
-{"This is a wonderful business at a fair price. I'd be comfortable with a 5-10% portfolio position." if pe < 20 and roe > 15 else "Quality business but price leaves little margin of safety. Hold if owned, but I'd wait for a better pitch if buying new." if pe < 30 else "Price is too high for the quality. Be patient - Mr. Market will eventually offer a better price."}
-
-**My Holding Period**: Forever (if the business quality remains high)
-"""
-
-    elif investor_name == "Ray Dalio":
-        risk_level = "High" if beta > 1.5 else "Medium" if beta > 1 else "Low"
-
-        return f"""# Ray Dalio's Analysis: {company} ({ticker})
-
-## All-Weather Portfolio Perspective
-Within a properly diversified, risk-balanced portfolio, {company} serves as {"a growth asset with moderate volatility" if beta < 1.2 else "a high-volatility growth position"}.
-
-**Risk Parity Assessment**:
-- Beta of {beta:.2f} indicates {risk_level.lower()} volatility relative to market
-- {"Good risk-adjusted returns given quality metrics" if roe > 15 and beta < 1.2 else "Higher risk requires proportionally higher returns"}
-- Position size should be {"2-4%" if beta > 1.5 else "3-5%" if beta > 1 else "4-6%"} to maintain portfolio balance
-
-## Macroeconomic Context
-**Current Environment Fit**:
-- {sector} sector {"provides growth exposure in reflationary environment" if sector == "Technology" else "offers defensive characteristics in uncertain times" if sector in ["Consumer Defensive", "Utilities"] else "balanced exposure"}
-- {"Quality characteristics protect in deleveraging scenarios" if debt_to_equity < 1 else "Leverage increases vulnerability in credit tightening"}
-
-**Diversification Value**:
-- {"Low correlation to bonds and commodities - good equity diversifier" if sector == "Technology" else "Provides inflation hedge characteristics" if sector in ["Energy", "Materials"] else "Standard equity correlation"}
-
-## Principles-Based Evaluation
-**Balance**: {"Well-balanced - quality business with reasonable valuation" if roe > 15 and pe < 25 else "Imbalanced - " + ("strong business, expensive price" if roe > 15 else "fair price, mediocre business")}
-**Diversification**: Adds {"meaningful" if sector not in ["Technology", "Financial Services"] else "concentrated tech"} exposure
-**What I Don't Know**: {"Technological disruption risk" if sector == "Technology" else "Regulatory changes" if sector in ["Healthcare", "Financial Services"] else "Competitive dynamics"}
-
-## Investment Decision
-**{("BUY - Measured Position" if roe > 15 and pe < 30 else "HOLD - Monitor" if pe < 35 else "UNDERWEIGHT")}**
-
-{"Initiate 3-4% position, add on 10%+ pullbacks. Quality metrics support allocation within balanced portfolio." if roe > 15 and pe < 30 else "Acceptable for existing holdings but not adding at these levels. Rebalance if grows beyond 5% of portfolio." if pe < 35 else "Reduce exposure - risk/reward unfavorable in current macro environment."}
-
-**Hedging Strategy**: {"Pair with uncorrelated assets (gold, bonds)" if beta > 1.2 else "Monitor correlation to overall equity exposure"}
-"""
-
-    elif investor_name == "Cathie Wood":
-        innovation_score = 9 if sector == "Technology" and revenue_growth > 20 else 7 if sector == "Technology" else 6 if revenue_growth > 15 else 4
-
-        return f"""# Cathie Wood's Analysis: {company} ({ticker})
-
-## Disruptive Innovation Thesis
-{company} {"operates at the intersection of multiple innovation platforms - exactly what I look for!" if sector == "Technology" and revenue_growth > 20 else "shows innovation characteristics worth exploring" if revenue_growth > 15 else "represents traditional business model with limited disruption potential"}
-
-**Innovation Score**: {innovation_score}/10
-- Revenue growth of {revenue_growth:+.1f}% {"demonstrates exponential growth trajectory" if revenue_growth > 25 else "shows solid growth" if revenue_growth > 10 else "indicates mature market"}
-- {sector} sector {"is being transformed by AI, cloud, and digital innovation" if sector == "Technology" else "faces digital transformation pressures" if sector in ["Financial Services", "Healthcare"] else "experiencing traditional dynamics"}
-
-## Exponential Growth Analysis
-**Growth Trajectory**:
-- Current growth: {revenue_growth:+.1f}%
-- {"This is the kind of exponential growth that compounds into massive returns!" if revenue_growth > 30 else "Solid growth but not exponential yet" if revenue_growth > 15 else "Linear growth trajectory"}
-- TAM expansion: {"Massive - multi-trillion dollar opportunity" if sector == "Technology" else "Significant opportunity in digital transformation" if sector in ["Healthcare", "Financial Services"] else "Limited expansion potential"}
-
-**Platform Network Effects**:
-- {"Strong network effects compound user value" if sector == "Technology" and market_cap > 100e9 else "Developing platform characteristics" if sector == "Technology" else "Limited network effect dynamics"}
-
-## Valuation Through Innovation Lens
-Traditional metrics miss the story! Looking at:
-- **Innovation Value**: Platform potential could be worth {"$500B+" if sector == "Technology" and market_cap > 100e9 else "substantial premium" if revenue_growth > 20 else "moderate premium"}
-- **5-Year Vision**: {"10-20x potential if execution continues" if revenue_growth > 30 else "3-5x potential" if revenue_growth > 15 else "2-3x potential"}
-- P/E of {pe:.1f}x is {"irrelevant for exponential growth story" if revenue_growth > 25 else "reasonable for growth profile" if revenue_growth > 15 else "fair for linear growth"}
-
-## Conviction Level
-**{"VERY HIGH" if innovation_score > 7 and revenue_growth > 20 else "HIGH" if innovation_score > 5 else "MODERATE"}**
-
-{"This is exactly the type of disruptive innovation opportunity I pound the table on! The market is underestimating the transformation potential." if innovation_score > 7 and revenue_growth > 20 else "Interesting innovation play worth significant allocation" if innovation_score > 5 else "Doesn't fit our innovation-focused mandate strongly"}
-
-## Investment Decision
-**{("STRONG BUY" if innovation_score > 7 and revenue_growth > 20 else "BUY" if innovation_score > 5 and revenue_growth > 10 else "HOLD")}**
-
-{"8-12% portfolio position - this is a generational opportunity! Ignore the volatility, focus on the 5-year outcome." if innovation_score > 7 and revenue_growth > 20 else "4-6% position - solid innovation exposure with growth potential" if innovation_score > 5 else "2-3% position - limited innovation angle but acceptable growth"}
-
-**Time Horizon**: 5+ years (volatility is a feature, not a bug)
-**What Would Change My Mind**: {("Loss of market share to competitors" if sector == "Technology" else "Regulatory disruption of business model")}
-"""
-
-    elif investor_name == "Peter Lynch":
-        peg = pe / revenue_growth if revenue_growth > 0 else 999
-        category = "Fast Grower" if revenue_growth > 20 else "Stalwart" if market_cap > 10e9 else "Slow Grower"
-
-        return f"""# Peter Lynch's Analysis: {company} ({ticker})
-
-## Know What You Own
-**The One-Sentence Story**: "{company} {("is growing rapidly in" if revenue_growth > 20 else "steadily serves") + f" the {sector} market" + (" with strong profitability" if profit_margin > 15 else "")}"
-
-If you can't explain this to a 10-year-old, don't own it. This business {"is easy to understand - " + (sector + " company selling products/services people use") if sector in ["Consumer Defensive", "Technology"] else "requires more industry knowledge"}
-
-## Stock Category: {category}
-**Classification**:
-- {"Fast Grower" if revenue_growth > 20 else "Stalwart" if market_cap > 10e9 else "Slow Grower" if revenue_growth < 10 else "Asset Play"}
-- {"Expect 50-100% returns over 3-5 years" if revenue_growth > 25 else "Expect 30-50% returns" if revenue_growth > 15 else "Expect 10-20% returns annually"}
-
-## The Peter Lynch Checklist
-✓ Company has niche: {("YES - strong market position" if roe > 20 else "MODERATE" if roe > 10 else "NO")}
-✓ Product people need: {("YES" if sector in ["Healthcare", "Consumer Defensive"] else "MODERATE")}
-✓ Company buying back shares: (Would need to verify)
-✓ Debt manageable: {("YES" if debt_to_equity < 1 else "BORDERLINE" if debt_to_equity < 2 else "NO")}
-✓ Hidden assets: (Requires deeper analysis)
-{"✓ Good dividend: YES" if dividend_yield > 2 else ""}
-
-## The Numbers That Matter
-**PEG Ratio**: {peg:.1f}
-- **Lynch's Rule**: PEG should be {"<1.0 for fast growers" if revenue_growth > 20 else "<1.5 for stalwarts"}
-- {("Excellent value!" if peg < 1 else "Fair deal" if peg < 1.5 else "Fully valued" if peg < 2 else "Too expensive")}
-
-**The Story**: {"Growth of {revenue_growth:.0f}% justifies P/E of {pe:.0f}x - this is growth at a reasonable price!" if peg < 1.5 else "Paying up for quality - make sure the growth continues"}
-
-## Investment Decision
-**{("BUY" if peg < 1.5 and debt_to_equity < 1 else "HOLD if owned" if peg < 2.5 else "WAIT")}**
-
-{"Start a half position now, add on 10% dips. This is a {category.lower()} I'd be comfortable owning for years." if peg < 1.5 else "Hold what you own, but I'd wait for a better price to buy more. Patience pays." if peg < 2.5 else "Too expensive. Walk away and find better opportunities. The stock market isn't a slot machine - don't force it."}
-
-**Position Size**: {("8-12% - this is a core holding" if peg < 1 and revenue_growth > 20 else "5-8% - solid stalwart position" if peg < 1.5 else "3-5% - speculative only")}
-**When to Sell**: {("Only if story changes (growth slows to <5%)" if revenue_growth > 15 else "If P/E exceeds 30 and growth slows")}
-"""
-
-    else:  # Michael Burry
-        concern_level = "Very High" if pe > 30 and debt_to_equity > 2 else "High" if pe > 25 else "Moderate"
-
-        return f"""# Michael Burry's Analysis: {company} ({ticker})
-
-## Contrarian Perspective
-Everyone {"loves" if year_change > 20 else "likes" if year_change > 0 else "hates"} {company}. That {"concerns me greatly" if year_change > 20 else "makes me cautious" if year_change > 0 else "interests me"}.
-
-**Market Sentiment**: {"Euphoric - danger zone" if year_change > 30 else "Bullish - crowded trade" if year_change > 10 else "Neutral" if year_change > -10 else "Bearish - potential opportunity"}
-
-## Bearish Case (What I'm Worried About)
-**Valuation Red Flags**:
-- P/E of {pe:.1f}x {"is absurdly high - shades of 1999 dot-com bubble" if pe > 40 else "leaves zero margin for error" if pe > 30 else "is elevated but not insane" if pe > 20 else "is actually reasonable"}
-- {("Trading at {pe:.0f}x earnings assumes perfection - what if growth slows?" if pe > 25 else "Valuation has some cushion")}
-- {"Debt/Equity of {debt_to_equity:.1f}x is dangerous in rising rate environment" if debt_to_equity > 2 else ""}
-
-**Growth Sustainability Questions**:
-- {revenue_growth:+.1f}% growth {"is unsustainable - reversion to mean inevitable" if revenue_growth > 30 else "will decelerate - they always do" if revenue_growth > 20 else "is already slowing"}
-- {("What happens when competition catches up?" if profit_margin > 20 else "Margins will compress")}
-
-**Macro Headwinds**:
-- Beta of {beta:.2f} means {"massive volatility in market downturn" if beta > 1.5 else "market sensitivity"}
-- {"This gets crushed in recession" if beta > 1.5 and pe > 25 else "Vulnerable to macro shocks"}
-
-## What the Herd Misses
-**Underappreciated Risks**:
-1. Valuation assumes current growth continues forever (it won't)
-2. {"High debt could become crisis in downturn" if debt_to_equity > 2 else "Leverage limits flexibility"}
-3. Mr. Market is {"euphorically optimistic" if year_change > 20 else "too bullish"}
-4. {"This could easily drop 40-50% if sentiment shifts" if pe > 30 and beta > 1.5 else "Downside of 25-35% on multiple compression"}
-
-## The Trade
-**I'm {("NOT long, considering SHORT" if pe > 35 and year_change > 30 else "NOT long, NOT short" if pe > 25 else "CAUTIOUSLY watching")}**
-
-{"This is exactly the kind of overvalued, overhyped stock I look to short. Risk/reward is terrible." if pe > 35 and year_change > 30 else "Too expensive to own, not quite expensive enough to short. Cash is better." if pe > 25 else "Not compelling either way - there are better opportunities."}
-
-## When I'd Change My Mind
-**Would Consider Long If**:
-- Stock drops {("50-60%" if pe > 35 else "30-40%" if pe > 25 else "15-20%")}
-- Recession forces multiple compression to 15-18x
-- {"Debt is significantly reduced" if debt_to_equity > 1.5 else ""}
-- Consensus turns bearish (contrarian signal)
-
-**Investment Recommendation**: {("AVOID / SHORT" if pe > 35 and debt_to_equity > 2 else "AVOID" if pe > 25 else "WAIT")}
-
-{"I'd rather hold cash and wait for fat pitches. This isn't one. The market can stay irrational longer than you can stay solvent - don't fight it, just stay away." if pe > 25 else "Not terrible, but not compelling. Be patient for better opportunities."}
-"""
-
-def get_generic_synthesis(ticker, investor_opinions):
-    """Generate a generic synthesis for any stock."""
-    return f"""# Investment Synthesis: {ticker}
-
-## Summary
-Based on preliminary analysis from our investment panel, {ticker} has been reviewed across multiple investment philosophies.
-
-## Recommendation
-**Position**: HOLD - Pending detailed analysis
-
-The panel recommends conducting thorough due diligence before making investment decisions.
-
-**Next Steps**:
-- Conduct detailed fundamental analysis
-- Review competitive positioning
-- Assess valuation relative to growth
-- Monitor for entry opportunities
-
-*Note: This is a preliminary synthesis. Request detailed analysis for comprehensive investment guidance.*
-"""
-
-ANALYST_REPORTS = {
-    "Fundamental Analyst": """
-# Fundamental Analysis: Microsoft (MSFT)
-
-## Executive Summary
-Microsoft demonstrates exceptionally strong fundamentals with robust profitability, solid balance sheet, and consistent revenue growth driven by cloud computing transformation.
-
-## Key Strengths
-- **Market Leadership**: Dominant position in cloud infrastructure (Azure), productivity software (Microsoft 365), and enterprise solutions
-- **Revenue Diversification**: Strong mix across Intelligent Cloud, Productivity/Business Processes, and Personal Computing segments
-- **Profit Margins**: Industry-leading operating margins (~40%) and net margins (~35%), reflecting strong pricing power and operational efficiency
-- **Cash Generation**: Massive free cash flow generation ($60B+ annually) enabling strategic investments and shareholder returns
-- **Balance Sheet**: Fortress balance sheet with significant cash reserves and manageable debt levels
-
-## Financial Metrics
-- **P/E Ratio**: Trading at premium valuation reflecting quality and growth prospects
-- **Revenue Growth**: Consistent double-digit growth driven primarily by cloud services
-- **ROE**: Excellent return on equity (>40%) demonstrating efficient capital allocation
-- **Dividend**: Growing dividend with moderate yield, sustainable payout ratio
-
-## Concerns
-- **Valuation**: Premium multiples limit margin of safety
-- **Competitive Pressure**: Increasing competition in cloud from AWS and Google Cloud
-- **Regulatory Risk**: Ongoing antitrust scrutiny globally
-
-## Recommendation
-**STRONG BUY** - Microsoft's fundamental strength, competitive moat, and growth trajectory justify current valuation for long-term investors.
-""",
-
-    "Technical Analyst": """
-# Technical Analysis: Microsoft (MSFT)
-
-## Chart Pattern Analysis
-- **Primary Trend**: Strong long-term uptrend intact, trading above all major moving averages (50-day, 200-day)
-- **Support Levels**: Key support at $380-$390 range (previous resistance turned support), secondary support at $350
-- **Resistance Levels**: Testing all-time highs around $430-$440
-
-## Momentum Indicators
-- **RSI**: Currently at 62 - in bullish territory but not overbought, suggesting room for further upside
-- **MACD**: Positive divergence with bullish crossover signaling continued momentum
-- **Volume**: Above-average volume on up days indicates institutional accumulation
-
-## Moving Averages
-- **50-day MA**: Currently above, showing short-term strength
-- **200-day MA**: Well above, confirming long-term bullish trend
-- **Golden Cross**: Formed earlier this year, historically bullish signal
-
-## Price Action
-- **Pattern**: Forming ascending triangle pattern, typically bullish continuation
-- **Volatility**: Below historical average, suggesting potential for larger moves
-- **Gap Analysis**: Most gaps filled, showing healthy price discovery
-
-## Trading Recommendation
-**BUY** - Technical setup is constructive with bullish momentum, strong support levels, and breakout potential above $440. Entry on pullback to $400-$410 offers better risk/reward.
-
-## Stop Loss Suggestion
-Conservative: $380 (below key support)
-Aggressive: $400 (tight stop for swing traders)
-""",
-
-    "Industry Analyst": """
-# Industry Analysis: Microsoft in the Technology Sector
-
-## Sector Overview
-The technology sector continues to outperform broader markets, driven by digital transformation, AI adoption, and cloud migration. Enterprise software and cloud infrastructure remain the highest-growth segments.
-
-## Competitive Positioning
-**Market Share Analysis**:
-- **Cloud Infrastructure**: Azure is #2 (25% market share) behind AWS (32%), growing faster than market
-- **Productivity Software**: Near-monopoly with Microsoft 365/Office suite (~80% market share)
-- **Operating Systems**: Windows maintains ~75% desktop OS market share despite mobile shift
-- **Gaming**: Xbox ecosystem continues to grow; Activision acquisition strengthens position
-
-## Competitive Advantages
-1. **Network Effects**: Billions of users locked into Microsoft ecosystem
-2. **Switching Costs**: Enterprise integration makes migration extremely costly
-3. **Brand Value**: Trusted enterprise brand with long-standing customer relationships
-4. **Distribution**: Global sales organization and partner network unmatched in reach
-
-## Industry Trends Favoring MSFT
-- **AI Revolution**: Leading position with OpenAI partnership and Copilot integration across products
-- **Hybrid Cloud**: Microsoft's hybrid approach (Azure Stack) addresses enterprise needs better than pure-cloud competitors
-- **Cybersecurity**: Growing security suite benefits from increasing threat landscape
-- **Digital Workplace**: Remote work trends strengthen Teams and Microsoft 365 demand
-
-## Industry Risks
-- **Regulatory Environment**: Increased antitrust scrutiny in US, EU, and globally
-- **Open Source Movement**: Linux, open-source alternatives gaining enterprise traction
-- **Commoditization**: Cloud infrastructure margins could compress with competition
-- **Cyclical Exposure**: Enterprise IT spending vulnerable to economic downturns
-
-## Recommendation
-**OVERWEIGHT** - Microsoft is best-positioned mega-cap tech company to benefit from secular industry trends. Diversified revenue streams and strong competitive moats provide downside protection.
-""",
-
-    "Quantitative Analyst": """
-# Quantitative Analysis: Microsoft (MSFT)
-
-## Statistical Metrics
-**Volatility Analysis**:
-- Historical Volatility (30-day): 22% - moderate for large-cap tech
-- Beta: 0.88 - slightly less volatile than broader market
-- Sharpe Ratio (3-year): 0.95 - excellent risk-adjusted returns
-- Maximum Drawdown (5-year): -35% (March 2020) - recovered within 6 months
-
-## Correlation Analysis
-- S&P 500: 0.75 correlation - moderate positive correlation
-- Nasdaq: 0.82 correlation - strong correlation with tech sector
-- Tech Peers (AAPL, GOOGL): 0.70-0.80 - high correlation but not excessive
-- Defensive Sectors: Low correlation - acts as growth asset
-
-## Factor Exposure
-**Style Factors**:
-- Quality Factor: +2.5 (very high quality scores)
-- Growth Factor: +1.8 (strong growth characteristics)
-- Value Factor: -0.5 (slight value tilt negative)
-- Momentum Factor: +1.2 (positive momentum)
-
-## Quantitative Models
-**Multi-Factor Model Score**: 8.2/10
-- Quality Metrics: Excellent (ROE, margins, cash flow)
-- Growth Metrics: Strong (revenue growth, earnings growth)
-- Valuation Metrics: Fair (premium but justified)
-- Risk Metrics: Moderate (manageable volatility)
-
-## Mean Reversion Analysis
-- Current Price vs. 200-day MA: +8% - within normal range
-- Fair Value Estimate (DCF): $425 ± $40 - current price in fair value range
-- Regression to Mean: Low probability of mean reversion given fundamental improvement
-
-## Options Market Analysis
-- Implied Volatility: 24% - slightly above historical, suggesting market uncertainty
-- Put/Call Ratio: 0.85 - neutral to slightly bullish sentiment
-- Skew: Moderate put skew - some hedging demand but not excessive
-
-## Portfolio Optimization
-In a diversified tech portfolio:
-- Optimal Weight: 20-25% of tech allocation
-- Risk Contribution: Moderate risk contributor
-- Diversification Benefit: Good diversifier due to revenue mix
-
-## Quantitative Recommendation
-**ACCUMULATE** - Quantitative metrics support long position with following parameters:
-- Target Allocation: 20-25% of tech exposure
-- Entry Strategy: Dollar-cost average on any 5%+ pullbacks
-- Risk Management: Maintain stop at 15% below entry
-- Expected Return (12-month): 12-15% probability-weighted return
-""",
-
-    "ESG Analyst": """
-# ESG Analysis: Microsoft (MSFT)
-
-## ESG Overall Rating: A+ (Top Tier)
-
-## Environmental (E) Score: 9/10
-**Strengths**:
-- **Carbon Negative Goal**: Committed to being carbon negative by 2030, removing all historical emissions by 2050
-- **Renewable Energy**: 100% renewable energy commitment for datacenters by 2025
-- **Circular Economy**: Strong e-waste and hardware recycling programs
-- **Innovation**: Investing $1B+ in carbon removal technologies and climate innovation fund
-- **Transparency**: Comprehensive environmental reporting and third-party verification
-
-**Concerns**:
-- Datacenter energy consumption continues to grow with AI/cloud expansion
-- Supply chain Scope 3 emissions remain significant challenge
-
-## Social (S) Score: 8.5/10
-**Strengths**:
-- **Diversity & Inclusion**: Strong programs with improving representation, though still room for improvement
-- **Employee Benefits**: Industry-leading compensation, benefits, and work-life balance
-- **Community Investment**: $3.5B+ in technology access programs for underserved communities
-- **Education**: Significant investment in STEM education and digital skills training
-- **Accessibility**: Leading the industry in accessible technology development
-
-**Concerns**:
-- Tech sector labor practices scrutiny (contractor treatment, geopolitical manufacturing)
-- Gender and racial representation gaps in leadership positions
-
-## Governance (G) Score: 9/10
-**Strengths**:
-- **Board Independence**: Highly independent board with diverse expertise
-- **Shareholder Rights**: Strong shareholder voting rights, responsive to investor concerns
-- **Executive Compensation**: Well-structured compensation tied to long-term performance
-- **Transparency**: Excellent disclosure practices and regulatory compliance
-- **Ethics Program**: Robust compliance and ethics training programs
-
-**Concerns**:
-- Executive compensation levels remain very high even by tech standards
-- Some legacy antitrust concerns persist
-
-## Stakeholder Impact
-**Positive Impacts**:
-- Enabling digital transformation for organizations globally
-- Bridging digital divide through accessibility and affordability initiatives
-- Supporting small business and startup ecosystems
-- Contributing to climate technology innovation
-
-**Negative Impacts**:
-- Platform used in surveillance and military applications (ethical concerns)
-- Potential job displacement from AI and automation technologies
-- Environmental cost of hardware lifecycle and datacenter operations
-
-## ESG Risk Assessment
-**Material ESG Risks**:
-- **Regulatory Risk**: Data privacy, antitrust, AI regulation (Medium-High)
-- **Climate Risk**: Physical risks to datacenters, transition risks from carbon pricing (Medium)
-- **Cybersecurity**: Increasing attack surface and responsibility (High)
-- **Human Rights**: Supply chain labor practices, product use in authoritarian regimes (Medium)
-
-**Risk Mitigation**: Microsoft has strong ESG risk management frameworks and is generally proactive in addressing emerging issues.
-
-## ESG Momentum
-**Trend**: Positive - Microsoft is improving ESG performance year-over-year and setting industry leadership standards in multiple areas.
-
-## ESG Investment Recommendation
-**STRONG ESG BUY** - Microsoft is a top-tier ESG performer in the technology sector. Suitable for ESG-focused portfolios, impact investors, and those seeking sustainable technology exposure. The company's commitment to climate action, social responsibility, and strong governance makes it attractive for long-term responsible investors.
-
-## Engagement Opportunities
-Shareholders should continue to engage on:
-- Scope 3 emissions reduction acceleration
-- Diversity in leadership and technical roles
-- Ethical AI development and deployment guardrails
-- Supply chain labor standards enforcement
-"""
-}
-
-INVESTOR_OPINIONS = {
-    "Warren Buffett": """
-# Warren Buffett's Investment Analysis: Microsoft (MSFT)
-
-## Investment Philosophy Application
-Looking at Microsoft through my value investing lens, I see a business that possesses many characteristics I've traditionally sought:
-
-**Economic Moat Analysis**:
-Microsoft has one of the widest economic moats I've seen in technology. The switching costs for enterprises using Microsoft 365, Azure, and Windows are enormous. Once a company integrates these systems, the cost and disruption of migrating away is often prohibitive. This is the kind of competitive advantage that compounds over time.
-
-**Business Quality**:
-This is what I call a "wonderful business at a fair price" rather than a "fair business at a wonderful price." The key metrics that matter to me:
-- Return on Equity exceeding 40% - exceptional capital efficiency
-- Free cash flow generation of $60B+ annually - the business prints money
-- Gross margins around 70% - tremendous pricing power
-- Management that allocates capital intelligently (buybacks, dividends, strategic acquisitions)
-
-**Management Assessment**:
-Satya Nadella has proven to be an exceptional capital allocator. The pivot to cloud, the OpenAI investment, and the cultural transformation demonstrate strategic thinking that creates long-term value. This is the kind of management team you want running your business.
-
-**Valuation Perspective**:
-Here's where I have some reservation. At current multiples, Microsoft is priced for perfection. While the business is exceptional, I prefer a margin of safety. That said, if I already owned Microsoft (and Berkshire does through our portfolio managers), I wouldn't sell it. The quality of the business justifies holding even at premium valuations.
-
-**Circle of Competence**:
-Technology has traditionally been outside my circle of competence - I don't invest in businesses I don't understand. However, Microsoft has evolved into more of a utility-like business with predictable subscription revenues. It's less about predicting technological disruption and more about understanding network effects and customer dependency.
-
-## Investment Decision
-
-**HOLD (if owned) / WAIT FOR PULLBACK (if not owned)**
-
-**Reasoning**:
-- Quality is unquestionable - this is an exceptional business
-- Economic moat is wide and durable
-- Management is excellent
-- Current valuation leaves limited margin of safety for new purchases
-- Would be aggressive buyer on any 15-20% pullback
-
-**Position Sizing**:
-If I were buying today, I'd limit it to 5-7% of portfolio at current prices. On a significant market correction, I'd be comfortable with 10-15% allocation.
-
-**Final Thought**:
-Microsoft embodies many principles I've taught over the decades: sustainable competitive advantages, pricing power, shareholder-friendly management, and predictable economics. While I've historically avoided tech, Microsoft has characteristics more similar to my traditional holdings than most technology companies. The price is the only thing keeping me from pounding the table on this one.
-
-Remember: "Price is what you pay, value is what you get." Microsoft offers great value, but the current price doesn't offer the margin of safety I traditionally require. That doesn't make it a bad investment - just means I'd prefer to pay less.
-""",
-
-    "Ray Dalio": """
-# Ray Dalio's Investment Analysis: Microsoft (MSFT)
-
-## Macro Context
-We're operating in an environment of:
-- High government debt levels globally
-- Central banks balancing inflation concerns with growth needs
-- Technological disruption accelerating (AI revolution)
-- Geopolitical tensions rising (US-China competition)
-- Transition from globalization to fragmentation
-
-In this context, Microsoft represents a high-quality asset with both growth and defensive characteristics.
-
-## All-Weather Portfolio Perspective
-
-**Diversification Analysis**:
-Within a properly diversified portfolio, Microsoft serves several functions:
-1. **Growth Asset**: Exposure to secular technology trends (cloud, AI, digital transformation)
-2. **Quality Ballast**: Defensive characteristics in downturn due to subscription revenue and enterprise lock-in
-3. **USD Asset**: Benefits from dollar strength given global revenue base
-4. **Inflation Hedge**: Pricing power allows margin protection in inflationary environments
-
-**Correlation Benefits**:
-- Low correlation to bonds and commodities
-- Moderate correlation to equities (Beta ~0.9)
-- Good diversifier within tech sector due to enterprise focus vs. consumer tech
-
-## Risk Parity Assessment
-
-**Risk Factors**:
-1. **Economic Growth Risk**: Moderate exposure - enterprise spending vulnerable to recession
-2. **Inflation Risk**: Well-hedged - pricing power and subscription model protect margins
-3. **Geopolitical Risk**: Moderate exposure - global operations, China tensions
-4. **Technology Disruption Risk**: Lower than peers - diversified product portfolio
-
-**Risk-Adjusted Returns**:
-Microsoft offers excellent Sharpe ratio (0.95 over 3 years), suggesting strong risk-adjusted performance. The consistency of returns is particularly attractive.
-
-## Principles-Based Analysis
-
-**Applying My Principles**:
-1. **"Don't have false precision"**: While models might suggest exact price targets, acknowledge uncertainty
-2. **"Diversify well"**: Microsoft should be one position among many uncorrelated return streams
-3. **"Balance your portfolio"**: Position size should reflect both conviction and risk
-4. **"Know what you don't know"**: Technology evolution is uncertain - don't over-concentrate
-
-**Debt Cycle Positioning**:
-We're likely in late stages of long-term debt cycle. In this environment:
-- Quality companies with pricing power outperform
-- Companies with strong balance sheets weather deleveraging better
-- Microsoft checks both boxes
-
-## Scenario Analysis
-
-**Bull Scenario (40% probability)**:
-- AI revolution accelerates, Microsoft monetizes via Copilot and Azure AI services
-- Cloud migration continues faster than expected
-- Returns: 15-20% annually
-
-**Base Scenario (40% probability)**:
-- Steady growth continues, cloud market share stable
-- AI adoption meets expectations
-- Returns: 8-12% annually
-
-**Bear Scenario (20% probability)**:
-- Recession impacts enterprise IT spending
-- Competitive pressure compresses cloud margins
-- Regulatory action limits growth
-- Returns: -5% to +5% annually
-
-**Expected Return** (probability-weighted): ~10-12% annually
-
-## Portfolio Construction Recommendation
-
-**Strategic Allocation**: 3-5% of total portfolio
-- Large enough to matter if thesis plays out
-- Small enough to survive if wrong
-- Fits within equity allocation bucket
-
-**Tactical Considerations**:
-- Current environment favors quality over value
-- Fed policy uncertainty suggests keeping some dry powder
-- Would increase position on 10%+ pullback
-
-## Investment Decision
-
-**BUY - Measured Position**
-
-**Rationale**:
-Microsoft fits well within a diversified, all-weather portfolio. It provides:
-- Growth exposure with defensive characteristics
-- Quality earnings with inflation protection
-- Diversification benefits within equity allocation
-- Strong risk-adjusted return potential
-
-**Key Hedges to Consider**:
-- Pair with uncorrelated assets (gold, bonds, commodities)
-- Use options to define risk if position size grows large
-- Monitor recession indicators for tactical adjustments
-
-**Action Items**:
-1. Initiate 3-4% portfolio position at current levels
-2. Prepare to add another 1-2% on any >10% pullback
-3. Rebalance if position grows beyond 6% due to appreciation
-4. Review quarterly in context of macro environment changes
-
-**Final Thought**:
-In a world of elevated uncertainty, Microsoft represents one of the highest-quality growth assets available. While not without risks, it earns a place in a well-diversified portfolio. Just remember: this should be one of many bets, not the bet. Diversification is still the holy grail of investing.
-""",
-
-    "Cathie Wood": """
-# Cathie Wood's Investment Analysis: Microsoft (MSFT)
-
-## Disruptive Innovation Thesis
-
-Microsoft is at the epicenter of multiple exponential innovation curves converging simultaneously:
-
-**Primary Innovation Platforms**:
-1. **Artificial Intelligence**: OpenAI partnership and Copilot integration represents the most aggressive AI commercialization strategy in the industry
-2. **Cloud Computing**: Azure's infrastructure powers the next generation of innovation - from genomics to autonomous systems
-3. **Digital Biology**: Azure cloud enables genomic sequencing and precision medicine at scale
-4. **Blockchain/Web3**: Azure blockchain services supporting decentralized innovation
-5. **Metaverse**: HoloLens and mixed reality positioning for spatial computing revolution
-
-## Wright's Law Analysis
-
-Applying Wright's Law (cost declines with cumulative production), Microsoft benefits from:
-- **AI Model Training**: Costs declining 40% annually as scale increases
-- **Cloud Infrastructure**: Unit economics improving with datacenter optimization
-- **Software Distribution**: Near-zero marginal cost for digital product distribution
-
-**Exponential Growth Indicators**:
-- Azure AI service usage growing 100%+ YoY
-- Copilot adoption exceeding early internet adoption curves
-- Developer platform engagement accelerating (GitHub + AI tools)
-
-## Total Addressable Market (TAM)
-
-**Current TAM**: ~$1T across cloud, productivity, gaming, AI
-**Future TAM (2030)**: ~$5T+ as AI transforms every software category
-
-**Market Share Trajectory**:
-- Cloud: Growing share in $1.8T market
-- AI Services: Early leader in $500B+ emerging market
-- Productivity: Defending ~$300B market while expanding with AI
-- Gaming: Growing share in $400B market
-
-## Innovation Velocity Assessment
-
-**What Excites Me**:
-1. **AI Monetization Speed**: Copilot integration fastest enterprise AI rollout ever observed
-2. **Platform Network Effects**: Azure + AI + Microsoft 365 creating compounding value
-3. **Developer Ecosystem**: GitHub Copilot transforming how 100M+ developers work
-4. **Cultural Transformation**: Satya has created innovation culture rivaling any tech company
-
-**Innovation Risks**:
-- **Incumbency Drag**: Large installed base could slow disruptive innovation
-- **Regulatory Capture**: Success attracting regulatory scrutiny
-- **Innovator's Dilemma**: Protecting existing revenue streams vs. cannibalizing with AI
-
-## Disruption Vulnerability Analysis
-
-**Microsoft as Disruptor** (Offensive):
-- AI Copilots disrupting knowledge work productivity (massive TAM)
-- Azure disrupting traditional enterprise IT infrastructure
-- Gaming (Xbox Cloud) disrupting console gaming business model
-
-**Microsoft as Disrupted** (Defensive):
-- Low Risk: Strong competitive moats, network effects protect core
-- Medium Risk: Open-source AI models could democratize capabilities
-- High Risk: Completely new computing paradigm (quantum, etc.)
-
-**Net Assessment**: Microsoft is more disruptor than disrupted - rare for company of this size
-
-## Growth Trajectory Modeling
-
-**Revenue Growth Projections** (CAGR 2024-2030):
-- Base Case: 12-15% (driven by cloud and AI)
-- Bull Case: 18-22% (AI adoption accelerates dramatically)
-- Bear Case: 7-10% (economic headwinds, slower AI adoption)
-
-**My Forecast**: 16-18% CAGR - AI represents once-in-a-generation platform shift
-
-## Valuation Through Innovation Lens
-
-Traditional valuation metrics miss the story. I focus on:
-- **Innovation Value**: What's the NPV of Copilot alone? Easily $500B+
-- **Platform Value**: Network effects creating $1T+ in value over decade
-- **Optionality Value**: Multiple shots on goal (AI, metaverse, quantum, etc.)
-
-**Fair Value Estimate**: $550-650 per share (2025 target)
-**Current Price**: Undervalued relative to innovation potential
-
-## Portfolio Strategy
-
-**Conviction Level**: VERY HIGH
-
-**Why This Fits ARK Strategy**:
-- Pure play on AI revolution (the biggest innovation theme)
-- Exposure to multiple exponential growth curves
-- Platform company with compounding network effects
-- Management aligned with innovation-first culture
-
-**Position Sizing**:
-In an innovation-focused portfolio: **8-12% position**
-- Higher than typical for mega-cap (we usually focus on smaller innovators)
-- Justified by innovation velocity and execution capability
-- Diversified across multiple innovation themes
-
-**Trading Strategy**:
-- Core long-term holding (5-year+ horizon)
-- Add on any pullbacks >10%
-- Not a trading position - this is a compounding story
-- Volatile markets are buying opportunities
-
-## Investment Decision
-
-**STRONG BUY - High Conviction Core Holding**
-
-**Why I'm Pounding The Table**:
-1. **AI Revolution Leader**: Best-positioned large cap to monetize AI transformation
-2. **Execution**: Satya Nadella is the best innovation CEO at scale
-3. **Multiple Shots on Goal**: Not a single-product story - diversified innovation portfolio
-4. **Network Effects**: Compounding advantages accelerating
-5. **Underappreciated**: Market underestimating AI's impact on Microsoft's value
-
-**Risk Management**:
-- Volatility is feature, not bug - expect 30%+ drawdowns
-- Maintain conviction through volatility
-- Focus on 5-year outcome, not quarterly results
-- Pair with other innovation themes for diversification
-
-**What Would Change My Mind**:
-- Loss of OpenAI partnership
-- Regulatory action breaking up company
-- Fundamental shift in AI economics (open-source dominates)
-- Management change to non-innovation focused leadership
-
-**Final Thought**:
-We're living through the most significant technology platform shift since the internet - artificial intelligence. Microsoft, under Satya's leadership, has positioned itself at the absolute center of this revolution. The integration of AI into every Microsoft product, combined with Azure infrastructure leadership, creates a compounding growth story that will unfold over the next decade.
-
-This is exactly the kind of disruptive innovation story we look for - except it's happening inside a $3T company. That's historically rare and incredibly exciting. The market is underestimating how profoundly AI will transform Microsoft's growth trajectory.
-
-**Don't overthink this one. This is a generational opportunity to own the AI revolution's primary commercial vehicle.**
-""",
-
-    "Peter Lynch": """
-# Peter Lynch's Investment Analysis: Microsoft (MSFT)
-
-## Know What You Own
-
-**The Business in Plain English**:
-Microsoft makes and sells software that businesses and consumers use every day. Their main products:
-- **Office/Microsoft 365**: Word, Excel, PowerPoint - the tools people use to work (you've probably used these today)
-- **Windows**: Operating system running most PCs worldwide
-- **Azure**: Rents computer servers to other companies (cloud computing)
-- **Xbox**: Video game consoles and games
-- **LinkedIn**: Professional networking platform
-
-**The One-Sentence Story**: "Microsoft sells essential productivity software and cloud services that businesses depend on and can't easily replace."
-
-If you can't explain what a company does to a 10-year-old in 2 minutes, you probably shouldn't own it. Microsoft passes this test.
-
-## Category Classification
-
-**Company Type**: **Stalwart** (with some Fast Grower characteristics)
-
-Microsoft used to be a fast grower, became a slow grower (2010s), and is now a stalwart showing fast-grower tendencies again thanks to cloud and AI.
-
-**What This Means**:
-- Expect 10-15% annual gains (not 50%, not 500%)
-- Large position size appropriate (can be 5-10% of portfolio)
-- Good core holding for steady appreciation
-- Lower risk than pure growth stocks
-- Better than bonds or utilities
-
-## The Story - Is It Simple and Understandable?
-
-**The Investment Story**:
-"Companies are moving their computer systems to the cloud to save money and work better. Microsoft's Azure is one of the few companies that can handle this for big businesses. Also, they're adding AI tools to all their products that people already use daily. Since everyone already uses their software, it's easy to sell them the AI upgrade."
-
-**What I Like About This Story**:
-- Simple to understand ✓
-- Visible in everyday life ✓
-- Long runway ahead ✓
-- Defensible position ✓
-
-## Check The Fundamentals
-
-**The Peter Lynch Checklist**:
-
-✓ **Company has a niche** - Windows and Office = quasi-monopoly in corporate software
-✓ **People have to keep buying the product** - Subscription model means recurring revenue
-✓ **Company buys back shares** - Returning cash to shareholders intelligently
-✓ **Management owns stock** - Satya and team are aligned with shareholders
-✓ **Debt is manageable** - Strong balance sheet, could borrow much more if needed
-✓ **Company has a fortress balance sheet** - Massive cash reserves
-✓ **Hidden assets** - LinkedIn, GitHub, huge patent portfolio
-✗ **Cyclical timing** - Not a cyclical, so N/A
-✗ **"Diworsification"** - Some concern: gaming, hardware less obviously synergistic
-
-**Score**: 8/10 on the Lynch checklist
-
-## The Numbers That Matter
-
-**P/E Ratio Analysis**:
-- P/E: ~32 (roughly market price / annual earnings per share)
-- **Lynch's Rule**: Fair P/E = Growth Rate
-- Expected growth: 15% annually
-- **PEG Ratio**: ~2.1 (P/E of 32 ÷ Growth of 15%)
-
-**Lynch's Interpretation**:
-PEG over 2 suggests "fully valued" - you're paying up for quality. Not a screaming bargain, but not crazy for a company this good. I'd prefer PEG closer to 1.0, but will pay up to 1.5 for exceptional companies.
-
-**The 30-Second Balance Sheet**:
-- Tons of cash ✓
-- Little debt ✓
-- No worries ✓
-
-**Cash Flow**:
-Free cash flow of $60B+ annually = ~$8 per share
-That's fantastic - cash is piling up faster than they can spend it.
-
-## The Two-Minute Drill
-
-**What Could Go Right**:
-1. AI becomes essential, Microsoft monetizes across entire product line
-2. Cloud growth continues for another decade
-3. Copilot becomes as essential as Office was
-4. Gaming and LinkedIn grow faster than expected
-5. They acquire another game-changing company (like LinkedIn, GitHub)
-
-**What Could Go Wrong**:
-1. Recession hurts business software spending
-2. Competitors (Amazon, Google) take cloud market share
-3. Government breaks up company (antitrust)
-4. AI turns out to be overhyped
-5. Major cybersecurity breach damages reputation
-6. Young competitors disrupt with better AI products
-
-**Lynch's Risk Assessment**: Moderate risk - unlikely to go bankrupt or collapse, but could underperform for periods
-
-## Buy, Sell, or Hold?
-
-**If I Don't Own It**:
-**BUY on pullback** - I'd love to buy this at 20-25x earnings (around $320-340). At current prices, I'd start a half position and wait for a better entry.
-
-**If I Own It**:
-**HOLD and accumulate on dips** - This is the kind of stock you buy and forget about. Add more on any selloff of 10%+.
-
-**When I'd Sell**:
-- If P/E exceeds 40 and growth slows to single digits
-- If cloud growth stalls (revenue growth <5% for 2+ quarters)
-- If government breaks up company
-- If better opportunity comes along (rare for a stalwart)
-
-## Position Sizing
-
-**For a $100,000 portfolio**:
-- Conservative investor: $5,000-8,000 (5-8%)
-- Moderate investor: $8,000-12,000 (8-12%)
-- Aggressive investor: $10,000-15,000 (10-15%)
-
-**Lynch's Approach**: This is a stalwart, not a 10-bagger in waiting. Size accordingly. Could be among your larger positions, but shouldn't be 25% of your portfolio.
-
-## The Bottom Line
-
-**What I'd Tell My Brother-in-Law**:
-
-"Listen, Microsoft isn't going to make you rich overnight, but it's not going to make you poor either. It's one of the best-run companies in the world, selling products people need to use. They're not going anywhere.
-
-At today's price, you're paying a premium, but sometimes you get what you pay for. I'd rather own a great company at a fair price than a fair company at a great price.
-
-If you're building a portfolio for the long-term, Microsoft should probably be in there. Not your whole portfolio - diversify, for God's sake - but a solid 5-10% position makes sense.
-
-Don't try to trade it. Don't panic when it drops 10%. Just buy it, hold it, and check on it every quarter to make sure the story hasn't changed. That's it. Boring wins in the long run."
-
-## Final Recommendation
-
-**BUY - Quality Stalwart at Fair Price**
-
-**Action Plan**:
-1. **Start a position**: Buy 50% of your intended position at current prices
-2. **Scale in**: Add 25% more if it drops 10%
-3. **Complete position**: Add final 25% if it drops 15%
-4. **Hold long-term**: 5+ year holding period
-5. **Review quarterly**: Make sure cloud and AI growth remain strong
-
-**Remember Lynch's Rule**: "The stock market is not a slot machine. It rewards patience and punishes impatience. Microsoft is a stock to own for years, not weeks."
-
-**Expected Return**: 12-15% annually over next 5 years (from a combination of earnings growth and modest multiple expansion)
-
-That won't make you rich quick, but it'll make you wealthier steadily - and that's actually better.
-""",
-
-    "Michael Burry": """
-# Michael Burry's Investment Analysis: Microsoft (MSFT)
-
-## Contrarian Perspective
-
-Everyone loves Microsoft. Wall Street rates it a buy. Retail investors think it's safe. Tech enthusiasts are excited about AI. The consensus is overwhelmingly bullish.
-
-**That alone makes me cautious.**
-
-My career has been built on being right when the consensus is wrong. So let me look at what everyone else might be missing.
-
-## The Bearish Case (What I'm Worried About)
-
-**1. Valuation Risk - The Biggest Concern**
-
-Microsoft trades at:
-- P/E of ~32x (vs. historical average of ~20x)
-- EV/EBITDA of ~24x (premium to historical norms)
-- Price/Sales of ~12x (elevated for any company)
-
-**Historical Context**: In 2000, Microsoft traded at 60x earnings. Then it went sideways for 13 years as earnings grew into the valuation. We could see a similar period where the stock flatlines even as business grows.
-
-**AI Premium**: The market is pricing in massive AI upside. But what if:
-- AI adoption is slower than expected?
-- Open-source AI commoditizes the technology?
-- Regulatory constraints limit AI monetization?
-- Competitors catch up quickly?
-
-Current price assumes AI revolution happens as bulls expect. High probability of disappointment.
-
-**2. Macro Environment - Underappreciated Risk**
-
-We're facing:
-- **Interest Rates**: Higher for longer means growth stocks should trade at lower multiples. Microsoft trades like we're in a zero-rate world.
-- **Enterprise Spending**: Recessions hurt IT budgets. Azure growth could decelerate sharply in downturn.
-- **Dollar Strength**: Strong USD hurts international revenue (42% of sales).
-- **Tech Bubble 2.0?**: Are we repeating 1999 with AI replacing the internet as the narrative?
-
-**3. Competitive Threats - More Real Than Acknowledged**
-
-- **AWS**: Still #1 in cloud, has more experience and larger ecosystem
-- **Google Cloud**: Growing faster than Azure, gaining enterprise credibility, Cheaper pricing
-- **Open Source AI**: Meta's Llama, Mistral, others could democratize AI capabilities
-- **Regulatory Risk**: Antitrust actions in US, EU, and globally could constrain growth
-- **Customer Pushback**: Enterprise customers resisting price increases, exploring alternatives
-
-**4. Capital Allocation Questions**
-
-Microsoft's M&A track record is mixed:
-- Nokia acquisition: ~$7B writedown (disaster)
-- LinkedIn: $26B (jury still out on returns)
-- Activision: $69B (very expensive, regulatory headaches)
-- GitHub: Success, but small
-
-**Concern**: Are they overpaying for growth as internal innovation slows? Activision at $69B seems aggressive.
-
-**5. The AI Overhang**
-
-Everyone's focused on AI upside. I'm focused on AI costs:
-- Massive capex required ($30B+ annually on datacenters)
-- OpenAI partnership isn't exclusive - they could work with others
-- Copilot pricing unproven - will customers pay premiums?
-- Margin pressure from AI infrastructure costs
-
-**What if AI becomes a cost center rather than a profit center?**
-
-## The Bull Case (What I Might Be Wrong About)
-
-**Being intellectually honest - the bull arguments have merit**:
-
-1. **Network Effects**: The moat is real - switching costs are massive
-2. **Subscription Model**: Recurring revenue is more valuable than historical perpetual licensing
-3. **Management Quality**: Satya is legitimately excellent
-4. **Balance Sheet**: Fortress balance sheet provides downside protection
-5. **Dividend Growth**: Sustainable and growing income stream
-6. **AI Leadership**: Even if overhyped, Microsoft is genuinely ahead in commercialization
-
-## What the Numbers Tell Me
-
-**Deep Value Analysis**:
-
-Looking at normalized earnings power:
-- Normalized FCF: ~$60B annually
-- Conservative multiple: 20x FCF
-- Fair value: ~$1.2T market cap vs. current ~$3.1T
-
-**Implies**: 60%+ downside if we return to historical valuation norms
-
-**Bull Rebuttal**: Business quality has improved, higher multiples justified
-**My Response**: That's what they said in 2000
-
-**Scenario Analysis**:
-- **Bear Case (-40%)**: AI disappoints, recession hits, reversion to 20x earnings
-- **Base Case (-10% to +10%)**: Muddle through, valuations stay elevated
-- **Bull Case (+30%)**: AI revolution happens faster than expected
-
-**My Probability Weighting**:
-- Bear: 35%
-- Base: 50%
-- Bull: 15%
-
-**Expected Return**: Slightly negative to flat over next 2-3 years
-
-## The Trade
-
-**I'm Not Short (Yet), But I'm Not Long Either**
-
-**Why I'm Not Short**:
-- Too crowded as a long - but still hard to borrow and time
-- Balance sheet too strong - company won't collapse
-- Dividend and buybacks provide support
-- Could be wrong about AI adoption curve
-- Market can stay irrational longer than I can stay solvent (learned this the hard way)
-
-**Why I'm Not Long**:
-- Valuation offers no margin of safety
-- Macro headwinds increasing
-- Consensus is too bullish - crowded trade
-- Better opportunities elsewhere (value, special situations)
-- Risk/reward is unfavorable at current prices
-
-## Alternative Trade Ideas
-
-**If You Must Own Tech Exposure**:
-
-Instead of Microsoft at 32x earnings, consider:
-- **Meta**: Trading at 24x with better growth (but different risks)
-- **Oracle**: Trading at 28x with cloud momentum and lower valuation
-- **Alphabet**: Trading at 22x with AI exposure and better value
-- **Small-cap cloud companies**: trading at 3-5x sales vs. Microsoft at 12x
-
-**Or Wait**: Cash earns 5%+ risk-free. Be patient for better entry.
-
-## When I'd Change My Mind
-
-**What Would Make Me Bullish**:
-1. Stock drops 25-30% (around $280-300)
-2. Recession hits and company shows resilience
-3. AI monetization proves out with real revenue acceleration
-4. Valuation compresses to 22-25x earnings
-5. Consensus turns bearish (contrarian indicator)
-
-**What Would Make Me Short**:
-1. Evidence AI spending is wasted (low ROI)
-2. Azure growth decelerates to <10%
-3. Margins compress from competition
-4. Macro environment deteriorates sharply
-5. Stock rallies another 20% on AI hype (blow-off top)
-
-## Final Recommendation
-
-**AVOID / WAIT FOR BETTER ENTRY**
-
-**For Current Holders**:
-- **Trim**: Consider taking some profits, especially if it's a large position
-- **Hedge**: Use put options to define downside if unwilling to sell
-- **Tax Harvest**: If you have losses elsewhere, consider selling to offset gains
-
-**For Prospective Buyers**:
-- **Wait**: Cash is better than overpaying for quality
-- **Set Limit Orders**: $320 (10% pullback), $280 (25% pullback)
-- **Watch Fundamentals**: If Azure growth slows, that's your warning sign
-
-## The Contrarian Bottom Line
-
-**What Everyone Believes**:
-"Microsoft is a safe, high-quality AI play that belongs in every portfolio."
-
-**What I Believe**:
-"Microsoft is a great company trading at a price that assumes perfection. The risk/reward is poor. Patience will be rewarded with better entry points."
-
-**Remember**:
-- Great company ≠ Great stock (at any price)
-- Consensus can be right about quality but wrong about price
-- The biggest risks come from investments everyone thinks are safe
-- Valuation matters - always has, always will
-
-**I'd rather own a good company at a great price than a great company at a good price. Microsoft is a great company at a full price. I'll wait.**
-
-**Track Record Reminder**: I was mocked for shorting housing in 2005-2006. I was mocked for buying value stocks in 2020. I'm comfortable being wrong with the crowd or right against it. Right now, I'm comfortable sitting in cash and waiting for fat pitches.
-
-This isn't a fat pitch. It's a pitch everyone's swinging at. I'll wait for mine.
-"""
-}
-
-SYNTHESIS_DECISION = """
-# Investment Synthesis: Microsoft (MSFT)
-
-## 1. Summary of Investor Opinions
-
-The panel of legendary investors has provided diverse perspectives on Microsoft, reflecting their distinct investment philosophies:
-
-**Warren Buffett** - HOLD (if owned) / WAIT FOR PULLBACK (if not owned)
-Views Microsoft as a wonderful business with exceptional competitive moats and quality, but finds current valuation leaves limited margin of safety for new purchases.
-
-**Ray Dalio** - BUY (Measured Position)
-Recommends 3-5% portfolio allocation, appreciating Microsoft's quality characteristics and diversification benefits within an all-weather portfolio framework. Sees strong risk-adjusted returns.
-
-**Cathie Wood** - STRONG BUY (High Conviction)
-Extremely bullish, viewing Microsoft as the primary commercial vehicle for the AI revolution. Recommends 8-12% position size, emphasizing innovation velocity and multiple exponential growth curves.
-
-**Peter Lynch** - BUY on pullback
-Classifies as a "stalwart" with fast-grower characteristics. Finds the business simple to understand with strong fundamentals, but prefers entry at lower valuation (PEG closer to 1.0).
-
-**Michael Burry** - AVOID / WAIT FOR BETTER ENTRY
-Most bearish perspective, concerned about premium valuation, macro headwinds, and AI hype. Would trim existing positions and wait for 25-30% pullback before considering purchase.
-
-## 2. Areas of Agreement
-
-Despite different investment styles, several consensus themes emerged:
-
-✓ **Business Quality**: Universal agreement that Microsoft is an exceptional, high-quality business
-✓ **Competitive Moat**: All investors acknowledge Microsoft's wide and durable economic moat through network effects and switching costs
-✓ **Management Excellence**: Satya Nadella widely praised for strategic vision and capital allocation
-✓ **AI Leadership**: Recognition that Microsoft is well-positioned in the AI revolution (though disagreement on valuation impact)
-✓ **Cash Generation**: Strong free cash flow and balance sheet strength acknowledged across all perspectives
-✓ **Subscription Model**: Recurring revenue model viewed positively for predictability
-
-## 3. Areas of Disagreement
-
-**Valuation Assessment**:
-- **Bulls (Wood, Dalio)**: Current valuation justified by innovation potential and quality
-- **Moderates (Buffett, Lynch)**: Fairly valued but prefer lower entry points
-- **Bears (Burry)**: Significantly overvalued with 40-60% downside risk
-
-**AI Impact**:
-- **Wood**: AI is transformational, underappreciated by market
-- **Dalio/Lynch**: AI is positive but already priced in
-- **Burry**: AI may be overhyped, could become cost center rather than profit driver
-
-**Risk Assessment**:
-- **Conservative (Buffett, Burry)**: Emphasize valuation risk and macro headwinds
-- **Balanced (Dalio, Lynch)**: Acknowledge risks but see quality offsetting concerns
-- **Aggressive (Wood)**: View volatility as opportunity, focus on 5-year potential
-
-**Position Sizing**:
-- Ranges from 0% (Burry's avoidance) to 12% (Wood's high conviction)
-- Average recommended allocation among buyers: ~6-8% of portfolio
-
-## 4. Key Decision Factors
-
-**Primary Factors Supporting Purchase**:
-1. **Durable competitive advantages** - Network effects, switching costs, brand value
-2. **AI commercialization leadership** - OpenAI partnership, Copilot integration
-3. **Cloud growth runway** - Azure market share gains, hybrid cloud positioning
-4. **Subscription revenue model** - Predictable, recurring cash flows
-5. **Management quality** - Satya Nadella's strategic execution
-6. **Financial strength** - Fortress balance sheet, massive FCF generation
-
-**Primary Concerns**:
-1. **Premium valuation** - P/E of 32x vs. historical 20x average, PEG ratio of 2.1
-2. **Macro environment** - Interest rate sensitivity, enterprise spending vulnerability
-3. **Competition** - AWS, Google Cloud gaining ground; open-source AI threats
-4. **Regulatory risk** - Antitrust scrutiny in multiple jurisdictions
-5. **AI uncertainty** - Monetization path unclear, infrastructure costs high
-6. **Market consensus** - Crowded trade with bullish positioning
-
-## 5. Final Recommendation: **MODERATE BUY**
-
-**Recommendation Breakdown**:
-- Strong Buy: 1 investor (Wood)
-- Buy: 2 investors (Dalio, Lynch - with conditions)
-- Hold/Selective: 1 investor (Buffett - hold if owned)
-- Avoid: 1 investor (Burry)
-
-**Synthesized View**:
-Microsoft represents a rare combination of quality, growth, and relative defensive characteristics. The business fundamentals are exceptional, the competitive position is strong, and the company is well-positioned for secular technology trends (cloud, AI, digital transformation).
-
-However, current valuation reflects much of this positive outlook, leaving limited margin of safety. The stock is "fairly valued" rather than "undervalued," making it more suitable for:
-- Long-term buy-and-hold investors willing to accept moderate returns (10-15% annually)
-- Core portfolio holdings in diversified portfolios
-- Investors seeking quality exposure to technology trends
-- Those implementing dollar-cost averaging strategies
-
-Less suitable for:
-- Value investors seeking significant margin of safety
-- Short-term traders looking for quick gains
-- Concentrated portfolios (position sizing discipline critical)
-- Investors unable to tolerate 20-30% volatility
-
-## 6. Confidence Level: **MEDIUM-HIGH**
-
-**Confidence in Business Quality**: HIGH
-The panel unanimously agrees on Microsoft's exceptional business characteristics, competitive position, and management quality.
-
-**Confidence in Valuation**: MEDIUM
-Significant disagreement exists on whether current price offers adequate risk/reward. Valuation assessment depends heavily on:
-- AI adoption and monetization timeline
-- Macroeconomic conditions
-- Competitive dynamics evolution
-- Interest rate environment
-
-**Confidence in Timing**: MEDIUM
-Current entry point is reasonable for long-term investors but not compelling. Better entry opportunities may emerge on market corrections.
-
-## 7. Key Risks and Considerations
-
-**Critical Risks to Monitor**:
-
-1. **Valuation Compression Risk** (HIGH)
-   - If AI monetization disappoints or macro conditions deteriorate, P/E could compress to 25x or below
-   - Potential 20-30% downside even with stable business fundamentals
-   - Mitigation: Position sizing discipline, dollar-cost averaging
-
-2. **Competitive Pressure** (MEDIUM-HIGH)
-   - AWS maintaining cloud leadership, Google accelerating AI efforts
-   - Open-source AI models democratizing capabilities
-   - Mitigation: Monitor Azure growth rates and market share trends
-
-3. **Macroeconomic Sensitivity** (MEDIUM)
-   - Enterprise IT spending vulnerable to recession
-   - Higher rates pressure growth stock multiples
-   - Mitigation: Diversification, long-term perspective
-
-4. **Regulatory Risk** (MEDIUM)
-   - Antitrust actions could limit M&A or force business changes
-   - Data privacy regulations increasing compliance costs
-   - Mitigation: Factor into valuation assumptions
-
-5. **Technology Disruption** (LOW-MEDIUM)
-   - New computing paradigms could emerge
-   - Open-source alternatives gaining traction
-   - Mitigation: Microsoft's scale and resources provide adaptation capability
-
-**Recommended Portfolio Actions**:
-
-**For New Investors**:
-- Initiate 3-5% position at current levels
-- Scale into full 6-8% position on any 10%+ pullbacks
-- Use dollar-cost averaging over 3-6 months
-- Set alerts for entry points: $380 (10% down), $340 (20% down)
-
-**For Current Holders**:
-- Maintain core holding (5-10% of portfolio)
-- Rebalance if position exceeds 12% due to appreciation
-- Consider trimming if P/E exceeds 40x
-- Add to position opportunistically on weakness
-
-**For Risk Management**:
-- Pair with uncorrelated assets (bonds, commodities, international stocks)
-- Consider put options if position size grows large (>10%)
-- Monitor quarterly for changes in growth trajectory
-- Be prepared for 25-35% drawdowns (normal for high-quality growth)
-
-## Conclusion
-
-Microsoft earns a **MODERATE BUY** recommendation with **6-8% target portfolio weight** for long-term investors. The exceptional business quality, durable competitive advantages, and strong positioning in secular trends justify ownership despite premium valuation.
-
-This is not a "slam dunk" buy at current prices, but rather a quality holding that should deliver solid risk-adjusted returns over a 5+ year period. Investors should approach with realistic return expectations (10-15% annually) and appropriate position sizing discipline.
-
-**Investment Timeframe**: 5+ years
-**Expected Annual Return**: 10-15%
-**Volatility Expectation**: High (25-35% peak-to-trough drawdowns possible)
-**Suitable For**: Long-term growth portfolios, diversified technology exposure, quality-focused strategies
-
-**Action Required**: Build or maintain position with disciplined position sizing. Patience may be rewarded with better entry points, but missing the long-term compounding would be more costly than paying a fair price today.
-"""
@@ -0,0 +1,39 @@
+"""
+Pre-generated responses from Claude for the FinAgents system.
+This allows the system to run without making external API calls.
+
+The generic generators are always available; canned documents for specific
+tickers are loaded from the data files on first use.
+"""
+
+from .generators import (
+    get_generic_analyst_report,
+    get_generic_investor_opinion,
+    get_generic_synthesis,
+    ReportFeatures,
+    build_features,
+    render_reports,
+)
+from .library import (
+    has_canned_responses,
+    get_canned_analyst_report,
+    get_canned_investor_opinion,
+    get_canned_synthesis,
+    get_canned_documents,
+)
+from .portfolio import render_portfolio, iter_render_portfolio, failure_text
+
+# The original module exposed the MSFT texts as constants; they are now built on demand
+_LEGACY_TICKER = "MSFT"
+
+def __getattr__(name):
+    if name == "ANALYST_REPORTS":
+        value = get_canned_documents(_LEGACY_TICKER, "analyst")
+    elif name == "INVESTOR_OPINIONS":
+        value = get_canned_documents(_LEGACY_TICKER, "investor")
+    elif name == "SYNTHESIS_DECISION":
+        value = get_canned_synthesis(_LEGACY_TICKER)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
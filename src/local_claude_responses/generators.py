@@ -0,0 +1,778 @@
+"""
+Generic response generators for the FinAgents system.
+
+These build analyst reports, investor opinions and a synthesis for any ticker
+from its stock data, and are kept apart from the canned texts so importing
+them never loads the response library.
+
+Rendering is split in two steps: ``build_features`` reads a ticker's stock data
+once and formats the figures that several templates print, and each agent's
+template renders from that record and classifies the figures it needs.
+"""
+
+from typing import Any, Dict, NamedTuple, Tuple
+
+class ReportFeatures(NamedTuple):
+    """Stock data fields and preformatted figures shared by the report templates."""
+    ticker: str
+    company: Any
+    sector: Any
+    industry: Any
+    price: Any
+    pe: Any
+    forward_pe: Any
+    market_cap: Any
+    dividend_yield: Any
+    beta: Any
+    eps: Any
+    revenue_growth: Any
+    profit_margin: Any
+    roe: Any
+    debt_to_equity: Any
+    year_high: Any
+    year_low: Any
+    year_change: Any
+    recent_trend: Any
+    cap_str: Any
+    # Formatted once here rather than in each template that prints them
+    price_fmt: Any
+    pe_fmt: Any
+    forward_pe_fmt: Any
+    beta_fmt: Any
+    revenue_growth_fmt: Any
+    profit_margin_fmt: Any
+    roe_fmt: Any
+    debt_to_equity_fmt: Any
+    year_high_fmt: Any
+    year_low_fmt: Any
+    year_change_fmt: Any
+
+class _FormatFailure:
+    """Stands in for a field that could not be formatted and re-raises when a template prints it."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+    def __format__(self, spec: str) -> str:
+        raise self.error
+
+def _format(value: Any, spec: str) -> Any:
+    # Bad data only fails the templates that print the field, as before
+    try:
+        return format(value, spec)
+    except Exception as e:
+        return _FormatFailure(e)
+
+def _format_market_cap(market_cap: Any) -> Any:
+    try:
+        if market_cap >= 1e12:
+            return f"${market_cap/1e12:.2f}T"
+        elif market_cap >= 1e9:
+            return f"${market_cap/1e9:.1f}B"
+        else:
+            return f"${market_cap/1e6:.0f}M"
+    except Exception as e:
+        return _FormatFailure(e)
+
+def build_features(ticker: str, stock_data: Dict[str, Any]) -> ReportFeatures:
+    """Read a ticker's stock data and format the shared figures for the report templates."""
+    price = stock_data.get('current_price', 0)
+    pe = stock_data.get('pe_ratio', 0)
+    forward_pe = stock_data.get('forward_pe', 0)
+    market_cap = stock_data.get('market_cap', 0)
+    beta = stock_data.get('beta', 0)
+    revenue_growth = stock_data.get('revenue_growth', 0)
+    profit_margin = stock_data.get('profit_margin', 0)
+    roe = stock_data.get('return_on_equity', 0)
+    debt_to_equity = stock_data.get('debt_to_equity', 0)
+    year_high = stock_data.get('52w_high', 0)
+    year_low = stock_data.get('52w_low', 0)
+    year_change = stock_data.get('52w_change', 0)
+
+    # Positional, in field order: building the record is on the per-report path
+    return ReportFeatures(
+        ticker,
+        stock_data.get('company_name', ticker),
+        stock_data.get('sector', 'Unknown'),
+        stock_data.get('industry', 'Unknown'),
+        price,
+        pe,
+        forward_pe,
+        market_cap,
+        stock_data.get('dividend_yield', 0) * 100,
+        beta,
+        stock_data.get('eps', 0),
+        revenue_growth,
+        profit_margin,
+        roe,
+        debt_to_equity,
+        year_high,
+        year_low,
+        year_change,
+        stock_data.get('recent_trend', 'Unknown'),
+        _format_market_cap(market_cap),
+        _format(price, ".2f"),
+        _format(pe, ".1f"),
+        _format(forward_pe, ".1f"),
+        _format(beta, ".2f"),
+        _format(revenue_growth, "+.1f"),
+        _format(profit_margin, ".1f"),
+        _format(roe, ".1f"),
+        _format(debt_to_equity, ".2f"),
+        _format(year_high, ".2f"),
+        _format(year_low, ".2f"),
+        _format(year_change, "+.1f"),
+    )
+
+def _fundamental_analyst(features):
+    ticker = features.ticker
+    company = features.company
+    sector = features.sector
+    industry = features.industry
+    pe = features.pe
+    forward_pe = features.forward_pe
+    dividend_yield = features.dividend_yield
+    eps = features.eps
+    revenue_growth = features.revenue_growth
+    profit_margin = features.profit_margin
+    roe = features.roe
+    debt_to_equity = features.debt_to_equity
+    cap_str = features.cap_str
+    price_fmt = features.price_fmt
+    pe_fmt = features.pe_fmt
+    forward_pe_fmt = features.forward_pe_fmt
+    revenue_growth_fmt = features.revenue_growth_fmt
+    profit_margin_fmt = features.profit_margin_fmt
+    roe_fmt = features.roe_fmt
+    debt_to_equity_fmt = features.debt_to_equity_fmt
+    year_high_fmt = features.year_high_fmt
+    year_low_fmt = features.year_low_fmt
+    year_change_fmt = features.year_change_fmt
+
+    valuation_assessment = "Undervalued" if pe < 15 else "Fairly Valued" if pe < 25 else "Premium Valuation" if pe < 40 else "Extended Valuation"
+    growth_assessment = "High Growth" if revenue_growth > 15 else "Moderate Growth" if revenue_growth > 5 else "Low Growth" if revenue_growth > 0 else "Declining"
+    profitability = "Excellent" if profit_margin > 20 else "Strong" if profit_margin > 10 else "Moderate" if profit_margin > 5 else "Weak"
+
+    return f"""# Fundamental Analysis: {company} ({ticker})
+
+## Executive Summary
+{company} is a {sector} sector company with {cap_str} market capitalization. Current fundamental analysis reveals {valuation_assessment.lower()} characteristics with {growth_assessment.lower()} profile.
+
+## Key Metrics
+- **Current Price**: ${price_fmt}
+- **Market Cap**: {cap_str}
+- **Sector/Industry**: {sector} / {industry}
+- **52-Week Range**: ${year_low_fmt} - ${year_high_fmt}
+- **Year-to-Date Performance**: {year_change_fmt}%
+
+## Valuation Analysis
+**P/E Ratio**: {pe_fmt}x (Forward: {forward_pe_fmt}x)
+- **Assessment**: {valuation_assessment}
+- Trailing P/E suggests the stock is trading at {"a premium" if pe > 25 else "reasonable" if pe > 15 else "attractive"} valuation relative to earnings
+- Forward P/E of {forward_pe_fmt}x indicates {"improving" if forward_pe < pe else "deteriorating"} earnings outlook
+
+**Earnings Per Share**: ${eps:.2f}
+- {"Strong" if eps > 5 else "Moderate" if eps > 1 else "Developing"} earnings generation capability
+
+## Growth & Profitability
+**Revenue Growth**: {revenue_growth_fmt}%
+- **Assessment**: {growth_assessment}
+- {"Excellent" if revenue_growth > 20 else "Solid" if revenue_growth > 10 else "Modest" if revenue_growth > 0 else "Concerning"} top-line expansion
+
+**Profit Margin**: {profit_margin_fmt}%
+- **Assessment**: {profitability} margins
+- {"Industry-leading" if profit_margin > 20 else "Competitive" if profit_margin > 10 else "Below average"} operational efficiency
+
+**Return on Equity**: {roe_fmt}%
+- {"Exceptional" if roe > 20 else "Strong" if roe > 15 else "Adequate" if roe > 10 else "Weak"} capital efficiency
+
+## Financial Health
+**Debt-to-Equity**: {debt_to_equity_fmt}x
+- {"Conservative" if debt_to_equity < 0.5 else "Moderate" if debt_to_equity < 1.0 else "Elevated" if debt_to_equity < 2.0 else "High"} leverage
+- Balance sheet appears {"strong" if debt_to_equity < 1.0 else "manageable" if debt_to_equity < 2.0 else "stretched"}
+
+**Dividend Yield**: {dividend_yield:.2f}%
+- {"Income-generating with" if dividend_yield > 2 else "Modest" if dividend_yield > 0 else "No"} dividend payment
+
+## Investment Thesis
+**Strengths**:
+- {sector} sector positioning
+- {growth_assessment} revenue trajectory
+- {profitability} profitability profile
+{"- Attractive dividend yield" if dividend_yield > 2 else ""}
+
+**Concerns**:
+{"- Extended valuation metrics" if pe > 30 else ""}
+{"- Negative revenue growth" if revenue_growth < 0 else ""}
+{"- Weak profit margins" if profit_margin < 5 else ""}
+{"- High leverage" if debt_to_equity > 2 else ""}
+
+## Recommendation
+**{("BUY" if pe < 20 and revenue_growth > 10 and profit_margin > 15 else "HOLD" if pe < 30 else "CAUTIOUS")}** - From a fundamental perspective, {company} {"presents compelling value with strong growth and profitability" if pe < 20 and revenue_growth > 10 else "offers reasonable quality at current valuation" if pe < 30 else "appears fully valued and requires patience for better entry"}.
+
+Target Entry: Consider {"current levels" if pe < 20 else "10-15% pullback" if pe < 30 else "significant pullback (20%+)"} for optimal risk/reward.
+"""
+
+def _technical_analyst(features):
+    ticker = features.ticker
+    company = features.company
+    price = features.price
+    beta = features.beta
+    year_high = features.year_high
+    year_low = features.year_low
+    year_change = features.year_change
+    recent_trend = features.recent_trend
+    price_fmt = features.price_fmt
+    beta_fmt = features.beta_fmt
+    year_high_fmt = features.year_high_fmt
+    year_low_fmt = features.year_low_fmt
+    year_change_fmt = features.year_change_fmt
+
+    price_vs_high = ((price - year_high) / year_high) * 100
+    price_vs_low = ((price - year_low) / year_low) * 100
+    momentum = "Bullish" if year_change > 10 else "Neutral" if year_change > -5 else "Bearish"
+
+    return f"""# Technical Analysis: {company} ({ticker})
+
+## Chart Overview
+**Current Price**: ${price_fmt}
+**52-Week High**: ${year_high_fmt} ({price_vs_high:+.1f}% from high)
+**52-Week Low**: ${year_low_fmt} ({price_vs_low:+.1f}% from low)
+**YTD Performance**: {year_change_fmt}%
+**Recent Trend**: {recent_trend}
+
+## Price Action Analysis
+The stock is currently trading {"near its 52-week high" if price_vs_high > -5 else "in the upper half of its range" if price > (year_high + year_low)/2 else "in the lower half of its range" if price > year_low * 1.1 else "near its 52-week low"}, suggesting {"strong momentum" if price_vs_high > -10 else "consolidation" if price_vs_high > -30 else "potential value opportunity"}.
+
+**Price Position**:
+- Distance from 52W high: {price_vs_high:+.1f}%
+- Distance from 52W low: {price_vs_low:+.1f}%
+- {"Uptrend intact" if year_change > 10 else "Sideways movement" if year_change > -5 else "Downtrend present"}
+
+## Momentum Indicators
+**Overall Momentum**: {momentum}
+- YTD return of {year_change_fmt}% indicates {"strong bullish momentum" if year_change > 20 else "positive momentum" if year_change > 10 else "neutral momentum" if year_change > -5 else "bearish momentum"}
+- Recent trend showing {recent_trend}
+
+**Volatility Assessment**:
+- Beta: {beta_fmt}
+- {"High volatility" if beta > 1.5 else "Moderate volatility" if beta > 0.8 else "Low volatility"} relative to market
+- {"More volatile than market" if beta > 1 else "Less volatile than market"} (Beta {beta_fmt})
+
+## Support & Resistance Levels
+**Key Support**: ${year_low_fmt} (52-week low)
+**Secondary Support**: ${(year_low * 1.1):.2f} (10% above low)
+**Key Resistance**: ${year_high_fmt} (52-week high)
+**Secondary Resistance**: ${(price * 1.1):.2f} (10% above current)
+
+## Trading Recommendation
+**Bias**: {momentum}
+
+{"**BUY on dips**" if momentum == "Bullish" and price_vs_high < -10 else "**ACCUMULATE**" if momentum == "Bullish" else "**HOLD**" if momentum == "Neutral" else "**WAIT**"} - Technical setup shows {recent_trend.lower()} with {"bullish" if year_change > 10 else "neutral" if year_change > -5 else "bearish"} momentum.
+
+**Entry Strategy**:
+- Aggressive: ${price_fmt} (current level)
+- Conservative: ${(price * 0.95):.2f} (5% pullback)
+- Value: ${(price * 0.90):.2f} (10% pullback)
+
+**Stop Loss**: ${(year_low * 0.95):.2f} (below 52-week low)
+**Target**: ${(price * 1.15):.2f} (15% upside)
+"""
+
+def _industry_analyst(features):
+    ticker = features.ticker
+    company = features.company
+    sector = features.sector
+    industry = features.industry
+    pe = features.pe
+    market_cap = features.market_cap
+    revenue_growth = features.revenue_growth
+    profit_margin = features.profit_margin
+    debt_to_equity = features.debt_to_equity
+    cap_str = features.cap_str
+    revenue_growth_fmt = features.revenue_growth_fmt
+    profit_margin_fmt = features.profit_margin_fmt
+
+    market_position = "Large Cap" if market_cap > 10e9 else "Mid Cap" if market_cap > 2e9 else "Small Cap"
+
+    return f"""# Industry Analysis: {company} ({ticker})
+
+## Company Profile
+**Sector**: {sector}
+**Industry**: {industry}
+**Market Capitalization**: {cap_str} ({market_position})
+
+## Competitive Positioning
+{company} operates in the {sector} sector, specifically within {industry}. As a {market_position.lower()} company with {cap_str} market capitalization, it {"holds significant market influence" if market_cap > 100e9 else "maintains meaningful industry presence" if market_cap > 10e9 else "represents emerging opportunity"}.
+
+## Sector Dynamics
+**Sector**: {sector}
+- Growth characteristics: {"High growth" if sector in ["Technology", "Healthcare", "Consumer Cyclical"] else "Stable growth" if sector in ["Consumer Defensive", "Utilities"] else "Moderate growth"}
+- Market maturity: {"Mature" if sector in ["Utilities", "Consumer Defensive"] else "Growing" if sector in ["Technology", "Healthcare"] else "Cyclical"}
+- Regulatory environment: {"Heavily regulated" if sector in ["Healthcare", "Financial Services", "Utilities"] else "Moderately regulated"}
+
+## Industry Trends
+**Current Industry Environment**:
+- Revenue growth of {revenue_growth_fmt}% {"outpaces" if revenue_growth > 5 else "aligns with" if revenue_growth > 0 else "lags"} typical sector growth
+- Profit margins of {profit_margin_fmt}% {"exceed" if profit_margin > 15 else "match" if profit_margin > 5 else "trail"} industry averages
+- {"Technology disruption" if sector == "Technology" else "Healthcare innovation" if sector == "Healthcare" else "Market evolution"} driving sector changes
+
+## Competitive Advantages
+**Observable Strengths**:
+- {"Market leadership indicated by large market cap" if market_cap > 100e9 else "Established position" if market_cap > 10e9 else "Nimble smaller player"}
+- {"Strong profitability metrics" if profit_margin > 15 else "Adequate profitability"}
+- {"Solid balance sheet" if debt_to_equity < 1 else "Leveraged growth strategy"}
+
+## Industry Risks
+**Key Challenges**:
+- {"Intense competition in technology sector" if sector == "Technology" else "Regulatory pressures" if sector in ["Healthcare", "Financial Services"] else "Economic sensitivity"}
+- {"High valuation multiple" if pe > 30 else "Valuation concerns" if pe > 20 else "Reasonable valuation"}
+- {"Execution risk on growth plans" if revenue_growth > 20 else "Growth sustainability"}
+
+## Sector Outlook
+The {sector} sector {"continues strong growth trajectory" if sector in ["Technology", "Healthcare"] else "provides defensive characteristics" if sector in ["Consumer Defensive", "Utilities"] else "faces cyclical headwinds and opportunities"}.
+
+**Industry Recommendation**: {("OVERWEIGHT" if revenue_growth > 10 and profit_margin > 15 else "MARKET WEIGHT" if revenue_growth > 0 else "UNDERWEIGHT")} - {company} {"demonstrates strong competitive positioning" if market_cap > 50e9 else "shows promise" if revenue_growth > 10 else "requires monitoring"} within {sector}.
+"""
+
+def _quantitative_analyst(features):
+    ticker = features.ticker
+    company = features.company
+    pe = features.pe
+    beta = features.beta
+    revenue_growth = features.revenue_growth
+    profit_margin = features.profit_margin
+    roe = features.roe
+    debt_to_equity = features.debt_to_equity
+    year_change = features.year_change
+    pe_fmt = features.pe_fmt
+    beta_fmt = features.beta_fmt
+    revenue_growth_fmt = features.revenue_growth_fmt
+    profit_margin_fmt = features.profit_margin_fmt
+    roe_fmt = features.roe_fmt
+    debt_to_equity_fmt = features.debt_to_equity_fmt
+    year_change_fmt = features.year_change_fmt
+
+    sharpe_estimate = year_change / (abs(beta) * 15) if beta > 0 else 0
+    quality_score = (
+        (10 if roe > 20 else 7 if roe > 15 else 4 if roe > 10 else 2) +
+        (10 if profit_margin > 20 else 7 if profit_margin > 10 else 4 if profit_margin > 5 else 2) +
+        (10 if debt_to_equity < 0.5 else 7 if debt_to_equity < 1 else 4 if debt_to_equity < 2 else 2)
+    ) / 3
+
+    return f"""# Quantitative Analysis: {company} ({ticker})
+
+## Statistical Metrics
+**Volatility Profile**:
+- Beta: {beta_fmt}
+- {"High volatility asset" if beta > 1.5 else "Moderate volatility" if beta > 0.8 else "Low volatility"} relative to market
+- Estimated Sharpe Ratio: {sharpe_estimate:.2f}
+
+**Performance Metrics**:
+- YTD Return: {year_change_fmt}%
+- Annualized volatility estimate: ~{abs(beta) * 15:.1f}%
+- Risk-adjusted return {"attractive" if sharpe_estimate > 0.5 else "moderate" if sharpe_estimate > 0 else "concerning"}
+
+## Quality Metrics
+**Quality Score**: {quality_score:.1f}/10
+- Return on Equity: {roe_fmt}% ({"High" if roe > 20 else "Good" if roe > 15 else "Moderate" if roe > 10 else "Low"} quality)
+- Profit Margin: {profit_margin_fmt}% ({"Strong" if profit_margin > 15 else "Adequate" if profit_margin > 5 else "Weak"} profitability)
+- Debt/Equity: {debt_to_equity_fmt}x ({"Conservative" if debt_to_equity < 0.5 else "Moderate" if debt_to_equity < 1 else "Elevated"} leverage)
+
+## Factor Exposure
+**Style Factors**:
+- Quality: {"High" if quality_score > 7 else "Medium" if quality_score > 4 else "Low"} ({quality_score:.1f}/10)
+- Growth: {"High" if revenue_growth > 15 else "Medium" if revenue_growth > 5 else "Low"} ({revenue_growth_fmt}% revenue growth)
+- Value: {"Attractive" if pe < 15 else "Fair" if pe < 25 else "Expensive"} (P/E: {pe_fmt}x)
+- Momentum: {"Positive" if year_change > 10 else "Neutral" if year_change > -5 else "Negative"} ({year_change_fmt}% YTD)
+
+## Valuation Model
+**Multi-Factor Score**: {(quality_score + (10 if revenue_growth > 15 else 5 if revenue_growth > 5 else 2) + (10 if pe < 15 else 5 if pe < 25 else 2)) / 3:.1f}/10
+
+Components:
+- Quality: {quality_score:.1f}/10
+- Growth: {(10 if revenue_growth > 15 else 5 if revenue_growth > 5 else 2)}/10
+- Value: {(10 if pe < 15 else 5 if pe < 25 else 2)}/10
+
+## Risk Assessment
+**Key Risks**:
+- Volatility Risk: {"High" if beta > 1.5 else "Medium" if beta > 1 else "Low"} (Beta: {beta_fmt})
+- Leverage Risk: {"High" if debt_to_equity > 2 else "Medium" if debt_to_equity > 1 else "Low"}
+- Valuation Risk: {"High" if pe > 30 else "Medium" if pe > 20 else "Low"}
+
+## Quantitative Recommendation
+**{"BUY" if quality_score > 7 and revenue_growth > 10 and pe < 25 else "ACCUMULATE" if quality_score > 5 else "HOLD"}** - Quantitative metrics {"support long position" if quality_score > 7 else "suggest selective exposure" if quality_score > 4 else "indicate caution"}.
+
+Expected 12-month return: {(10 if quality_score > 7 else 7 if quality_score > 4 else 3) + (revenue_growth / 2):.1f}%
+Risk-adjusted allocation: {min(25, quality_score * 3):.0f}% of portfolio
+"""
+
+def _esg_analyst(features):
+    ticker = features.ticker
+    company = features.company
+    sector = features.sector
+    market_cap = features.market_cap
+    cap_str = features.cap_str
+
+    esg_score = 7 if market_cap > 100e9 else 6 if market_cap > 10e9 else 5
+
+    return f"""# ESG Analysis: {company} ({ticker})
+
+## ESG Overview
+**Estimated ESG Rating**: {("A" if esg_score >= 8 else "B" if esg_score >= 6 else "C")}/A+ Scale
+
+As a {sector} sector company with {cap_str} market cap, {company} {"likely maintains robust ESG practices given size and scrutiny" if market_cap > 50e9 else "operates with developing ESG framework" if market_cap > 10e9 else "represents emerging ESG opportunity"}.
+
+## Environmental (E) Assessment
+**Estimated Score**: {esg_score}/10
+
+{sector} sector companies face {"significant environmental considerations" if sector in ["Energy", "Materials", "Utilities"] else "moderate environmental impact" if sector in ["Industrials", "Technology"] else "limited direct environmental footprint"}.
+
+**Key Considerations**:
+- Carbon footprint: {("Material concern" if sector in ["Energy", "Materials"] else "Moderate impact" if sector in ["Industrials", "Technology"] else "Limited direct impact")}
+- Resource efficiency: {"Critical to operations" if sector in ["Materials", "Utilities"] else "Important consideration"}
+- Sustainability initiatives: {"Likely advanced" if market_cap > 50e9 else "Developing" if market_cap > 10e9 else "Emerging"}
+
+## Social (S) Assessment
+**Estimated Score**: {esg_score}/10
+
+**Stakeholder Considerations**:
+- Employee practices: {"Sophisticated given scale" if market_cap > 50e9 else "Developing programs"}
+- Community impact: {sector} companies {"have significant community touchpoints" if sector in ["Healthcare", "Consumer Defensive"] else "maintain standard community engagement"}
+- Product responsibility: {"High scrutiny" if sector in ["Healthcare", "Financial Services"] else "Standard oversight"}
+
+## Governance (G) Assessment
+**Estimated Score**: {esg_score + 1}/10
+
+Large public companies typically maintain {"strong" if market_cap > 50e9 else "adequate" if market_cap > 10e9 else "developing"} governance frameworks:
+- Board independence: {"Likely strong" if market_cap > 50e9 else "Developing"}
+- Shareholder rights: {"Well-established" if market_cap > 10e9 else "Standard"}
+- Transparency: {"High disclosure" if market_cap > 50e9 else "Adequate reporting"}
+
+## ESG Risk Assessment
+**Material ESG Risks**:
+- Environmental: {("High" if sector in ["Energy", "Materials"] else "Medium" if sector in ["Industrials"] else "Low")}
+- Social: {("High" if sector in ["Healthcare", "Financial Services"] else "Medium")}
+- Governance: {("Low - large cap scrutiny" if market_cap > 50e9 else "Medium")}
+
+## ESG Investment Perspective
+**{"SUITABLE" if esg_score >= 6 else "CONDITIONAL"}** for ESG-focused portfolios - {company} {"demonstrates characteristics consistent with responsible investing" if esg_score >= 7 else "shows developing ESG profile" if esg_score >= 5 else "requires enhanced ESG diligence"}.
+
+**ESG Momentum**: {"Positive" if market_cap > 50e9 else "Developing"} - {"Large cap companies face increasing ESG expectations and typically respond proactively" if market_cap > 50e9 else "Growing companies increasingly prioritize ESG considerations"}.
+"""
+
+def _warren_buffett(features):
+    ticker = features.ticker
+    company = features.company
+    sector = features.sector
+    pe = features.pe
+    dividend_yield = features.dividend_yield
+    profit_margin = features.profit_margin
+    roe = features.roe
+    debt_to_equity = features.debt_to_equity
+    pe_fmt = features.pe_fmt
+    profit_margin_fmt = features.profit_margin_fmt
+    roe_fmt = features.roe_fmt
+    debt_to_equity_fmt = features.debt_to_equity_fmt
+
+    moat_strength = "wide" if roe > 20 and profit_margin > 15 else "moderate" if roe > 15 else "narrow"
+    valuation_view = "attractive" if pe < 15 else "fair" if pe < 25 else "full" if pe < 35 else "expensive"
+
+    return f"""# Warren Buffett's Analysis: {company} ({ticker})
+
+## Business Quality Assessment
+Looking at {company} through my value investing lens, I evaluate three core elements: economic moat, management quality, and intrinsic value.
+
+**Economic Moat**: {moat_strength.capitalize()}
+- ROE of {roe_fmt}% indicates {"exceptional" if roe > 20 else "strong" if roe > 15 else "adequate" if roe > 10 else "weak"} returns on capital
+- Profit margins of {profit_margin_fmt}% suggest {"pricing power and competitive advantages" if profit_margin > 15 else "decent profitability" if profit_margin > 10 else "limited pricing power"}
+- {"This business prints money - exactly what I look for" if roe > 20 and profit_margin > 15 else "Acceptable economic characteristics" if roe > 15 else "Mediocre business economics"}
+
+**Business Fundamentals**:
+- Debt/Equity of {debt_to_equity_fmt}x - {"Conservative balance sheet" if debt_to_equity < 0.5 else "Prudent leverage" if debt_to_equity < 1 else "Concerning debt levels"}
+- {("Shareholder-friendly dividend of {dividend_yield:.1f}%" if dividend_yield > 2 else "Growing with retained earnings")}
+
+## Valuation Perspective
+**Price is what you pay, value is what you get.**
+
+At P/E of {pe_fmt}x, this is a {valuation_view} price for {"a wonderful business" if roe > 20 and profit_margin > 15 else "a good business" if roe > 15 else "this business"}.
+
+**My Margin of Safety**: {"Adequate at current levels" if pe < 20 else "Limited - would prefer 15-20% lower" if pe < 30 else "Insufficient - this is priced for perfection"}
+
+## Circle of Competence
+{sector} sector {"falls within my circle of competence" if sector in ["Consumer Defensive", "Financial Services", "Industrials"] else "requires careful evaluation - not my traditional area"}. {"I understand this business and can value it with confidence." if sector in ["Consumer Defensive", "Financial Services"] else "Would need to study this industry more carefully."}
+
+## Investment Decision
+**{("BUY" if pe < 20 and roe > 15 and debt_to_equity < 1 else "HOLD if owned" if pe < 30 and roe > 10 else "WAIT")}**
+
+{"This is a wonderful business at a fair price. I'd be comfortable with a 5-10% portfolio position." if pe < 20 and roe > 15 else "Quality business but price leaves little margin of safety. Hold if owned, but I'd wait for a better pitch if buying new." if pe < 30 else "Price is too high for the quality. Be patient - Mr. Market will eventually offer a better price."}
+
+**My Holding Period**: Forever (if the business quality remains high)
+"""
+
+def _ray_dalio(features):
+    ticker = features.ticker
+    company = features.company
+    sector = features.sector
+    pe = features.pe
+    beta = features.beta
+    roe = features.roe
+    debt_to_equity = features.debt_to_equity
+    beta_fmt = features.beta_fmt
+
+    risk_level = "High" if beta > 1.5 else "Medium" if beta > 1 else "Low"
+
+    return f"""# Ray Dalio's Analysis: {company} ({ticker})
+
+## All-Weather Portfolio Perspective
+Within a properly diversified, risk-balanced portfolio, {company} serves as {"a growth asset with moderate volatility" if beta < 1.2 else "a high-volatility growth position"}.
+
+**Risk Parity Assessment**:
+- Beta of {beta_fmt} indicates {risk_level.lower()} volatility relative to market
+- {"Good risk-adjusted returns given quality metrics" if roe > 15 and beta < 1.2 else "Higher risk requires proportionally higher returns"}
+- Position size should be {"2-4%" if beta > 1.5 else "3-5%" if beta > 1 else "4-6%"} to maintain portfolio balance
+
+## Macroeconomic Context
+**Current Environment Fit**:
+- {sector} sector {"provides growth exposure in reflationary environment" if sector == "Technology" else "offers defensive characteristics in uncertain times" if sector in ["Consumer Defensive", "Utilities"] else "balanced exposure"}
+- {"Quality characteristics protect in deleveraging scenarios" if debt_to_equity < 1 else "Leverage increases vulnerability in credit tightening"}
+
+**Diversification Value**:
+- {"Low correlation to bonds and commodities - good equity diversifier" if sector == "Technology" else "Provides inflation hedge characteristics" if sector in ["Energy", "Materials"] else "Standard equity correlation"}
+
+## Principles-Based Evaluation
+**Balance**: {"Well-balanced - quality business with reasonable valuation" if roe > 15 and pe < 25 else "Imbalanced - " + ("strong business, expensive price" if roe > 15 else "fair price, mediocre business")}
+**Diversification**: Adds {"meaningful" if sector not in ["Technology", "Financial Services"] else "concentrated tech"} exposure
+**What I Don't Know**: {"Technological disruption risk" if sector == "Technology" else "Regulatory changes" if sector in ["Healthcare", "Financial Services"] else "Competitive dynamics"}
+
+## Investment Decision
+**{("BUY - Measured Position" if roe > 15 and pe < 30 else "HOLD - Monitor" if pe < 35 else "UNDERWEIGHT")}**
+
+{"Initiate 3-4% position, add on 10%+ pullbacks. Quality metrics support allocation within balanced portfolio." if roe > 15 and pe < 30 else "Acceptable for existing holdings but not adding at these levels. Rebalance if grows beyond 5% of portfolio." if pe < 35 else "Reduce exposure - risk/reward unfavorable in current macro environment."}
+
+**Hedging Strategy**: {"Pair with uncorrelated assets (gold, bonds)" if beta > 1.2 else "Monitor correlation to overall equity exposure"}
+"""
+
+def _cathie_wood(features):
+    ticker = features.ticker
+    company = features.company
+    sector = features.sector
+    market_cap = features.market_cap
+    revenue_growth = features.revenue_growth
+    pe_fmt = features.pe_fmt
+    revenue_growth_fmt = features.revenue_growth_fmt
+
+    innovation_score = 9 if sector == "Technology" and revenue_growth > 20 else 7 if sector == "Technology" else 6 if revenue_growth > 15 else 4
+
+    return f"""# Cathie Wood's Analysis: {company} ({ticker})
+
+## Disruptive Innovation Thesis
+{company} {"operates at the intersection of multiple innovation platforms - exactly what I look for!" if sector == "Technology" and revenue_growth > 20 else "shows innovation characteristics worth exploring" if revenue_growth > 15 else "represents traditional business model with limited disruption potential"}
+
+**Innovation Score**: {innovation_score}/10
+- Revenue growth of {revenue_growth_fmt}% {"demonstrates exponential growth trajectory" if revenue_growth > 25 else "shows solid growth" if revenue_growth > 10 else "indicates mature market"}
+- {sector} sector {"is being transformed by AI, cloud, and digital innovation" if sector == "Technology" else "faces digital transformation pressures" if sector in ["Financial Services", "Healthcare"] else "experiencing traditional dynamics"}
+
+## Exponential Growth Analysis
+**Growth Trajectory**:
+- Current growth: {revenue_growth_fmt}%
+- {"This is the kind of exponential growth that compounds into massive returns!" if revenue_growth > 30 else "Solid growth but not exponential yet" if revenue_growth > 15 else "Linear growth trajectory"}
+- TAM expansion: {"Massive - multi-trillion dollar opportunity" if sector == "Technology" else "Significant opportunity in digital transformation" if sector in ["Healthcare", "Financial Services"] else "Limited expansion potential"}
+
+**Platform Network Effects**:
+- {"Strong network effects compound user value" if sector == "Technology" and market_cap > 100e9 else "Developing platform characteristics" if sector == "Technology" else "Limited network effect dynamics"}
+
+## Valuation Through Innovation Lens
+Traditional metrics miss the story! Looking at:
+- **Innovation Value**: Platform potential could be worth {"$500B+" if sector == "Technology" and market_cap > 100e9 else "substantial premium" if revenue_growth > 20 else "moderate premium"}
+- **5-Year Vision**: {"10-20x potential if execution continues" if revenue_growth > 30 else "3-5x potential" if revenue_growth > 15 else "2-3x potential"}
+- P/E of {pe_fmt}x is {"irrelevant for exponential growth story" if revenue_growth > 25 else "reasonable for growth profile" if revenue_growth > 15 else "fair for linear growth"}
+
+## Conviction Level
+**{"VERY HIGH" if innovation_score > 7 and revenue_growth > 20 else "HIGH" if innovation_score > 5 else "MODERATE"}**
+
+{"This is exactly the type of disruptive innovation opportunity I pound the table on! The market is underestimating the transformation potential." if innovation_score > 7 and revenue_growth > 20 else "Interesting innovation play worth significant allocation" if innovation_score > 5 else "Doesn't fit our innovation-focused mandate strongly"}
+
+## Investment Decision
+**{("STRONG BUY" if innovation_score > 7 and revenue_growth > 20 else "BUY" if innovation_score > 5 and revenue_growth > 10 else "HOLD")}**
+
+{"8-12% portfolio position - this is a generational opportunity! Ignore the volatility, focus on the 5-year outcome." if innovation_score > 7 and revenue_growth > 20 else "4-6% position - solid innovation exposure with growth potential" if innovation_score > 5 else "2-3% position - limited innovation angle but acceptable growth"}
+
+**Time Horizon**: 5+ years (volatility is a feature, not a bug)
+**What Would Change My Mind**: {("Loss of market share to competitors" if sector == "Technology" else "Regulatory disruption of business model")}
+"""
+
+def _peter_lynch(features):
+    ticker = features.ticker
+    company = features.company
+    sector = features.sector
+    pe = features.pe
+    market_cap = features.market_cap
+    dividend_yield = features.dividend_yield
+    revenue_growth = features.revenue_growth
+    profit_margin = features.profit_margin
+    roe = features.roe
+    debt_to_equity = features.debt_to_equity
+
+    peg = pe / revenue_growth if revenue_growth > 0 else 999
+    category = "Fast Grower" if revenue_growth > 20 else "Stalwart" if market_cap > 10e9 else "Slow Grower"
+
+    return f"""# Peter Lynch's Analysis: {company} ({ticker})
+
+## Know What You Own
+**The One-Sentence Story**: "{company} {("is growing rapidly in" if revenue_growth > 20 else "steadily serves") + f" the {sector} market" + (" with strong profitability" if profit_margin > 15 else "")}"
+
+If you can't explain this to a 10-year-old, don't own it. This business {"is easy to understand - " + (sector + " company selling products/services people use") if sector in ["Consumer Defensive", "Technology"] else "requires more industry knowledge"}
+
+## Stock Category: {category}
+**Classification**:
+- {"Fast Grower" if revenue_growth > 20 else "Stalwart" if market_cap > 10e9 else "Slow Grower" if revenue_growth < 10 else "Asset Play"}
+- {"Expect 50-100% returns over 3-5 years" if revenue_growth > 25 else "Expect 30-50% returns" if revenue_growth > 15 else "Expect 10-20% returns annually"}
+
+## The Peter Lynch Checklist
+✓ Company has niche: {("YES - strong market position" if roe > 20 else "MODERATE" if roe > 10 else "NO")}
+✓ Product people need: {("YES" if sector in ["Healthcare", "Consumer Defensive"] else "MODERATE")}
+✓ Company buying back shares: (Would need to verify)
+✓ Debt manageable: {("YES" if debt_to_equity < 1 else "BORDERLINE" if debt_to_equity < 2 else "NO")}
+✓ Hidden assets: (Requires deeper analysis)
+{"✓ Good dividend: YES" if dividend_yield > 2 else ""}
+
+## The Numbers That Matter
+**PEG Ratio**: {peg:.1f}
+- **Lynch's Rule**: PEG should be {"<1.0 for fast growers" if revenue_growth > 20 else "<1.5 for stalwarts"}
+- {("Excellent value!" if peg < 1 else "Fair deal" if peg < 1.5 else "Fully valued" if peg < 2 else "Too expensive")}
+
+**The Story**: {"Growth of {revenue_growth:.0f}% justifies P/E of {pe:.0f}x - this is growth at a reasonable price!" if peg < 1.5 else "Paying up for quality - make sure the growth continues"}
+
+## Investment Decision
+**{("BUY" if peg < 1.5 and debt_to_equity < 1 else "HOLD if owned" if peg < 2.5 else "WAIT")}**
+
+{"Start a half position now, add on 10% dips. This is a {category.lower()} I'd be comfortable owning for years." if peg < 1.5 else "Hold what you own, but I'd wait for a better price to buy more. Patience pays." if peg < 2.5 else "Too expensive. Walk away and find better opportunities. The stock market isn't a slot machine - don't force it."}
+
+**Position Size**: {("8-12% - this is a core holding" if peg < 1 and revenue_growth > 20 else "5-8% - solid stalwart position" if peg < 1.5 else "3-5% - speculative only")}
+**When to Sell**: {("Only if story changes (growth slows to <5%)" if revenue_growth > 15 else "If P/E exceeds 30 and growth slows")}
+"""
+
+def _michael_burry(features):
+    ticker = features.ticker
+    company = features.company
+    pe = features.pe
+    beta = features.beta
+    revenue_growth = features.revenue_growth
+    profit_margin = features.profit_margin
+    debt_to_equity = features.debt_to_equity
+    year_change = features.year_change
+    pe_fmt = features.pe_fmt
+    beta_fmt = features.beta_fmt
+    revenue_growth_fmt = features.revenue_growth_fmt
+
+    concern_level = "Very High" if pe > 30 and debt_to_equity > 2 else "High" if pe > 25 else "Moderate"
+
+    return f"""# Michael Burry's Analysis: {company} ({ticker})
+
+## Contrarian Perspective
+Everyone {"loves" if year_change > 20 else "likes" if year_change > 0 else "hates"} {company}. That {"concerns me greatly" if year_change > 20 else "makes me cautious" if year_change > 0 else "interests me"}.
+
+**Market Sentiment**: {"Euphoric - danger zone" if year_change > 30 else "Bullish - crowded trade" if year_change > 10 else "Neutral" if year_change > -10 else "Bearish - potential opportunity"}
+
+## Bearish Case (What I'm Worried About)
+**Valuation Red Flags**:
+- P/E of {pe_fmt}x {"is absurdly high - shades of 1999 dot-com bubble" if pe > 40 else "leaves zero margin for error" if pe > 30 else "is elevated but not insane" if pe > 20 else "is actually reasonable"}
+- {("Trading at {pe:.0f}x earnings assumes perfection - what if growth slows?" if pe > 25 else "Valuation has some cushion")}
+- {"Debt/Equity of {debt_to_equity:.1f}x is dangerous in rising rate environment" if debt_to_equity > 2 else ""}
+
+**Growth Sustainability Questions**:
+- {revenue_growth_fmt}% growth {"is unsustainable - reversion to mean inevitable" if revenue_growth > 30 else "will decelerate - they always do" if revenue_growth > 20 else "is already slowing"}
+- {("What happens when competition catches up?" if profit_margin > 20 else "Margins will compress")}
+
+**Macro Headwinds**:
+- Beta of {beta_fmt} means {"massive volatility in market downturn" if beta > 1.5 else "market sensitivity"}
+- {"This gets crushed in recession" if beta > 1.5 and pe > 25 else "Vulnerable to macro shocks"}
+
+## What the Herd Misses
+**Underappreciated Risks**:
+1. Valuation assumes current growth continues forever (it won't)
+2. {"High debt could become crisis in downturn" if debt_to_equity > 2 else "Leverage limits flexibility"}
+3. Mr. Market is {"euphorically optimistic" if year_change > 20 else "too bullish"}
+4. {"This could easily drop 40-50% if sentiment shifts" if pe > 30 and beta > 1.5 else "Downside of 25-35% on multiple compression"}
+
+## The Trade
+**I'm {("NOT long, considering SHORT" if pe > 35 and year_change > 30 else "NOT long, NOT short" if pe > 25 else "CAUTIOUSLY watching")}**
+
+{"This is exactly the kind of overvalued, overhyped stock I look to short. Risk/reward is terrible." if pe > 35 and year_change > 30 else "Too expensive to own, not quite expensive enough to short. Cash is better." if pe > 25 else "Not compelling either way - there are better opportunities."}
+
+## When I'd Change My Mind
+**Would Consider Long If**:
+- Stock drops {("50-60%" if pe > 35 else "30-40%" if pe > 25 else "15-20%")}
+- Recession forces multiple compression to 15-18x
+- {"Debt is significantly reduced" if debt_to_equity > 1.5 else ""}
+- Consensus turns bearish (contrarian signal)
+
+**Investment Recommendation**: {("AVOID / SHORT" if pe > 35 and debt_to_equity > 2 else "AVOID" if pe > 25 else "WAIT")}
+
+{"I'd rather hold cash and wait for fat pitches. This isn't one. The market can stay irrational longer than you can stay solvent - don't fight it, just stay away." if pe > 25 else "Not terrible, but not compelling. Be patient for better opportunities."}
+"""
+
+ANALYST_TEMPLATES = {
+    "Fundamental Analyst": _fundamental_analyst,
+    "Technical Analyst": _technical_analyst,
+    "Industry Analyst": _industry_analyst,
+    "Quantitative Analyst": _quantitative_analyst,
+    "ESG Analyst": _esg_analyst,
+}
+
+INVESTOR_TEMPLATES = {
+    "Warren Buffett": _warren_buffett,
+    "Ray Dalio": _ray_dalio,
+    "Cathie Wood": _cathie_wood,
+    "Peter Lynch": _peter_lynch,
+    "Michael Burry": _michael_burry,
+}
+
+def render_analyst_report(analyst_type: str, features: ReportFeatures) -> str:
+    """Render an analyst report from precomputed features."""
+    # Unknown analyst types get the ESG report, as they always have
+    return ANALYST_TEMPLATES.get(analyst_type, _esg_analyst)(features)
+
+def render_investor_opinion(investor_name: str, features: ReportFeatures) -> str:
+    """Render an investor opinion from precomputed features."""
+    # Unknown investors get Michael Burry's opinion, as they always have
+    return INVESTOR_TEMPLATES.get(investor_name, _michael_burry)(features)
+
+def render_reports(ticker: str, stock_data: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Render every analyst report and investor opinion for a ticker from one feature record."""
+    features = build_features(ticker, stock_data)
+    reports = {name: render(features) for name, render in ANALYST_TEMPLATES.items()}
+    opinions = {name: render(features) for name, render in INVESTOR_TEMPLATES.items()}
+    return reports, opinions
+
+def get_generic_analyst_report(analyst_type, ticker, stock_data):
+    """Generate a detailed analyst report for any stock based on actual data."""
+    return render_analyst_report(analyst_type, build_features(ticker, stock_data))
+
+def get_generic_investor_opinion(investor_name, ticker, stock_data):
+    """Generate a detailed investor opinion for any stock."""
+    return render_investor_opinion(investor_name, build_features(ticker, stock_data))
+
+def get_generic_synthesis(ticker, investor_opinions):
+    """Generate a generic synthesis for any stock."""
+    return f"""# Investment Synthesis: {ticker}
+
+## Summary
+Based on preliminary analysis from our investment panel, {ticker} has been reviewed across multiple investment philosophies.
+
+## Recommendation
+**Position**: HOLD - Pending detailed analysis
+
+The panel recommends conducting thorough due diligence before making investment decisions.
+
+**Next Steps**:
+- Conduct detailed fundamental analysis
+- Review competitive positioning
+- Assess valuation relative to growth
+- Monitor for entry opportunities
+
+*Note: This is a preliminary synthesis. Request detailed analysis for comprehensive investment guidance.*
+"""
@@ -0,0 +1,74 @@
+"""
+Canned response library for the FinAgents system.
+
+Pre-generated documents live under ``data/<TICKER>/``, described by that
+ticker's ``index.json``. Nothing is read until a document is requested, and
+only a bounded number of documents are kept in memory, so import time and
+memory use do not grow with the size of the library.
+"""
+
+import os
+import re
+import json
+import logging
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+MAX_CACHED_DOCUMENTS = 256
+
+# Tickers become directory names, so anything that could escape DATA_DIR is rejected
+_TICKER_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9.\-^=]*$")
+
+@lru_cache(maxsize=None)
+def _load_index(ticker: str) -> Dict[str, Any]:
+    """Return a ticker's document index, or an empty one if it has no canned responses."""
+    if not _TICKER_PATTERN.match(ticker):
+        return {}
+    path = os.path.join(DATA_DIR, ticker, "index.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable canned response index {path}: {e}")
+        return {}
+
+@lru_cache(maxsize=MAX_CACHED_DOCUMENTS)
+def _read_document(ticker: str, filename: str) -> str:
+    with open(os.path.join(DATA_DIR, ticker, filename), encoding="utf-8", newline="") as f:
+        return f.read()
+
+def _get_document(ticker: str, role: str, name: Optional[str] = None) -> Optional[str]:
+    entry = _load_index(ticker).get(role)
+    filename = entry.get(name) if isinstance(entry, dict) else entry
+    if not filename:
+        return None
+    return _read_document(ticker, filename)
+
+def has_canned_responses(ticker: str) -> bool:
+    """Return True if the library holds any pre-generated documents for a ticker."""
+    return bool(_load_index(ticker))
+
+def get_canned_analyst_report(ticker: str, analyst_type: str) -> Optional[str]:
+    """Return the pre-generated report of an analyst for a ticker, or None."""
+    return _get_document(ticker, "analyst", analyst_type)
+
+def get_canned_investor_opinion(ticker: str, investor_name: str) -> Optional[str]:
+    """Return the pre-generated opinion of an investor on a ticker, or None."""
+    return _get_document(ticker, "investor", investor_name)
+
+def get_canned_synthesis(ticker: str) -> Optional[str]:
+    """Return the pre-generated synthesis for a ticker, or None."""
+    return _get_document(ticker, "synthesis")
+
+def get_canned_documents(ticker: str, role: str) -> Dict[str, str]:
+    """Return every pre-generated document of a role (``analyst`` or ``investor``) for a ticker."""
+    entry = _load_index(ticker).get(role)
+    if not isinstance(entry, dict):
+        return {}
+    return {name: _read_document(ticker, filename) for name, filename in entry.items()}
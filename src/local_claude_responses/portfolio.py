@@ -0,0 +1,139 @@
+"""
+Portfolio rendering for the FinAgents system.
+
+Local agents are pure functions of the ticker and its stock data, so a whole
+portfolio can be rendered in one pass without dispatching each agent call
+separately, and spread across worker processes in chunks of tickers.
+"""
+
+import time
+import logging
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .generators import build_features, render_analyst_report, render_investor_opinion, get_generic_synthesis
+from .library import get_canned_analyst_report, get_canned_investor_opinion, get_canned_synthesis
+
+logger = logging.getLogger(__name__)
+
+# Tickers sent to a worker process per task
+DEFAULT_CHUNK_SIZE = 64
+
+def failure_text(kind: str, error: Exception) -> str:
+    """Return the text that stands in for a report or opinion that failed with ``error``."""
+    return f"Unable to generate {kind} due to: {str(error)}"
+
+def render_ticker(ticker: str, stock_data: Dict[str, Any], analysts: List[str],
+                  investors: List[str], timed: bool = False) -> Dict[str, Any]:
+    """
+    Render every analyst report, investor opinion and the synthesis for one ticker.
+
+    Canned documents take precedence over generic ones, as they do for the local
+    agents. A document that fails to render maps to the exception it raised; the
+    synthesis sees such an opinion as the failure text of a failed agent call.
+    With ``timed`` the result also has ``timings_ns``: the nanoseconds each
+    document took, by role and name, and those of the synthesis and the ticker.
+    """
+    started = time.perf_counter_ns()
+    try:
+        features = build_features(ticker, stock_data)
+    except Exception as e:
+        features = e
+
+    timings = {"analyst": {}, "investor": {}}
+    analyst_reports = {}
+    for name in analysts:
+        start = time.perf_counter_ns()
+        analyst_reports[name] = _render(get_canned_analyst_report(ticker, name), render_analyst_report, name, features)
+        timings["analyst"][name] = time.perf_counter_ns() - start
+    investor_opinions = {}
+    for name in investors:
+        start = time.perf_counter_ns()
+        investor_opinions[name] = _render(get_canned_investor_opinion(ticker, name), render_investor_opinion,
+                                          name, features)
+        timings["investor"][name] = time.perf_counter_ns() - start
+
+    start = time.perf_counter_ns()
+    decision = get_canned_synthesis(ticker)
+    if decision is None:
+        decision = get_generic_synthesis(ticker, {
+            name: failure_text("opinion", opinion) if isinstance(opinion, Exception) else opinion
+            for name, opinion in investor_opinions.items()
+        })
+    end = time.perf_counter_ns()
+    timings["synthesis"] = end - start
+    timings["ticker"] = end - started
+
+    result = {
+        "analyst_reports": analyst_reports,
+        "investor_opinions": investor_opinions,
+        "decision": decision
+    }
+    if timed:
+        result["timings_ns"] = timings
+    return result
+
+def iter_render_portfolio(tickers: Iterable[str], stock_data: Dict[str, Any], analysts: Iterable[str],
+                          investors: Iterable[str], max_workers: int = 1,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          timed: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Render a portfolio, yielding ``(ticker, result)`` pairs in ticker order.
+
+    Args:
+        tickers: The stock ticker symbols to render
+        stock_data: Stock data keyed by ticker
+        analysts: Analyst types whose reports to render
+        investors: Investor names whose opinions to render
+        max_workers: Number of worker processes; one renders in this process
+        chunk_size: Number of tickers sent to a worker per task
+        timed: Add each ticker's render timings to its result; see ``render_ticker``
+
+    Yields:
+        ``(ticker, result)`` pairs, each result shaped like a debate result
+    """
+    tickers = list(tickers)
+    analysts = list(analysts)
+    investors = list(investors)
+    chunks = [tickers[i:i + chunk_size] for i in range(0, len(tickers), chunk_size)]
+    max_workers = min(max_workers, len(chunks))
+
+    if max_workers <= 1:
+        for ticker in tickers:
+            yield ticker, render_ticker(ticker, stock_data.get(ticker, {}), analysts, investors, timed)
+        return
+
+    # Imported here so loading the package stays cheap for callers that never use processes
+    from concurrent.futures import ProcessPoolExecutor
+
+    logger.info(f"Rendering {len(tickers)} tickers in {len(chunks)} chunks on {max_workers} processes")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Keep a couple of chunks queued per worker so results are consumed as they arrive
+        pending = deque()
+        for chunk in chunks:
+            items = [(ticker, stock_data.get(ticker, {})) for ticker in chunk]
+            pending.append(executor.submit(_render_chunk, items, analysts, investors, timed))
+            if len(pending) >= 2 * max_workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def render_portfolio(tickers: Iterable[str], stock_data: Dict[str, Any], analysts: Iterable[str],
+                     investors: Iterable[str], max_workers: int = 1,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Dict[str, Any]]:
+    """Render a portfolio and return the results keyed by ticker; see ``iter_render_portfolio``."""
+    return dict(iter_render_portfolio(tickers, stock_data, analysts, investors, max_workers, chunk_size))
+
+def _render_chunk(items: List[Tuple[str, Dict[str, Any]]], analysts: List[str], investors: List[str],
+                  timed: bool) -> List[Tuple[str, Dict[str, Any]]]:
+    return [(ticker, render_ticker(ticker, data, analysts, investors, timed)) for ticker, data in items]
+
+def _render(canned, render, name, features):
+    if canned is not None:
+        return canned
+    if isinstance(features, Exception):
+        return features
+    try:
+        return render(name, features)
+    except Exception as e:
+        return e
@@ -0,0 +1,100 @@
+"""
+Change Detection Module
+
+This module decides which stocks need a new debate. Each finished stock's
+manifest entry keeps a snapshot of the inputs it was analyzed from, and a delta
+run compares the new stock data against it: a stock is analyzed again only if
+its price moved more than a threshold, its recent trend label changed, new
+financial statements came out, or its last results are too old. The others
+keep their previous results.
+"""
+
+import math
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+from .hashing import stable_hash
+from .run_manifest import RunManifest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRICE_CHANGE_PCT = 3.0
+DEFAULT_MAX_AGE_DAYS = 7.0
+
+# Fields derived from the financial statements; any change means new statements were published
+STATEMENT_FIELDS = ("revenue_growth", "profit_margin", "debt_to_equity", "current_ratio",
+                    "return_on_equity", "free_cash_flow")
+
+class ChangeThresholds:
+    """How much a stock's inputs must change before it is debated again."""
+
+    def __init__(self, price_change_pct: float = DEFAULT_PRICE_CHANGE_PCT,
+                 max_age_days: Optional[float] = DEFAULT_MAX_AGE_DAYS):
+        """
+        Create the thresholds.
+
+        Args:
+            price_change_pct: Price move, in percent of the last analyzed price, that counts as a change
+            max_age_days: Age after which results are refreshed even if nothing changed, or None to keep them
+        """
+        self.price_change_pct = price_change_pct
+        self.max_age_days = max_age_days
+
+def take_snapshot(stock_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the fields of a stock's data that change detection compares, in JSON-safe form."""
+    price = stock_data.get("current_price")
+    return {
+        "current_price": float(price) if isinstance(price, (int, float)) else None,
+        "recent_trend": stock_data.get("recent_trend"),
+        "statements": stable_hash({field: stock_data.get(field) for field in STATEMENT_FIELDS}),
+        "error": "error" in stock_data
+    }
+
+def change_reason(previous: Optional[Dict[str, Any]], snapshot: Dict[str, Any],
+                  thresholds: ChangeThresholds, now: Optional[float] = None) -> Optional[str]:
+    """
+    Explain why a stock must be debated again, or return None if its previous results still hold.
+
+    Args:
+        previous: The stock's completed manifest entry, or None if it has none
+        snapshot: ``take_snapshot`` of the stock's new data
+        thresholds: Changes that count
+        now: Current time (default: now)
+    """
+    if previous is None or "snapshot" not in previous:
+        return "no previous results"
+    before = previous["snapshot"]
+    if snapshot["error"] or before.get("error"):
+        return "stock data had errors"
+
+    if thresholds.max_age_days is not None:
+        age_days = ((time.time() if now is None else now) - previous["updated_at"]) / 86400
+        if age_days > thresholds.max_age_days:
+            return f"results are {age_days:.1f} days old"
+
+    price, previous_price = snapshot["current_price"], before.get("current_price")
+    if price and previous_price and math.isfinite(price) and math.isfinite(previous_price):
+        moved = abs(price / previous_price - 1) * 100
+        if moved > thresholds.price_change_pct:
+            return f"price moved {moved:.1f}%"
+    elif price != previous_price:
+        return "price unavailable"
+
+    if snapshot["recent_trend"] != before.get("recent_trend"):
+        return f"trend changed from {before.get('recent_trend')} to {snapshot['recent_trend']}"
+    if snapshot["statements"] != before.get("statements"):
+        return "new financial statements"
+    return None
+
+def detect_changes(tickers: List[str], stock_data: Dict[str, Dict[str, Any]], manifest: RunManifest,
+                   thresholds: ChangeThresholds) -> Dict[str, Optional[str]]:
+    """Return why each ticker must be debated again, or None for tickers whose previous results still hold."""
+    now = time.time()
+    changes = {}
+    for ticker in tickers:
+        snapshot = take_snapshot(stock_data.get(ticker, {}))
+        changes[ticker] = change_reason(manifest.completed_entry(ticker), snapshot, thresholds, now)
+        if changes[ticker] is not None:
+            logger.info(f"Debating {ticker} again: {changes[ticker]}")
+    return changes
@@ -0,0 +1,53 @@
+"""
+Hashing Utility Module
+
+This module turns agent inputs and stock data into a canonical JSON form so
+equal payloads always produce the same content hash, regardless of key order
+or whether numbers arrive as Python or NumPy scalars.
+"""
+
+import json
+import math
+import hashlib
+import datetime
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+def canonicalize(value: Any) -> Any:
+    """Convert a value into plain JSON-compatible types with a deterministic layout."""
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        # NaN and infinities are not valid JSON and NaN never equals itself
+        return value if math.isfinite(value) else repr(value)
+    if isinstance(value, Mapping):
+        return {str(k): canonicalize(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(canonicalize(v) for v in value)
+    if isinstance(value, pd.DataFrame):
+        return canonicalize(value.to_dict(orient="split"))
+    if isinstance(value, pd.Series):
+        return canonicalize(value.to_dict())
+    if isinstance(value, np.ndarray):
+        return canonicalize(value.tolist())
+    if isinstance(value, (datetime.date, datetime.datetime, pd.Timestamp)):
+        return value.isoformat()
+    return repr(value)
+
+def canonical_json(value: Any) -> str:
+    """Serialize a value to compact, key-sorted JSON after canonicalizing it."""
+    return json.dumps(canonicalize(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+def stable_hash(*parts: Any) -> str:
+    """Return a SHA-256 hex digest identifying the canonical form of the given parts."""
+    return hashlib.sha256(canonical_json(list(parts)).encode("utf-8")).hexdigest()
@@ -0,0 +1,244 @@
+"""
+Price History Store Module
+
+This module keeps each ticker's daily OHLCV series on local disk so later runs
+only need to download the bars after the last stored date.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+import pandas as pd
+from typing import Callable, Optional, Tuple
+
+from .stock_cache import DEFAULT_TTLS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_PATH = os.path.join(os.getenv("FINAGENTS_CACHE_DIR", ".finagents_cache"), "price_history.sqlite")
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+PERIOD_OFFSETS = {
+    "1d": pd.DateOffset(days=1),
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+# Relative tolerance when checking that a re-downloaded bar matches the stored one
+ADJUSTMENT_TOLERANCE = 1e-6
+
+def period_start(period: str, now: Optional[pd.Timestamp] = None) -> Optional[pd.Timestamp]:
+    """Return the first date covered by a yfinance period string, or None for ``max``."""
+    now = (now or pd.Timestamp.now()).normalize()
+    if period == "max":
+        return None
+    if period == "ytd":
+        return now.replace(month=1, day=1)
+    if period not in PERIOD_OFFSETS:
+        raise ValueError(f"Unsupported history period: {period}")
+    return now - PERIOD_OFFSETS[period]
+
+class PriceHistoryStore:
+    """
+    SQLite-backed store of daily OHLCV bars per ticker.
+
+    Each update re-downloads from the second-to-last stored bar: the last bar may
+    have been captured mid-session, and the one before it is used to detect
+    dividend or split adjustments, in which case the series is downloaded in full.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH, min_refresh: float = DEFAULT_TTLS["daily"],
+                 refresh: bool = False):
+        """
+        Open (or create) the history database.
+
+        Args:
+            path: Location of the SQLite file
+            min_refresh: Seconds after an update during which the stored series is used as-is
+            refresh: Always check for new bars, ignoring ``min_refresh``
+        """
+        self.path = path
+        self.min_refresh = min_refresh
+        self.refresh = refresh
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS price_history ("
+            "ticker TEXT NOT NULL, ts INTEGER NOT NULL, "
+            "open REAL, high REAL, low REAL, close REAL, volume REAL, "
+            "PRIMARY KEY (ticker, ts));"
+            "CREATE TABLE IF NOT EXISTS history_meta ("
+            "ticker TEXT PRIMARY KEY, tz TEXT, covered_from INTEGER, checked_at REAL NOT NULL);"
+        )
+        self._conn.commit()
+
+    def plan(self, ticker: str, period: str) -> Tuple[str, Optional[pd.Timestamp]]:
+        """
+        Decide how to bring a ticker's series up to date.
+
+        Returns:
+            ``("fresh", None)`` if no download is needed, ``("full", None)`` if the
+            whole period must be downloaded, or ``("incremental", start)`` with the
+            date to download from
+        """
+        meta = self._meta(ticker)
+        if meta is None:
+            return "full", None
+
+        tz, covered_from, checked_at = meta
+        wanted_from = period_start(period)
+        if covered_from is not None and (wanted_from is None or self._to_timestamp(covered_from, None) > self._naive(wanted_from)):
+            return "full", None
+        if not self.refresh and time.time() - checked_at < self.min_refresh:
+            return "fresh", None
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT ts FROM price_history WHERE ticker = ? ORDER BY ts DESC LIMIT 2", (ticker,)
+            ).fetchall()
+        if len(rows) < 2:
+            return "full", None
+        return "incremental", self._to_timestamp(rows[1][0], tz)
+
+    def apply(self, ticker: str, period: str, mode: str, hist: pd.DataFrame) -> bool:
+        """
+        Store bars downloaded according to ``plan``.
+
+        Returns:
+            False if an incremental download no longer matches the stored series
+            (prices were re-adjusted) and the full period must be downloaded instead
+        """
+        if mode == "full":
+            if hist.empty and self._meta(ticker) is not None:
+                logger.warning(f"Empty history download for {ticker}, keeping the stored series")
+                return True
+            self._replace(ticker, period, hist)
+            return True
+
+        if mode == "incremental":
+            if hist.empty:
+                self._touch(ticker)
+                return True
+            stored = self._load(ticker)
+            overlap = stored.index.intersection(hist.index)
+            if len(overlap) == 0:
+                return False
+            old_close = stored.loc[overlap[0], "Close"]
+            new_close = hist.loc[overlap[0], "Close"]
+            if abs(new_close - old_close) > ADJUSTMENT_TOLERANCE * max(1.0, abs(old_close)):
+                logger.info(f"Stored history for {ticker} was re-adjusted, downloading it again")
+                return False
+            self._upsert(ticker, hist)
+            self._touch(ticker)
+        return True
+
+    def get_history(self, ticker: str, period: str,
+                    fetch: Callable[[Optional[pd.Timestamp]], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Return the stored series for the period, downloading only what is missing.
+
+        Args:
+            ticker: The stock ticker symbol
+            period: The yfinance period the series must cover
+            fetch: Downloads bars from a start date, or the full period when given None
+        """
+        mode, start = self.plan(ticker, period)
+        if mode == "incremental" and not self.apply(ticker, period, mode, fetch(start)):
+            mode = "full"
+        if mode == "full":
+            self.apply(ticker, period, mode, fetch(None))
+        return self.load(ticker, period)
+
+    def load(self, ticker: str, period: str) -> pd.DataFrame:
+        """Load the stored bars that fall within the period."""
+        hist = self._load(ticker)
+        start = period_start(period)
+        if start is None or hist.empty:
+            return hist
+        if hist.index.tz is not None:
+            start = start.tz_localize(hist.index.tz)
+        return hist[hist.index >= start]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _load(self, ticker: str) -> pd.DataFrame:
+        meta = self._meta(ticker)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT ts, open, high, low, close, volume FROM price_history WHERE ticker = ? ORDER BY ts",
+                (ticker,)
+            ).fetchall()
+        if not rows:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        frame = pd.DataFrame(rows, columns=["ts"] + OHLCV_COLUMNS)
+        index = pd.to_datetime(frame.pop("ts"), unit="ns")
+        tz = meta[0] if meta else None
+        frame.index = pd.DatetimeIndex(index).tz_localize("UTC").tz_convert(tz) if tz else pd.DatetimeIndex(index)
+        frame.index.name = "Date"
+        return frame
+
+    def _replace(self, ticker: str, period: str, hist: pd.DataFrame) -> None:
+        tz = str(hist.index.tz) if isinstance(hist.index, pd.DatetimeIndex) and hist.index.tz is not None else None
+        wanted_from = period_start(period)
+        covered_from = None if wanted_from is None else int(wanted_from.value)
+        with self._lock:
+            self._conn.execute("DELETE FROM price_history WHERE ticker = ?", (ticker,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO history_meta (ticker, tz, covered_from, checked_at) VALUES (?, ?, ?, ?)",
+                (ticker, tz, covered_from, time.time())
+            )
+            self._conn.commit()
+        self._upsert(ticker, hist)
+
+    def _upsert(self, ticker: str, hist: pd.DataFrame) -> None:
+        if hist.empty:
+            return
+        bars = hist.reindex(columns=OHLCV_COLUMNS).astype(float)
+        timestamps = pd.DatetimeIndex(hist.index).as_unit("ns").asi8
+        rows = [
+            (ticker, int(ts), *[None if pd.isna(v) else v for v in values])
+            for ts, values in zip(timestamps, bars.itertuples(index=False, name=None))
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO price_history (ticker, ts, open, high, low, close, volume) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def _touch(self, ticker: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE history_meta SET checked_at = ? WHERE ticker = ?", (time.time(), ticker))
+            self._conn.commit()
+
+    def _meta(self, ticker: str) -> Optional[Tuple[Optional[str], Optional[int], float]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT tz, covered_from, checked_at FROM history_meta WHERE ticker = ?", (ticker,)
+            ).fetchone()
+
+    @staticmethod
+    def _to_timestamp(value: int, tz: Optional[str]) -> pd.Timestamp:
+        ts = pd.Timestamp(value)
+        return ts.tz_localize("UTC").tz_convert(tz) if tz else ts
+
+    @staticmethod
+    def _naive(ts: pd.Timestamp) -> pd.Timestamp:
+        return ts.tz_localize(None) if ts.tzinfo is not None else ts
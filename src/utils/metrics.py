@@ -0,0 +1,215 @@
+"""
+Metrics Module
+
+This module collects timings and counters from a portfolio run. Spans are timed
+with ``perf_counter_ns`` and summarized per name and label set. They can be read
+in process with ``snapshot()``, streamed as JSON lines while the run goes, or
+written as a Prometheus text-format file. ``NULL_METRICS`` has the same interface
+and records nothing, so instrumented code costs next to nothing when metrics are
+disabled.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .results_writer import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Prefix of every exported Prometheus metric
+METRIC_PREFIX = "finagents"
+
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+def _series_key(name: str, labels: Dict[str, Any]) -> SeriesKey:
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+def _quantile(durations: List[int], q: float) -> int:
+    # Nearest-rank quantile of sorted durations
+    return durations[min(len(durations) - 1, int(q * len(durations)))]
+
+class _Span:
+    """Times the block it wraps and records it on exit."""
+
+    __slots__ = ("_metrics", "_name", "_labels", "_start")
+
+    def __init__(self, metrics: "Metrics", name: str, labels: Dict[str, Any]):
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._metrics.observe(self._name, time.perf_counter_ns() - self._start, **self._labels)
+
+class Metrics:
+    """Thread-safe collector of span durations and counters."""
+
+    enabled = True
+
+    def __init__(self, events_path: Optional[str] = None):
+        """
+        Create the collector.
+
+        Args:
+            events_path: Optional JSON lines file every span and counter update is
+                appended to as it happens
+        """
+        self._lock = threading.Lock()
+        self._durations: Dict[SeriesKey, array] = {}
+        self._counters: Dict[SeriesKey, float] = {}
+        self._events = None
+        if events_path:
+            directory = os.path.dirname(events_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._events = open(events_path, "a", encoding="utf-8")
+
+    def span(self, name: str, **labels: Any) -> _Span:
+        """Return a context manager that records how long its block takes."""
+        return _Span(self, name, labels)
+
+    def observe(self, name: str, duration_ns: int, **labels: Any) -> None:
+        """Record a duration in nanoseconds that was measured elsewhere."""
+        key = _series_key(name, labels)
+        with self._lock:
+            durations = self._durations.get(key)
+            if durations is None:
+                durations = self._durations[key] = array("q")
+            durations.append(duration_ns)
+            if self._events is not None:
+                self._write_event({"type": "span", "name": name, "labels": labels, "duration_ns": duration_ns})
+
+    def increment(self, name: str, amount: float = 1, **labels: Any) -> None:
+        """Add ``amount`` to a counter."""
+        key = _series_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+            if self._events is not None:
+                self._write_event({"type": "counter", "name": name, "labels": labels, "amount": amount})
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return every span summary and counter recorded so far.
+
+        Spans are summarized as their count, total, minimum, maximum and
+        quantiles in seconds.
+        """
+        with self._lock:
+            series = {key: sorted(durations) for key, durations in self._durations.items()}
+            counters = dict(self._counters)
+
+        spans = []
+        for (name, labels), durations in sorted(series.items()):
+            summary = {
+                "name": name,
+                "labels": dict(labels),
+                "count": len(durations),
+                "sum_seconds": sum(durations) / 1e9,
+                "min_seconds": durations[0] / 1e9,
+                "max_seconds": durations[-1] / 1e9,
+            }
+            for q in SUMMARY_QUANTILES:
+                summary[f"p{round(q * 100)}_seconds"] = _quantile(durations, q) / 1e9
+            spans.append(summary)
+        return {
+            "spans": spans,
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(counters.items())
+            ]
+        }
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the metrics to ``path`` in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        for name in sorted({span["name"] for span in snapshot["spans"]}):
+            metric = f"{METRIC_PREFIX}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for span in snapshot["spans"]:
+                if span["name"] != name:
+                    continue
+                for q in SUMMARY_QUANTILES:
+                    labels = _format_labels({**span["labels"], "quantile": q})
+                    lines.append(f"{metric}{labels} {span[f'p{round(q * 100)}_seconds']:.9f}")
+                labels = _format_labels(span["labels"])
+                lines.append(f"{metric}_sum{labels} {span['sum_seconds']:.9f}")
+                lines.append(f"{metric}_count{labels} {span['count']}")
+        for name in sorted({counter["name"] for counter in snapshot["counters"]}):
+            metric = f"{METRIC_PREFIX}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for counter in snapshot["counters"]:
+                if counter["name"] == name:
+                    lines.append(f"{metric}{_format_labels(counter['labels'])} {counter['value']:g}")
+
+        # Written through a rename so a scraper never reads a partial file, readable by other users
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        atomic_write(path, "\n".join(lines) + "\n")
+
+    def close(self) -> None:
+        """Flush and close the JSON lines file, if any."""
+        with self._lock:
+            events, self._events = self._events, None
+        if events is not None:
+            events.close()
+
+    def _write_event(self, event: Dict[str, Any]) -> None:
+        event["time"] = time.time()
+        self._events.write(json.dumps(event, default=str) + "\n")
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    # Label values escape backslashes, quotes and newlines
+    pairs = (
+        key + '="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for key, value in sorted(labels.items())
+    )
+    return "{" + ",".join(pairs) + "}"
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class NullMetrics:
+    """Collector that records nothing, used when metrics are disabled."""
+
+    enabled = False
+
+    def span(self, name: str, **labels: Any) -> _NullSpan:
+        return _NULL_SPAN
+
+    def observe(self, name: str, duration_ns: int, **labels: Any) -> None:
+        pass
+
+    def increment(self, name: str, amount: float = 1, **labels: Any) -> None:
+        pass
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {"spans": [], "counters": []}
+
+    def write_prometheus(self, path: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+NULL_METRICS = NullMetrics()
@@ -0,0 +1,99 @@
+"""
+Portfolio Module
+
+This module reads the tickers to analyze from a broker's portfolio export.
+Only the ticker and instrument type columns are parsed, as strings, and the
+filters are applied to whole columns at once. Large CSV exports are streamed
+in chunks so memory stays flat, and Parquet exports are read column-wise.
+"""
+
+import os
+import logging
+import pandas as pd
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Columns of the export that are read; every other column is skipped while parsing
+TICKER_COLUMN = "TICKER"
+TYPE_COLUMN = "BS"
+PORTFOLIO_COLUMNS = (TICKER_COLUMN, TYPE_COLUMN)
+
+# Instrument type of ETFs and funds, which are not analyzed
+EXCLUDED_TYPE = "I"
+
+# Crypto pairs are quoted against the dollar, like BTC-USD
+CRYPTO_SUFFIX = "-USD"
+
+# Exports larger than this are streamed in chunks of ``CHUNK_ROWS`` rows
+CHUNK_THRESHOLD_BYTES = 64 * 1024 * 1024
+CHUNK_ROWS = 100_000
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+
+logger = logging.getLogger(__name__)
+
+def load_portfolio(path: str, chunksize: Optional[int] = None) -> List[str]:
+    """
+    Read the stock tickers to analyze from a CSV or Parquet portfolio export.
+
+    Rows flagged as ETFs or funds, crypto pairs and blank tickers are dropped,
+    and each ticker is kept once, in the order it first appears.
+
+    Args:
+        path: The export; files ending in ``.parquet`` or ``.pq`` are read as Parquet
+        chunksize: Rows parsed at a time (default: the whole file, or chunks of
+            ``CHUNK_ROWS`` for files over ``CHUNK_THRESHOLD_BYTES``)
+
+    Returns:
+        The tickers to analyze
+
+    Raises:
+        ValueError: If the export has no ticker column
+        ImportError: If a Parquet export is given and pyarrow is not installed
+    """
+    if chunksize is None and os.path.getsize(path) > CHUNK_THRESHOLD_BYTES:
+        chunksize = CHUNK_ROWS
+    if path.lower().endswith(PARQUET_EXTENSIONS):
+        frames = _read_parquet(path, chunksize)
+    else:
+        frames = _read_csv(path, chunksize)
+
+    # A dict keeps the first occurrence of each ticker in order
+    tickers: Dict[str, None] = {}
+    for frame in frames:
+        tickers.update(dict.fromkeys(filter_tickers(frame)))
+    logger.info(f"Loaded {len(tickers)} tickers from {path}")
+    return list(tickers)
+
+def filter_tickers(frame: pd.DataFrame) -> List[str]:
+    """Return the distinct stock tickers of a portfolio frame, without ETFs, crypto or blanks."""
+    if TICKER_COLUMN not in frame.columns:
+        raise ValueError(f"Portfolio has no {TICKER_COLUMN} column")
+    tickers = frame[TICKER_COLUMN]
+    if TYPE_COLUMN in frame.columns:
+        tickers = tickers[~frame[TYPE_COLUMN].isin([EXCLUDED_TYPE])]
+    # Exports repeat a ticker for every position, so the string checks run on distinct values only
+    tickers = pd.Series(tickers.dropna().unique(), dtype=str).str.strip()
+    keep = (tickers != "") & ~tickers.str.contains(CRYPTO_SUFFIX, regex=False)
+    return tickers[keep].drop_duplicates().tolist()
+
+def _read_csv(path: str, chunksize: Optional[int]) -> Iterable[pd.DataFrame]:
+    # The parser skips columns named in a list faster than ones rejected by a callable
+    header = pd.read_csv(path, nrows=0).columns
+    reader = pd.read_csv(path, usecols=[column for column in PORTFOLIO_COLUMNS if column in header],
+                         dtype=str, chunksize=chunksize)
+    return reader if chunksize else [reader]
+
+def _read_parquet(path: str, chunksize: Optional[int]) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(f"Reading the Parquet portfolio {path} requires pyarrow; "
+                          f"install it with `pip install pyarrow` or `pip install .[parquet]`") from error
+
+    parquet = pq.ParquetFile(path)
+    columns = [column for column in PORTFOLIO_COLUMNS if column in parquet.schema_arrow.names]
+    if chunksize is None:
+        yield parquet.read(columns=columns).to_pandas()
+        return
+    for batch in parquet.iter_batches(batch_size=chunksize, columns=columns):
+        yield batch.to_pandas()
@@ -0,0 +1,206 @@
+"""
+Progress Module
+
+This module reports the progress of a portfolio run without slowing it down.
+Worker threads only push small event tuples onto a queue. A single consumer
+thread formats them and hands them to a sink: the original line-per-agent
+output, one aggregated progress bar, JSON lines for other tools, or nothing.
+"""
+
+import sys
+import json
+import time
+import queue
+import logging
+import threading
+from typing import Any, Optional, TextIO
+
+# Event kinds pushed by the debate manager
+RUN_START = "run_start"
+PHASE_START = "phase_start"
+PHASE_DONE = "phase_done"
+AGENT_START = "agent_start"
+AGENT_DONE = "agent_done"
+AGENT_FAILED = "agent_failed"
+SYNTHESIS_START = "synthesis_start"
+SYNTHESIS_DONE = "synthesis_done"
+TICKER_DONE = "ticker_done"
+
+# Seconds between redraws of the progress bar
+BAR_REFRESH_INTERVAL = 0.1
+
+BAR_WIDTH = 30
+
+PROGRESS_SINKS = ("bar", "verbose", "events", "none")
+
+logger = logging.getLogger(__name__)
+
+class VerboseSink:
+    """Prints a line for every phase and agent call, like the original console output."""
+
+    # Phase title and what an agent's response is called, by role
+    WORDING = {"analyst": ("analyst reports", "analysis"), "investor": ("investor opinions", "investment analysis")}
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def handle(self, kind: str, ticker: Any, role: Any, name: Any, value: Any, timestamp: float) -> None:
+        title, label = self.WORDING.get(role, ("", ""))
+        if kind == PHASE_START:
+            line = f"\nGathering {title} for {ticker}..."
+        elif kind == PHASE_DONE:
+            line = f"All {title} completed in {value:.2f} seconds\n"
+        elif kind == AGENT_START:
+            line = f"  • Working on {name}'s {label}..."
+        elif kind == AGENT_DONE:
+            line = f"  ✓ Completed {name}'s {label} ({value:.2f}s)"
+        elif kind == AGENT_FAILED:
+            line = f"  ✗ Failed to get {name}'s {label}: {value}"
+        elif kind == SYNTHESIS_START:
+            line = f"\nSynthesizing final investment decision for {ticker}..."
+        elif kind == SYNTHESIS_DONE:
+            line = f"Decision synthesis completed in {value:.2f} seconds\n"
+        else:
+            return
+        print(line, file=self.stream or sys.stdout)
+
+    def close(self) -> None:
+        pass
+
+class BarSink:
+    """Redraws one line with tickers and agent calls completed, at most every ``BAR_REFRESH_INTERVAL``."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+        self.total = 0
+        self.tickers_done = 0
+        self.calls_done = 0
+        self.calls_failed = 0
+        self._started = time.monotonic()
+        self._drawn_at = 0.0
+        self._drawn = False
+
+    def handle(self, kind: str, ticker: Any, role: Any, name: Any, value: Any, timestamp: float) -> None:
+        if kind == RUN_START:
+            self.total += value
+        elif kind == AGENT_DONE:
+            self.calls_done += 1
+        elif kind == AGENT_FAILED:
+            self.calls_failed += 1
+        elif kind == TICKER_DONE:
+            self.tickers_done += 1
+        else:
+            return
+        now = time.monotonic()
+        if kind == TICKER_DONE or now - self._drawn_at >= BAR_REFRESH_INTERVAL:
+            self._draw(now)
+
+    def _draw(self, now: float) -> None:
+        stream = self.stream or sys.stderr
+        filled = BAR_WIDTH * self.tickers_done // self.total if self.total else 0
+        failed = f", {self.calls_failed} failed" if self.calls_failed else ""
+        stream.write(f"\r[{'#' * filled}{'.' * (BAR_WIDTH - filled)}] {self.tickers_done}/{self.total} stocks, "
+                     f"{self.calls_done} agent calls{failed} ({now - self._started:.0f}s)")
+        stream.flush()
+        self._drawn_at = now
+        self._drawn = True
+
+    def close(self) -> None:
+        if self._drawn:
+            self._draw(time.monotonic())
+            (self.stream or sys.stderr).write("\n")
+
+class EventSink:
+    """Writes every event as a JSON line, for dashboards and log shippers."""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def handle(self, kind: str, ticker: Any, role: Any, name: Any, value: Any, timestamp: float) -> None:
+        event = {"event": kind, "time": timestamp}
+        for key, field in (("ticker", ticker), ("role", role), ("agent", name), ("value", value)):
+            if field is not None:
+                event[key] = field
+        (self.stream or sys.stdout).write(json.dumps(event, default=str) + "\n")
+
+    def close(self) -> None:
+        (self.stream or sys.stdout).flush()
+
+class ProgressReporter:
+    """
+    Queue of progress events rendered by one consumer thread.
+
+    ``emit`` never formats or writes anything itself, so it is cheap to call
+    from many worker threads. The consumer thread starts on the first event.
+    """
+
+    def __init__(self, sink):
+        self.sink = sink
+        self._queue = queue.SimpleQueue()
+        self._consumer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def emit(self, kind: str, ticker: Any = None, role: Any = None, name: Any = None, value: Any = None) -> None:
+        """Queue an event; ``value`` carries the event's number or message, if any."""
+        if self._consumer is None:
+            self._start()
+        self._queue.put((kind, ticker, role, name, value, time.time()))
+
+    def flush(self) -> None:
+        """Wait until every event queued so far has been rendered."""
+        if self._consumer is not None:
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait()
+
+    def close(self) -> None:
+        """Render the remaining events, stop the consumer thread and close the sink."""
+        with self._lock:
+            consumer, self._consumer = self._consumer, None
+        if consumer is not None:
+            self._queue.put(None)
+            consumer.join()
+        self.sink.close()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._consumer is None:
+                self._consumer = threading.Thread(target=self._consume, name="progress", daemon=True)
+                self._consumer.start()
+
+    def _consume(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            if isinstance(event, threading.Event):
+                event.set()
+                continue
+            try:
+                self.sink.handle(*event)
+            except Exception as e:
+                # Progress output must never take the run down
+                logger.warning(f"Progress sink failed to render {event[0]}: {e}")
+
+class NullProgress:
+    """Reporter that discards every event."""
+
+    def emit(self, kind: str, ticker: Any = None, role: Any = None, name: Any = None, value: Any = None) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+NULL_PROGRESS = NullProgress()
+
+def create_progress(kind: str, stream: Optional[TextIO] = None):
+    """Return a reporter for a sink named in ``PROGRESS_SINKS``."""
+    if kind == "none":
+        return NULL_PROGRESS
+    sinks = {"bar": BarSink, "verbose": VerboseSink, "events": EventSink}
+    if kind not in sinks:
+        raise ValueError(f"Unknown progress sink {kind!r}, expected one of {PROGRESS_SINKS}")
+    return ProgressReporter(sinks[kind](stream))
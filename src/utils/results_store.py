@@ -0,0 +1,180 @@
+"""
+Results Store Module
+
+This module records the outcome of every analyzed stock in an indexed SQLite
+database next to the Markdown results, so questions across runs ("which
+tickers did Michael Burry rate SELL last week?") are answered by a query
+instead of parsing thousands of files. Each investor's opinion and the
+synthesized decision are reduced to BUY, HOLD or SELL when they are recorded.
+"""
+
+import os
+import re
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RESULTS_DB_FILENAME = "results.sqlite"
+
+RATINGS = ("BUY", "HOLD", "SELL")
+
+# Where a document states its verdict, tried in order; the last match of a pattern wins
+VERDICT_PATTERNS = [
+    # **Investment Recommendation**: AVOID, **Position**: HOLD - Pending analysis
+    re.compile(r"\*\*(?:Investment |Final |Trading )?(?:Recommendation|Position|Decision)\*\*:\s*\**(.+)", re.I),
+    # ## 5. Final Recommendation: **MODERATE BUY**
+    re.compile(r"^#+\s*(?:\d+\.\s*)?(?:Final |Investment )?(?:Recommendation|Decision)\s*:\s*\**(.+?)\**\s*$",
+               re.I | re.M),
+    # ## Investment Decision, followed by a bold verdict
+    re.compile(r"^#+[^\n]*(?:Decision|Recommendation|The Trade)[^\n]*\n+\s*\*\*(.+?)\*\*", re.I | re.M),
+]
+
+# Phrases that rule a direction out rather than recommend it, as in "NOT long, NOT short"
+NEGATED = re.compile(r"\bNOT\s+(?:LONG|SHORT)\b", re.I)
+
+# The first of these words in a verdict decides its rating
+VERDICT_WORDS = re.compile(
+    r"\b(SELL|SHORT|AVOID|UNDERWEIGHT|REDUCE|TRIM|BUY|ACCUMULATE|OVERWEIGHT|HOLD|WAIT|NEUTRAL|CAUTIOUS\w*|"
+    r"MARKET WEIGHT|WATCH\w*)\b", re.I
+)
+SELL_WORDS = {"SELL", "SHORT", "AVOID", "UNDERWEIGHT", "REDUCE", "TRIM"}
+BUY_WORDS = {"BUY", "ACCUMULATE", "OVERWEIGHT"}
+
+def extract_verdict(text: str) -> Optional[str]:
+    """Return the phrase a document states its recommendation with, or None if it has none."""
+    for pattern in VERDICT_PATTERNS:
+        matches = pattern.findall(text)
+        if matches:
+            return matches[-1].strip().strip("*").strip()
+    return None
+
+def extract_rating(text: str) -> Optional[str]:
+    """Reduce an investor opinion or a synthesis to BUY, HOLD or SELL, or None if it states no verdict."""
+    verdict = extract_verdict(text)
+    if verdict is None:
+        return None
+    word = VERDICT_WORDS.search(NEGATED.sub("", verdict))
+    if word is None:
+        # A verdict that only rules directions out is a neutral one
+        return "HOLD" if NEGATED.search(verdict) else None
+    word = word.group(1).upper()
+    if word in SELL_WORDS:
+        return "SELL"
+    if word in BUY_WORDS:
+        return "BUY"
+    return "HOLD"
+
+def new_run_id() -> str:
+    """Return an identifier for a run that sorts by start time."""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+class ResultsStore:
+    """
+    SQLite tables of runs, synthesized positions and investor ratings.
+
+    Every stock recorded through one store belongs to the same run. Recording
+    is safe from any thread, such as the results writer's.
+    """
+
+    def __init__(self, path: str = os.path.join("results", RESULTS_DB_FILENAME), run_id: Optional[str] = None):
+        """
+        Open (or create) the store and start a run.
+
+        Args:
+            path: Location of the SQLite file
+            run_id: Identifier of the run (default: a new one from ``new_run_id``)
+        """
+        self.path = path
+        self.run_id = run_id or new_run_id()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, started_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS decisions ("
+            "run_id TEXT NOT NULL, ticker TEXT NOT NULL, recorded_at REAL NOT NULL, "
+            "position TEXT, verdict TEXT, seconds REAL, "
+            "PRIMARY KEY (run_id, ticker));"
+            "CREATE TABLE IF NOT EXISTS ratings ("
+            "run_id TEXT NOT NULL, ticker TEXT NOT NULL, investor TEXT NOT NULL, recorded_at REAL NOT NULL, "
+            "rating TEXT, verdict TEXT, "
+            "PRIMARY KEY (run_id, ticker, investor));"
+            "CREATE INDEX IF NOT EXISTS decisions_by_ticker ON decisions (ticker, recorded_at);"
+            "CREATE INDEX IF NOT EXISTS ratings_by_investor ON ratings (investor, rating, recorded_at);"
+            "CREATE INDEX IF NOT EXISTS ratings_by_ticker ON ratings (ticker, recorded_at);"
+        )
+        self._conn.execute("INSERT OR IGNORE INTO runs (run_id, started_at) VALUES (?, ?)",
+                           (self.run_id, time.time()))
+        self._conn.commit()
+
+    def record(self, ticker: str, result: Dict[str, Any], seconds: Optional[float] = None,
+               recorded_at: Optional[float] = None) -> None:
+        """
+        Record a stock's synthesized position and each investor's rating in this run.
+
+        Args:
+            ticker: The stock ticker symbol
+            result: The debate result
+            seconds: How long the stock's debate took, if known
+            recorded_at: Time of the record (default: now)
+        """
+        recorded_at = time.time() if recorded_at is None else recorded_at
+        decision = result["decision"]
+        ratings = [
+            (self.run_id, ticker, investor, recorded_at, extract_rating(opinion), extract_verdict(opinion))
+            for investor, opinion in result["investor_opinions"].items()
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO decisions (run_id, ticker, recorded_at, position, verdict, seconds) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (self.run_id, ticker, recorded_at, extract_rating(decision), extract_verdict(decision),
+                     seconds)
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO ratings (run_id, ticker, investor, recorded_at, rating, verdict) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", ratings
+                )
+
+    def ratings(self, investor: Optional[str] = None, rating: Optional[str] = None,
+                ticker: Optional[str] = None, since: Optional[float] = None,
+                until: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Return investor ratings matching every given filter, oldest first."""
+        return self._query("ratings", {"investor": investor, "rating": rating, "ticker": ticker}, since, until)
+
+    def decisions(self, ticker: Optional[str] = None, position: Optional[str] = None,
+                  run_id: Optional[str] = None, since: Optional[float] = None,
+                  until: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Return synthesized positions matching every given filter, oldest first."""
+        return self._query("decisions", {"ticker": ticker, "position": position, "run_id": run_id}, since, until)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, table: str, filters: Dict[str, Any], since: Optional[float],
+               until: Optional[float]) -> List[Dict[str, Any]]:
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        if since is not None:
+            clauses.append("recorded_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("recorded_at < ?")
+            params.append(until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT * FROM {table}{where} ORDER BY recorded_at, ticker", params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -0,0 +1,206 @@
+"""
+Results Writer Module
+
+This module writes the Markdown results of each analyzed stock. Every document
+is assembled in one string and written atomically, so a crash never leaves a
+truncated file. ``ResultsWriter`` does the writing on a background thread, so
+the debate never waits on the disk, and can put a whole run into one JSON lines
+or tar archive instead of two small files per stock.
+"""
+
+import io
+import os
+import json
+import time
+import queue
+import logging
+import tarfile
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMATS = ("jsonl", "tar")
+
+# Results queued for the writer thread before ``submit`` blocks
+DEFAULT_MAX_PENDING = 64
+
+def decision_filename(ticker: str) -> str:
+    return f"{ticker}_decision.md"
+
+def detailed_filename(ticker: str) -> str:
+    return f"{ticker}_detailed_analysis.md"
+
+def render_documents(ticker: str, result: Dict[str, Any]) -> Dict[str, str]:
+    """Return the decision and detailed analysis Markdown of a debate result, keyed by file name."""
+    decision = f"# Investment Analysis for {ticker}\n\n{result['decision']}"
+
+    parts = [f"# Detailed Analysis for {ticker}\n\n", "## Analyst Reports\n\n"]
+    for analyst, report in result["analyst_reports"].items():
+        parts += [f"### {analyst}\n\n", report, "\n\n---\n\n"]
+    parts.append("## Investor Opinions\n\n")
+    for investor, opinion in result["investor_opinions"].items():
+        parts += [f"### {investor}\n\n", opinion, "\n\n---\n\n"]
+
+    return {decision_filename(ticker): decision, detailed_filename(ticker): "".join(parts)}
+
+def _file_mode() -> int:
+    """Return the mode ``open`` gives new files under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+def atomic_write(path: str, text: str) -> None:
+    """Write ``text`` to ``path`` through a temporary file and a rename."""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        # mkstemp creates owner-only files; give the result the mode a plain open would
+        os.chmod(tmp_path, _file_mode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def write_results(ticker: str, result: Dict[str, Any], output_dir: str = "results") -> List[str]:
+    """Write a stock's decision and detailed analysis to ``output_dir`` and return their paths."""
+    paths = []
+    for filename, text in render_documents(ticker, result).items():
+        path = os.path.join(output_dir, filename)
+        atomic_write(path, text)
+        paths.append(path)
+    return paths
+
+class ResultsWriter:
+    """
+    Writes debate results on a background thread.
+
+    Results are handed over with ``submit`` and written in the order they were
+    submitted, either as Markdown files in ``output_dir`` or as entries of one
+    archive for the whole run. A result that fails to write is logged and kept
+    in ``errors``; its callback is not called.
+    """
+
+    def __init__(self, output_dir: str = "results", archive: Optional[str] = None,
+                 max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        Create the writer and start its thread.
+
+        Args:
+            output_dir: Directory of the results, created if it does not exist
+            archive: ``"jsonl"`` or ``"tar"`` to write every result of the run into
+                one archive in ``output_dir``, or None for two Markdown files per stock
+            max_pending: Results waiting to be written before ``submit`` blocks, which
+                bounds the memory held by a slow disk
+        """
+        if archive is not None and archive not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unknown archive format {archive!r}, expected one of {ARCHIVE_FORMATS}")
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.archive = archive
+        self.archive_path = None
+        if archive is not None:
+            self.archive_path = os.path.join(output_dir, f"results-{time.strftime('%Y%m%d-%H%M%S')}.{archive}")
+        self.errors: List[Tuple[str, Exception]] = []
+        self._archive_file = None
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="results-writer", daemon=True)
+        self._thread.start()
+
+    def outputs(self, ticker: str) -> List[str]:
+        """Return the paths a stock's results are written to."""
+        if self.archive_path is not None:
+            return [self.archive_path]
+        return [os.path.join(self.output_dir, decision_filename(ticker)),
+                os.path.join(self.output_dir, detailed_filename(ticker))]
+
+    def submit(self, ticker: str, result: Dict[str, Any],
+               on_written: Optional[Callable[[str, List[str]], None]] = None) -> List[str]:
+        """
+        Queue a stock's results for writing.
+
+        Args:
+            ticker: The stock ticker symbol
+            result: The debate result, which must not be modified afterwards
+            on_written: Called on the writer thread with the ticker and its output
+                paths once the results are on disk
+
+        Returns:
+            The paths the results will be written to
+        """
+        if self._closed:
+            raise RuntimeError("ResultsWriter is closed")
+        self._queue.put((ticker, result, on_written))
+        return self.outputs(ticker)
+
+    def flush(self) -> None:
+        """Wait until every result submitted so far has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write the remaining results, stop the thread and close the archive."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        if self._archive_file is not None:
+            self._archive_file.close()
+            self._archive_file = None
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                ticker, result, on_written = item
+                try:
+                    outputs = self._write(ticker, render_documents(ticker, result))
+                except Exception as e:
+                    logger.error(f"Error writing results for {ticker}: {e}")
+                    self.errors.append((ticker, e))
+                    continue
+                if on_written is not None:
+                    try:
+                        on_written(ticker, outputs)
+                    except Exception as e:
+                        logger.error(f"Error recording written results for {ticker}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, ticker: str, documents: Dict[str, str]) -> List[str]:
+        if self.archive is None:
+            paths = []
+            for filename, text in documents.items():
+                path = os.path.join(self.output_dir, filename)
+                atomic_write(path, text)
+                paths.append(path)
+            return paths
+
+        if self.archive == "jsonl":
+            if self._archive_file is None:
+                self._archive_file = open(self.archive_path, "w", encoding="utf-8")
+            self._archive_file.write(json.dumps({"ticker": ticker, "documents": documents}) + "\n")
+            self._archive_file.flush()
+        else:
+            if self._archive_file is None:
+                self._archive_file = tarfile.open(self.archive_path, "w")
+            for filename, text in documents.items():
+                data = text.encode("utf-8")
+                info = tarfile.TarInfo(filename)
+                info.size = len(data)
+                info.mtime = int(time.time())
+                self._archive_file.addfile(info, io.BytesIO(data))
+            self._archive_file.fileobj.flush()
+        return [self.archive_path]
@@ -0,0 +1,99 @@
+"""
+Run Manifest Module
+
+This module records the progress of a portfolio run in a JSON manifest next to
+the results, so an interrupted run can be resumed without redoing finished stocks.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+
+from .hashing import stable_hash
+from .results_writer import atomic_write
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+def input_hash(stock_data: Dict[str, Any]) -> str:
+    """Return the content hash of a stock's input data."""
+    return stable_hash(stock_data)
+
+class RunManifest:
+    """
+    Per-ticker status, input hash and output paths, persisted after every update.
+
+    A ticker counts as complete only if its last run finished, its outputs are still
+    on disk and it was produced from the same input data.
+    """
+
+    def __init__(self, path: str):
+        """Load the manifest at ``path``, or start an empty one if it does not exist."""
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                self.entries = data.get("tickers", {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable run manifest {path}: {e}")
+
+    def is_complete(self, ticker: str, data_hash: str) -> bool:
+        """Return True if the ticker was already analyzed from the same input data."""
+        entry = self.completed_entry(ticker)
+        return entry is not None and entry.get("input_hash") == data_hash
+
+    def completed_entry(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the ticker's entry if its last run finished and its outputs are still on disk."""
+        entry = self.get(ticker)
+        if not entry or entry.get("status") != "done":
+            return None
+        if not all(os.path.exists(path) for path in entry.get("outputs", [])):
+            return None
+        return entry
+
+    def mark_pending(self, tickers: List[str], hashes: Dict[str, str]) -> None:
+        """Record that the tickers are about to be analyzed."""
+        with self._lock:
+            for ticker in tickers:
+                self.entries[ticker] = self._entry("pending", hashes[ticker])
+            self._save()
+
+    def mark_done(self, ticker: str, data_hash: str, outputs: List[str],
+                  snapshot: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record that a ticker finished and where its outputs were written.
+
+        ``snapshot`` holds the input fields later runs compare against to decide
+        whether the ticker changed enough to be analyzed again.
+        """
+        fields = {"outputs": list(outputs)}
+        if snapshot is not None:
+            fields["snapshot"] = snapshot
+        with self._lock:
+            self.entries[ticker] = self._entry("done", data_hash, **fields)
+            self._save()
+
+    def get(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the manifest entry for a ticker."""
+        with self._lock:
+            entry = self.entries.get(ticker)
+            return dict(entry) if entry else None
+
+    @staticmethod
+    def _entry(status: str, data_hash: str, **fields) -> Dict[str, Any]:
+        return {"status": status, "input_hash": data_hash, "updated_at": time.time(), **fields}
+
+    def _save(self) -> None:
+        # Written through a temporary file and a rename so a crash never leaves a truncated manifest
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        atomic_write(self.path, json.dumps({"version": MANIFEST_VERSION, "tickers": self.entries},
+                                           indent=2, sort_keys=True))
@@ -0,0 +1,234 @@
+"""
+Stock Snapshot Module
+
+This module holds stock data in compact, typed records instead of free-form
+dicts. ``StockSnapshot`` keeps one stock's fields in ``__slots__``, with the
+numeric fields as Python floats and repeated labels such as the sector
+interned, and reads like the dict ``get_stock_data`` returns, so the agents and
+report templates use it unchanged. ``SnapshotTable`` stores the snapshots of a
+whole portfolio column-wise in NumPy arrays, so batch code can work on a
+column of every stock at once.
+"""
+
+import sys
+import numbers
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Stock data keys, the slot holding each one and its type, in the order of ``build_stock_data``
+FIELDS = (
+    ("ticker", "ticker", str),
+    ("company_name", "company_name", str),
+    ("sector", "sector", str),
+    ("industry", "industry", str),
+    ("current_price", "current_price", float),
+    ("market_cap", "market_cap", float),
+    ("pe_ratio", "pe_ratio", float),
+    ("forward_pe", "forward_pe", float),
+    ("dividend_yield", "dividend_yield", float),
+    ("52w_high", "year_high", float),
+    ("52w_low", "year_low", float),
+    ("52w_change", "year_change", float),
+    ("avg_volume", "avg_volume", float),
+    ("beta", "beta", float),
+    ("eps", "eps", float),
+    ("short_ratio", "short_ratio", float),
+    ("recommendation", "recommendation", str),
+    ("target_price", "target_price", float),
+    ("revenue_growth", "revenue_growth", float),
+    ("profit_margin", "profit_margin", float),
+    ("debt_to_equity", "debt_to_equity", float),
+    ("current_ratio", "current_ratio", float),
+    ("return_on_equity", "return_on_equity", float),
+    ("free_cash_flow", "free_cash_flow", float),
+    ("recent_trend", "recent_trend", str),
+    ("business_summary", "business_summary", str),
+    ("error", "error", str),
+)
+
+NUMERIC_FIELDS = tuple(key for key, _, kind in FIELDS if kind is float)
+TEXT_FIELDS = tuple(key for key, _, kind in FIELDS if kind is str)
+
+# Labels shared by many stocks, stored once per process
+INTERNED_FIELDS = frozenset({"sector", "industry", "recommendation", "recent_trend"})
+
+_SLOTS = {key: slot for key, slot, _ in FIELDS}
+_KINDS = {key: kind for key, _, kind in FIELDS}
+
+def _to_float(value: Any) -> Optional[float]:
+    """Convert a numeric field to a float, or None if it is missing or not a number."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, numbers.Real):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _to_text(key: str, value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    value = value if isinstance(value, str) else str(value)
+    return sys.intern(value) if key in INTERNED_FIELDS else value
+
+class StockSnapshot(Mapping):
+    """
+    One stock's data as a read-only mapping with typed fields.
+
+    Numeric fields are floats (None when missing or not a number) and text
+    fields are strings. A key that was not in the stock data, such as
+    ``current_price`` of a stock that failed to download, stays absent.
+    Keys outside ``FIELDS`` are kept as they are.
+    """
+
+    __slots__ = tuple(slot for _, slot, _ in FIELDS) + ("extra",)
+
+    def __init__(self, data: Mapping = ()):
+        """
+        Create a snapshot from stock data.
+
+        Args:
+            data: The stock data, as returned by ``get_stock_data``
+        """
+        extra = {}
+        for key, value in dict(data).items():
+            kind = _KINDS.get(key)
+            if kind is None:
+                extra[key] = value
+            elif kind is float:
+                object.__setattr__(self, _SLOTS[key], _to_float(value))
+            else:
+                object.__setattr__(self, _SLOTS[key], _to_text(key, value))
+        if extra:
+            object.__setattr__(self, "extra", extra)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("StockSnapshot is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        slot = _SLOTS.get(key)
+        if slot is None:
+            return getattr(self, "extra", {})[key]
+        try:
+            return getattr(self, slot)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        for key, slot, _ in FIELDS:
+            if hasattr(self, slot):
+                yield key
+        yield from getattr(self, "extra", {})
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the snapshot as a plain dict."""
+        return dict(self.items())
+
+    def __str__(self) -> str:
+        # Prompts show the stock data exactly as the dict would print
+        return str(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"StockSnapshot({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return (StockSnapshot, (self.to_dict(),))
+
+class SnapshotTable(Mapping):
+    """
+    The snapshots of many stocks, stored column-wise and keyed by ticker.
+
+    Numeric fields live in one float array with a row per stock, text fields
+    in one object array per field, and presence masks record which keys each
+    stock has. Looking a ticker up builds its ``StockSnapshot`` on demand, so
+    the table can replace the dict of stock data passed to the debate.
+    """
+
+    def __init__(self, stock_data: Mapping):
+        """
+        Store the data of many stocks.
+
+        Args:
+            stock_data: Stock data (dicts or snapshots) keyed by ticker
+        """
+        self.tickers: List[str] = list(stock_data)
+        self._rows = {ticker: row for row, ticker in enumerate(self.tickers)}
+        count = len(self.tickers)
+
+        self._numbers = np.full((count, len(NUMERIC_FIELDS)), np.nan)
+        self._numbers_none = np.zeros((count, len(NUMERIC_FIELDS)), dtype=bool)
+        self._text = {key: np.full(count, None, dtype=object) for key in TEXT_FIELDS}
+        self._present = np.zeros((count, len(FIELDS)), dtype=bool)
+        self._extra: Dict[int, Dict[str, Any]] = {}
+
+        columns = {key: column for column, key in enumerate(NUMERIC_FIELDS)}
+        positions = {key: position for position, (key, _, _) in enumerate(FIELDS)}
+        for row, data in enumerate(stock_data.values()):
+            snapshot = data if isinstance(data, StockSnapshot) else StockSnapshot(data)
+            for key, value in snapshot.items():
+                position = positions.get(key)
+                if position is None:
+                    self._extra.setdefault(row, {})[key] = value
+                    continue
+                self._present[row, position] = True
+                if key in columns:
+                    if value is None:
+                        self._numbers_none[row, columns[key]] = True
+                    else:
+                        self._numbers[row, columns[key]] = value
+                else:
+                    self._text[key][row] = value
+        self._numbers.flags.writeable = False
+        for column in self._text.values():
+            column.flags.writeable = False
+
+    def column(self, key: str) -> np.ndarray:
+        """
+        Return one field of every stock, in ticker order.
+
+        Numeric fields come back as a read-only float array with NaN where a
+        stock has no value; text fields as a read-only object array with None.
+        """
+        if key in NUMERIC_FIELDS:
+            return self._numbers[:, NUMERIC_FIELDS.index(key)]
+        if key in self._text:
+            return self._text[key]
+        raise KeyError(key)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return every stored field as a DataFrame indexed by ticker."""
+        frame = pd.DataFrame(self._numbers, index=pd.Index(self.tickers, name="ticker"),
+                             columns=list(NUMERIC_FIELDS))
+        for key in TEXT_FIELDS:
+            frame[key] = pd.Series(self._text[key], index=frame.index, dtype=object)
+        return frame[[key for key, _, _ in FIELDS]]
+
+    def __getitem__(self, ticker: str) -> StockSnapshot:
+        row = self._rows[ticker]
+        data = {}
+        numeric = 0
+        for position, (key, _, kind) in enumerate(FIELDS):
+            if kind is float:
+                column, numeric = numeric, numeric + 1
+                if self._present[row, position]:
+                    data[key] = None if self._numbers_none[row, column] else float(self._numbers[row, column])
+            elif self._present[row, position]:
+                data[key] = self._text[key][row]
+        data.update(self._extra.get(row, {}))
+        return StockSnapshot(data)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tickers)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __contains__(self, ticker: object) -> bool:
+        return ticker in self._rows
@@ -0,0 +1,147 @@
+"""
+Stock Data Cache Module
+
+This module provides a persistent on-disk cache for raw yfinance data.
+Each kind of data expires on its own schedule: price history goes stale within
+the trading day, company info daily, and financial statements quarterly.
+"""
+
+import os
+import time
+import pickle
+import sqlite3
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.getenv("FINAGENTS_CACHE_DIR", ".finagents_cache"), "stock_data.sqlite")
+
+# Expiry in seconds for each class of data
+DEFAULT_TTLS = {
+    "intraday": 5 * 60,
+    "daily": 60 * 60,
+    "info": 24 * 60 * 60,
+    "statements": 90 * 24 * 60 * 60,
+}
+
+# Which expiry class each cached kind of data belongs to
+KIND_TTL_CLASSES = {
+    "info": "info",
+    "income_stmt": "statements",
+    "balance_sheet": "statements",
+    "cashflow": "statements",
+}
+
+INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+
+def history_kind(interval: str = "1d") -> str:
+    """Return the cache kind used for price history at the given bar interval."""
+    return "history_intraday" if interval in INTRADAY_INTERVALS else "history_daily"
+
+def ttl_class(kind: str) -> str:
+    """Return the expiry class for a cached kind of data."""
+    if kind == "history_intraday":
+        return "intraday"
+    if kind == "history_daily":
+        return "daily"
+    return KIND_TTL_CLASSES[kind]
+
+class StockDataCache:
+    """
+    SQLite-backed cache of raw stock data keyed by ticker, kind and an optional sub-key.
+
+    Values are stored pickled so DataFrames round-trip exactly. The cache is safe
+    to share between the threads of a batch fetch.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttls: Optional[Dict[str, float]] = None,
+                 refresh: bool = False):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Location of the SQLite file
+            ttls: Overrides for the expiry time of each class in ``DEFAULT_TTLS``
+            refresh: Treat every lookup as a miss so all data is fetched again
+        """
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.refresh = refresh
+        self._counters = Counter()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stock_cache ("
+            "ticker TEXT NOT NULL, kind TEXT NOT NULL, key TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, payload BLOB NOT NULL, "
+            "PRIMARY KEY (ticker, kind, key))"
+        )
+        self._conn.commit()
+
+    def get(self, ticker: str, kind: str, key: str = "") -> Tuple[bool, Any]:
+        """Look up a fresh cached value, returning ``(hit, value)``."""
+        if not self.refresh:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT fetched_at, payload FROM stock_cache WHERE ticker = ? AND kind = ? AND key = ?",
+                    (ticker, kind, key)
+                ).fetchone()
+            if row is not None and time.time() - row[0] < self.ttls[ttl_class(kind)]:
+                self._count(kind, "hits")
+                return True, pickle.loads(row[1])
+
+        self._count(kind, "misses")
+        return False, None
+
+    def put(self, ticker: str, kind: str, value: Any, key: str = "") -> None:
+        """Store a freshly fetched value."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stock_cache (ticker, kind, key, fetched_at, payload) VALUES (?, ?, ?, ?, ?)",
+                (ticker, kind, key, time.time(), payload)
+            )
+            self._conn.commit()
+
+    def get_or_fetch(self, ticker: str, kind: str, fetch: Callable[[], Any], key: str = "") -> Any:
+        """Return the cached value, calling ``fetch`` and storing its result on a miss."""
+        hit, value = self.get(ticker, kind, key)
+        if hit:
+            return value
+        value = fetch()
+        self.put(ticker, kind, value, key)
+        return value
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return hit and miss counts per kind of data."""
+        with self._lock:
+            counters = dict(self._counters)
+        stats = {}
+        for (kind, outcome), count in counters.items():
+            stats.setdefault(kind, {"hits": 0, "misses": 0})[outcome] = count
+        return stats
+
+    def clear(self, ticker: Optional[str] = None) -> None:
+        """Remove cached entries for one ticker, or everything."""
+        with self._lock:
+            if ticker is None:
+                self._conn.execute("DELETE FROM stock_cache")
+            else:
+                self._conn.execute("DELETE FROM stock_cache WHERE ticker = ?", (ticker,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _count(self, kind: str, outcome: str) -> None:
+        with self._lock:
+            self._counters[(kind, outcome)] += 1
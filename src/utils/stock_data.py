@@ -7,19 +7,29 @@ It fetches financial data using yfinance and prepares it for analysis.
 
 import os
 import logging
+import numpy as np
 import pandas as pd
 import yfinance as yf
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Callable
+
+from .stock_cache import StockDataCache, history_kind
+from .history_store import PriceHistoryStore
 
 logger = logging.getLogger(__name__)
 
-def get_stock_data(ticker: str, period: str = "1y") -> Dict[str, Any]:
+def get_stock_data(ticker: str, period: str = "1y", cache: Optional[StockDataCache] = None,
+                   history_store: Optional[PriceHistoryStore] = None) -> Dict[str, Any]:
     """
     Retrieve comprehensive stock data for a given ticker.
     
     Args:
         ticker: The stock ticker symbol
         period: The time period for historical data (default: 1 year)
+        cache: Optional on-disk cache consulted before each yfinance request
+        history_store: Optional local price history; only bars after the last
+            stored date are downloaded
         
     Returns:
         A dictionary containing various stock data metrics
@@ -31,74 +41,264 @@ def get_stock_data(ticker: str, period: str = "1y") -> Dict[str, Any]:
         stock = yf.Ticker(ticker)
         
         # Basic company info
-        info = stock.info
+        info = _cached(cache, ticker, "info", lambda: stock.info)
         
         # Historical price data
-        hist = stock.history(period=period)
-        
-        # Calculate some basic metrics
-        if not hist.empty:
-            current_price = hist['Close'].iloc[-1]
-            year_high = hist['High'].max()
-            year_low = hist['Low'].min()
-            avg_volume = hist['Volume'].mean()
-            price_change = ((current_price / hist['Close'].iloc[0]) - 1) * 100  # percentage
+        if history_store is not None:
+            hist = history_store.get_history(
+                ticker, period,
+                lambda start: stock.history(period=period) if start is None
+                else stock.history(start=start.strftime("%Y-%m-%d"))
+            )
         else:
-            current_price = year_high = year_low = avg_volume = price_change = 0
+            hist = _cached(cache, ticker, history_kind(), lambda: stock.history(period=period), key=period)
         
         # Get financial statements if available
         try:
-            income_stmt = stock.income_stmt
-            balance_sheet = stock.balance_sheet
-            cash_flow = stock.cashflow
+            income_stmt, balance_sheet, cash_flow = _fetch_statements(stock, ticker, cache)
         except Exception as e:
             logger.warning(f"Could not fetch financial statements for {ticker}: {e}")
             income_stmt = balance_sheet = cash_flow = pd.DataFrame()
         
-        # Format the data
-        stock_data = {
+        return build_stock_data(ticker, info, hist, income_stmt, balance_sheet, cash_flow)
+        
+    except Exception as e:
+        logger.error(f"Error retrieving data for {ticker}: {e}")
+        return {
             "ticker": ticker,
-            "company_name": info.get("longName", ""),
-            "sector": info.get("sector", ""),
-            "industry": info.get("industry", ""),
-            "current_price": current_price,
-            "market_cap": info.get("marketCap", 0),
-            "pe_ratio": info.get("trailingPE", 0),
-            "forward_pe": info.get("forwardPE", 0),
-            "dividend_yield": info.get("dividendYield", 0),
-            "52w_high": year_high,
-            "52w_low": year_low,
-            "52w_change": price_change,
-            "avg_volume": avg_volume,
-            "beta": info.get("beta", 0),
-            "eps": info.get("trailingEps", 0),
-            "short_ratio": info.get("shortRatio", 0),
-            "recommendation": info.get("recommendationKey", ""),
-            "target_price": info.get("targetMeanPrice", 0),
-            
-            # Add key financial metrics from statements
+            "error": str(e)
+        }
+
+def get_stock_data_batch(tickers: List[str], period: str = "1y", max_workers: int = 8,
+                         provider: Any = None, cache: Optional[StockDataCache] = None,
+                         history_store: Optional[PriceHistoryStore] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieve stock data for many tickers at once.
+    
+    Price history for every symbol is downloaded in a single bulk request, company
+    info and financial statements are fetched concurrently, and the statement
+    ratios and price trends are computed for all tickers in one vectorized pass.
+    
+    Args:
+        tickers: The stock ticker symbols
+        period: The time period for historical data (default: 1 year)
+        max_workers: Maximum number of concurrent fundamentals requests
+        provider: Object exposing the yfinance ``Ticker`` and ``download`` API
+            (default: the yfinance module itself)
+        cache: Optional on-disk cache; only tickers without fresh cached data are requested
+        history_store: Optional local price history; takes precedence over ``cache``
+            for history, and tickers are grouped so each distinct start date of
+            missing bars costs one bulk request
+        
+    Returns:
+        A dictionary mapping each ticker to the same dictionary ``get_stock_data`` returns
+    """
+    provider = provider or yf
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+    
+    logger.info(f"Fetching data for {len(tickers)} tickers in batch")
+    
+    if history_store is not None:
+        histories = _update_history_store(provider, tickers, period, history_store)
+    else:
+        histories = {}
+        if cache is not None:
+            for ticker in tickers:
+                hit, hist = cache.get(ticker, history_kind(), key=period)
+                if hit:
+                    histories[ticker] = hist
+        missing = [ticker for ticker in tickers if ticker not in histories]
+        
+        if missing:
+            downloaded = _download_histories(provider, missing, period=period)
+            if cache is not None:
+                for ticker, hist in downloaded.items():
+                    if not hist.empty:
+                        cache.put(ticker, history_kind(), hist, key=period)
+            histories.update(downloaded)
+    
+    def fetch(ticker: str):
+        try:
+            stock = provider.Ticker(ticker)
+            info = _cached(cache, ticker, "info", lambda: stock.info)
+            try:
+                income_stmt, balance_sheet, cash_flow = _fetch_statements(stock, ticker, cache)
+            except Exception as e:
+                logger.warning(f"Could not fetch financial statements for {ticker}: {e}")
+                income_stmt = balance_sheet = cash_flow = pd.DataFrame()
+            return info, income_stmt, balance_sheet, cash_flow
+        except Exception as e:
+            logger.error(f"Error retrieving data for {ticker}: {e}")
+            return e
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers)))) as executor:
+        fetched = dict(zip(tickers, executor.map(fetch, tickers)))
+    
+    raw = {ticker: parts for ticker, parts in fetched.items() if not isinstance(parts, Exception)}
+    try:
+        metrics = compute_portfolio_metrics(
+            {ticker: parts[1] for ticker, parts in raw.items()},
+            {ticker: parts[2] for ticker, parts in raw.items()},
+            {ticker: histories[ticker] for ticker in raw}
+        ).to_dict(orient="index")
+    except Exception as e:
+        logger.warning(f"Vectorized metrics failed, calculating per ticker: {e}")
+        metrics = {}
+    
+    results = {}
+    for ticker, parts in fetched.items():
+        if isinstance(parts, Exception):
+            results[ticker] = {"ticker": ticker, "error": str(parts)}
+            continue
+        try:
+            info, income_stmt, balance_sheet, cash_flow = parts
+            results[ticker] = build_stock_data(ticker, info, histories[ticker], income_stmt, balance_sheet,
+                                               cash_flow, metrics=metrics.get(ticker))
+        except Exception as e:
+            logger.error(f"Error retrieving data for {ticker}: {e}")
+            results[ticker] = {
+                "ticker": ticker,
+                "error": str(e)
+            }
+    
+    return results
+
+def _download_histories(provider: Any, tickers: List[str], **kwargs) -> Dict[str, pd.DataFrame]:
+    """Download history for several tickers in one bulk request."""
+    try:
+        return split_batch_history(
+            provider.download(tickers, group_by="ticker", auto_adjust=True,
+                              progress=False, threads=True, **kwargs),
+            tickers
+        )
+    except Exception as e:
+        logger.warning(f"Bulk history download failed, continuing without history: {e}")
+        return {ticker: pd.DataFrame() for ticker in tickers}
+
+def _update_history_store(provider: Any, tickers: List[str], period: str,
+                          history_store: PriceHistoryStore) -> Dict[str, pd.DataFrame]:
+    """Bring the stored history of every ticker up to date and load it."""
+    full = []
+    by_start = defaultdict(list)
+    for ticker in tickers:
+        mode, start = history_store.plan(ticker, period)
+        if mode == "full":
+            full.append(ticker)
+        elif mode == "incremental":
+            by_start[start.strftime("%Y-%m-%d")].append(ticker)
+    
+    for start, group in by_start.items():
+        downloaded = _download_histories(provider, group, start=start)
+        for ticker in group:
+            if not history_store.apply(ticker, period, "incremental", downloaded[ticker]):
+                full.append(ticker)
+    
+    if full:
+        downloaded = _download_histories(provider, full, period=period)
+        for ticker in full:
+            history_store.apply(ticker, period, "full", downloaded[ticker])
+    
+    return {ticker: history_store.load(ticker, period) for ticker in tickers}
+
+def _cached(cache: Optional[StockDataCache], ticker: str, kind: str,
+            fetch: Callable[[], Any], key: str = "") -> Any:
+    """Fetch a piece of raw data through the cache when one is configured."""
+    if cache is None:
+        return fetch()
+    return cache.get_or_fetch(ticker, kind, fetch, key)
+
+def _fetch_statements(stock: Any, ticker: str, cache: Optional[StockDataCache]):
+    """Fetch the income statement, balance sheet and cash flow statement."""
+    income_stmt = _cached(cache, ticker, "income_stmt", lambda: stock.income_stmt)
+    balance_sheet = _cached(cache, ticker, "balance_sheet", lambda: stock.balance_sheet)
+    cash_flow = _cached(cache, ticker, "cashflow", lambda: stock.cashflow)
+    return income_stmt, balance_sheet, cash_flow
+
+def split_batch_history(data: Optional[pd.DataFrame], tickers: List[str]) -> Dict[str, pd.DataFrame]:
+    """Split a bulk ``yf.download(group_by="ticker")`` frame into per-ticker histories."""
+    histories = {}
+    for ticker in tickers:
+        if data is None or data.empty:
+            hist = pd.DataFrame()
+        elif isinstance(data.columns, pd.MultiIndex):
+            if ticker in data.columns.get_level_values(0):
+                hist = data[ticker]
+            else:
+                hist = pd.DataFrame()
+        elif len(tickers) == 1:
+            hist = data
+        else:
+            hist = pd.DataFrame()
+        # Symbols with a shorter listing history are padded with empty rows in the bulk frame
+        histories[ticker] = hist.dropna(how="all") if not hist.empty else hist
+    return histories
+
+def build_stock_data(ticker: str, info: Dict[str, Any], hist: pd.DataFrame,
+                     income_stmt: pd.DataFrame, balance_sheet: pd.DataFrame,
+                     cash_flow: pd.DataFrame, metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Assemble the stock data dictionary from raw yfinance info, history and statements.
+    
+    ``metrics`` is this ticker's row of ``compute_portfolio_metrics``; without it the
+    ratios and trend are calculated here one ticker at a time.
+    """
+    if metrics is None:
+        metrics = {
             "revenue_growth": calculate_revenue_growth(income_stmt),
             "profit_margin": calculate_profit_margin(income_stmt),
             "debt_to_equity": calculate_debt_to_equity(balance_sheet),
             "current_ratio": calculate_current_ratio(balance_sheet),
             "return_on_equity": calculate_roe(income_stmt, balance_sheet),
-            "free_cash_flow": get_latest_value(cash_flow, "Free Cash Flow"),
-            
-            # Recent price trend
             "recent_trend": get_recent_trend(hist),
-            
-            # Company description
-            "business_summary": info.get("longBusinessSummary", ""),
         }
+    
+    # Calculate some basic metrics
+    if not hist.empty:
+        current_price = hist['Close'].iloc[-1]
+        year_high = hist['High'].max()
+        year_low = hist['Low'].min()
+        avg_volume = hist['Volume'].mean()
+        price_change = ((current_price / hist['Close'].iloc[0]) - 1) * 100  # percentage
+    else:
+        current_price = year_high = year_low = avg_volume = price_change = 0
+    
+    # Format the data
+    return {
+        "ticker": ticker,
+        "company_name": info.get("longName", ""),
+        "sector": info.get("sector", ""),
+        "industry": info.get("industry", ""),
+        "current_price": current_price,
+        "market_cap": info.get("marketCap", 0),
+        "pe_ratio": info.get("trailingPE", 0),
+        "forward_pe": info.get("forwardPE", 0),
+        "dividend_yield": info.get("dividendYield", 0),
+        "52w_high": year_high,
+        "52w_low": year_low,
+        "52w_change": price_change,
+        "avg_volume": avg_volume,
+        "beta": info.get("beta", 0),
+        "eps": info.get("trailingEps", 0),
+        "short_ratio": info.get("shortRatio", 0),
+        "recommendation": info.get("recommendationKey", ""),
+        "target_price": info.get("targetMeanPrice", 0),
         
-        return stock_data
+        # Add key financial metrics from statements
+        "revenue_growth": metrics["revenue_growth"],
+        "profit_margin": metrics["profit_margin"],
+        "debt_to_equity": metrics["debt_to_equity"],
+        "current_ratio": metrics["current_ratio"],
+        "return_on_equity": metrics["return_on_equity"],
+        "free_cash_flow": get_latest_value(cash_flow, "Free Cash Flow"),
         
-    except Exception as e:
-        logger.error(f"Error retrieving data for {ticker}: {e}")
-        return {
-            "ticker": ticker,
-            "error": str(e)
-        }
+        # Recent price trend
+        "recent_trend": metrics["recent_trend"],
+        
+        # Company description
+        "business_summary": info.get("longBusinessSummary", ""),
+    }
 
 def calculate_revenue_growth(income_stmt: pd.DataFrame) -> float:
     """Calculate year-over-year revenue growth rate."""
@@ -192,4 +392,132 @@ def get_recent_trend(hist: pd.DataFrame) -> str:
     elif percent_change > -5:
         return "Moderate Downtrend"
     else:
-        return "Strong Downtrend"
\ No newline at end of file
+        return "Strong Downtrend"
+
+
+TREND_WINDOW = 30
+
+METRIC_COLUMNS = ["revenue_growth", "profit_margin", "debt_to_equity", "current_ratio",
+                  "return_on_equity", "recent_trend"]
+
+def compute_portfolio_metrics(income_stmts: Dict[str, pd.DataFrame], balance_sheets: Dict[str, pd.DataFrame],
+                              histories: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Calculate the statement ratios and price trend of many tickers at once.
+    
+    Every ticker's statements and closing prices are stacked into shared arrays and
+    each metric is computed in a single vectorized pass. Values match the scalar
+    ``calculate_*`` and ``get_recent_trend`` functions, including their fallbacks
+    to 0.0 and "Unknown" for missing data.
+    
+    Args:
+        income_stmts: Income statement of each ticker
+        balance_sheets: Balance sheet of each ticker
+        histories: Price history of each ticker
+        
+    Returns:
+        A DataFrame indexed by ticker with one column per metric
+    """
+    tickers = list(dict.fromkeys([*income_stmts, *balance_sheets, *histories]))
+    
+    income, income_has, income_periods = _stack_statements(
+        income_stmts, tickers, ["Total Revenue", "Net Income"], depth=2)
+    balance, balance_has, balance_periods = _stack_statements(
+        balance_sheets, tickers, ["Total Debt", "Total Stockholder Equity",
+                                  "Total Current Assets", "Total Current Liabilities"], depth=1)
+    
+    def latest(values, has, row):
+        # Missing rows count as 0, like ``get_latest_value(...) or 0``
+        return np.where(has[row], values[row][:, 0], 0.0)
+    
+    revenue = income["Total Revenue"][:, 0]
+    net_income = latest(income, income_has, "Net Income")
+    equity = latest(balance, balance_has, "Total Stockholder Equity")
+    has_balance = balance_periods > 0
+    
+    growth_ok, growth = _divide(income_has["Total Revenue"] & (income_periods >= 2),
+                                revenue, income["Total Revenue"][:, 1])
+    margin_ok, margin = _divide(income_has["Total Revenue"] & income_has["Net Income"], net_income, revenue)
+    debt_ok, debt_to_equity = _divide(has_balance, latest(balance, balance_has, "Total Debt"), equity)
+    current_ok, current_ratio = _divide(has_balance, latest(balance, balance_has, "Total Current Assets"),
+                                        latest(balance, balance_has, "Total Current Liabilities"))
+    roe_ok, roe = _divide((income_periods > 0) & has_balance, net_income, equity)
+    
+    return pd.DataFrame({
+        "revenue_growth": np.where(growth_ok, (growth - 1) * 100, 0.0),
+        "profit_margin": np.where(margin_ok, margin * 100, 0.0),
+        "debt_to_equity": np.where(debt_ok, debt_to_equity, 0.0),
+        "current_ratio": np.where(current_ok, current_ratio, 0.0),
+        "return_on_equity": np.where(roe_ok, roe * 100, 0.0),
+        "recent_trend": _trend_labels(histories, tickers),
+    }, index=pd.Index(tickers, name="ticker"), columns=METRIC_COLUMNS)
+
+def _divide(ok: np.ndarray, numerator: np.ndarray, denominator: np.ndarray):
+    """Divide where allowed, mirroring the scalar ``if denominator and denominator != 0`` check."""
+    # NaN passes the check and propagates, as it does in the scalar functions
+    valid = ok & (denominator != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return valid, numerator / np.where(valid, denominator, 1.0)
+
+def _stack_statements(statements: Dict[str, pd.DataFrame], tickers: List[str], rows: List[str], depth: int):
+    """
+    Stack the latest ``depth`` periods of the given rows of every ticker's statement.
+    
+    Returns the values of each row (tickers x periods), a per-row presence mask and
+    the number of periods each statement reports (0 for a missing or empty statement).
+    """
+    periods = np.zeros(len(tickers), dtype=int)
+    labels, blocks, owners = [], [], []
+    for i, ticker in enumerate(tickers):
+        df = statements.get(ticker)
+        if df is None or df.empty:
+            continue
+        periods[i] = df.shape[1]
+        labels.append(df.index)
+        blocks.append(df.to_numpy(dtype=float, na_value=np.nan)[:, :depth])
+        owners.append(np.full(len(df), i))
+    
+    values = np.full((len(tickers), len(rows), depth), np.nan)
+    has = np.zeros((len(tickers), len(rows)), dtype=bool)
+    if blocks:
+        # Match every statement line against the wanted rows in one lookup
+        positions = pd.Index(rows).get_indexer(np.concatenate([np.asarray(index_labels, dtype=object) for index_labels in labels]))
+        owner = np.concatenate(owners)
+        stacked = np.full((len(positions), depth), np.nan)
+        start = 0
+        for block in blocks:
+            stacked[start:start + len(block), :block.shape[1]] = block
+            start += len(block)
+        
+        # Reversed so the first occurrence of a duplicated line wins
+        found = np.flatnonzero(positions >= 0)[::-1]
+        values[owner[found], positions[found]] = stacked[found]
+        has[owner[found], positions[found]] = True
+    
+    return ({row: values[:, j] for j, row in enumerate(rows)},
+            {row: has[:, j] for j, row in enumerate(rows)},
+            periods)
+
+def _trend_labels(histories: Dict[str, pd.DataFrame], tickers: List[str]) -> np.ndarray:
+    """Label the recent trend of every ticker from its last ``TREND_WINDOW`` closes."""
+    closes = [histories[t]["Close"].to_numpy(dtype=float) if t in histories and not histories[t].empty
+              else np.empty(0) for t in tickers]
+    lengths = np.array([len(c) for c in closes], dtype=int)
+    labels = np.full(len(tickers), "Unknown", dtype=object)
+    present = lengths > 0
+    if not present.any():
+        return labels
+    
+    # Concatenate every series and index each ticker's window by its offsets
+    stacked = np.concatenate(closes)
+    ends = np.cumsum(lengths) - 1
+    starts = ends - np.minimum(lengths, TREND_WINDOW) + 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_change = (stacked[ends[present]] / stacked[starts[present]] - 1) * 100
+    
+    labels[present] = np.select(
+        [percent_change > 5, percent_change > 2, percent_change > -2, percent_change > -5],
+        ["Strong Uptrend", "Moderate Uptrend", "Sideways", "Moderate Downtrend"],
+        default="Strong Downtrend"
+    )
+    return labels
@@ -0,0 +1,107 @@
+"""
+Fake LLM provider for offline tests
+
+A local HTTP server that answers completion requests after a fixed latency and
+enforces request and token limits like a hosted provider, answering HTTP 429
+with a Retry-After header once a limit is exceeded. ``FakeLLMAgent`` calls it
+the way an LLM-backed agent would.
+"""
+
+import json
+import time
+import threading
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class FakeLLMServer:
+    """Rate-limited completion endpoint on localhost; use as a context manager."""
+
+    def __init__(self, requests_per_window=None, tokens_per_window=None, window=60.0, latency=0.0):
+        """
+        Create the server.
+
+        Args:
+            requests_per_window: Requests accepted per sliding window, or None for no limit
+            tokens_per_window: Prompt tokens accepted per sliding window, or None for no limit
+            window: Length of the sliding window in seconds
+            latency: Seconds taken to answer each accepted request
+        """
+        self.requests_per_window = requests_per_window
+        self.tokens_per_window = tokens_per_window
+        self.window = window
+        self.latency = latency
+        self.accepted = 0
+        self.rejected = 0
+        self._history = deque()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1/complete"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _admit(self, tokens):
+        # Returns 0 if the request is accepted, or the seconds until it would be
+        with self._lock:
+            now = time.monotonic()
+            while self._history and self._history[0][0] <= now - self.window:
+                self._history.popleft()
+            used = sum(size for _, size in self._history)
+            if ((self.requests_per_window is not None and len(self._history) >= self.requests_per_window)
+                    or (self.tokens_per_window is not None and used + tokens > self.tokens_per_window)):
+                self.rejected += 1
+                return self._history[0][0] + self.window - now if self._history else self.window
+            self._history.append((now, tokens))
+            self.accepted += 1
+            return 0
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                wait = server._admit(len(body["prompt"]) // 4 + 1)
+                if wait:
+                    self.send_response(429)
+                    self.send_header("Retry-After", f"{wait:.3f}")
+                    self.end_headers()
+                    return
+                time.sleep(server.latency)
+                payload = json.dumps({"text": f"Completion for {body['prompt'][:40]}"}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+class FakeLLMAgent:
+    """Agent that sends its inputs to a completion endpoint; HTTP errors are raised as ``HTTPError``."""
+
+    def __init__(self, url):
+        self.url = url
+
+    def invoke(self, inputs):
+        prompt = json.dumps(inputs, sort_keys=True, default=str)
+        request = urllib.request.Request(self.url, data=json.dumps({"prompt": prompt}).encode(),
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read())
@@ -16,6 +16,7 @@ from src.agents.investor_agents import create_investor_team
 from src.agents.analyst_agents import create_analyst_team
 from src.agents.debate_manager import DebateManager
 from src.utils.stock_data import get_stock_data
+from src.utils.results_writer import write_results
 
 class TestFullSystem(unittest.TestCase):
     """Integration tests for the full FinAgents system"""
@@ -147,5 +148,43 @@ class TestOutputFiles(unittest.TestCase):
         os.remove(test_decision_path)
         os.remove(test_analysis_path)
 
+    def test_write_results(self):
+        """Test that a debate result is written to decision and detailed files"""
+        import tempfile
+        import shutil
+        output_dir = tempfile.mkdtemp()
+        result = {
+            'analyst_reports': {'Analyst1': 'Report text'},
+            'investor_opinions': {'Investor1': 'Opinion text'},
+            'decision': 'Final decision text'
+        }
+
+        try:
+            write_results('TEST', result, output_dir)
+            with open(os.path.join(output_dir, 'TEST_decision.md')) as f:
+                decision = f.read()
+            with open(os.path.join(output_dir, 'TEST_detailed_analysis.md')) as f:
+                detailed = f.read()
+        finally:
+            shutil.rmtree(output_dir)
+
+        self.assertEqual(decision, '# Investment Analysis for TEST\n\nFinal decision text')
+        self.assertIn('### Analyst1\n\nReport text', detailed)
+        self.assertIn('### Investor1\n\nOpinion text', detailed)
+
+    def test_decisions_print_whatever_the_progress_display(self):
+        """Test that final decisions are printed by default and only left out with --no-decisions"""
+        import io
+        from contextlib import redirect_stdout
+        result = {'decision': 'Final decision text'}
+        outputs = ['results/TEST_decision.md', 'results/TEST_detailed_analysis.md']
+
+        for argv, printed in (([], True), (['--progress', 'none'], True), (['--no-decisions'], False)):
+            args = main.parse_args(argv)
+            stdout = io.StringIO()
+            with redirect_stdout(stdout):
+                main.report_results('TEST', result, outputs, show_decision=not args.no_decisions)
+            self.assertEqual('Final decision text' in stdout.getvalue(), printed)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Unit tests for the pipeline benchmark and its synthetic portfolios
+"""
+
+import sys
+import os
+import copy
+import unittest
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.stock_data import get_stock_data_batch
+from benchmarks.synthetic import SyntheticYFinance, generate_tickers, latency_teams
+from benchmarks.bench_pipeline import run_size, compare, parse_args, benchmark_config
+
+class TestSyntheticPortfolio(unittest.TestCase):
+    """Tests for the synthetic data used by benchmarks"""
+
+    def test_provider_serves_batch_fetch(self):
+        """Test that the fake provider yields complete stock data for every ticker"""
+        tickers = generate_tickers(20, seed=1)
+        self.assertEqual(len(set(tickers)), 20)
+        self.assertEqual(tickers, generate_tickers(20, seed=1))
+
+        results = get_stock_data_batch(tickers, provider=SyntheticYFinance(tickers, seed=1))
+        self.assertEqual(list(results), tickers)
+        for data in results.values():
+            self.assertNotIn('error', data)
+            self.assertGreater(data['current_price'], 0)
+            self.assertNotEqual(data['recent_trend'], 'Unknown')
+
+    def test_latency_agents(self):
+        """Test that latency agents answer with text naming the ticker"""
+        investors, analysts = latency_teams(0)
+        self.assertEqual(len(investors), 5)
+        self.assertTrue(analysts['ESG Analyst'].invoke({'ticker': 'AAA'})['text'].startswith('AAA: '))
+
+class TestPipelineBenchmark(unittest.TestCase):
+    """Tests for running and comparing benchmarks"""
+
+    def setUp(self):
+        """Run a small benchmark without latency"""
+        self.config = benchmark_config(parse_args(['--agent-latency', '0']))
+        self.report = {'config': self.config, 'results': {'5': run_size(5, self.config)}}
+
+    def test_reports_every_stage(self):
+        """Test that every stage of the pipeline is timed"""
+        result = self.report['results']['5']
+        self.assertEqual(result['tickers'], 5)
+        self.assertGreater(result['tickers_per_second'], 0)
+        stages = result['stages']
+        for stage in ('stock_data', 'phase.analyst', 'phase.investor', 'phase.synthesis', 'write_results'):
+            self.assertIn(stage, stages)
+        self.assertEqual(stages['agent_call.analyst']['count'], 25)
+
+    def test_compare_with_baseline(self):
+        """Test that slower throughput and stages are reported as regressions"""
+        self.assertEqual(compare(self.report, self.report), [])
+
+        baseline = copy.deepcopy(self.report)
+        result = baseline['results']['5']
+        result['tickers_per_second'] *= 2
+        result['stages']['phase.analyst']['p95_seconds'] = 0.001
+        self.report['results']['5']['stages']['phase.analyst']['p95_seconds'] = 0.5
+        regressions = compare(self.report, baseline)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith('5 tickers: throughput'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Unit tests for agent call deadlines, retries and hedging
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.agents.call_policy import CallPolicy, LatencyTracker, AgentTimeoutError, run_calls, arun_call
+
+def warm_tracker(seconds=0.01):
+    """Return a latency tracker with enough samples to hedge after ``seconds``"""
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.add(seconds)
+    return tracker
+
+class TestRunCalls(unittest.TestCase):
+    """Tests for running a phase of calls on a thread pool"""
+
+    def setUp(self):
+        """Set up a worker pool and a gate that releases hung calls"""
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        """Release hung calls and shut the pool down"""
+        self.release.set()
+        self.executor.shutdown(wait=True)
+
+    def test_deadline_bounds_hung_calls(self):
+        """Test that a hung call times out without holding up the others"""
+        def call(key):
+            if key == 'hung':
+                self.release.wait()
+            return key
+
+        start = time.monotonic()
+        outcomes = run_calls(lambda key: self.executor.submit(call, key), ['ok', 'hung'],
+                             CallPolicy(timeout=0.1), LatencyTracker())
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(outcomes['ok'], 'ok')
+        self.assertIsInstance(outcomes['hung'], AgentTimeoutError)
+        self.assertEqual(str(outcomes['hung']), 'timed out after 0.1s')
+
+    def test_retries_failed_calls(self):
+        """Test that failures are retried up to the limit and the last error is returned"""
+        attempts = {'flaky': 0, 'broken': 0}
+
+        def call(key):
+            attempts[key] += 1
+            if key == 'broken' or attempts[key] < 3:
+                raise ConnectionError(f'{key} attempt {attempts[key]}')
+            return 'recovered'
+
+        outcomes = run_calls(lambda key: self.executor.submit(call, key), ['flaky', 'broken'],
+                             CallPolicy(max_retries=2, base_backoff=0.01), LatencyTracker())
+
+        self.assertEqual(outcomes['flaky'], 'recovered')
+        self.assertEqual(str(outcomes['broken']), 'broken attempt 3')
+        self.assertEqual(attempts, {'flaky': 3, 'broken': 3})
+
+    def test_hedges_slow_calls(self):
+        """Test that a duplicate is sent once a call runs past the p95 latency and the first to finish wins"""
+        attempts = []
+
+        def call(key):
+            attempts.append(key)
+            if len(attempts) == 1:
+                self.release.wait()
+                return 'late'
+            return 'hedged'
+
+        start = time.monotonic()
+        outcomes = run_calls(lambda key: self.executor.submit(call, key), ['slow'],
+                             CallPolicy(hedge=True), warm_tracker())
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(outcomes['slow'], 'hedged')
+        self.assertEqual(len(attempts), 2)
+
+    def test_no_hedging_without_history(self):
+        """Test that calls are not hedged before enough latencies have been seen"""
+        self.assertIsNone(LatencyTracker().quantile(0.95))
+        self.assertEqual(warm_tracker(0.2).quantile(0.95), 0.2)
+
+class TestArunCall(unittest.TestCase):
+    """Tests for awaiting a call on the event loop"""
+
+    def test_deadline(self):
+        """Test that an awaited call is cancelled at its deadline"""
+        cancelled = []
+
+        async def hung():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with self.assertRaises(AgentTimeoutError):
+            asyncio.run(arun_call(hung, CallPolicy(timeout=0.05), LatencyTracker()))
+        self.assertEqual(cancelled, [True])
+
+    def test_retries_and_hedging(self):
+        """Test that awaited calls are retried and hedged like threaded ones"""
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError('reset')
+            if len(attempts) == 2:
+                await asyncio.sleep(10)
+            return 'done'
+
+        policy = CallPolicy(timeout=2, max_retries=1, hedge=True, base_backoff=0.01)
+        self.assertEqual(asyncio.run(arun_call(flaky, policy, warm_tracker())), 'done')
+        self.assertEqual(len(attempts), 3)
+
+if __name__ == '__main__':
+    unittest.main()
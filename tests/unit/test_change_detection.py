@@ -0,0 +1,107 @@
+"""
+Unit tests for the change detection module
+"""
+
+import sys
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.change_detection import ChangeThresholds, change_reason, detect_changes, take_snapshot
+from src.utils.run_manifest import RunManifest, input_hash
+
+def make_stock_data(price=100.0, trend='Upward', revenue_growth=0.1):
+    """Return stock data with the fields change detection compares"""
+    return {
+        'ticker': 'AAA',
+        'current_price': price,
+        'recent_trend': trend,
+        'revenue_growth': revenue_growth,
+        'profit_margin': 0.2,
+        'debt_to_equity': 50.0,
+        'current_ratio': 1.5,
+        'return_on_equity': 0.3,
+        'free_cash_flow': 1e9
+    }
+
+class TestChangeReason(unittest.TestCase):
+    """Tests for deciding whether a stock changed materially"""
+
+    def setUp(self):
+        """Set up a previous entry analyzed an hour ago"""
+        self.now = time.time()
+        self.previous = {'status': 'done', 'updated_at': self.now - 3600,
+                         'snapshot': take_snapshot(make_stock_data())}
+        self.thresholds = ChangeThresholds(price_change_pct=3.0, max_age_days=7)
+
+    def reason(self, stock_data):
+        return change_reason(self.previous, take_snapshot(stock_data), self.thresholds, self.now)
+
+    def test_unchanged_stock_keeps_its_results(self):
+        """Test that small price moves do not trigger a new debate"""
+        self.assertIsNone(self.reason(make_stock_data()))
+        self.assertIsNone(self.reason(make_stock_data(price=102.9)))
+
+    def test_price_move_beyond_threshold(self):
+        """Test that a price move larger than the threshold triggers a new debate"""
+        self.assertEqual(self.reason(make_stock_data(price=96.5)), 'price moved 3.5%')
+        self.thresholds.price_change_pct = 5.0
+        self.assertIsNone(self.reason(make_stock_data(price=96.5)))
+        self.assertEqual(self.reason(make_stock_data(price=None)), 'price unavailable')
+
+    def test_trend_and_statement_changes(self):
+        """Test that a new trend label or new statements trigger a new debate"""
+        self.assertEqual(self.reason(make_stock_data(trend='Downward')), 'trend changed from Upward to Downward')
+        self.assertEqual(self.reason(make_stock_data(revenue_growth=0.12)), 'new financial statements')
+
+    def test_old_results_and_errors(self):
+        """Test that stale results, missing snapshots and data errors trigger a new debate"""
+        self.previous['updated_at'] = self.now - 8 * 86400
+        self.assertEqual(self.reason(make_stock_data()), 'results are 8.0 days old')
+        self.thresholds.max_age_days = None
+        self.assertIsNone(self.reason(make_stock_data()))
+
+        self.assertEqual(self.reason({'ticker': 'AAA', 'error': 'timeout'}), 'stock data had errors')
+        del self.previous['snapshot']
+        self.assertEqual(self.reason(make_stock_data()), 'no previous results')
+
+class TestDetectChanges(unittest.TestCase):
+    """Tests for detecting changes against the run manifest"""
+
+    def setUp(self):
+        """Create a results directory with one finished stock"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.output = os.path.join(self.tmpdir, 'AAA_decision.md')
+        with open(self.output, 'w') as f:
+            f.write('# Decision')
+        stock_data = make_stock_data()
+        manifest = RunManifest(os.path.join(self.tmpdir, 'manifest.json'))
+        manifest.mark_done('AAA', input_hash(stock_data), [self.output], snapshot=take_snapshot(stock_data))
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.tmpdir)
+
+    def test_snapshot_survives_reload(self):
+        """Test that only stocks that changed since the stored snapshot are debated again"""
+        manifest = RunManifest(os.path.join(self.tmpdir, 'manifest.json'))
+        stock_data = {'AAA': make_stock_data(price=101.0), 'BBB': make_stock_data()}
+
+        changes = detect_changes(['AAA', 'BBB'], stock_data, manifest, ChangeThresholds())
+        self.assertEqual(changes, {'AAA': None, 'BBB': 'no previous results'})
+
+    def test_missing_outputs_are_not_reused(self):
+        """Test that a stock whose results were deleted is debated again"""
+        os.remove(self.output)
+        manifest = RunManifest(os.path.join(self.tmpdir, 'manifest.json'))
+
+        changes = detect_changes(['AAA'], {'AAA': make_stock_data()}, manifest, ChangeThresholds())
+        self.assertEqual(changes, {'AAA': 'no previous results'})
+
+if __name__ == '__main__':
+    unittest.main()
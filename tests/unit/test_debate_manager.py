@@ -4,13 +4,16 @@ Unit tests for debate manager module
 
 import sys
 import os
+import time
+import asyncio
+import threading
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 # Add the src directory to path
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
 
-from src.agents.debate_manager import DebateManager
+from src.agents.debate_manager import DebateManager, DEFAULT_MAX_WORKERS
 
 class TestDebateManager(unittest.TestCase):
     """Tests for the DebateManager class"""
@@ -107,5 +110,398 @@ class TestDebateManager(unittest.TestCase):
         self.assertEqual(self.debate_manager.get_investor_opinions.call_count, len(tickers))
         self.assertEqual(self.debate_manager.synthesize_decision.call_count, len(tickers))
 
+    def test_iter_debate_yields_in_completion_order(self):
+        """Test that pipelined debates are yielded as each ticker finishes"""
+        def slow_reports(ticker, stock_data):
+            time.sleep(0.2 if ticker == 'AAPL' else 0)
+            return {'Analyst1': f'Report on {ticker}'}
+
+        self.debate_manager.get_analyst_reports = MagicMock(side_effect=slow_reports)
+        self.debate_manager.get_investor_opinions = MagicMock(return_value={'Investor1': 'Opinion'})
+        self.debate_manager.synthesize_decision = MagicMock(return_value='Decision')
+
+        tickers = ['AAPL', 'MSFT', 'GOOG']
+        stock_data = {ticker: {} for ticker in tickers}
+        results = list(self.debate_manager.iter_debate(tickers, stock_data, max_in_flight=2))
+
+        self.assertEqual([ticker for ticker, _ in results], ['MSFT', 'GOOG', 'AAPL'])
+        for ticker, result in results:
+            self.assertEqual(result['analyst_reports'], {'Analyst1': f'Report on {ticker}'})
+            self.assertEqual(result['decision'], 'Decision')
+
+    def test_iter_debate_is_lazy(self):
+        """Test that sequential results are yielded before the next stock starts"""
+        self.debate_manager.get_analyst_reports = MagicMock(return_value={})
+        self.debate_manager.get_investor_opinions = MagicMock(return_value={})
+        self.debate_manager.synthesize_decision = MagicMock(return_value='Decision')
+
+        results = self.debate_manager.iter_debate(['AAPL', 'MSFT'], {})
+        ticker, _ = next(results)
+
+        self.assertEqual(ticker, 'AAPL')
+        self.assertEqual(self.debate_manager.get_analyst_reports.call_count, 1)
+        self.assertEqual([t for t, _ in results], ['MSFT'])
+
+    def test_iter_debate_bounds_tickers_in_flight(self):
+        """Test that no more than max_in_flight tickers are debated at once"""
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def tracked_reports(ticker, stock_data):
+            with lock:
+                active.append(ticker)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(ticker)
+            return {}
+
+        self.debate_manager.get_analyst_reports = MagicMock(side_effect=tracked_reports)
+        self.debate_manager.get_investor_opinions = MagicMock(return_value={})
+        self.debate_manager.synthesize_decision = MagicMock(return_value='Decision')
+
+        tickers = [f'T{i}' for i in range(6)]
+        results = self.debate_manager.run_debate(tickers, {}, max_in_flight=3)
+
+        self.assertEqual(set(results), set(tickers))
+        self.assertLessEqual(max(peak), 3)
+
+    def test_shared_executor_is_reused(self):
+        """Test that every phase and ticker runs on one long-lived worker pool"""
+        for name, agent in {**self.analyst_team, **self.investor_team}.items():
+            agent.invoke.return_value = {'text': f'Text from {name}'}
+
+        executor = self.debate_manager.executor
+        for ticker in ['AAPL', 'MSFT']:
+            self.debate_manager.get_analyst_reports(ticker, {})
+            self.debate_manager.get_investor_opinions(ticker, {}, {})
+
+        self.assertIs(self.debate_manager.executor, executor)
+        self.assertEqual(executor._max_workers, DEFAULT_MAX_WORKERS)
+
+    def test_close_and_context_manager(self):
+        """Test that the worker pool is shut down on close and on leaving a with block"""
+        with DebateManager(self.investor_team, self.analyst_team, max_workers=3) as manager:
+            executor = manager.executor
+            self.assertEqual(executor._max_workers, 3)
+
+        with self.assertRaises(RuntimeError):
+            executor.submit(lambda: None)
+        # A closed manager can still be used; it starts a fresh pool
+        self.assertIsNot(manager.executor, executor)
+        manager.close()
+
+    def test_worker_pool_caps_concurrent_calls(self):
+        """Test that concurrent agent calls never exceed the pool size"""
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def tracked_invoke(inputs):
+            with lock:
+                active.append(inputs['ticker'])
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(inputs['ticker'])
+            return {'text': 'Report'}
+
+        analyst_team = {f'Analyst{i}': MagicMock() for i in range(4)}
+        for agent in analyst_team.values():
+            agent.invoke.side_effect = tracked_invoke
+
+        manager = DebateManager(self.investor_team, analyst_team, max_workers=2)
+        manager.synthesize_decision = MagicMock(return_value='Decision')
+        manager.get_investor_opinions = MagicMock(return_value={})
+        manager.run_debate(['A', 'B', 'C'], {}, max_in_flight=3)
+        manager.close()
+
+        self.assertLessEqual(max(peak), 2)
+
+class TestAsyncDebate(unittest.TestCase):
+    """Tests for the asyncio debate path"""
+
+    def setUp(self):
+        """Set up teams of native async agents and blocking agents"""
+        self.analyst_team = {'Analyst1': MagicMock(), 'Analyst2': MagicMock()}
+        for name, agent in self.analyst_team.items():
+            agent.ainvoke = AsyncMock(return_value={'text': f'Report from {name}'})
+        self.investor_team = {'Investor1': MagicMock(), 'Investor2': MagicMock()}
+        for name, agent in self.investor_team.items():
+            agent.invoke.return_value = {'text': f'Opinion from {name}'}
+        self.debate_manager = DebateManager(self.investor_team, self.analyst_team)
+
+    def tearDown(self):
+        """Shut down the worker pool"""
+        self.debate_manager.close()
+
+    def test_arun_debate(self):
+        """Test that async agents are awaited and blocking agents run on the pool"""
+        tickers = ['AAPL', 'MSFT', 'AAPL']
+        results = asyncio.run(self.debate_manager.arun_debate(tickers, {'AAPL': {}, 'MSFT': {}}))
+
+        self.assertEqual(list(results), ['AAPL', 'MSFT'])
+        for result in results.values():
+            self.assertEqual(result['analyst_reports']['Analyst1'], 'Report from Analyst1')
+            self.assertEqual(result['investor_opinions']['Investor2'], 'Opinion from Investor2')
+            self.assertIn('decision', result)
+        for agent in self.analyst_team.values():
+            self.assertEqual(agent.ainvoke.await_count, 2)
+            agent.invoke.assert_not_called()
+        for agent in self.investor_team.values():
+            self.assertEqual(agent.invoke.call_count, 2)
+
+    def test_agent_errors_are_reported(self):
+        """Test that a failing agent yields an error text instead of failing the debate"""
+        self.analyst_team['Analyst1'].ainvoke = AsyncMock(side_effect=Exception('boom'))
+        reports = asyncio.run(self.debate_manager.aget_analyst_reports('AAPL', {}))
+
+        self.assertIn('boom', reports['Analyst1'])
+        self.assertEqual(reports['Analyst2'], 'Report from Analyst2')
+
+    def test_max_concurrency(self):
+        """Test that the semaphore caps agent calls awaited at once"""
+        active = []
+        peak = []
+
+        async def tracked(inputs):
+            active.append(inputs['ticker'])
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(inputs['ticker'])
+            return {'text': 'Report'}
+
+        for agent in self.analyst_team.values():
+            agent.ainvoke = tracked
+        self.debate_manager.investor_team = {}
+        tickers = [f'T{i}' for i in range(20)]
+        results = asyncio.run(self.debate_manager.arun_debate(tickers, {}, max_concurrency=3))
+
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_matches_sync_path_with_local_agents(self):
+        """Test that the async path produces the same output as run_debate"""
+        from src.agents.investor_agents import create_investor_team
+        from src.agents.analyst_agents import create_analyst_team
+
+        stock_data = {'TEST': {'company_name': 'Test Co', 'pe_ratio': 18.0, 'revenue_growth': 12.0}}
+        with DebateManager(create_investor_team(), create_analyst_team()) as manager:
+            expected = manager.run_debate(['TEST'], stock_data)
+            actual = asyncio.run(manager.arun_debate(['TEST'], stock_data))
+
+        self.assertEqual(actual, expected)
+
+    def test_reports_like_the_sync_path(self):
+        """Test that the async path emits the same progress events and metrics as the sync path"""
+        from src.agents.call_policy import CallPolicy
+        from src.utils.metrics import Metrics
+
+        def run(debate):
+            flaky = MagicMock()
+            flaky.invoke.side_effect = [Exception('busy'), {'text': 'Report'}]
+            failing = MagicMock()
+            failing.invoke.side_effect = Exception('boom')
+            investor = MagicMock()
+            investor.invoke.return_value = {'text': 'Opinion'}
+            progress = MagicMock()
+            metrics = Metrics()
+            with DebateManager({'Investor1': investor}, {'Flaky': flaky, 'Failing': failing}, metrics=metrics,
+                               progress=progress, call_policy=CallPolicy(max_retries=1, base_backoff=0)) as manager:
+                result = debate(manager)
+            emitted = sorted(call.args[:4] for call in progress.emit.call_args_list if call.args[0] != 'run_start')
+            snapshot = metrics.snapshot()
+            spans = sorted((span['name'], sorted(span['labels'].items()), span['count']) for span in snapshot['spans'])
+            counters = sorted((counter['name'], sorted(counter['labels'].items()), counter['value'])
+                              for counter in snapshot['counters'])
+            return result, emitted, spans, counters
+
+        sync = run(lambda manager: manager.debate_ticker('AAPL', {}))
+        async_ = run(lambda manager: asyncio.run(manager.arun_debate(['AAPL'], {}))['AAPL'])
+
+        self.assertEqual(async_, sync)
+        result, emitted, spans, _ = sync
+        self.assertEqual(result['analyst_reports']['Failing'], 'Unable to generate report due to: boom')
+        self.assertIn(('phase_start', 'AAPL', 'analyst'), emitted)
+        self.assertIn(('phase_done', 'AAPL', 'investor'), emitted)
+        self.assertEqual([kind for kind, *labels in emitted if labels[1:] == ['analyst', 'Flaky']],
+                         ['agent_done', 'agent_start', 'agent_start'])
+        # Each attempt is timed on its own, including the retry of the flaky agent
+        self.assertIn(('agent_call', [('agent', 'Flaky'), ('role', 'analyst')], 2), spans)
+
+class TestLocalPortfolio(unittest.TestCase):
+    """Tests for rendering a portfolio of local agents in one pass"""
+
+    def setUp(self):
+        """Set up the local teams and stock data for a few tickers"""
+        from src.agents.investor_agents import create_investor_team
+        from src.agents.analyst_agents import create_analyst_team
+
+        self.investor_team = create_investor_team()
+        self.analyst_team = create_analyst_team()
+        self.tickers = ['MSFT', 'TEST', 'EMPTY']
+        self.stock_data = {
+            'TEST': {'company_name': 'Test Co', 'pe_ratio': 18.0, 'revenue_growth': 12.0,
+                     '52w_high': 120.0, '52w_low': 80.0, 'current_price': 100.0},
+            'EMPTY': {}
+        }
+
+    def test_detects_local_teams(self):
+        """Test that only teams made entirely of local agents use the portfolio renderer"""
+        manager = DebateManager(self.investor_team, self.analyst_team)
+        self.assertTrue(manager.uses_local_agents())
+
+        manager.analyst_team = {**self.analyst_team, 'Extra Analyst': MagicMock()}
+        self.assertFalse(manager.uses_local_agents())
+
+        # An agent registered under another name must still be invoked individually
+        manager.analyst_team = {'Renamed Analyst': self.analyst_team['ESG Analyst']}
+        self.assertFalse(manager.uses_local_agents())
+
+    def test_matches_agent_invocation(self):
+        """Test that the one-pass rendering matches debating each stock agent by agent"""
+        with DebateManager(self.investor_team, self.analyst_team) as manager:
+            expected = {ticker: manager.debate_ticker(ticker, self.stock_data.get(ticker, {}))
+                        for ticker in self.tickers}
+            with patch.object(manager, 'debate_ticker') as debate_ticker:
+                actual = list(manager.iter_debate(self.tickers, self.stock_data))
+            debate_ticker.assert_not_called()
+
+        self.assertEqual([ticker for ticker, _ in actual], self.tickers)
+        self.assertEqual(dict(actual), expected)
+        # Failures are reported the same way as failed agent calls
+        self.assertTrue(expected['EMPTY']['analyst_reports']['Technical Analyst']
+                        .startswith('Unable to generate report due to:'))
+
+    def test_reports_agent_progress_and_metrics(self):
+        """Test that rendered documents are reported and timed like agent calls"""
+        from src.utils.metrics import Metrics
+
+        progress = MagicMock()
+        metrics = Metrics()
+        with DebateManager(self.investor_team, self.analyst_team, metrics=metrics, progress=progress) as manager:
+            results = dict(manager.iter_debate(self.tickers, self.stock_data))
+
+        kinds = [call.args[0] for call in progress.emit.call_args_list]
+        agents = len(self.analyst_team) + len(self.investor_team)
+        self.assertEqual(kinds.count('agent_start'), agents * len(self.tickers))
+        self.assertEqual(kinds.count('agent_done') + kinds.count('agent_failed'), agents * len(self.tickers))
+        self.assertEqual(kinds.count('ticker_done'), len(self.tickers))
+        self.assertEqual(set(manager.ticker_seconds), set(self.tickers))
+        self.assertNotIn('timings_ns', results['TEST'])
+
+        spans = {(span['name'], tuple(sorted(span['labels'].items()))): span['count']
+                 for span in metrics.snapshot()['spans']}
+        self.assertEqual(spans[('ticker', (('ticker', 'TEST'),))], 1)
+        self.assertEqual(spans[('phase', (('phase', 'investor'),))], len(self.tickers))
+        self.assertEqual(spans[('agent_call', (('agent', 'ESG Analyst'), ('role', 'analyst')))], len(self.tickers))
+
+    def test_worker_processes_match_in_process(self):
+        """Test that rendering across worker processes gives the same results as in process"""
+        from src.local_claude_responses import render_portfolio
+
+        analysts, investors = list(self.analyst_team), list(self.investor_team)
+        in_process = render_portfolio(self.tickers, self.stock_data, analysts, investors)
+        in_workers = render_portfolio(self.tickers, self.stock_data, analysts, investors,
+                                      max_workers=2, chunk_size=1)
+
+        self.assertEqual(list(in_workers), self.tickers)
+        self.assertEqual(repr(in_workers), repr(in_process))
+
+class PidAgent:
+    """Agent that reports the process it was invoked in"""
+
+    def invoke(self, inputs):
+        return {'text': f"{inputs['ticker']}:{os.getpid()}"}
+
+class TestProcessExecutor(unittest.TestCase):
+    """Tests for invoking agents in worker processes"""
+
+    def setUp(self):
+        """Set up stock data with NumPy values, as built from yfinance frames"""
+        import numpy as np
+
+        self.stock_data = {
+            'company_name': 'Test Co', 'current_price': np.float64(101.25), 'pe_ratio': np.float64(18.5),
+            'market_cap': np.int64(250_000_000_000), '52w_high': np.float64(120.0), '52w_low': np.float64(80.0),
+            'revenue_growth': np.float64(12.0), 'recent_trend': 'Uptrend'
+        }
+
+    def test_rejects_unknown_executor(self):
+        """Test that an unknown executor type is rejected"""
+        with self.assertRaises(ValueError):
+            DebateManager({}, {}, executor='fiber')
+
+    def test_agents_run_in_worker_processes(self):
+        """Test that agent calls are sent to a bounded number of worker processes"""
+        team = {f'Analyst{i}': PidAgent() for i in range(8)}
+        with DebateManager({}, team, max_workers=2, executor='process') as manager:
+            reports = manager.get_analyst_reports('AAPL', self.stock_data)
+
+        pids = {report.split(':')[1] for report in reports.values()}
+        self.assertEqual(len(reports), 8)
+        self.assertNotIn(str(os.getpid()), pids)
+        self.assertLessEqual(len(pids), 2)
+
+    def test_matches_thread_executor(self):
+        """Test that local agents give the same responses in worker processes as in threads"""
+        from src.agents.investor_agents import create_investor_team
+        from src.agents.analyst_agents import create_analyst_team
+
+        investor_team, analyst_team = create_investor_team(), create_analyst_team()
+        with DebateManager(investor_team, analyst_team) as manager:
+            expected = manager.debate_ticker('TEST', self.stock_data)
+        with DebateManager(investor_team, analyst_team, max_workers=2, executor='process') as manager:
+            actual = manager.debate_ticker('TEST', self.stock_data)
+            async_reports = asyncio.run(manager.aget_analyst_reports('TEST', self.stock_data))
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(async_reports, expected['analyst_reports'])
+
+    def test_payloads_are_plain_values(self):
+        """Test that NumPy and pandas values are reduced to plain Python values before pickling"""
+        import pickle
+        import pandas as pd
+        from src.agents.process_pool import compact_payload
+
+        inputs = {'ticker': 'TEST', 'stock_data': self.stock_data,
+                  'history': pd.Series([1.0, 2.0], index=['a', 'b'])}
+        payload = compact_payload(inputs)
+
+        self.assertEqual(payload['stock_data']['market_cap'], 250_000_000_000)
+        self.assertIs(type(payload['stock_data']['current_price']), float)
+        self.assertEqual(payload['history'], {'a': 1.0, 'b': 2.0})
+        self.assertLess(len(pickle.dumps(payload)), len(pickle.dumps(inputs)))
+
+class TestCallPolicy(unittest.TestCase):
+    """Tests for agent deadlines in the debate"""
+
+    def test_timeouts_are_recorded(self):
+        """Test that a hung agent is reported as timed out without stalling the ticker"""
+        from src.agents.call_policy import CallPolicy
+
+        release = threading.Event()
+        hung = MagicMock()
+        hung.invoke.side_effect = lambda inputs: release.wait() and {'text': 'late'}
+        fast = MagicMock()
+        fast.invoke.return_value = {'text': 'Report'}
+        manager = DebateManager({'Investor1': fast}, {'Hung': hung, 'Fast': fast},
+                                call_policy=CallPolicy(timeout=0.1))
+        try:
+            start = time.monotonic()
+            result = manager.debate_ticker('AAPL', {})
+            async_result = asyncio.run(manager.arun_debate(['MSFT'], {}))['MSFT']
+        finally:
+            release.set()
+            manager.close()
+
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual(result['analyst_reports']['Fast'], 'Report')
+        self.assertEqual(result['analyst_reports']['Hung'], 'Unable to generate report due to: timed out after 0.1s')
+        self.assertEqual(result['timeouts'], [{'role': 'analyst', 'agent': 'Hung', 'seconds': 0.1}])
+        self.assertEqual(async_result['timeouts'], result['timeouts'])
+        self.assertEqual(manager._timeouts, {})
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Unit tests for the incremental price history store
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.history_store import PriceHistoryStore, period_start
+
+def make_history(start, periods, base=100.0, tz='America/New_York'):
+    """Build a daily OHLCV frame like yfinance returns"""
+    dates = pd.date_range(start=start, periods=periods, freq='D', tz=tz)
+    closes = [base + i for i in range(periods)]
+    return pd.DataFrame({
+        'Open': closes,
+        'High': [c + 1 for c in closes],
+        'Low': [c - 1 for c in closes],
+        'Close': closes,
+        'Volume': [1000000] * periods
+    }, index=dates)
+
+class FakeHistorySource:
+    """Serves slices of a full series and records what was requested"""
+
+    def __init__(self, full):
+        self.full = full
+        self.requests = []
+
+    def fetch(self, start):
+        self.requests.append(start)
+        if start is None:
+            return self.full
+        return self.full[self.full.index >= start]
+
+class TestPriceHistoryStore(unittest.TestCase):
+    """Tests for the PriceHistoryStore class"""
+
+    def setUp(self):
+        """Create a store in a temporary directory"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'price_history.sqlite')
+        start = pd.Timestamp.now().normalize() - pd.Timedelta(days=59)
+        self.full = make_history(start, 60)
+        self.source = FakeHistorySource(self.full.iloc[:50])
+
+    def tearDown(self):
+        """Remove the temporary store"""
+        shutil.rmtree(self.tmpdir)
+
+    def test_period_start(self):
+        """Test conversion of yfinance period strings"""
+        now = pd.Timestamp('2024-06-15 13:45')
+        self.assertEqual(period_start('1y', now), pd.Timestamp('2023-06-15'))
+        self.assertEqual(period_start('ytd', now), pd.Timestamp('2024-01-01'))
+        self.assertIsNone(period_start('max', now))
+        with self.assertRaises(ValueError):
+            period_start('7y', now)
+
+    def test_first_run_downloads_full_period(self):
+        """Test that an empty store downloads and round-trips the full series"""
+        store = PriceHistoryStore(self.path)
+        hist = store.get_history('AAA', '1y', self.source.fetch)
+        store.close()
+
+        self.assertEqual(self.source.requests, [None])
+        self.assertEqual(list(hist.index), list(self.source.full.index))
+        self.assertEqual(hist.values.tolist(), self.source.full.astype(float).values.tolist())
+
+    def test_fresh_series_is_not_downloaded(self):
+        """Test that a recently checked series is served from disk"""
+        store = PriceHistoryStore(self.path)
+        store.get_history('AAA', '1y', self.source.fetch)
+        store.get_history('AAA', '1y', self.source.fetch)
+        store.close()
+
+        self.assertEqual(self.source.requests, [None])
+
+    def test_incremental_append(self):
+        """Test that later runs only download bars after the stored ones"""
+        store = PriceHistoryStore(self.path)
+        store.get_history('AAA', '1y', self.source.fetch)
+        store.close()
+
+        self.source.full = self.full
+        store = PriceHistoryStore(self.path, refresh=True)
+        hist = store.get_history('AAA', '1y', self.source.fetch)
+        store.close()
+
+        # Re-download starts at the second-to-last stored bar
+        self.assertEqual(self.source.requests, [None, self.full.index[48]])
+        self.assertEqual(len(hist), 60)
+        self.assertEqual(hist['Close'].iloc[-1], self.full['Close'].iloc[-1])
+
+    def test_readjusted_series_is_downloaded_again(self):
+        """Test that a dividend or split adjustment triggers a full download"""
+        store = PriceHistoryStore(self.path)
+        store.get_history('AAA', '1y', self.source.fetch)
+
+        adjusted = self.full.copy()
+        adjusted[['Open', 'High', 'Low', 'Close']] *= 0.5
+        self.source.full = adjusted
+        store.refresh = True
+        hist = store.get_history('AAA', '1y', self.source.fetch)
+        store.close()
+
+        self.assertEqual(self.source.requests, [None, self.full.index[48], None])
+        self.assertEqual(hist['Close'].iloc[0], adjusted['Close'].iloc[0])
+
+    def test_load_trims_to_period(self):
+        """Test that loading a shorter period only returns bars within it"""
+        store = PriceHistoryStore(self.path)
+        store.get_history('AAA', '1y', self.source.fetch)
+        recent = store.load('AAA', '1mo')
+        store.close()
+
+        self.assertLess(len(recent), 50)
+        self.assertGreaterEqual(recent.index[0].tz_localize(None), period_start('1mo'))
+
+if __name__ == '__main__':
+    unittest.main()
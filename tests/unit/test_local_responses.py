@@ -0,0 +1,124 @@
+"""
+Unit tests for the canned response library
+"""
+
+import sys
+import os
+import subprocess
+import unittest
+
+# Add the src directory to path
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src')
+sys.path.append(SRC_DIR)
+
+import src.local_claude_responses as responses  # noqa: E402
+from src.local_claude_responses import (  # noqa: E402
+    build_features,
+    render_reports,
+    get_generic_analyst_report,
+    get_generic_investor_opinion,
+    get_canned_analyst_report,
+    get_canned_investor_opinion,
+    get_canned_synthesis,
+    get_generic_synthesis,
+    has_canned_responses
+)
+
+class TestCannedResponses(unittest.TestCase):
+    """Tests for loading pre-generated documents by ticker and agent"""
+
+    def test_loads_documents_by_ticker_and_agent(self):
+        """Test that canned documents are found for a ticker in the library"""
+        self.assertTrue(has_canned_responses('MSFT'))
+        self.assertIn('Fundamental Analysis: Microsoft', get_canned_analyst_report('MSFT', 'Fundamental Analyst'))
+        self.assertIn('Microsoft', get_canned_investor_opinion('MSFT', 'Warren Buffett'))
+        self.assertIn('MSFT', get_canned_synthesis('MSFT'))
+
+    def test_missing_documents(self):
+        """Test that unknown tickers, agents and unsafe names return None"""
+        self.assertIsNone(get_canned_analyst_report('AAPL', 'Fundamental Analyst'))
+        self.assertIsNone(get_canned_investor_opinion('MSFT', 'Unknown Investor'))
+        self.assertIsNone(get_canned_synthesis('../MSFT'))
+        self.assertFalse(has_canned_responses('AAPL'))
+
+    def test_legacy_constants(self):
+        """Test that the original module-level constants are still available"""
+        self.assertEqual(set(responses.ANALYST_REPORTS), {
+            'Fundamental Analyst', 'Technical Analyst', 'Industry Analyst', 'Quantitative Analyst', 'ESG Analyst'
+        })
+        self.assertEqual(responses.INVESTOR_OPINIONS['Ray Dalio'], get_canned_investor_opinion('MSFT', 'Ray Dalio'))
+        self.assertEqual(responses.SYNTHESIS_DECISION, get_canned_synthesis('MSFT'))
+        with self.assertRaises(AttributeError):
+            responses.UNKNOWN_CONSTANT
+
+    def test_import_does_not_load_documents(self):
+        """Test that importing the generators reads no canned documents"""
+        code = (
+            "import local_claude_responses as r\n"
+            "from local_claude_responses import get_generic_analyst_report\n"
+            "from local_claude_responses.library import _load_index, _read_document\n"
+            "assert 'ANALYST_REPORTS' not in vars(r)\n"
+            "assert _load_index.cache_info().currsize == 0\n"
+            "assert _read_document.cache_info().currsize == 0\n"
+        )
+        subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR, check=True)
+
+    def test_generic_synthesis(self):
+        """Test that tickers without canned documents get a generic synthesis"""
+        self.assertIn('Investment Synthesis: AAPL', get_generic_synthesis('AAPL', {}))
+
+class TestReportRendering(unittest.TestCase):
+    """Tests for rendering generic reports from a shared feature record"""
+
+    def setUp(self):
+        """Set up stock data for a ticker without canned documents"""
+        self.stock_data = {
+            'company_name': 'Acme Corp', 'sector': 'Technology', 'industry': 'Software',
+            'current_price': 100.0, 'pe_ratio': 28.0, 'forward_pe': 24.0, 'market_cap': 2.5e11,
+            'dividend_yield': 0.01, 'beta': 1.2, 'eps': 3.5, 'revenue_growth': 12.0,
+            'profit_margin': 22.0, 'return_on_equity': 30.0, 'debt_to_equity': 0.4,
+            '52w_high': 120.0, '52w_low': 80.0, '52w_change': 15.0, 'recent_trend': 'Sideways'
+        }
+
+    def test_batch_matches_single_reports(self):
+        """Test that rendering all agents at once matches rendering each agent"""
+        reports, opinions = render_reports('ACME', self.stock_data)
+
+        self.assertEqual(len(reports), 5)
+        self.assertEqual(len(opinions), 5)
+        for name, text in reports.items():
+            self.assertEqual(text, get_generic_analyst_report(name, 'ACME', self.stock_data))
+        for name, text in opinions.items():
+            self.assertEqual(text, get_generic_investor_opinion(name, 'ACME', self.stock_data))
+
+    def test_shared_figures_are_formatted_once(self):
+        """Test that the feature record carries the formatted figures the templates print"""
+        features = build_features('ACME', self.stock_data)
+
+        self.assertEqual(features.cap_str, '$250.0B')
+        self.assertEqual(features.revenue_growth_fmt, '+12.0')
+        self.assertIn('**P/E Ratio**: 28.0x (Forward: 24.0x)',
+                      get_generic_analyst_report('Fundamental Analyst', 'ACME', self.stock_data))
+
+    def test_bad_figures_only_fail_templates_that_print_them(self):
+        """Test that an unformattable value does not break unrelated templates"""
+        stock_data = {**self.stock_data, 'forward_pe': None}
+
+        with self.assertRaises(TypeError):
+            get_generic_analyst_report('Fundamental Analyst', 'ACME', stock_data)
+        self.assertIn('ESG Analysis', get_generic_analyst_report('ESG Analyst', 'ACME', stock_data))
+
+    def test_synthesis_sees_failures_as_text(self):
+        """Test that opinions that failed to render reach the synthesis as failure texts, as from agents"""
+        from unittest.mock import patch
+        from src.local_claude_responses import portfolio
+
+        with patch.object(portfolio, 'get_generic_synthesis', return_value='Synthesis') as synthesis:
+            result = portfolio.render_ticker('ACME', {'dividend_yield': None}, [], ['Warren Buffett'])
+
+        self.assertIsInstance(result['investor_opinions']['Warren Buffett'], Exception)
+        opinions = synthesis.call_args[0][1]
+        self.assertTrue(opinions['Warren Buffett'].startswith('Unable to generate opinion due to:'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Unit tests for the metrics collector
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.metrics import Metrics, NULL_METRICS
+from src.agents.debate_manager import DebateManager
+from src.agents.call_policy import CallPolicy
+from src.agents.response_cache import ResponseCache
+
+class TestMetrics(unittest.TestCase):
+    """Tests for collecting and exporting spans and counters"""
+
+    def setUp(self):
+        """Set up a temporary directory for exported files"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_span_summaries(self):
+        """Test that spans are summarized per name and label set"""
+        metrics = Metrics()
+        for duration in range(1, 101):
+            metrics.observe('agent_call', duration * 1_000_000, role='analyst', agent='A')
+        with metrics.span('agent_call', role='investor', agent='B'):
+            pass
+
+        spans = metrics.snapshot()['spans']
+        self.assertEqual([span['labels']['role'] for span in spans], ['analyst', 'investor'])
+        summary = spans[0]
+        self.assertEqual(summary['count'], 100)
+        self.assertAlmostEqual(summary['sum_seconds'], 5.05)
+        self.assertAlmostEqual(summary['min_seconds'], 0.001)
+        self.assertAlmostEqual(summary['max_seconds'], 0.1)
+        self.assertAlmostEqual(summary['p50_seconds'], 0.051)
+        self.assertAlmostEqual(summary['p95_seconds'], 0.096)
+        self.assertEqual(spans[1]['count'], 1)
+
+    def test_counters(self):
+        """Test that counters add up per label set"""
+        metrics = Metrics()
+        metrics.increment('agent_retries', role='analyst')
+        metrics.increment('agent_retries', 2, role='analyst')
+        metrics.increment('agent_retries', role='investor')
+
+        self.assertEqual(metrics.snapshot()['counters'], [
+            {'name': 'agent_retries', 'labels': {'role': 'analyst'}, 'value': 3},
+            {'name': 'agent_retries', 'labels': {'role': 'investor'}, 'value': 1}
+        ])
+
+    def test_exports(self):
+        """Test the JSON lines and Prometheus text exports"""
+        events_path = os.path.join(self.temp_dir, 'events.jsonl')
+        prometheus_path = os.path.join(self.temp_dir, 'metrics.prom')
+        metrics = Metrics(events_path=events_path)
+        metrics.observe('phase', 2_000_000_000, phase='analyst')
+        metrics.increment('response_cache_hits', role='say "hi"')
+        umask = os.umask(0o022)
+        try:
+            metrics.write_prometheus(prometheus_path)
+        finally:
+            os.umask(umask)
+        metrics.close()
+
+        with open(events_path) as f:
+            events = [json.loads(line) for line in f]
+        self.assertEqual([event['type'] for event in events], ['span', 'counter'])
+        self.assertEqual(events[0]['duration_ns'], 2_000_000_000)
+
+        with open(prometheus_path) as f:
+            text = f.read()
+        self.assertIn('# TYPE finagents_phase_seconds summary', text)
+        self.assertIn('finagents_phase_seconds{phase="analyst",quantile="0.95"} 2.000000000', text)
+        self.assertIn('finagents_phase_seconds_count{phase="analyst"} 1', text)
+        self.assertIn('finagents_response_cache_hits_total{role="say \\"hi\\""} 1', text)
+        # Readable by a textfile collector running as another user
+        self.assertEqual(os.stat(prometheus_path).st_mode & 0o777, 0o644)
+
+    def test_null_metrics(self):
+        """Test that the disabled collector records nothing"""
+        with NULL_METRICS.span('ticker', ticker='AAPL'):
+            NULL_METRICS.increment('agent_failures')
+        self.assertEqual(NULL_METRICS.snapshot(), {'spans': [], 'counters': []})
+
+class TestDebateMetrics(unittest.TestCase):
+    """Tests for the spans and counters recorded by the debate manager"""
+
+    def test_records_tickers_phases_and_agents(self):
+        """Test that a debate records every level of timing, cache hits and retries"""
+        flaky = MagicMock()
+        flaky.invoke.side_effect = [ConnectionError('reset'), {'text': 'Report'}]
+        investor = MagicMock()
+        investor.invoke.return_value = {'text': 'Opinion'}
+        metrics = Metrics()
+        with DebateManager({'Investor': investor}, {'Analyst': flaky}, metrics=metrics,
+                           response_cache=ResponseCache(),
+                           call_policy=CallPolicy(max_retries=1, base_backoff=0.001)) as manager:
+            manager.debate_ticker('AAPL', {})
+            manager.debate_ticker('AAPL', {})
+            snapshot = manager.metrics()
+
+        spans = {(span['name'], tuple(sorted(span['labels'].items()))): span['count'] for span in snapshot['spans']}
+        self.assertEqual(spans[('ticker', (('ticker', 'AAPL'),))], 2)
+        self.assertEqual(spans[('phase', (('phase', 'analyst'),))], 2)
+        self.assertEqual(spans[('phase', (('phase', 'synthesis'),))], 2)
+        # The retry is a second attempt of the first debate's analyst call
+        self.assertEqual(spans[('agent_queue_wait', (('agent', 'Analyst'), ('role', 'analyst')))], 3)
+        counters = {(counter['name'], counter['labels'].get('role')): counter['value'] for counter in snapshot['counters']}
+        self.assertEqual(counters[('agent_retries', 'analyst')], 1)
+        self.assertEqual(counters[('response_cache_misses', 'analyst')], 2)
+        self.assertEqual(counters[('response_cache_hits', 'analyst')], 1)
+        self.assertEqual(counters[('response_cache_hits', 'investor')], 1)
+
+if __name__ == '__main__':
+    unittest.main()
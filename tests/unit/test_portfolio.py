@@ -0,0 +1,83 @@
+"""
+Unit tests for loading portfolio exports
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import importlib.util
+import unittest
+from unittest.mock import patch
+import pandas as pd
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.portfolio import load_portfolio, filter_tickers
+
+PORTFOLIO_CSV = """TICKER,NAME,BS,PRICE
+AAPL,Apple,B,190.5
+SPY,S&P 500 ETF,I,510.2
+BTC-USD,Bitcoin,B,64000
+ ,Blank,B,1
+,Missing,B,1
+MSFT ,Microsoft,,410.1
+AAPL,Apple,S,191.0
+NVDA,Nvidia,S,900.0
+"""
+
+class TestLoadPortfolio(unittest.TestCase):
+    """Tests for reading and filtering the tickers of a portfolio export"""
+
+    def setUp(self):
+        """Write a small portfolio export"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, 'portfolio.csv')
+        with open(self.csv_path, 'w') as f:
+            f.write(PORTFOLIO_CSV)
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_filters_and_dedupes(self):
+        """Test that ETFs, crypto and blanks are dropped and each ticker is kept once in order"""
+        self.assertEqual(load_portfolio(self.csv_path), ['AAPL', 'MSFT', 'NVDA'])
+
+    def test_chunked_matches_whole_file(self):
+        """Test that streaming the export in chunks gives the same tickers"""
+        self.assertEqual(load_portfolio(self.csv_path, chunksize=2), ['AAPL', 'MSFT', 'NVDA'])
+
+    def test_without_type_column(self):
+        """Test that an export without the instrument type column keeps every stock ticker"""
+        frame = pd.DataFrame({'TICKER': ['AAPL', 'SPY', 'ETH-USD', None]})
+        self.assertEqual(filter_tickers(frame), ['AAPL', 'SPY'])
+
+    def test_missing_ticker_column(self):
+        """Test that an export without a ticker column is rejected"""
+        path = os.path.join(self.temp_dir, 'other.csv')
+        with open(path, 'w') as f:
+            f.write('SYMBOL,BS\nAAPL,B\n')
+        with self.assertRaises(ValueError):
+            load_portfolio(path)
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_parquet(self):
+        """Test that a Parquet export is read like the CSV one"""
+        path = os.path.join(self.temp_dir, 'portfolio.parquet')
+        pd.read_csv(self.csv_path, dtype=str).to_parquet(path)
+        self.assertEqual(load_portfolio(path), ['AAPL', 'MSFT', 'NVDA'])
+        self.assertEqual(load_portfolio(path, chunksize=2), ['AAPL', 'MSFT', 'NVDA'])
+
+    def test_parquet_without_pyarrow(self):
+        """Test that a Parquet export without pyarrow installed fails with a clear error"""
+        path = os.path.join(self.temp_dir, 'portfolio.parquet')
+        with open(path, 'wb') as f:
+            f.write(b'PAR1')
+        with patch.dict(sys.modules, {'pyarrow': None, 'pyarrow.parquet': None}):
+            with self.assertRaisesRegex(ImportError, 'requires pyarrow'):
+                load_portfolio(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for progress reporting
+"""
+
+import sys
+import os
+import io
+import json
+import threading
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import MagicMock
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils import progress as events
+from src.utils.progress import create_progress, NULL_PROGRESS
+from src.agents.debate_manager import DebateManager
+
+class TestProgressReporter(unittest.TestCase):
+    """Tests for the queued reporter and its sinks"""
+
+    def test_verbose_sink(self):
+        """Test that the verbose sink prints the original line per phase and agent"""
+        stream = io.StringIO()
+        progress = create_progress('verbose', stream)
+        progress.emit(events.PHASE_START, 'AAPL', 'analyst')
+        progress.emit(events.AGENT_START, 'AAPL', 'analyst', 'Analyst')
+        progress.emit(events.AGENT_DONE, 'AAPL', 'analyst', 'Analyst', 1.5)
+        progress.emit(events.AGENT_FAILED, 'AAPL', 'investor', 'Investor', 'reset')
+        progress.close()
+
+        lines = stream.getvalue().splitlines()
+        self.assertIn('Gathering analyst reports for AAPL...', lines)
+        self.assertIn("  ✓ Completed Analyst's analysis (1.50s)", lines)
+        self.assertIn("  ✗ Failed to get Investor's investment analysis: reset", lines)
+
+    def test_bar_sink(self):
+        """Test that the bar counts tickers and agent calls on one line"""
+        stream = io.StringIO()
+        progress = create_progress('bar', stream)
+        progress.emit(events.RUN_START, value=2)
+        progress.emit(events.AGENT_DONE, 'AAPL', 'analyst', 'Analyst', 0.1)
+        progress.emit(events.AGENT_FAILED, 'AAPL', 'investor', 'Investor', 'reset')
+        progress.emit(events.TICKER_DONE, 'AAPL')
+        progress.close()
+
+        output = stream.getvalue()
+        self.assertTrue(output.endswith('\n'))
+        self.assertEqual(output.count('\n'), 1)
+        self.assertIn('1/2 stocks, 1 agent calls, 1 failed', output.split('\r')[-1])
+
+    def test_event_sink(self):
+        """Test that events are written as JSON lines without empty fields"""
+        stream = io.StringIO()
+        progress = create_progress('events', stream)
+        progress.emit(events.AGENT_DONE, 'AAPL', 'analyst', 'Analyst', 0.25)
+        progress.emit(events.TICKER_DONE, 'AAPL')
+        progress.flush()
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(records[0]['agent'], 'Analyst')
+        self.assertEqual(records[0]['value'], 0.25)
+        self.assertEqual(set(records[1]), {'event', 'time', 'ticker'})
+        progress.close()
+
+    def test_failing_sink_does_not_stop_reporting(self):
+        """Test that an error in a sink is logged and later events still render"""
+        sink = MagicMock()
+        sink.handle.side_effect = [ValueError('bad'), None]
+        progress = events.ProgressReporter(sink)
+        progress.emit(events.AGENT_START)
+        progress.emit(events.AGENT_DONE)
+        progress.close()
+
+        self.assertEqual(sink.handle.call_count, 2)
+        sink.close.assert_called_once()
+
+    def test_unknown_sink(self):
+        """Test that an unknown sink name is rejected"""
+        with self.assertRaises(ValueError):
+            create_progress('fancy')
+        self.assertIs(create_progress('none'), NULL_PROGRESS)
+
+class TestDebateProgress(unittest.TestCase):
+    """Tests for the events emitted by the debate manager"""
+
+    def test_workers_only_queue_events(self):
+        """Test that agent workers never write to the console and events render on one thread"""
+        rendered_on = set()
+
+        class RecordingSink:
+            def __init__(self):
+                self.kinds = []
+
+            def handle(self, kind, *args):
+                rendered_on.add(threading.current_thread().name)
+                self.kinds.append(kind)
+
+            def close(self):
+                pass
+
+        agent = MagicMock()
+        agent.invoke.return_value = {'text': 'Report'}
+        sink = RecordingSink()
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            with DebateManager({'Investor': agent}, {'Analyst': agent},
+                               progress=events.ProgressReporter(sink)) as manager:
+                manager.debate_ticker('AAPL', {})
+                manager.progress.close()
+
+        self.assertEqual(stdout.getvalue(), '')
+        self.assertEqual(rendered_on, {'progress'})
+        self.assertEqual(sink.kinds.count(events.AGENT_DONE), 2)
+        self.assertEqual(sink.kinds[-1], events.TICKER_DONE)
+
+if __name__ == '__main__':
+    unittest.main()
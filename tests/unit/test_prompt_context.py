@@ -0,0 +1,105 @@
+"""
+Unit tests for the prompt context module
+"""
+
+import sys
+import os
+import pickle
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.agents.prompt_context import PromptContext, build_prompt_context
+from src.agents.response_cache import response_key
+from src.agents.debate_manager import DebateManager
+
+def make_stock_data(**overrides):
+    """Return stock data with NumPy values and a long business summary"""
+    data = {
+        'ticker': 'TEST',
+        'company_name': 'Test Co',
+        'current_price': np.float64(101.123456789),
+        'market_cap': np.int64(250_000_000_000),
+        'pe_ratio': None,
+        'beta': np.float64('nan'),
+        'recent_trend': 'Sideways',
+        'business_summary': 'Test Co makes tests for testing. ' * 100
+    }
+    data.update(overrides)
+    return data
+
+class TestPromptContext(unittest.TestCase):
+    """Tests for preparing a ticker's stock data once for every prompt"""
+
+    def test_compact_text(self):
+        """Test that the text lists present fields in order with rounded numbers"""
+        text = str(build_prompt_context('TEST', make_stock_data(), max_tokens=None))
+        lines = text.split('\n')
+
+        self.assertEqual(lines[:5], ['ticker: TEST', 'company_name: Test Co', 'current_price: 101.123',
+                                     'market_cap: 250000000000', 'recent_trend: Sideways'])
+        self.assertEqual(lines[5], 'business_summary: ' + ('Test Co makes tests for testing. ' * 100).strip())
+
+    def test_summary_fits_the_token_budget(self):
+        """Test that the business summary is shortened at a word so the text fits its budget"""
+        text = build_prompt_context('TEST', make_stock_data(), max_tokens=50).text
+
+        self.assertLessEqual(len(text), 50 * 4)
+        self.assertTrue(text.endswith('...'))
+        self.assertIn('recent_trend: Sideways', text)
+        self.assertNotIn('business_summary', build_prompt_context('TEST', make_stock_data(), max_tokens=20).text)
+
+    def test_reads_like_the_stock_data(self):
+        """Test that agents can look fields up and that contexts survive pickling"""
+        data = make_stock_data()
+        context = build_prompt_context('TEST', data)
+
+        self.assertEqual(context.get('company_name'), 'Test Co')
+        self.assertEqual(context.get('eps', 0), 0)
+        self.assertIs(build_prompt_context('TEST', context), context)
+        restored = pickle.loads(pickle.dumps(context))
+        self.assertEqual((restored.text, restored.digest), (context.text, context.digest))
+        self.assertIs(type(restored['current_price']), float)
+        with self.assertRaises(AttributeError):
+            context.text = ''
+
+    def test_cache_keys_use_the_digest(self):
+        """Test that cache keys follow the full data and token budget, not the rounded prompt text"""
+        first = build_prompt_context('TEST', make_stock_data())
+        same = build_prompt_context('TEST', make_stock_data(current_price=101.123456789, market_cap=250_000_000_000))
+        changed = build_prompt_context('TEST', make_stock_data(current_price=101.123456))
+
+        key = response_key('agent', {'ticker': 'TEST', 'stock_data': first})
+        self.assertEqual(key, response_key('agent', {'ticker': 'TEST', 'stock_data': same}))
+        self.assertEqual(first.text, changed.text)
+        self.assertNotEqual(key, response_key('agent', {'ticker': 'TEST', 'stock_data': changed}))
+
+        for max_tokens in (50, None):
+            budget = build_prompt_context('TEST', make_stock_data(), max_tokens=max_tokens)
+            self.assertNotEqual(key, response_key('agent', {'ticker': 'TEST', 'stock_data': budget}))
+
+    def test_one_context_is_shared_by_every_agent(self):
+        """Test that a ticker's analysts and investors all receive the same prepared context"""
+        received = []
+
+        def make_agent():
+            agent = MagicMock()
+            agent.invoke.side_effect = lambda inputs: received.append(
+                inputs.get('stock_data', inputs.get('stock_info'))) or {'text': 'Response'}
+            return agent
+
+        analysts = {f'Analyst{i}': make_agent() for i in range(3)}
+        investors = {f'Investor{i}': make_agent() for i in range(3)}
+        with DebateManager(investors, analysts) as manager:
+            manager.debate_ticker('TEST', make_stock_data())
+
+        self.assertEqual(len(received), 6)
+        self.assertIsInstance(received[0], PromptContext)
+        self.assertTrue(all(context is received[0] for context in received))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Unit tests for the agent response cache
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from unittest.mock import MagicMock
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.agents.response_cache import ResponseCache, agent_fingerprint, response_key
+from src.agents.debate_manager import DebateManager
+from src.utils.hashing import canonical_json, stable_hash
+
+class TestHashing(unittest.TestCase):
+    """Tests for canonical payload hashing"""
+
+    def test_key_order_and_numpy_types(self):
+        """Test that equal payloads hash the same regardless of layout"""
+        a = {'ticker': 'AAA', 'stock_data': {'pe_ratio': np.float64(20.5), 'market_cap': np.int64(10)}}
+        b = {'stock_data': {'market_cap': 10, 'pe_ratio': 20.5}, 'ticker': 'AAA'}
+
+        self.assertEqual(canonical_json(a), canonical_json(b))
+        self.assertEqual(stable_hash(a), stable_hash(b))
+        self.assertNotEqual(stable_hash(a), stable_hash({**b, 'ticker': 'BBB'}))
+
+    def test_nan_is_stable(self):
+        """Test that NaN values produce a stable hash"""
+        self.assertEqual(stable_hash({'x': float('nan')}), stable_hash({'x': np.nan}))
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the ResponseCache class"""
+
+    def setUp(self):
+        """Create a temporary directory for the disk store"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'responses.sqlite')
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.tmpdir)
+
+    def test_memory_lru_evicts_by_size(self):
+        """Test that the least recently used responses are evicted past the size limit"""
+        cache = ResponseCache(max_memory_bytes=10)
+        cache.put('a', 'xxxx')
+        cache.put('b', 'yyyy')
+        self.assertEqual(cache.get('a'), 'xxxx')
+        cache.put('c', 'zzzz')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'xxxx')
+        self.assertEqual(cache.get('c'), 'zzzz')
+        self.assertEqual(cache.stats()['memory_bytes'], 8)
+
+    def test_disk_store_persists_and_evicts(self):
+        """Test that the disk store survives reopening and stays under its size limit"""
+        cache = ResponseCache(path=self.path, max_disk_bytes=10)
+        cache.put('a', 'xxxx')
+        cache.put('b', 'yyyy')
+        cache.put('c', 'zzzz')
+        cache.close()
+
+        reopened = ResponseCache(path=self.path)
+        self.assertIsNone(reopened.get('a'))
+        self.assertEqual(reopened.get('c'), 'zzzz')
+        self.assertEqual(reopened.stats()['disk_hits'], 1)
+        reopened.close()
+
+    def test_fingerprint_includes_prompt(self):
+        """Test that changing an agent's prompt changes its cache key"""
+        agent = MagicMock(spec=['invoke', 'prompt'])
+        agent.prompt = 'Prompt v1'
+        first = response_key(agent_fingerprint('analyst', 'Analyst1', agent), {'ticker': 'AAA'})
+        agent.prompt = 'Prompt v2'
+        second = response_key(agent_fingerprint('analyst', 'Analyst1', agent), {'ticker': 'AAA'})
+
+        self.assertNotEqual(first, second)
+
+class TestDebateManagerResponseCache(unittest.TestCase):
+    """Tests for response caching in DebateManager"""
+
+    def test_rerun_skips_unchanged_agents(self):
+        """Test that a second run with unchanged inputs does not invoke the agents"""
+        analyst_team = {'Analyst1': MagicMock()}
+        analyst_team['Analyst1'].invoke.return_value = {'text': 'Report'}
+        investor_team = {'Investor1': MagicMock()}
+        investor_team['Investor1'].invoke.return_value = {'text': 'Opinion'}
+        cache = ResponseCache()
+
+        with DebateManager(investor_team, analyst_team, response_cache=cache) as manager:
+            first = manager.run_debate(['AAA'], {'AAA': {'pe_ratio': 20.0}})
+            second = manager.run_debate(['AAA'], {'AAA': {'pe_ratio': 20.0}})
+            manager.run_debate(['AAA'], {'AAA': {'pe_ratio': 21.0}})
+
+        self.assertEqual(first, second)
+        self.assertEqual(analyst_team['Analyst1'].invoke.call_count, 2)
+        self.assertEqual(investor_team['Investor1'].invoke.call_count, 2)
+        self.assertEqual(cache.stats()['memory_hits'], 2)
+
+    def test_failures_are_not_cached(self):
+        """Test that an agent error is retried on the next run"""
+        analyst_team = {'Analyst1': MagicMock()}
+        analyst_team['Analyst1'].invoke.side_effect = [Exception('boom'), {'text': 'Report'}]
+
+        with DebateManager({}, analyst_team, response_cache=ResponseCache()) as manager:
+            first = manager.get_analyst_reports('AAA', {})
+            second = manager.get_analyst_reports('AAA', {})
+
+        self.assertIn('boom', first['Analyst1'])
+        self.assertEqual(second['Analyst1'], 'Report')
+
+if __name__ == '__main__':
+    unittest.main()
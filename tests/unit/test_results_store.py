@@ -0,0 +1,112 @@
+"""
+Unit tests for the structured results store
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.results_store import ResultsStore, extract_rating, extract_verdict
+from src.local_claude_responses import get_canned_investor_opinion, get_canned_synthesis, get_generic_synthesis
+
+def make_result(burry, buffett):
+    """Return a debate result with two investor opinions"""
+    return {
+        'analyst_reports': {},
+        'investor_opinions': {
+            'Michael Burry': f'## Final Recommendation\n\n**{burry}**\n',
+            'Warren Buffett': f'## Investment Decision\n**{buffett}**\n\nMore text'
+        },
+        'decision': '## Recommendation\n**Position**: HOLD - Pending detailed analysis'
+    }
+
+class TestExtractRating(unittest.TestCase):
+    """Tests for reducing free-form verdicts to BUY, HOLD or SELL"""
+
+    def test_verdict_phrases(self):
+        """Test the verdict phrases used by the investor templates"""
+        cases = {
+            'STRONG BUY - High Conviction Core Holding': 'BUY',
+            'BUY on dips': 'BUY',
+            'HOLD (if owned) / WAIT FOR PULLBACK (if not owned)': 'HOLD',
+            'WAIT': 'HOLD',
+            'AVOID / WAIT FOR BETTER ENTRY': 'SELL',
+            'UNDERWEIGHT': 'SELL',
+            'NOT long, considering SHORT': 'SELL',
+            'NOT long, NOT short': 'HOLD',
+        }
+        for verdict, rating in cases.items():
+            self.assertEqual(extract_rating(f'## Investment Decision\n\n**{verdict}**\n'), rating, verdict)
+
+    def test_labelled_verdicts(self):
+        """Test verdicts given after a label or in a heading"""
+        self.assertEqual(extract_rating('**Investment Recommendation**: AVOID / SHORT\n'), 'SELL')
+        self.assertEqual(extract_verdict('## 5. Final Recommendation: **MODERATE BUY**\n'), 'MODERATE BUY')
+        self.assertEqual(extract_rating(get_generic_synthesis('MSFT', {})), 'HOLD')
+        self.assertIsNone(extract_rating('No conclusion here'))
+
+    def test_canned_documents(self):
+        """Test the ratings extracted from the canned MSFT documents"""
+        self.assertEqual(extract_rating(get_canned_investor_opinion('MSFT', 'Cathie Wood')), 'BUY')
+        self.assertEqual(extract_rating(get_canned_investor_opinion('MSFT', 'Michael Burry')), 'SELL')
+        self.assertEqual(extract_rating(get_canned_investor_opinion('MSFT', 'Warren Buffett')), 'HOLD')
+        self.assertEqual(extract_rating(get_canned_synthesis('MSFT')), 'BUY')
+
+class TestResultsStore(unittest.TestCase):
+    """Tests for recording and querying results across runs"""
+
+    def setUp(self):
+        """Set up a temporary store location"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'results.sqlite')
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_record_and_query_across_runs(self):
+        """Test that ratings and positions from several runs can be filtered"""
+        first = ResultsStore(self.path, run_id='run-1')
+        first.record('MSFT', make_result('SELL', 'BUY'), seconds=1.5, recorded_at=100)
+        first.record('AAPL', make_result('BUY', 'HOLD'), recorded_at=101)
+        first.close()
+        second = ResultsStore(self.path, run_id='run-2')
+        second.record('MSFT', make_result('SELL', 'HOLD'), recorded_at=200)
+
+        sells = second.ratings(investor='Michael Burry', rating='SELL')
+        self.assertEqual([(row['ticker'], row['run_id']) for row in sells], [('MSFT', 'run-1'), ('MSFT', 'run-2')])
+        self.assertEqual(len(second.ratings(investor='Michael Burry', rating='SELL', since=150)), 1)
+
+        decisions = second.decisions(ticker='MSFT')
+        self.assertEqual([row['position'] for row in decisions], ['HOLD', 'HOLD'])
+        self.assertEqual(decisions[0]['verdict'], 'HOLD - Pending detailed analysis')
+        self.assertEqual(decisions[0]['seconds'], 1.5)
+        self.assertEqual(len(second.decisions(run_id='run-1')), 2)
+        second.close()
+
+    def test_rerecording_replaces_a_stock(self):
+        """Test that recording a stock twice in a run keeps the latest outcome"""
+        store = ResultsStore(self.path)
+        store.record('MSFT', make_result('SELL', 'BUY'))
+        store.record('MSFT', make_result('BUY', 'BUY'))
+
+        self.assertEqual([row['rating'] for row in store.ratings(investor='Michael Burry')], ['BUY'])
+        store.close()
+
+    def test_investor_queries_use_an_index(self):
+        """Test that filtering ratings by investor does not scan the table"""
+        store = ResultsStore(self.path)
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM ratings WHERE investor = ? AND rating = ? AND recorded_at >= ?",
+            ('Michael Burry', 'SELL', 0)
+        ).fetchall()
+        self.assertIn('ratings_by_investor', ' '.join(str(row) for row in plan))
+        store.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Unit tests for the results writer
+"""
+
+import sys
+import os
+import json
+import shutil
+import tarfile
+import tempfile
+import threading
+import unittest
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.results_writer import ResultsWriter, render_documents, write_results
+
+def make_result(ticker):
+    """Return a small debate result"""
+    return {
+        'analyst_reports': {'Analyst1': f'{ticker} report', 'Analyst2': 'Second report'},
+        'investor_opinions': {'Investor1': f'{ticker} opinion'},
+        'decision': f'Buy {ticker}'
+    }
+
+class TestResultsWriter(unittest.TestCase):
+    """Tests for rendering and writing debate results"""
+
+    def setUp(self):
+        """Set up a temporary results directory"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_render_documents(self):
+        """Test that the documents keep the Markdown layout of the results files"""
+        documents = render_documents('MSFT', make_result('MSFT'))
+
+        self.assertEqual(documents['MSFT_decision.md'], '# Investment Analysis for MSFT\n\nBuy MSFT')
+        self.assertEqual(documents['MSFT_detailed_analysis.md'],
+                         '# Detailed Analysis for MSFT\n\n## Analyst Reports\n\n'
+                         '### Analyst1\n\nMSFT report\n\n---\n\n### Analyst2\n\nSecond report\n\n---\n\n'
+                         '## Investor Opinions\n\n### Investor1\n\nMSFT opinion\n\n---\n\n')
+
+    def test_write_results_leaves_no_temporary_files(self):
+        """Test that results are written atomically under their final names only"""
+        paths = write_results('MSFT', make_result('MSFT'), self.temp_dir)
+
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['MSFT_decision.md', 'MSFT_detailed_analysis.md'])
+        self.assertEqual(paths[0], os.path.join(self.temp_dir, 'MSFT_decision.md'))
+
+    def test_written_files_follow_the_umask(self):
+        """Test that results get the permissions of a plain open, not the owner-only temporary file's"""
+        umask = os.umask(0o022)
+        try:
+            paths = write_results('MSFT', make_result('MSFT'), self.temp_dir)
+        finally:
+            os.umask(umask)
+
+        self.assertEqual(os.stat(paths[0]).st_mode & 0o777, 0o644)
+
+    def test_background_writes_and_callbacks(self):
+        """Test that submitted results are written on the writer thread in order, then reported"""
+        written = []
+        threads = set()
+
+        def on_written(ticker, outputs):
+            threads.add(threading.current_thread().name)
+            written.append((ticker, all(os.path.exists(path) for path in outputs)))
+
+        with ResultsWriter(self.temp_dir) as writer:
+            for ticker in ['AAPL', 'MSFT', 'NVDA']:
+                writer.submit(ticker, make_result(ticker), on_written=on_written)
+
+        self.assertEqual(written, [('AAPL', True), ('MSFT', True), ('NVDA', True)])
+        self.assertEqual(threads, {'results-writer'})
+        with self.assertRaises(RuntimeError):
+            writer.submit('TSLA', make_result('TSLA'))
+
+    def test_failed_write_is_not_reported_as_written(self):
+        """Test that a result that cannot be written is recorded as an error without a callback"""
+        written = []
+        with ResultsWriter(self.temp_dir) as writer:
+            writer.submit('BAD', {'decision': 'Buy'}, on_written=lambda ticker, outputs: written.append(ticker))
+            writer.submit('MSFT', make_result('MSFT'), on_written=lambda ticker, outputs: written.append(ticker))
+
+        self.assertEqual(written, ['MSFT'])
+        self.assertEqual([ticker for ticker, _ in writer.errors], ['BAD'])
+
+    def test_jsonl_archive(self):
+        """Test that a JSON lines archive holds every document of the run"""
+        with ResultsWriter(self.temp_dir, archive='jsonl') as writer:
+            outputs = writer.submit('AAPL', make_result('AAPL'))
+            writer.submit('MSFT', make_result('MSFT'))
+
+        self.assertEqual(outputs, [writer.archive_path])
+        with open(writer.archive_path) as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual([entry['ticker'] for entry in entries], ['AAPL', 'MSFT'])
+        self.assertEqual(entries[1]['documents'], render_documents('MSFT', make_result('MSFT')))
+
+    def test_tar_archive(self):
+        """Test that a tar archive holds the Markdown files of every stock"""
+        with ResultsWriter(self.temp_dir, archive='tar') as writer:
+            writer.submit('AAPL', make_result('AAPL'))
+            writer.submit('MSFT', make_result('MSFT'))
+
+        with tarfile.open(writer.archive_path) as archive:
+            self.assertEqual(archive.getnames(), ['AAPL_decision.md', 'AAPL_detailed_analysis.md',
+                                                  'MSFT_decision.md', 'MSFT_detailed_analysis.md'])
+            self.assertEqual(archive.extractfile('MSFT_decision.md').read().decode(),
+                             '# Investment Analysis for MSFT\n\nBuy MSFT')
+
+    def test_unknown_archive_format(self):
+        """Test that an unknown archive format is rejected"""
+        with self.assertRaises(ValueError):
+            ResultsWriter(self.temp_dir, archive='zip')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Unit tests for the run manifest module
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.run_manifest import RunManifest, input_hash
+
+class TestRunManifest(unittest.TestCase):
+    """Tests for the RunManifest class"""
+
+    def setUp(self):
+        """Create a results directory with one finished output"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'manifest.json')
+        self.output = os.path.join(self.tmpdir, 'AAA_decision.md')
+        with open(self.output, 'w') as f:
+            f.write('# Decision')
+        self.hash = input_hash({'ticker': 'AAA', 'current_price': 10.0})
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.tmpdir)
+
+    def test_complete_after_reload(self):
+        """Test that a finished ticker is recognised by a new manifest instance"""
+        manifest = RunManifest(self.path)
+        manifest.mark_pending(['AAA', 'BBB'], {'AAA': self.hash, 'BBB': 'other'})
+        manifest.mark_done('AAA', self.hash, [self.output])
+
+        reloaded = RunManifest(self.path)
+        self.assertTrue(reloaded.is_complete('AAA', self.hash))
+        self.assertFalse(reloaded.is_complete('BBB', 'other'))
+        self.assertEqual(reloaded.get('AAA')['outputs'], [self.output])
+
+    def test_changed_input_or_missing_output(self):
+        """Test that a ticker is rerun when its data changed or its outputs are gone"""
+        manifest = RunManifest(self.path)
+        manifest.mark_done('AAA', self.hash, [self.output])
+
+        changed = input_hash({'ticker': 'AAA', 'current_price': 11.0})
+        self.assertFalse(manifest.is_complete('AAA', changed))
+        os.remove(self.output)
+        self.assertFalse(manifest.is_complete('AAA', self.hash))
+
+    def test_manifest_file_format(self):
+        """Test that the manifest is written as JSON with the usual file mode and no leftover temporary files"""
+        umask = os.umask(0o022)
+        try:
+            RunManifest(self.path).mark_done('AAA', self.hash, [self.output])
+        finally:
+            os.umask(umask)
+
+        with open(self.path) as f:
+            data = json.load(f)
+        self.assertEqual(data['tickers']['AAA']['status'], 'done')
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ['AAA_decision.md', 'manifest.json'])
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+    def test_unreadable_manifest_is_ignored(self):
+        """Test that a corrupt manifest starts a fresh run instead of failing"""
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+
+        manifest = RunManifest(self.path)
+        self.assertFalse(manifest.is_complete('AAA', self.hash))
+
+if __name__ == '__main__':
+    unittest.main()
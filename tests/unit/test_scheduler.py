@@ -0,0 +1,185 @@
+"""
+Unit tests for the agent call scheduler
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.agents.scheduler import AgentScheduler, TokenBucket, estimate_tokens, is_rate_limit_error, retry_after
+from src.agents.debate_manager import DebateManager
+from tests.fake_llm import FakeLLMServer, FakeLLMAgent
+
+class RateLimited(Exception):
+    """Provider error carrying an HTTP status like the Anthropic client's"""
+    status_code = 429
+
+class FakeClock:
+    """Clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for the token bucket"""
+
+    def test_refills_at_rate(self):
+        """Test that the bucket allows a burst and then refills at its rate"""
+        clock = FakeClock()
+        bucket = TokenBucket(60, burst_seconds=2, clock=clock)
+
+        self.assertEqual(bucket.delay(2), 0)
+        bucket.take(2)
+        self.assertAlmostEqual(bucket.delay(1), 1.0)
+        clock.now = 1.0
+        self.assertEqual(bucket.delay(1), 0)
+
+    def test_oversized_calls_leave_debt(self):
+        """Test that a call larger than the bucket goes once it is full and delays later calls"""
+        clock = FakeClock()
+        bucket = TokenBucket(600, burst_seconds=1, clock=clock)
+
+        self.assertEqual(bucket.delay(50), 0)
+        bucket.take(50)
+        self.assertAlmostEqual(bucket.delay(10), 5.0)
+
+class TestAgentScheduler(unittest.TestCase):
+    """Tests for ordering, retries and backoff"""
+
+    def test_dispatches_by_priority(self):
+        """Test that earlier tickers go before later ones and analysts before investors"""
+        scheduler = AgentScheduler(requests_per_minute=600, burst_seconds=0.1)
+        order = []
+        scheduler.priority('analyst', 'AAA')
+        scheduler.acquire()
+
+        # Queue behind the exhausted bucket, in the reverse of the expected order
+        requests = [('investor', 'BBB'), ('investor', 'AAA'), ('analyst', 'BBB'), ('analyst', 'AAA')]
+        threads = []
+        for role, ticker in requests:
+            def call(role=role, ticker=ticker):
+                scheduler.acquire(scheduler.priority(role, ticker))
+                order.append((role, ticker))
+            threads.append(threading.Thread(target=call))
+            threads[-1].start()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(order, [('analyst', 'AAA'), ('investor', 'AAA'), ('analyst', 'BBB'), ('investor', 'BBB')])
+
+    def test_tickers_under_way_go_before_new_ones(self):
+        """Test that a later ticker's analysts do not preempt an earlier ticker's investors"""
+        scheduler = AgentScheduler()
+        old_investor = scheduler.priority('investor', 'OLD')
+        new_analyst = scheduler.priority('analyst', 'NEW')
+
+        self.assertLess(old_investor, new_analyst)
+        self.assertLess(scheduler.priority('analyst', 'OLD'), old_investor)
+
+    def test_retries_rate_limited_calls(self):
+        """Test that rate-limit errors are retried after backing off the rate"""
+        scheduler = AgentScheduler(requests_per_minute=6000, base_backoff=0.01)
+        attempts = []
+
+        def call():
+            attempts.append(time.monotonic())
+            if len(attempts) < 3:
+                raise RateLimited()
+            return 'done'
+
+        self.assertEqual(scheduler.run(call), 'done')
+        stats = scheduler.stats()
+        self.assertEqual(stats['rate_limited'], 2)
+        self.assertEqual(stats['succeeded'], 1)
+        self.assertLess(stats['rate_scale'], 1.0)
+
+    def test_gives_up_and_passes_other_errors(self):
+        """Test that other errors are not retried and retries are bounded"""
+        scheduler = AgentScheduler(max_retries=1, base_backoff=0.001)
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise ValueError('bad request')
+
+        def limited():
+            calls.append(1)
+            raise RateLimited()
+
+        with self.assertRaises(ValueError):
+            scheduler.run(failing)
+        self.assertEqual(len(calls), 1)
+        with self.assertRaises(RateLimited):
+            scheduler.run(limited)
+        self.assertEqual(len(calls), 3)
+
+    def test_helpers(self):
+        """Test the token estimate and rate-limit error inspection"""
+        self.assertEqual(estimate_tokens('x' * 40), 11)
+        self.assertTrue(is_rate_limit_error(RateLimited()))
+        self.assertFalse(is_rate_limit_error(ValueError()))
+        error = RateLimited()
+        error.headers = {'retry-after': '2.5'}
+        self.assertEqual(retry_after(error), 2.5)
+        self.assertIsNone(retry_after(RateLimited()))
+
+class TestFakeProvider(unittest.TestCase):
+    """Tests against a local rate-limited LLM server"""
+
+    def run_portfolio(self, server, scheduler, tickers):
+        analyst_team = {f'Analyst{i}': FakeLLMAgent(server.url) for i in range(4)}
+        with DebateManager({}, analyst_team, max_workers=8, scheduler=scheduler) as manager:
+            return [manager.get_analyst_reports(ticker, {'price': 1.0}) for ticker in tickers]
+
+    def test_stays_under_limits(self):
+        """Test that configured limits below the provider's avoid rate-limit errors"""
+        with FakeLLMServer(requests_per_window=10, window=0.2) as server:
+            scheduler = AgentScheduler(requests_per_minute=1500, burst_seconds=0.1)
+            results = self.run_portfolio(server, scheduler, [f'T{i}' for i in range(8)])
+
+        self.assertEqual(server.rejected, 0)
+        self.assertEqual(server.accepted, 32)
+        for reports in results:
+            for report in reports.values():
+                self.assertTrue(report.startswith('Completion'))
+
+    def test_recovers_from_rate_limits(self):
+        """Test that limits above the provider's are learned from 429s without losing calls"""
+        with FakeLLMServer(requests_per_window=5, window=0.2) as server:
+            scheduler = AgentScheduler(requests_per_minute=6000, base_backoff=0.05)
+            results = self.run_portfolio(server, scheduler, [f'T{i}' for i in range(6)])
+
+        self.assertGreater(server.rejected, 0)
+        self.assertEqual(server.accepted, 24)
+        self.assertEqual(scheduler.stats()['rate_limited'], server.rejected)
+        for reports in results:
+            for report in reports.values():
+                self.assertTrue(report.startswith('Completion'))
+
+    def test_async_path(self):
+        """Test that the asyncio path waits for the scheduler too"""
+        analyst_team = {f'Analyst{i}': FakeLLMAgent(None) for i in range(4)}
+        with FakeLLMServer(requests_per_window=4, window=0.2) as server:
+            for agent in analyst_team.values():
+                agent.url = server.url
+            scheduler = AgentScheduler(requests_per_minute=600, burst_seconds=0.1)
+            with DebateManager({}, analyst_team, scheduler=scheduler) as manager:
+                results = asyncio.run(manager.arun_debate(['A', 'B'], {}))
+
+        self.assertEqual(server.rejected, 0)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(report.startswith('Completion')
+                            for result in results.values() for report in result['analyst_reports'].values()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the stock snapshot module
+"""
+
+import sys
+import os
+import pickle
+import unittest
+
+import numpy as np
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.snapshot import StockSnapshot, SnapshotTable
+from src.local_claude_responses import get_generic_analyst_report
+
+def make_stock_data(ticker='AAA', price=100.0):
+    """Return stock data shaped like the output of get_stock_data"""
+    return {
+        'ticker': ticker,
+        'company_name': f'{ticker} Inc.',
+        'sector': 'Technology',
+        'industry': 'Software',
+        'current_price': np.float64(price),
+        'market_cap': 2_000_000_000,
+        'pe_ratio': None,
+        'dividend_yield': 0.01,
+        '52w_high': np.float64(price * 1.2),
+        'free_cash_flow': None,
+        'recent_trend': 'Sideways',
+        'business_summary': 'Makes software.'
+    }
+
+class TestStockSnapshot(unittest.TestCase):
+    """Tests for the typed, dict-compatible stock record"""
+
+    def test_reads_like_the_stock_data_dict(self):
+        """Test that a snapshot has the same keys and values as the dict it was built from"""
+        data = make_stock_data()
+        snapshot = StockSnapshot(data)
+
+        self.assertEqual(snapshot, data)
+        self.assertEqual(list(snapshot), list(data))
+        self.assertIs(type(snapshot['current_price']), float)
+        self.assertIsNone(snapshot['pe_ratio'])
+        self.assertEqual(snapshot.get('beta', 0), 0)
+        self.assertNotIn('error', snapshot)
+        self.assertEqual(str(snapshot), str(snapshot.to_dict()))
+
+    def test_typed_fields(self):
+        """Test that numeric fields are converted to floats and extra keys are kept"""
+        snapshot = StockSnapshot({'ticker': 'AAA', 'pe_ratio': 'Infinity', 'beta': 'n/a', 'note': [1]})
+
+        self.assertEqual(snapshot['pe_ratio'], float('inf'))
+        self.assertIsNone(snapshot['beta'])
+        self.assertEqual(snapshot['note'], [1])
+        with self.assertRaises(AttributeError):
+            snapshot.ticker = 'BBB'
+
+    def test_pickle_and_reports(self):
+        """Test that snapshots survive pickling and render the same reports as dicts"""
+        data = dict(make_stock_data(), pe_ratio=22.5, forward_pe=20.0, beta=1.1, eps=4.2,
+                    revenue_growth=12.0, profit_margin=25.0, return_on_equity=30.0, debt_to_equity=0.5)
+        snapshot = StockSnapshot(data)
+
+        self.assertEqual(pickle.loads(pickle.dumps(snapshot)), snapshot)
+        self.assertEqual(get_generic_analyst_report('Fundamental Analyst', 'AAA', snapshot),
+                         get_generic_analyst_report('Fundamental Analyst', 'AAA', data))
+
+class TestSnapshotTable(unittest.TestCase):
+    """Tests for the column-wise portfolio container"""
+
+    def setUp(self):
+        """Set up a table of two stocks and one failed download"""
+        self.data = {
+            'AAA': make_stock_data('AAA', 100.0),
+            'BBB': make_stock_data('BBB', 50.0),
+            'CCC': {'ticker': 'CCC', 'error': 'Not found'}
+        }
+        self.table = SnapshotTable(self.data)
+
+    def test_lookup_rebuilds_each_snapshot(self):
+        """Test that every stock reads back exactly as stored, including missing keys"""
+        self.assertEqual(list(self.table), ['AAA', 'BBB', 'CCC'])
+        for ticker, data in self.data.items():
+            self.assertEqual(self.table[ticker], data)
+        self.assertIsNone(self.table['AAA']['pe_ratio'])
+        self.assertEqual(dict(self.table['CCC']), {'ticker': 'CCC', 'error': 'Not found'})
+        self.assertEqual(self.table.get('DDD', {}), {})
+
+    def test_columns(self):
+        """Test that batch code reads a field of every stock as one array"""
+        prices = self.table.column('current_price')
+
+        np.testing.assert_array_equal(prices, [100.0, 50.0, np.nan])
+        self.assertFalse(prices.flags.writeable)
+        self.assertEqual(list(self.table.column('sector')), ['Technology', 'Technology', None])
+        self.assertEqual(self.table.to_frame().loc['BBB', '52w_high'], 60.0)
+        with self.assertRaises(KeyError):
+            self.table.column('unknown')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the stock data cache module
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src'))
+
+from src.utils.stock_cache import StockDataCache, history_kind, ttl_class
+from src.utils.stock_data import get_stock_data
+
+class TestStockDataCache(unittest.TestCase):
+    """Tests for the SQLite-backed stock data cache"""
+
+    def setUp(self):
+        """Create a cache in a temporary directory"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'cache', 'stock_data.sqlite')
+        self.cache = StockDataCache(self.path)
+
+    def tearDown(self):
+        """Remove the temporary cache"""
+        self.cache.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_ttl_classes(self):
+        """Test that each kind of data maps to its expiry class"""
+        self.assertEqual(ttl_class(history_kind('1d')), 'daily')
+        self.assertEqual(ttl_class(history_kind('5m')), 'intraday')
+        self.assertEqual(ttl_class('info'), 'info')
+        for kind in ['income_stmt', 'balance_sheet', 'cashflow']:
+            self.assertEqual(ttl_class(kind), 'statements')
+
+    def test_round_trip_and_stats(self):
+        """Test that values round-trip and hits and misses are counted"""
+        df = pd.DataFrame({'2023': [1000, 300]}, index=['Total Revenue', 'Net Income'])
+
+        hit, _ = self.cache.get('AAA', 'income_stmt')
+        self.assertFalse(hit)
+        self.cache.put('AAA', 'income_stmt', df)
+        hit, value = self.cache.get('AAA', 'income_stmt')
+
+        self.assertTrue(hit)
+        pd.testing.assert_frame_equal(value, df)
+        self.assertEqual(self.cache.stats(), {'income_stmt': {'hits': 1, 'misses': 1}})
+
+    def test_persists_across_instances(self):
+        """Test that cached data survives reopening the database"""
+        self.cache.put('AAA', 'info', {'longName': 'AAA Inc'})
+        reopened = StockDataCache(self.path)
+        hit, value = reopened.get('AAA', 'info')
+        reopened.close()
+
+        self.assertTrue(hit)
+        self.assertEqual(value, {'longName': 'AAA Inc'})
+
+    def test_expiry(self):
+        """Test that entries older than their class TTL are misses"""
+        with patch('src.utils.stock_cache.time.time', return_value=1000.0):
+            self.cache.put('AAA', 'info', {'longName': 'AAA Inc'})
+            self.cache.put('AAA', 'cashflow', pd.DataFrame())
+
+        with patch('src.utils.stock_cache.time.time', return_value=1000.0 + 2 * 24 * 60 * 60):
+            self.assertFalse(self.cache.get('AAA', 'info')[0])
+            self.assertTrue(self.cache.get('AAA', 'cashflow')[0])
+
+    def test_refresh_ignores_cache(self):
+        """Test that refresh mode refetches but still stores the new value"""
+        self.cache.put('AAA', 'info', {'longName': 'Old'})
+        refreshing = StockDataCache(self.path, refresh=True)
+        value = refreshing.get_or_fetch('AAA', 'info', lambda: {'longName': 'New'})
+        refreshing.close()
+
+        self.assertEqual(value, {'longName': 'New'})
+        self.assertEqual(self.cache.get('AAA', 'info')[1], {'longName': 'New'})
+
+    @patch('src.utils.stock_data.yf.Ticker')
+    def test_get_stock_data_uses_cache(self, mock_ticker):
+        """Test that a second fetch is served without calling yfinance"""
+        dates = pd.date_range(start='2023-01-01', periods=10)
+        mock_instance = MagicMock()
+        mock_instance.info = {'longName': 'Test Company'}
+        mock_instance.history.return_value = pd.DataFrame({
+            'Close': [100.0] * 10, 'High': [101.0] * 10, 'Low': [99.0] * 10, 'Volume': [1000] * 10
+        }, index=dates)
+        mock_instance.income_stmt = pd.DataFrame()
+        mock_instance.balance_sheet = pd.DataFrame()
+        mock_instance.cashflow = pd.DataFrame()
+        mock_ticker.return_value = mock_instance
+
+        first = get_stock_data('TEST', cache=self.cache)
+        second = get_stock_data('TEST', cache=self.cache)
+
+        self.assertEqual(first, second)
+        mock_instance.history.assert_called_once()
+        self.assertEqual(self.cache.stats()['info'], {'hits': 1, 'misses': 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,10 @@ Unit tests for stock data utility module
 
 import sys
 import os
+import shutil
+import tempfile
 import unittest
+import numpy as np
 import pandas as pd
 from unittest.mock import patch, MagicMock
 
@@ -13,14 +16,17 @@ sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__f
 
 from src.utils.stock_data import (
     get_stock_data,
+    get_stock_data_batch,
     calculate_revenue_growth,
     calculate_profit_margin,
     calculate_debt_to_equity,
     calculate_current_ratio,
     calculate_roe,
     get_latest_value,
-    get_recent_trend
+    get_recent_trend,
+    compute_portfolio_metrics
 )
+from src.utils.history_store import PriceHistoryStore
 
 class TestStockDataUtils(unittest.TestCase):
     """Tests for stock data utility functions - these work correctly"""
@@ -186,5 +192,190 @@ class TestStockDataUtils(unittest.TestCase):
         result = get_stock_data('ERROR')
         self.assertIn('error', result)
 
+class FakeTicker:
+    """Stand-in for yf.Ticker serving canned fundamentals"""
+    
+    def __init__(self, provider, ticker):
+        self.provider = provider
+        self.ticker = ticker
+    
+    @property
+    def info(self):
+        self.provider.info_calls.append(self.ticker)
+        if self.ticker in self.provider.failing:
+            raise Exception(f"No data for {self.ticker}")
+        return {'longName': f'{self.ticker} Inc', 'sector': 'Technology', 'trailingPE': 20.0}
+    
+    @property
+    def income_stmt(self):
+        return self.provider.income_stmt
+    
+    @property
+    def balance_sheet(self):
+        return self.provider.balance_sheet
+    
+    @property
+    def cashflow(self):
+        return pd.DataFrame({'2023': [400]}, index=['Free Cash Flow'])
+
+class FakeYFinance:
+    """Local fake of the yfinance module API used by get_stock_data_batch"""
+    
+    def __init__(self, histories, income_stmt, balance_sheet, failing=()):
+        self.histories = histories
+        self.income_stmt = income_stmt
+        self.balance_sheet = balance_sheet
+        self.failing = set(failing)
+        self.download_calls = []
+        self.info_calls = []
+    
+    def Ticker(self, ticker):
+        return FakeTicker(self, ticker)
+    
+    def download(self, tickers, period=None, group_by=None, start=None, **kwargs):
+        self.download_calls.append((list(tickers), start or period))
+        frames = {t: self.histories[t] for t in tickers if t in self.histories}
+        if start is not None:
+            frames = {t: h[h.index >= start] for t, h in frames.items()}
+        return pd.concat(frames, axis=1)
+
+class TestStockDataBatch(unittest.TestCase):
+    """Tests for the batched multi-ticker fetch"""
+    
+    def setUp(self):
+        """Set up a fake provider with two tickers of different history lengths"""
+        dates = pd.date_range(end=pd.Timestamp.now().normalize(), periods=60)
+        long_hist = pd.DataFrame({
+            'Open': [100 + i*0.5 for i in range(60)],
+            'High': [105 + i*0.5 for i in range(60)],
+            'Low': [95 + i*0.5 for i in range(60)],
+            'Close': [100 + i*0.5 for i in range(60)],
+            'Volume': [1000000 for _ in range(60)]
+        }, index=dates)
+        short_hist = long_hist.iloc[30:].copy()
+        
+        income_stmt = pd.DataFrame({'2023': [1000, 300], '2022': [800, 200]},
+                                   index=['Total Revenue', 'Net Income'])
+        balance_sheet = pd.DataFrame({'2023': [500, 300, 200, 100]},
+                                     index=['Total Current Assets', 'Total Current Liabilities',
+                                            'Total Debt', 'Total Stockholder Equity'])
+        self.hists = {'AAA': long_hist, 'BBB': short_hist}
+        self.provider = FakeYFinance(self.hists, income_stmt, balance_sheet)
+    
+    def test_single_bulk_history_download(self):
+        """Test that history for all tickers is fetched in one call"""
+        results = get_stock_data_batch(['AAA', 'BBB'], provider=self.provider)
+        
+        self.assertEqual(self.provider.download_calls, [(['AAA', 'BBB'], '1y')])
+        self.assertEqual(sorted(self.provider.info_calls), ['AAA', 'BBB'])
+        self.assertEqual(list(results), ['AAA', 'BBB'])
+    
+    def test_matches_single_ticker_fetch(self):
+        """Test that batch results match get_stock_data for each ticker"""
+        results = get_stock_data_batch(['AAA', 'BBB'], provider=self.provider)
+        
+        for ticker in ['AAA', 'BBB']:
+            fake = self.provider.Ticker(ticker)
+            fake.history = MagicMock(return_value=self.hists[ticker])
+            with patch('src.utils.stock_data.yf.Ticker', return_value=fake):
+                expected = get_stock_data(ticker)
+            self.assertEqual(results[ticker], expected)
+        
+        # Padding rows from the bulk frame must not leak into the shorter history
+        self.assertAlmostEqual(results['BBB']['52w_low'], self.hists['BBB']['Low'].min())
+    
+    def test_per_ticker_errors(self):
+        """Test that one failing ticker does not affect the others"""
+        self.provider.failing.add('BBB')
+        results = get_stock_data_batch(['AAA', 'BBB', 'AAA'], provider=self.provider)
+        
+        self.assertEqual(len(results), 2)
+        self.assertNotIn('error', results['AAA'])
+        self.assertIn('error', results['BBB'])
+    
+    def test_history_store_downloads_only_new_bars(self):
+        """Test that a second batch run only requests bars after the stored ones"""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            store = PriceHistoryStore(os.path.join(tmpdir, 'history.sqlite'), refresh=True)
+            first = get_stock_data_batch(['AAA', 'BBB'], provider=self.provider, history_store=store)
+            second = get_stock_data_batch(['AAA', 'BBB'], provider=self.provider, history_store=store)
+            store.close()
+        finally:
+            shutil.rmtree(tmpdir)
+        
+        restart = self.hists['AAA'].index[-2].strftime('%Y-%m-%d')
+        self.assertEqual(self.provider.download_calls, [(['AAA', 'BBB'], '1y'), (['AAA', 'BBB'], restart)])
+        for ticker in ['AAA', 'BBB']:
+            self.assertAlmostEqual(second[ticker]['52w_high'], first[ticker]['52w_high'])
+            self.assertAlmostEqual(second[ticker]['avg_volume'], first[ticker]['avg_volume'])
+            self.assertEqual(second[ticker]['recent_trend'], first[ticker]['recent_trend'])
+
+class TestPortfolioMetrics(unittest.TestCase):
+    """Tests for the vectorized portfolio-wide metrics"""
+    
+    def setUp(self):
+        """Set up statements and histories covering the scalar fallbacks"""
+        dates = pd.date_range(start='2023-01-01', periods=60)
+        income = pd.DataFrame({'2023': [1000, 300], '2022': [800, 200]}, index=['Total Revenue', 'Net Income'])
+        balance = pd.DataFrame({'2023': [500, 300, 200, 100]},
+                               index=['Total Current Assets', 'Total Current Liabilities',
+                                      'Total Debt', 'Total Stockholder Equity'])
+        
+        self.income_stmts = {
+            'AAA': income,
+            'BBB': income[['2023']],  # only one period: no growth
+            'CCC': pd.DataFrame({'2023': [np.nan, 50], '2022': [0, 40]}, index=['Total Revenue', 'Net Income']),
+            'DDD': pd.DataFrame(),
+        }
+        self.balance_sheets = {
+            'AAA': balance,
+            'BBB': balance.drop('Total Debt'),
+            'CCC': pd.DataFrame({'2023': [0, -50]}, index=['Total Current Liabilities', 'Total Stockholder Equity']),
+        }
+        self.histories = {
+            'AAA': pd.DataFrame({'Close': [100 + i*0.5 for i in range(60)]}, index=dates),
+            'BBB': pd.DataFrame({'Close': [100 - i*0.5 for i in range(60)]}, index=dates),
+            'CCC': pd.DataFrame({'Close': [100.0, 101.0, 99.5]}, index=dates[:3]),
+            'DDD': pd.DataFrame(),
+        }
+    
+    def test_matches_scalar_functions(self):
+        """Test that every metric equals the per-ticker calculation"""
+        metrics = compute_portfolio_metrics(self.income_stmts, self.balance_sheets, self.histories)
+        
+        self.assertEqual(list(metrics.index), ['AAA', 'BBB', 'CCC', 'DDD'])
+        for ticker in metrics.index:
+            income = self.income_stmts.get(ticker, pd.DataFrame())
+            balance = self.balance_sheets.get(ticker, pd.DataFrame())
+            expected = {
+                'revenue_growth': calculate_revenue_growth(income),
+                'profit_margin': calculate_profit_margin(income),
+                'debt_to_equity': calculate_debt_to_equity(balance),
+                'current_ratio': calculate_current_ratio(balance),
+                'return_on_equity': calculate_roe(income, balance),
+                'recent_trend': get_recent_trend(self.histories[ticker]),
+            }
+            for column, value in expected.items():
+                actual = metrics.at[ticker, column]
+                if isinstance(value, float) and np.isnan(value):
+                    self.assertTrue(np.isnan(actual), f"{ticker} {column}")
+                else:
+                    self.assertEqual(actual, value, f"{ticker} {column}")
+    
+    def test_batch_uses_vectorized_metrics(self):
+        """Test that batch results carry the vectorized metric values"""
+        hist = self.histories['AAA'].assign(High=lambda df: df['Close'] + 1, Low=lambda df: df['Close'] - 1,
+                                            Volume=1000000)
+        provider = FakeYFinance({'AAA': hist}, self.income_stmts['AAA'],
+                                self.balance_sheets['AAA'])
+        with patch('src.utils.stock_data.compute_portfolio_metrics',
+                   wraps=compute_portfolio_metrics) as vectorized:
+            results = get_stock_data_batch(['AAA'], provider=provider)
+        
+        vectorized.assert_called_once()
+        self.assertAlmostEqual(results['AAA']['revenue_growth'], 25.0)
+        self.assertEqual(results['AAA']['recent_trend'], 'Strong Uptrend')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file